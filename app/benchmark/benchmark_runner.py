@@ -367,6 +367,13 @@ def _run_single_frame_text(
             )
             return self._eng.extract_text(frame, opts)
 
+        def extract_text_batch(self, frames, engine=None, options=None):
+            opts = options or OCRProcessingOptions(
+                language=source_language,
+                confidence_threshold=0.3,
+            )
+            return self._eng.extract_text_batch(frames, opts)
+
         def cleanup(self):
             if self._cleanup_engine and getattr(self._eng, "cleanup", None):
                 self._eng.cleanup()
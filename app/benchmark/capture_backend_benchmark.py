@@ -0,0 +1,114 @@
+"""
+CPU screen capture microbenchmark.
+
+Grabs the same screen region repeatedly with the PIL screenshot path
+(``ImageGrab.grab`` plus array conversion and channel flip per frame, the
+former CPU fallback) and with ``MSSCapture`` (one persistent mss instance,
+MIT-SHM on X11, reused BGR buffers), both as the transient buffer damage
+tracking reads and as the copy ``CapturePluginManager`` hands to the
+pipeline.  Reports median and p95 latency per frame, frames per second,
+buffers allocated, and whether the paths return the same pixels.
+
+Needs ``mss`` and an X server.  ``--xvfb`` starts a private Xvfb (the
+``Xvfb`` binary must be installed) so it runs headless, e.g. in CI.  Run
+from the project root::
+
+    python -m app.benchmark.capture_backend_benchmark --xvfb --frames 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import time
+
+import numpy as np
+
+
+def _start_xvfb(width: int, height: int) -> subprocess.Popen:
+    if shutil.which("Xvfb") is None:
+        raise SystemExit("Xvfb is not installed")
+    for number in range(99, 120):
+        if not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            break
+    proc = subprocess.Popen(
+        ["Xvfb", f":{number}", "-screen", "0", f"{width}x{height}x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10.0
+    while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            raise SystemExit("Xvfb did not start")
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = f":{number}"
+    os.environ.pop("XDG_SESSION_TYPE", None)
+    return proc
+
+
+def _run(grab, region: dict, frames: int) -> tuple[list[float], np.ndarray]:
+    frame = grab(region)  # warm-up (opens the connection, allocates buffers)
+    samples = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        frame = grab(region)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples, np.array(frame)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--width", type=int, default=1280, help="Region width")
+    parser.add_argument("--height", type=int, default=720, help="Region height")
+    parser.add_argument("--x", type=int, default=0)
+    parser.add_argument("--y", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=200, help="Grabs per variant")
+    parser.add_argument("--xvfb", action="store_true",
+                        help="Run against a private Xvfb display (1920x1080)")
+    args = parser.parse_args()
+
+    xvfb = _start_xvfb(1920, 1080) if args.xvfb else None
+    try:
+        from app.capture.mss_capture import MSS_AVAILABLE, MSSCapture
+        from app.capture.pil_screenshot import capture_screenshot
+
+        if not MSS_AVAILABLE:
+            raise SystemExit("mss is not installed")
+        if not MSSCapture.is_supported():
+            raise SystemExit("no X display to capture (set DISPLAY or use --xvfb)")
+        region = {"x": args.x, "y": args.y, "width": args.width, "height": args.height}
+        capture = MSSCapture()
+        results = {}
+        variants = (
+            ("PIL ImageGrab", capture_screenshot),
+            ("MSS transient", capture.grab),
+            ("MSS + copy", lambda r: capture.grab(r).copy()),
+        )
+        for name, grab in variants:
+            results[name] = _run(grab, region, args.frames)
+        sct = capture._instance()
+        shm = getattr(sct, "shm_status", None)
+        capture.close()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    print(f"{args.width}x{args.height} region, {args.frames} frames, DISPLAY={os.environ.get('DISPLAY')}")
+    print(f"{'variant':>15}{'median ms':>11}{'p95 ms':>9}{'fps':>8}{'buffers':>9}")
+    for name, (samples, _) in results.items():
+        p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+        median = statistics.median(samples)
+        buffers = capture.stats["buffer_allocations"] if name == "MSS transient" else args.frames + 1
+        print(f"{name:>15}{median:>11.2f}{p95:>9.2f}{1000.0 / median:>8.0f}{buffers:>9}")
+    if shm is not None:
+        print(f"MIT-SHM: {shm.name}")
+    pil_frame, mss_frame, _ = (frame for _, frame in results.values())
+    print(f"identical pixels: {pil_frame.shape == mss_frame.shape and np.array_equal(pil_frame, mss_frame)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Cloud translation engine transport benchmark.
+
+Runs the LibreTranslate and Azure plugins against a local stub HTTP server
+that speaks both APIs (single texts and array requests) and adds a fixed
+delay per request to stand in for network round trips.  For each engine
+it compares:
+
+- one ``requests.post`` per text on a fresh connection, one after another
+  (the former behaviour),
+- per-text requests on the pooled keep-alive session, ``max_concurrency``
+  at a time,
+- native array requests on the pooled session.
+
+Every translation is checked against the expected output, and
+``--fail-every`` makes the stub answer every n-th request with a 503 (first
+attempts only) to exercise retry/backoff.  Needs only ``requests``.  Run from the project
+root::
+
+    python -m app.benchmark.cloud_translation_benchmark --texts 40 --rtt-ms 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from plugins.stages.translation.azure.azure_engine import TranslationEngine as AzureEngine
+from plugins.stages.translation.libretranslate.libretranslate_engine import (
+    TranslationEngine as LibreEngine,
+)
+
+
+def _translate(text: str, tgt: str) -> str:
+    return f"<{tgt}>{text}"
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, rtt_ms: float, fail_every: int) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay_s = rtt_ms / 1000.0
+        self.fail_every = fail_every
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+            self.failures = 0
+            self.seen: set[str] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # client's delayed ACK adds ~40 ms to every keep-alive request
+    disable_nagle_algorithm = True
+    server: _StubServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, status: int, body: Any, headers: dict[str, str] | None = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        self._reply(200, [{"code": code} for code in ("en", "de", "fr", "ja")])
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        time.sleep(self.server.delay_s)
+        with self.server.lock:
+            self.server.requests += 1
+            # Only first attempts fail, so every retry gets through
+            payload = json.dumps(body, sort_keys=True)
+            first = payload not in self.server.seen
+            self.server.seen.add(payload)
+            fail = (first and self.server.fail_every
+                    and self.server.requests % self.server.fail_every == 0)
+            if fail:
+                self.server.failures += 1
+        if fail:
+            self._reply(503, {"error": "busy"}, {"Retry-After": "0"})
+        elif isinstance(body, list):
+            # Azure Translator v3: [{"text": ...}, ...]
+            tgt = parse_qs(urlparse(self.path).query)["to"][0]
+            self._reply(200, [
+                {"translations": [{"text": _translate(item["text"], tgt), "to": tgt}]}
+                for item in body
+            ])
+        else:
+            # LibreTranslate: q is a string or a list of strings
+            q, tgt = body["q"], body["target"]
+            translated = [_translate(t, tgt) for t in q] if isinstance(q, list) else _translate(q, tgt)
+            self._reply(200, {"translatedText": translated})
+
+
+def _make_engine(kind: str, variant: str, url: str, concurrency: int) -> Any:
+    if kind == "libretranslate":
+        engine = LibreEngine()
+        config = {"api_url": url, "timeout": 10}
+    else:
+        engine = AzureEngine()
+        config = {"api_key": "stub", "endpoint": url}
+    config["max_concurrency"] = 1 if variant == "sequential" else concurrency
+    config["max_retries"] = 3
+    if not engine.initialize(config):
+        raise SystemExit(f"{kind} failed to initialize against the stub server")
+    engine._retry_backoff = 0.0
+    if variant != "native batch":
+        engine._native_batch_size = 0
+    if variant == "sequential":
+        # The module-level requests API opens a new connection per call
+        engine._get_session = lambda: requests
+    return engine
+
+
+def _run(engine: Any, server: _StubServer, texts: list[str], repeats: int) -> dict[str, Any]:
+    samples = []
+    server.reset()
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = engine.translate_batch(texts, "en", "de")
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        got = [r.translated_text for r in result.results]
+        if got != [_translate(t, "de") for t in texts] or result.failed_translations:
+            raise SystemExit(f"{engine.engine_name}: wrong translations {got[:3]}...")
+    return {
+        "ms": statistics.median(samples),
+        "requests": server.requests / repeats,
+        "connections": server.connections / repeats,
+        "retried": server.failures / repeats,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--texts", type=int, default=40, help="Texts per translate_batch")
+    parser.add_argument("--rtt-ms", type=float, default=30.0, help="Stub delay per request")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--fail-every", type=int, default=0,
+                        help="Answer every n-th first attempt with 503 (0 = never)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    server = _StubServer(args.rtt_ms, args.fail_every)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    texts = [f"Speech bubble number {i}." for i in range(args.texts)]
+
+    print(f"{args.texts} texts, {args.rtt_ms:g} ms per request, concurrency {args.concurrency}, "
+          f"median per translate_batch")
+    print(f"{'engine':>15}{'variant':>16}{'ms':>9}{'requests':>10}{'connections':>13}{'503s':>7}")
+    for kind in ("libretranslate", "azure"):
+        for variant in ("sequential", "pooled per text", "native batch"):
+            engine = _make_engine(kind, variant, server.url, args.concurrency)
+            row = _run(engine, server, texts, args.repeats)
+            engine.cleanup()
+            print(f"{kind:>15}{variant:>16}{row['ms']:>9.0f}{row['requests']:>10.0f}"
+                  f"{row['connections']:>13.0f}{row['retried']:>7.0f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Damage-driven capture microbenchmark.
+
+Runs capture plus the frame-skip decision for a sequence of frames of a
+synthetic 1920x1080 screen and compares three variants:
+
+- ``full``: grab the whole region every tick and let ``FrameSkipOptimizer``
+  compare thumbnails (the former behaviour)
+- ``tiles``: ``DamageTracker`` without XDamage -- grab the whole region,
+  compare tiles with the persistent buffer, skip the optimizer's
+  comparison when no tile changed
+- ``xdamage``: ``DamageTracker`` fed the damaged rectangles of each tick,
+  as the XDamage extension reports them -- no grab while nothing changed,
+  only the dirty rectangles otherwise
+
+A grab is a copy out of the synthetic screen array, so grab cost here is
+a memory copy; real screen grabs cost more, which favours the variants
+that skip them.  Scenarios: ``static`` (a page being read), ``typing`` (a
+small text box changing every tick) and ``scroll`` (the whole region
+changing every 10th tick).  Run from the project root::
+
+    python -m app.benchmark.damage_capture_benchmark --frames 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from app.capture.damage_tracking import DamageTracker
+from app.models import CaptureRegion, Frame, Rectangle
+from plugins.enhancers.optimizers.frame_skip.optimizer import FrameSkipOptimizer
+
+
+class _ScriptedDamage:
+    """Stands in for ``XDamageMonitor``: reports what the scenario drew."""
+
+    def __init__(self):
+        self.rects = []
+
+    def poll(self):
+        rects, self.rects = self.rects, []
+        return rects
+
+    def close(self):
+        pass
+
+
+def _scenario(name: str, tick: int, screen: np.ndarray, rng) -> list[tuple[int, int, int, int]]:
+    """Draw this tick's change into *screen*; return the damaged rects."""
+    if name == "typing":
+        x, y, w, h = 400 + (tick % 40) * 12, 300, 12, 24
+    elif name == "scroll" and tick % 10 == 0:
+        x, y, w, h = 0, 0, screen.shape[1], screen.shape[0]
+    else:
+        return []
+    screen[y:y + h, x:x + w] = rng.integers(0, 255, (h, w, 3), dtype=np.uint8)
+    return [(x, y, w, h)]
+
+
+def _run(variant: str, scenario: str, region: dict, frames: int, seed: int) -> tuple[list[float], int]:
+    rng = np.random.default_rng(seed)
+    screen = rng.integers(0, 255, (1080, 1920, 3), dtype=np.uint8)
+
+    def grab(r: dict) -> np.ndarray:
+        return screen[r["y"]:r["y"] + r["height"], r["x"]:r["x"] + r["width"]].copy()
+
+    tracker = None
+    damage = _ScriptedDamage()
+    if variant != "full":
+        tracker = DamageTracker(use_xdamage=False, refresh_interval=1e9)
+        if variant == "xdamage":
+            tracker._xdamage = damage
+    optimizer = FrameSkipOptimizer({"adaptive_backoff": False})
+    source = CaptureRegion(rectangle=Rectangle(region["x"], region["y"],
+                                               region["width"], region["height"]))
+
+    samples = []
+    processed = 0
+    for tick in range(frames + 1):
+        damage.rects.extend(_scenario(scenario, tick, screen, rng))
+        t0 = time.perf_counter()
+        metadata = {}
+        if tracker is None:
+            data = grab(region)
+        else:
+            data, metadata["dirty_rects"] = tracker.capture(region, grab)
+        frame = Frame(data=data, timestamp=time.time(), source_region=source, metadata=metadata)
+        result = optimizer.process({"frame": frame})
+        if tick:  # the first frame fills buffers
+            samples.append((time.perf_counter() - t0) * 1000.0)
+            processed += not result["skip_processing"]
+    return samples, processed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--width", type=int, default=1280, help="Region width")
+    parser.add_argument("--height", type=int, default=720, help="Region height")
+    parser.add_argument("--frames", type=int, default=120, help="Ticks per run")
+    parser.add_argument("--scenarios", default="static,typing,scroll")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    region = {"x": 200, "y": 100, "width": args.width, "height": args.height}
+    print(f"{args.width}x{args.height} region, {args.frames} ticks, "
+          "ms per tick for capture + frame-skip decision")
+    print(f"{'scenario':>9}{'variant':>9}{'median ms':>11}{'mean ms':>9}{'processed':>11}")
+    for scenario in args.scenarios.split(","):
+        for variant in ("full", "tiles", "xdamage"):
+            samples, processed = _run(variant, scenario, region, args.frames, args.seed)
+            print(f"{scenario:>9}{variant:>9}{statistics.median(samples):>11.2f}"
+                  f"{statistics.mean(samples):>9.2f}{processed:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+SmartDictionary fuzzy lookup microbenchmark.
+
+Builds synthetic en->de dictionaries with 10k, 100k and 1M entries and
+times ``SmartDictionary.fuzzy_lookup`` for typo'd queries, comparing the
+``FuzzyIndex`` candidate lookup with a full scan that scores every entry
+(the former behaviour).  The full scan is only run up to
+``--scan-max`` entries because it takes seconds per query beyond that.
+
+Run from the project root::
+
+    python -m app.benchmark.dictionary_fuzzy_benchmark --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import string
+import tempfile
+import time
+from typing import Any
+
+from app.text_translation.fuzzy_index import FuzzyIndex
+from app.text_translation.smart_dictionary import SmartDictionary
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+_PAIR = ("en", "de")
+
+
+def _make_dictionary(size: int, seed: int = 0) -> dict[str, dict]:
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+        for _ in range(20_000)
+    ]
+    dictionary: dict[str, dict] = {}
+    while len(dictionary) < size:
+        words = rng.randint(1, 5)
+        phrase = " ".join(rng.choices(vocabulary, k=words))
+        dictionary[phrase] = {"translation": phrase.upper(), "usage_count": 1, "confidence": 0.9}
+    return dictionary
+
+
+def _typo(text: str, rng: random.Random) -> str:
+    i = rng.randrange(len(text))
+    return text[:i] + rng.choice(string.ascii_lowercase) + text[i + 1:]
+
+
+class _FullScan(FuzzyIndex):
+    """Index stand-in that proposes every key, i.e. the O(N) scan."""
+
+    def candidates(self, text: str, limit: int = 50, min_length_ratio: float = 0.3) -> list[str]:
+        return [k for k in self._keys if k is not None]
+
+
+class _ScanDictionary(SmartDictionary):
+    def _get_fuzzy_index(self, lang_pair, dictionary):
+        return _FullScan(dictionary)
+
+
+def _dictionary(cls: type[SmartDictionary], data: dict[str, dict]) -> SmartDictionary:
+    with tempfile.TemporaryDirectory() as empty_dir:
+        sd = cls(dictionary_path=empty_dir, cache_size=16)
+    sd._dictionaries[_PAIR] = data
+    return sd
+
+
+def _time_queries(sd: SmartDictionary, queries: list[str]) -> tuple[float, int]:
+    samples = []
+    hits = 0
+    for query in queries:
+        t0 = time.perf_counter()
+        matches = sd.fuzzy_lookup(query, *_PAIR, threshold=0.5)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        hits += bool(matches)
+    return statistics.median(samples), hits
+
+
+def run(sizes: list[int], queries: int, scan_max: int) -> list[dict[str, Any]]:
+    rows = []
+    for size in sizes:
+        data = _make_dictionary(size)
+        rng = random.Random(size)
+        keys = rng.sample(list(data), queries)
+        typos = [_typo(k, rng) for k in keys]
+
+        indexed = _dictionary(SmartDictionary, data)
+        t0 = time.perf_counter()
+        with indexed._lock:
+            indexed._get_fuzzy_index(_PAIR, data)
+        build_s = time.perf_counter() - t0
+
+        row: dict[str, Any] = {"entries": size, "build_s": build_s}
+        row["indexed"] = _time_queries(indexed, typos)
+        if size <= scan_max:
+            row["full scan"] = _time_queries(_dictionary(_ScanDictionary, data), typos[:max(3, queries // 10)])
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--scan-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"median ms per fuzzy_lookup (queries with a match / queries), threshold 0.5")
+    print(f"{'entries':>9}{'index build s':>15}{'indexed':>20}{'full scan':>20}")
+    for row in run(args.sizes, args.queries, args.scan_max):
+        cells = ""
+        for name in ("indexed", "full scan"):
+            if name in row:
+                ms, hits = row[name]
+                n = args.queries if name == "indexed" else max(3, args.queries // 10)
+                cells += f"{ms:>11.2f} ({hits:>3}/{n:<3})"
+            else:
+                cells += f"{'-':>20}"
+        print(f"{row['entries']:>9}{row['build_s']:>15.2f}{cells}")
+
+
+if __name__ == "__main__":
+    main()
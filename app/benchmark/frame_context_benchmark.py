@@ -0,0 +1,149 @@
+"""
+Per-frame allocation microbenchmark for stage hand-offs.
+
+Compares the old hand-off (``dict(data)`` at every stage hop plus a
+full-frame copy for overlay masking) against ``FrameContext.fork()`` with
+copy-on-write masking of only the ROI crops that touch an overlay.
+Allocations are counted with ``tracemalloc`` (NumPy reports its buffers
+to it), so the numbers include pixel copies.
+
+Run from the project root::
+
+    python -m app.benchmark.frame_context_benchmark --frames 200 --stages 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from app.models import Rectangle
+from app.workflow.pipeline.frame_context import FrameContext
+from app.workflow.pipeline.stages import OCRStage
+
+_MARGIN = 4
+
+
+def _initial_data(width: int, height: int) -> dict[str, Any]:
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame.flags.writeable = False
+    return {
+        "region": Rectangle(0, 0, width, height),
+        "source": "custom_region",
+        "_overlay_positions": [Rectangle(100 + 300 * i, 200, 240, 60) for i in range(3)],
+        "_pipeline_start": time.perf_counter(),
+        "_frame_seq": 1,
+        "frame": frame,
+        "roi_regions": [Rectangle(80 + 200 * i, 180 + 40 * (i % 3), 180, 90) for i in range(8)],
+        "frame_changed": False,
+        "skip_processing": False,
+        "source_language": "ja",
+        "target_language": "en",
+    }
+
+
+def _mask_full_frame(data: dict[str, Any]) -> list[np.ndarray]:
+    """Old behaviour: copy and paint the whole frame, then slice crops."""
+    masked = data["frame"].copy()
+    h, w = masked.shape[:2]
+    for pos in data["_overlay_positions"]:
+        x0, y0 = max(0, pos.x - _MARGIN), max(0, pos.y - _MARGIN)
+        x1 = min(w, pos.x + pos.width + _MARGIN)
+        y1 = min(h, pos.y + pos.height + _MARGIN)
+        masked[y0:y1, x0:x1] = 255
+    return [masked[r.y:r.y + r.height, r.x:r.x + r.width] for r in data["roi_regions"]]
+
+
+def _mask_crops(data: Any) -> list[np.ndarray]:
+    """New behaviour: mask each ROI crop, copying only the ones hit."""
+    frame = data["frame"]
+    positions = data["_overlay_positions"]
+    return [
+        OCRStage._mask_overlay_regions(
+            frame[r.y:r.y + r.height, r.x:r.x + r.width],
+            positions, _MARGIN, origin=(r.x, r.y),
+        )
+        for r in data["roi_regions"]
+    ]
+
+
+def _frame_dict(initial: dict[str, Any], stages: int) -> dict[str, Any]:
+    data = dict(initial)
+    for i in range(stages):
+        if i == 1:
+            data["crops"] = _mask_full_frame(data)
+        data.update({f"stage_{i}": i})
+        data = dict(data)
+    return data
+
+
+def _frame_context(initial: dict[str, Any], stages: int) -> dict[str, Any]:
+    data = FrameContext(initial)
+    for i in range(stages):
+        if i == 1:
+            data["crops"] = _mask_crops(data)
+        data.update({f"stage_{i}": i})
+        data = data.fork()
+    return data.to_dict()
+
+
+def _measure(fn: Callable[[dict[str, Any], int], Any], initial: dict[str, Any],
+             stages: int, frames: int) -> dict[str, float]:
+    fn(initial, stages)  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        fn(initial, stages)
+    elapsed = time.perf_counter() - t0
+
+    # Allocations still alive when the frame leaves the pipeline, i.e.
+    # everything the hand-offs created for it (sampled, snapshots are slow)
+    samples = max(1, min(frames, 20))
+    blocks = size = 0
+    tracemalloc.start()
+    for _ in range(samples):
+        before = tracemalloc.take_snapshot()
+        result = fn(initial, stages)
+        after = tracemalloc.take_snapshot()
+        for stat in after.compare_to(before, "filename"):
+            if stat.size_diff > 0:
+                blocks += stat.count_diff
+                size += stat.size_diff
+        del result
+    tracemalloc.stop()
+    return {
+        "allocs_per_frame": blocks / samples,
+        "kib_per_frame": size / samples / 1024,
+        "us_per_frame": elapsed / frames * 1e6,
+    }
+
+
+def run(frames: int, stages: int, width: int, height: int) -> list[dict[str, Any]]:
+    initial = _initial_data(width, height)
+    return [
+        {"variant": "dict copy", **_measure(_frame_dict, initial, stages, frames)},
+        {"variant": "FrameContext", **_measure(_frame_context, initial, stages, frames)},
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--stages", type=int, default=4)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    print(f"{args.width}x{args.height} BGR, {args.stages} stages, {args.frames} frames "
+          f"(allocations alive at pipeline exit)")
+    print(f"{'variant':<14}{'allocs/frame':>14}{'KiB/frame':>12}{'us/frame':>10}")
+    for row in run(args.frames, args.stages, args.width, args.height):
+        print(f"{row['variant']:<14}{row['allocs_per_frame']:>14.1f}"
+              f"{row['kib_per_frame']:>12.1f}{row['us_per_frame']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
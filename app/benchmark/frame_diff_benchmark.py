@@ -0,0 +1,125 @@
+"""
+Frame differencing microbenchmark.
+
+Times ``FrameDifferenceEngine.calculate_difference`` on synthetic frame
+pairs with 10-500 changed blobs, comparing the former per-component mask
+loop in ``_find_change_regions`` with the single-pass ``np.bincount``
+version, and the bincount version on 1/2 and 1/4 resolution pyramids.
+
+Run from the project root::
+
+    python -m app.benchmark.frame_diff_benchmark --width 1920 --height 1080
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import Any
+
+import cv2
+import numpy as np
+
+from app.models import CaptureRegion, Frame, Rectangle
+from app.preprocessing.frame_differencing import (
+    ChangeRegion,
+    DifferenceConfig,
+    FrameDifferenceEngine,
+)
+
+BLOB_COUNTS = (10, 50, 100, 250, 500)
+
+
+def _frame(data: np.ndarray) -> Frame:
+    h, w = data.shape[:2]
+    return Frame(
+        data=data, timestamp=time.time(),
+        source_region=CaptureRegion(rectangle=Rectangle(0, 0, w, h)),
+    )
+
+
+def _make_pair(width: int, height: int, blobs: int, seed: int = 0) -> tuple[Frame, Frame]:
+    rng = np.random.default_rng(seed)
+    base = rng.integers(90, 110, size=(height, width, 3), dtype=np.uint8)
+    changed = base.copy()
+    for _ in range(blobs):
+        bw, bh = (int(v) for v in rng.integers(12, 60, size=2))
+        x = int(rng.integers(0, width - bw))
+        y = int(rng.integers(0, height - bh))
+        colour = tuple(int(c) for c in rng.integers(180, 256, size=3))
+        cv2.rectangle(changed, (x, y), (x + bw, y + bh), colour, thickness=-1)
+    return _frame(changed), _frame(base)
+
+
+class _LegacyEngine(FrameDifferenceEngine):
+    """Engine with the former O(components x pixels) region statistics."""
+
+    def _find_change_regions(self, binary_diff: np.ndarray, diff_map: np.ndarray,
+                             scale: int = 1) -> list[ChangeRegion]:
+        regions = []
+        num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(binary_diff, connectivity=8)
+        for i in range(1, num_labels):
+            x, y, w, h, area = stats[i]
+            if area < self.config.min_change_area:
+                continue
+            change_intensity = np.mean(diff_map[labels == i])
+            confidence = min(1.0, (area / 1000.0) * change_intensity * 2.0)
+            regions.append(ChangeRegion(
+                rectangle=Rectangle(x, y, w, h),
+                change_intensity=change_intensity,
+                pixel_count=area,
+                confidence=confidence,
+            ))
+        regions.sort(key=lambda r: r.confidence, reverse=True)
+        return regions
+
+
+def _time(engine: FrameDifferenceEngine, current: Frame, previous: Frame,
+          repeats: int) -> tuple[float, int]:
+    result = engine.calculate_difference(current, previous)  # warm-up
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = engine.calculate_difference(current, previous)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples), len(result.change_regions)
+
+
+def run(width: int, height: int, repeats: int) -> list[dict[str, Any]]:
+    # Synthetic blobs are smaller than the default 100 px minimum after
+    # 4x downscaling is accounted for, so keep the filter permissive.
+    variants = {
+        "legacy": _LegacyEngine(DifferenceConfig(min_change_area=50)),
+        "bincount": FrameDifferenceEngine(DifferenceConfig(min_change_area=50)),
+        "bincount 1/2": FrameDifferenceEngine(DifferenceConfig(min_change_area=50, pyramid_levels=1)),
+        "bincount 1/4": FrameDifferenceEngine(DifferenceConfig(min_change_area=50, pyramid_levels=2)),
+    }
+    rows = []
+    for blobs in BLOB_COUNTS:
+        current, previous = _make_pair(width, height, blobs)
+        row: dict[str, Any] = {"blobs": blobs}
+        for name, engine in variants.items():
+            row[name] = _time(engine, current, previous, repeats)
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.width, args.height, args.repeats)
+    names = [k for k in rows[0] if k != "blobs"]
+    print(f"{args.width}x{args.height}, median ms (regions found)")
+    print(f"{'blobs':>6}" + "".join(f"{n:>18}" for n in names))
+    for row in rows:
+        cells = "".join(f"{row[n][0]:>11.1f} ({row[n][1]:>3})" for n in names)
+        print(f"{row['blobs']:>6}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Subprocess IPC microbenchmark.
+
+Measures frame round-trip latency through ``OCRSubprocess`` for the
+line-delimited JSON protocol (base64 frames), the binary length-prefixed
+protocol (raw payload) and the binary protocol with the shared-memory
+frame ring, plus pipelined throughput with several requests in flight.
+
+Run from the project root::
+
+    python -m app.benchmark.ipc_benchmark --frames 100 --width 1920 --height 1080
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.models import CaptureRegion, Frame, Rectangle
+from app.workflow.base.ipc_protocol import PROTOCOL_BINARY, PROTOCOL_JSON
+from app.workflow.subprocesses.ocr_subprocess import OCRSubprocess
+
+ECHO_WORKER = str(Path(__file__).resolve().parent / "ipc_echo_worker.py")
+
+
+def _make_frame(width: int, height: int) -> Frame:
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    region = CaptureRegion(rectangle=Rectangle(0, 0, width, height))
+    return Frame(data=data, timestamp=time.time(), source_region=region)
+
+
+def _start(protocol: str, shared_memory: bool) -> OCRSubprocess:
+    sub = OCRSubprocess("echo", ECHO_WORKER, protocol=protocol)
+    sub.shared_memory = shared_memory
+    if not sub.start({}):
+        raise RuntimeError(f"Echo worker failed to start ({protocol})")
+    return sub
+
+
+def _latency(sub: OCRSubprocess, frame: Frame, frames: int) -> list[float]:
+    sub.process_data({"frame": frame})  # warm-up
+    samples = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        if sub.process_data({"frame": frame}) is None:
+            raise RuntimeError("Echo worker returned no result")
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def _pipelined_fps(sub: OCRSubprocess, frame: Frame, frames: int, depth: int) -> float:
+    t0 = time.perf_counter()
+    in_flight: list[int] = []
+    for _ in range(frames):
+        request_id = sub.submit({"frame": frame})
+        if request_id is not None:
+            in_flight.append(request_id)
+        if len(in_flight) >= depth:
+            sub.collect(in_flight.pop(0))
+    for request_id in in_flight:
+        sub.collect(request_id)
+    return frames / (time.perf_counter() - t0)
+
+
+def run(frames: int, width: int, height: int, depth: int) -> list[dict]:
+    """Run every protocol variant and return one row per variant."""
+    frame = _make_frame(width, height)
+    variants = [
+        ("json+base64", PROTOCOL_JSON, False),
+        ("binary", PROTOCOL_BINARY, False),
+        ("binary+shm", PROTOCOL_BINARY, True),
+    ]
+    rows = []
+    for label, protocol, shm in variants:
+        sub = _start(protocol, shm)
+        try:
+            samples = _latency(sub, frame, frames)
+            fps = _pipelined_fps(sub, frame, frames, depth)
+        finally:
+            sub.stop()
+        rows.append({
+            "variant": label,
+            "median_ms": statistics.median(samples),
+            "p95_ms": sorted(samples)[int(len(samples) * 0.95) - 1],
+            "pipelined_fps": fps,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--depth", type=int, default=2,
+                        help="requests in flight for the pipelined run")
+    args = parser.parse_args()
+
+    print(f"{args.width}x{args.height} BGR, {args.frames} frames")
+    print(f"{'variant':<14}{'median ms':>12}{'p95 ms':>10}{'pipelined fps':>16}")
+    for row in run(args.frames, args.width, args.height, args.depth):
+        print(f"{row['variant']:<14}{row['median_ms']:>12.2f}{row['p95_ms']:>10.2f}"
+              f"{row['pipelined_fps']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
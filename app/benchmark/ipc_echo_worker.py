@@ -0,0 +1,34 @@
+"""
+Echo worker used by ``ipc_benchmark``.
+
+Decodes each frame exactly like an OCR plugin worker and replies with a
+single fake text block, so the measured time is pure IPC overhead.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from app.workflow.base.base_worker import BaseWorker
+from app.workflow.base.ocr_frame_utils import decode_frame
+
+
+class EchoWorker(BaseWorker):
+    """Worker that decodes the frame and returns a constant result."""
+
+    def initialize(self, config: dict) -> bool:
+        return True
+
+    def process(self, data: dict) -> dict:
+        frame, error = decode_frame(data)
+        if error:
+            return {'error': error}
+        return {
+            'text_blocks': [{'text': 'echo', 'bbox': [0, 0, frame.shape[1], frame.shape[0]], 'confidence': 1.0}],
+            'count': 1,
+        }
+
+
+if __name__ == '__main__':
+    EchoWorker(name="EchoWorker").run()
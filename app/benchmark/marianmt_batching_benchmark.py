@@ -0,0 +1,162 @@
+"""
+MarianMT batching microbenchmark (CPU).
+
+Translates a mix of short speech-bubble texts and a few long paragraphs
+(one longer than ``max_length``) with ``TranslationEngine.translate_batch``
+and compares the former single padded batch with sentence splitting plus
+length-bucketed generation.  Besides latency it reports the padded source
+tokens fed to the encoder and how many source tokens the former path
+silently truncated.
+
+Needs ``torch``, ``transformers`` and ``sentencepiece``, plus the model
+(downloaded on first use, or pass a local directory with ``--model``).
+Run from the project root::
+
+    python -m app.benchmark.marianmt_batching_benchmark --short 24 --long 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any
+
+from plugins.stages.translation.marianmt_gpu.marianmt_engine import (
+    TRANSFORMERS_AVAILABLE,
+    TranslationEngine,
+)
+
+_SHORT_TEXTS = [
+    "Hello!", "Where are you going?", "Wait for me.", "I can't believe it...",
+    "What's that sound?", "Thank you so much!", "Let's go.", "Is anyone there?",
+    "Don't move!", "It's getting late, we should head back.",
+]
+_SENTENCES = [
+    "The old lighthouse keeper had not spoken to anyone in three weeks.",
+    "Every evening he climbed the narrow stairs and lit the great lamp.",
+    "Ships passed far out at sea, their lights blinking like distant stars.",
+    "One night a small boat drifted toward the rocks with no one at the oars.",
+    "He ran down to the shore, shouting into the wind and the rain.",
+    "By morning the storm had passed and the boat lay quietly on the sand.",
+]
+
+
+def _make_texts(short: int, long: int, long_sentences: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    texts = [rng.choice(_SHORT_TEXTS) for _ in range(short)]
+    for i in range(long):
+        # The first paragraph is long enough to exceed max_length
+        count = long_sentences * (4 if i == 0 else 1)
+        texts.append(" ".join(rng.choice(_SENTENCES) for _ in range(count)))
+    rng.shuffle(texts)
+    return texts
+
+
+class _Engine(TranslationEngine):
+    model_name = "Helsinki-NLP/opus-mt-en-de"
+
+    def _get_model_name(self, src_lang: str, tgt_lang: str) -> str:
+        return self.model_name
+
+
+class _LegacyEngine(_Engine):
+    """Engine with the former single padded, truncating batch."""
+
+    def _translate_texts(self, texts, tgt_lang, model, tokenizer):
+        import torch
+        inputs = tokenizer(texts, return_tensors="pt", padding=True,
+                           truncation=True, max_length=self._max_length)
+        inputs = {k: v.to(self._device or torch.device("cpu")) for k, v in inputs.items()}
+        translated = model.generate(
+            **inputs,
+            max_length=self._max_length,
+            num_beams=self._num_beams,
+            early_stopping=True,
+        )
+        return tokenizer.batch_decode(translated, skip_special_tokens=True), {}
+
+
+def _encoder_tokens(engine: TranslationEngine, texts: list[str], tokenizer, legacy: bool) -> tuple[int, int]:
+    """Return (padded source tokens, truncated source tokens)."""
+    lengths = [len(ids) for ids in tokenizer(texts, truncation=False)["input_ids"]]
+    if legacy:
+        width = min(max(lengths), engine._max_length)
+        truncated = sum(max(0, n - engine._max_length) for n in lengths)
+        return width * len(lengths), truncated
+    seg_lengths = [len(ids) for _, ids in engine._plan_segments(texts, tokenizer)]
+    padded = sum(
+        len(bucket) * max(seg_lengths[k] for k in bucket)
+        for bucket in engine._make_buckets(seg_lengths)
+    )
+    return padded, 0
+
+
+def _time(engine: TranslationEngine, texts: list[str], repeats: int) -> float:
+    engine.translate_batch(texts, "en", "de")  # warm-up
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        engine.translate_batch(texts, "en", "de")
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def run(model: str, short: int, long: int, long_sentences: int, repeats: int,
+        config: dict[str, Any]) -> list[dict[str, Any]]:
+    texts = _make_texts(short, long, long_sentences)
+    rows = []
+    for name, cls in (("single batch", _LegacyEngine), ("bucketed", _Engine)):
+        engine = cls()
+        engine.model_name = model
+        engine.initialize({"gpu": False, "runtime_mode": "cpu", **config})
+        _, tokenizer = engine._load_model("en", "de")
+        padded, truncated = _encoder_tokens(engine, texts, tokenizer, cls is _LegacyEngine)
+        rows.append({
+            "variant": name,
+            "ms": _time(engine, texts, repeats),
+            "padded_tokens": padded,
+            "truncated_tokens": truncated,
+        })
+        engine.cleanup()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default=_Engine.model_name,
+                        help="Hugging Face model id or local model directory")
+    parser.add_argument("--short", type=int, default=24, help="Short texts per batch")
+    parser.add_argument("--long", type=int, default=2, help="Long paragraphs per batch")
+    parser.add_argument("--long-sentences", type=int, default=8,
+                        help="Sentences per long paragraph (the first gets 4x)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--num-beams", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--token-budget", type=int, default=2048)
+    parser.add_argument("--threads", type=int, default=0, help="torch CPU threads (0 = default)")
+    args = parser.parse_args()
+
+    if not TRANSFORMERS_AVAILABLE:
+        raise SystemExit("transformers is not installed")
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+
+    config = {
+        "num_beams": args.num_beams,
+        "batch_size": args.batch_size,
+        "batch_token_budget": args.token_budget,
+    }
+    rows = run(args.model, args.short, args.long, args.long_sentences, args.repeats, config)
+    print(f"{args.short} short + {args.long} long texts, {args.num_beams} beams, "
+          f"median ms per translate_batch")
+    print(f"{'variant':>14}{'ms':>10}{'padded src tokens':>20}{'truncated tokens':>19}")
+    for row in rows:
+        print(f"{row['variant']:>14}{row['ms']:>10.0f}{row['padded_tokens']:>20}"
+              f"{row['truncated_tokens']:>19}")
+
+
+if __name__ == "__main__":
+    main()
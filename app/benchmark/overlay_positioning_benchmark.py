@@ -0,0 +1,143 @@
+"""
+Overlay positioning microbenchmark.
+
+Places 10, 100 and 500 translation overlays on a 1920x1080 screen with
+``IntelligentPositioningEngine`` and compares the former collision search
+(every spiral candidate tested against every placed rectangle, in input
+order) with the grid index.  Reports median milliseconds per
+``calculate_optimal_positions`` call, how many overlays had to move, and
+whether the call fits the placement budget.
+
+Layouts are labels on a jittered lattice over the whole screen, like a
+dense wiki or game-UI page, shuffled with a fixed seed; ``--density``
+scales the boxes relative to their lattice cell (1.0 = many overlaps).
+Run from the project root::
+
+    python -m app.benchmark.overlay_positioning_benchmark --budget-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import time
+
+from app.models import Rectangle, Translation
+from app.overlay.intelligent_positioning import _SPIRAL_UNITS, IntelligentPositioningEngine
+
+
+class _LegacyEngine(IntelligentPositioningEngine):
+    """The former search: linear scan over all placed rectangles, input order."""
+
+    def _apply_intelligent_positioning(self, translations):
+        positioned = []
+        existing = []
+        for translation in translations:
+            rect = self._legacy_best(translation.position, existing)
+            positioned.append(Translation(
+                original_text=translation.original_text,
+                translated_text=translation.translated_text,
+                source_language=translation.source_language,
+                target_language=translation.target_language,
+                position=rect,
+                confidence=translation.confidence,
+                engine_used=translation.engine_used,
+            ))
+            existing.append(rect)
+        return positioned
+
+    def _legacy_best(self, rect, existing):
+        if not self._has_collision(rect, existing):
+            return rect
+        gap = self.collision_padding + 5
+        for ring in range(1, self._MAX_SPIRAL_RINGS + 1):
+            for candidate in self._spiral_candidates(rect, gap, ring):
+                if self._is_on_screen(candidate) and not self._has_collision(candidate, existing):
+                    return candidate
+        return rect
+
+    @staticmethod
+    def _spiral_candidates(rect, gap, ring):
+        dx = (rect.width + gap) * ring
+        dy = (rect.height + gap) * ring
+        return [Rectangle(rect.x + ux * dx, rect.y + uy * dy, rect.width, rect.height)
+                for ux, uy in _SPIRAL_UNITS]
+
+    def _has_collision(self, rect, existing_rects):
+        p = self.collision_padding
+        for existing in existing_rects:
+            if not (rect.x + rect.width + p < existing.x or
+                    existing.x + existing.width + p < rect.x or
+                    rect.y + rect.height + p < existing.y or
+                    existing.y + existing.height + p < rect.y):
+                return True
+        return False
+
+    def _is_on_screen(self, rect):
+        left, top, right, bottom = self._placement_bounds()
+        return (rect.x >= left and rect.y >= top and
+                rect.x + rect.width <= right and rect.y + rect.height <= bottom)
+
+
+def _layout(count: int, density: float, seed: int) -> list[Translation]:
+    """Labels on a jittered lattice covering the screen, like a dense UI.
+
+    Boxes are ``density`` times the lattice cell on average, so neighbours
+    overlap and have to be moved apart.
+    """
+    rng = random.Random(seed)
+    cols = max(1, math.ceil(math.sqrt(count * 16 / 9)))
+    rows = max(1, math.ceil(count / cols))
+    cell_w, cell_h = 1920 // cols, 1080 // rows
+    out = []
+    for i in range(count):
+        w = max(8, int(cell_w * density * rng.uniform(0.6, 1.4)))
+        h = max(8, int(cell_h * density * rng.uniform(0.4, 0.8)))
+        x = (i % cols) * cell_w + rng.randint(0, cell_w // 4)
+        y = (i // cols) * cell_h + rng.randint(0, cell_h // 4)
+        out.append(Translation(
+            original_text=f"text {i}", translated_text=f"translation {i}",
+            source_language="ja", target_language="en",
+            position=Rectangle(min(x, 1910 - w), min(y, 1070 - h), w, h),
+            confidence=0.9, engine_used="bench",
+        ))
+    rng.shuffle(out)
+    return out
+
+
+def _time(engine: IntelligentPositioningEngine, layout: list[Translation],
+          repeats: int) -> tuple[float, int]:
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = engine.calculate_optimal_positions(layout)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    moved = sum(1 for a, b in zip(layout, result)
+                if (a.position.x, a.position.y) != (b.position.x, b.position.y))
+    return statistics.median(samples), moved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--counts", default="10,100,500", help="Comma-separated overlay counts")
+    parser.add_argument("--density", type=float, default=0.8,
+                        help="Box size relative to the lattice cell")
+    parser.add_argument("--budget-ms", type=float, default=2.0)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"1920x1080 screen, density {args.density:g}, median ms per placement")
+    print(f"{'overlays':>9}{'variant':>10}{'ms':>9}{'moved':>7}{'in budget':>11}")
+    for count in (int(c) for c in args.counts.split(",")):
+        layout = _layout(count, args.density, args.seed)
+        for name, cls in (("linear", _LegacyEngine), ("grid", IntelligentPositioningEngine)):
+            ms, moved = _time(cls(), layout, args.repeats)
+            print(f"{count:>9}{name:>10}{ms:>9.2f}{moved:>7}"
+                  f"{'yes' if ms <= args.budget_ms else 'no':>11}")
+
+
+if __name__ == "__main__":
+    main()
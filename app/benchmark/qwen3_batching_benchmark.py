@@ -0,0 +1,113 @@
+"""
+Qwen3 batched generation microbenchmark (CPU).
+
+Translates a page of speech-bubble texts with the Qwen3 translation
+engine and compares one full-prompt ``generate`` call per text (the former
+behaviour) with left-padded batches that reuse the cached KV state of the
+shared system prompt and chat template.  Reports latency per
+``translate_batch`` and the prompt tokens each variant runs through the
+model, and checks that greedy outputs are identical.
+
+Needs ``torch`` and ``transformers`` plus a Qwen3 model (downloaded on
+first use, or pass a local directory with ``--model``).  Run from the
+project root::
+
+    python -m app.benchmark.qwen3_batching_benchmark --texts 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from app.llm.batched_generation import shared_prefix
+from plugins.stages.translation.qwen3.worker import (
+    _THINK_START,
+    TRANSFORMERS_AVAILABLE,
+    TranslationEngine,
+)
+
+_TEXTS = [
+    "Hello!", "Where are you going?", "Wait for me.", "I can't believe it...",
+    "What's that sound?", "Thank you so much!", "Let's go.", "Is anyone there?",
+    "Don't move!", "It's getting late, we should head back.", "Open the door.",
+    "Who are you?", "I'll be right back.", "This way, quickly!",
+]
+
+
+class _LegacyEngine(TranslationEngine):
+    """One uncached, unbatched generate call per text."""
+
+    def _generate_translations(self, texts, src_lang, tgt_lang, options, strict_mode):
+        generator = self._get_generator()
+        out = []
+        for text in texts:
+            prompt = self._render_prompt(text, src_lang, tgt_lang, options, strict_mode)
+            ids = generator.generate(
+                [prompt], max_batch_size=1, max_input_tokens=self._max_length,
+                max_new_tokens=min(self._max_length, 64), do_sample=False,
+                repetition_penalty=1.1, pad_token_id=self.tokenizer.eos_token_id,
+                suppress_tokens=[_THINK_START],
+            )[0]
+            out.append(self._decode_output(ids))
+        return out
+
+
+def _prompt_tokens(engine: TranslationEngine, texts: list[str], cached: bool) -> int:
+    def render(text: str) -> str:
+        return engine._render_prompt(text, "en", "de", None, False)
+
+    total = sum(len(engine.tokenizer(render(t))["input_ids"]) for t in texts)
+    if not cached:
+        return total
+    prefix = len(engine.tokenizer(shared_prefix(render))["input_ids"])
+    return total - prefix * len(texts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default="Qwen/Qwen3-0.6B",
+                        help="Hugging Face model id or local model directory")
+    parser.add_argument("--texts", type=int, default=12, help="Texts per translate_batch")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=0, help="torch CPU threads (0 = default)")
+    args = parser.parse_args()
+
+    if not TRANSFORMERS_AVAILABLE:
+        raise SystemExit("transformers is not installed")
+    import torch
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    texts = [_TEXTS[i % len(_TEXTS)] for i in range(args.texts)]
+    outputs = {}
+    print(f"{args.texts} texts, batch size {args.batch_size}, median ms per translate_batch")
+    print(f"{'variant':>22}{'ms':>10}{'ms/text':>10}{'prompt tokens':>16}")
+    for name, cls in (("per text", _LegacyEngine), ("batched + prefix cache", TranslationEngine)):
+        engine = cls()
+        if not engine.initialize({"model_name": args.model, "gpu": False,
+                                  "batch_size": args.batch_size}):
+            raise SystemExit(f"could not load {args.model}")
+        # float16 matmuls are slow or unsupported on many CPUs
+        engine.model = engine.model.float()
+        engine._generator = None
+        engine.translate_batch(texts[:2], "en", "de")  # warm-up (builds the prefix cache)
+        samples = []
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            result = engine.translate_batch(texts, "en", "de")
+            samples.append((time.perf_counter() - t0) * 1000.0)
+        outputs[name] = [r.translated_text for r in result.results]
+        ms = statistics.median(samples)
+        tokens = _prompt_tokens(engine, texts, cls is TranslationEngine)
+        print(f"{name:>22}{ms:>10.0f}{ms / len(texts):>10.1f}{tokens:>16}")
+        engine.cleanup()
+
+    same = outputs["per text"] == outputs["batched + prefix cache"]
+    print(f"identical outputs: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Qwen3 streaming translation microbenchmark (CPU).
+
+Translates speech-bubble texts one at a time with the Qwen3 translation
+engine, once with ``translate_text`` (the overlay waits for the whole
+translation) and once with ``translate_text_stream`` (the overlay shows
+partial text as it is decoded).  Reports time-to-first-text and total
+latency per text, and checks that the final streamed text equals the
+blocking result.
+
+Needs ``torch`` and ``transformers`` plus a Qwen3 model (downloaded on
+first use, or pass a local directory with ``--model``).  Run from the
+project root::
+
+    python -m app.benchmark.qwen3_streaming_benchmark --texts 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from plugins.stages.translation.qwen3.worker import TRANSFORMERS_AVAILABLE, TranslationEngine
+
+_TEXTS = [
+    "It's getting late, we should head back before it gets dark.",
+    "I can't believe you actually came all this way just to see me.",
+    "Where are you going?", "Don't move! Put your hands where I can see them.",
+    "Thank you so much, I'll never forget this.", "Is anyone there?",
+    "If we don't hurry, the last train will leave without us.",
+    "Open the door, I know you're in there!",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default="Qwen/Qwen3-0.6B",
+                        help="Hugging Face model id or local model directory")
+    parser.add_argument("--texts", type=int, default=8, help="Texts to translate")
+    parser.add_argument("--threads", type=int, default=0, help="torch CPU threads (0 = default)")
+    args = parser.parse_args()
+
+    if not TRANSFORMERS_AVAILABLE:
+        raise SystemExit("transformers is not installed")
+    import torch
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    engine = TranslationEngine()
+    if not engine.initialize({"model_name": args.model, "gpu": False}):
+        raise SystemExit(f"could not load {args.model}")
+    # float16 matmuls are slow or unsupported on many CPUs
+    engine.model = engine.model.float()
+    engine._generator = None
+    texts = [_TEXTS[i % len(_TEXTS)] for i in range(args.texts)]
+    engine.translate_text(texts[0], "en", "de")  # warm-up (builds the prefix cache)
+
+    blocking, first, total = [], [], []
+    mismatches = 0
+    for text in texts:
+        t0 = time.perf_counter()
+        expected = engine.translate_text(text, "en", "de").translated_text
+        blocking.append((time.perf_counter() - t0) * 1000.0)
+
+        t0 = time.perf_counter()
+        first_ms = None
+        final = ""
+        for final in engine.translate_text_stream(text, "en", "de"):
+            if first_ms is None and final:
+                first_ms = (time.perf_counter() - t0) * 1000.0
+        total.append((time.perf_counter() - t0) * 1000.0)
+        first.append(first_ms if first_ms is not None else total[-1])
+        mismatches += final != expected
+    engine.cleanup()
+
+    print(f"{len(texts)} texts, median ms per text")
+    print(f"{'variant':>16}{'first text':>12}{'total':>10}")
+    print(f"{'translate_text':>16}{statistics.median(blocking):>12.0f}{statistics.median(blocking):>10.0f}")
+    print(f"{'stream':>16}{statistics.median(first):>12.0f}{statistics.median(total):>10.0f}")
+    print(f"identical final outputs: {mismatches == 0}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Cross-request micro-batching benchmark.
+
+Several threads (capture regions, the audio pipeline, the image batch
+processor) translate a few texts at a time against the same local engine.
+Compares each caller running its own ``translate_batch`` with
+``TranslationBatchScheduler`` merging concurrent requests, at a few
+collection windows, and reports aggregate throughput, per-request latency
+and the number of engine calls.
+
+By default the engine is a cost model of a CPU-bound seq2seq model: one
+model call holds the model for ``--call-ms`` plus ``--text-ms`` per text,
+and calls from different threads are serialized.  ``--model`` runs the
+MarianMT engine on the CPU instead (needs ``torch`` and ``transformers``).
+Run from the project root::
+
+    python -m app.benchmark.translation_microbatch_benchmark --callers 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+from typing import Any
+
+from app.text_translation.layer.batch_scheduler import TranslationBatchScheduler
+from app.text_translation.translation_engine_interface import (
+    AbstractTranslationEngine,
+    BatchTranslationResult,
+    TranslationResult,
+)
+
+_TEXTS = [
+    "Hello!", "Where are you going?", "Wait for me.", "I can't believe it...",
+    "What's that sound?", "Thank you so much!", "Let's go.", "Is anyone there?",
+    "Don't move!", "It's getting late, we should head back.", "Open the door.",
+    "Who are you?", "I'll be right back.", "This way, quickly!",
+]
+
+
+class _CostModelEngine(AbstractTranslationEngine):
+    """Serialized engine whose calls cost a fixed overhead plus a per-text share."""
+
+    runs_locally = True
+
+    def __init__(self, call_ms: float, text_ms: float) -> None:
+        super().__init__("cost_model")
+        self._call_s = call_ms / 1000.0
+        self._text_s = text_ms / 1000.0
+        self._model = threading.Lock()
+        self._is_initialized = True
+
+    def initialize(self, config: dict[str, Any]) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        pass
+
+    def translate_text(self, text, src_lang, tgt_lang, options=None):
+        return self.translate_batch([text], src_lang, tgt_lang, options).results[0]
+
+    def translate_batch(self, texts, src_lang, tgt_lang, options=None):
+        with self._model:
+            time.sleep(self._call_s + self._text_s * len(texts))
+        return BatchTranslationResult(
+            results=[
+                TranslationResult(
+                    original_text=t, translated_text=t.upper(),
+                    source_language=src_lang, target_language=tgt_lang,
+                    confidence=1.0, engine_used=self.engine_name,
+                    processing_time_ms=0.0, from_cache=False,
+                )
+                for t in texts
+            ],
+            total_processing_time_ms=0.0,
+            cache_hit_rate=0.0,
+        )
+
+
+def _marian_engine(model: str) -> AbstractTranslationEngine:
+    from plugins.stages.translation.marianmt_gpu.marianmt_engine import TranslationEngine
+
+    class _Engine(TranslationEngine):
+        def _get_model_name(self, src_lang: str, tgt_lang: str) -> str:
+            return model
+
+    engine = _Engine()
+    engine.initialize({"gpu": False, "runtime_mode": "cpu", "num_beams": 1})
+    engine._load_model("en", "de")
+    return engine
+
+
+def _run(engine: AbstractTranslationEngine, scheduler: TranslationBatchScheduler | None,
+         callers: int, requests: int, texts_per_request: int) -> dict[str, Any]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(callers)
+
+    def caller(seed: int) -> None:
+        barrier.wait()
+        for r in range(requests):
+            offset = (seed * 7 + r * texts_per_request) % len(_TEXTS)
+            texts = [_TEXTS[(offset + k) % len(_TEXTS)] + f" #{seed}.{r}.{k}"
+                     for k in range(texts_per_request)]
+            t0 = time.perf_counter()
+            if scheduler is None:
+                engine.translate_batch(texts, "en", "de")
+            else:
+                scheduler.translate_batch(engine, texts, "en", "de")
+            with lock:
+                latencies.append((time.perf_counter() - t0) * 1000.0)
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(callers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "texts_per_s": callers * requests * texts_per_request / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))],
+        "calls": (scheduler.get_stats()["batches"] if scheduler is not None
+                  else callers * requests),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--callers", type=int, default=6, help="Concurrent caller threads")
+    parser.add_argument("--requests", type=int, default=40, help="Requests per caller")
+    parser.add_argument("--texts", type=int, default=2, help="Texts per request")
+    parser.add_argument("--call-ms", type=float, default=25.0,
+                        help="Fixed cost of one model call (cost model)")
+    parser.add_argument("--text-ms", type=float, default=3.0,
+                        help="Cost per text in a model call (cost model)")
+    parser.add_argument("--windows", default="0,2,4,8",
+                        help="Comma-separated collection windows in ms")
+    parser.add_argument("--max-texts", type=int, default=64)
+    parser.add_argument("--model", default="",
+                        help="Run MarianMT with this model id or local directory instead")
+    args = parser.parse_args()
+
+    if args.model:
+        engine = _marian_engine(args.model)
+        label = f"MarianMT ({args.model})"
+    else:
+        engine = _CostModelEngine(args.call_ms, args.text_ms)
+        label = f"cost model ({args.call_ms:g} ms/call + {args.text_ms:g} ms/text)"
+
+    rows = [("per caller", _run(engine, None, args.callers, args.requests, args.texts))]
+    for window in (float(w) for w in args.windows.split(",")):
+        scheduler = TranslationBatchScheduler(window_ms=window, max_texts=args.max_texts)
+        rows.append((f"merged {window:g} ms",
+                     _run(engine, scheduler, args.callers, args.requests, args.texts)))
+        scheduler.shutdown()
+
+    print(f"{label}: {args.callers} callers x {args.requests} requests x {args.texts} texts")
+    print(f"{'variant':>16}{'texts/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'engine calls':>14}")
+    for name, row in rows:
+        print(f"{name:>16}{row['texts_per_s']:>10.0f}{row['p50_ms']:>9.1f}"
+              f"{row['p95_ms']:>9.1f}{row['calls']:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@
 Capture Layer
 
 Component responsible for capturing screen content using plugin-based backends.
-Uses BetterCam (DXGI Desktop Duplication, AMD+NVIDIA) with PIL screenshot fallback.
+Uses BetterCam (DXGI Desktop Duplication, AMD+NVIDIA) with persistent mss and PIL
+screenshot fallbacks.
 """
 
 import logging
@@ -30,6 +31,12 @@ except ImportError as e:
     logger.warning("Could not import multi-monitor support: %s", e)
     MultiMonitorManager = None
 
+# Persistent mss capture (CPU, before the PIL fallback)
+from .mss_capture import MSSCapture
+
+# Dirty-rectangle tracking (XDamage or tile comparison)
+from .damage_tracking import DamageTracker
+
 # PIL screenshot (CPU fallback)
 from .pil_screenshot import capture_screenshot
 
@@ -43,6 +50,8 @@ __all__ = [
     'MonitorInfo',
     'MonitorOrientation',
 
-    # PIL screenshot
+    # CPU capture
+    'MSSCapture',
+    'DamageTracker',
     'capture_screenshot',
 ]
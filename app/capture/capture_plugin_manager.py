@@ -41,6 +41,9 @@ class CapturePluginManager:
         self._bettercam_region: tuple[int, ...] | None = None
         self._debug_frame_counter = 0
 
+        # Persistent CPU backend (mss), created on first use; False once it failed
+        self._mss_capture = None
+
     # ------------------------------------------------------------------
     # Plugin directories
     # ------------------------------------------------------------------
@@ -137,17 +140,30 @@ class CapturePluginManager:
     # Frame capture
     # ------------------------------------------------------------------
 
-    def capture_frame(self, region_data: dict) -> np.ndarray | None:
+    def capture_frame(self, region_data: dict, transient: bool = False) -> np.ndarray | None:
         """Capture a frame using the active backend.
 
         Returns a numpy array (BGR, uint8) or *None* on failure.
-        Falls back to PIL screenshot if the GPU backend fails or is inactive.
+        Falls back to the persistent mss capture, then PIL screenshot, if the
+        GPU backend fails or is inactive.
+
+        The mss capture grabs into reused buffers (see
+        ``app.capture.mss_capture``), so its frames are copied before they
+        are returned.  A caller that only reads the frame before the next
+        grab may pass ``transient=True`` to get the reused buffer itself.
         """
         frame: np.ndarray | None = None
 
         if self._active_plugin in ("bettercam_capture_gpu", "dxcam_capture_gpu"):
             frame = self._capture_bettercam(region_data)
 
+        if frame is None:
+            frame = self._capture_mss(region_data)
+            if frame is not None and not transient:
+                # Queued frames and stages that keep the previous frame
+                # would otherwise see later grabs overwrite it
+                frame = frame.copy()
+
         # PIL fallback — always available
         if frame is None:
             frame = self._capture_pil(region_data)
@@ -276,6 +292,23 @@ class CapturePluginManager:
 
         self._debug_frame_counter = 0
 
+    def _capture_mss(self, region_data: dict) -> np.ndarray | None:
+        if self._mss_capture is False:
+            return None
+        if self._mss_capture is None:
+            from app.capture.mss_capture import MSSCapture
+            if not MSSCapture.is_supported():
+                self._mss_capture = False
+                return None
+            self._mss_capture = MSSCapture()
+        try:
+            return self._mss_capture.grab(region_data)
+        except Exception as e:
+            self.logger.warning("MSS capture failed, using PIL screenshot: %s", e)
+            self._mss_capture.close()
+            self._mss_capture = False
+            return None
+
     @staticmethod
     def _capture_pil(region_data: dict) -> np.ndarray | None:
         from app.capture.pil_screenshot import capture_screenshot
@@ -323,4 +356,8 @@ class CapturePluginManager:
                 self.logger.error("Error cleaning up BetterCam: %s", e)
             self._bettercam_camera = None
 
+        if self._mss_capture:
+            self._mss_capture.close()
+        self._mss_capture = None
+
         self._active_plugin = None
@@ -0,0 +1,380 @@
+"""
+Damage Tracking
+
+Finds which parts of a capture region changed since the previous frame,
+so capture and change detection only touch those parts.
+
+- ``XDamageMonitor`` asks the X server (XDamage extension, through
+  ctypes) for the screen rectangles that were drawn to.  While nothing is
+  damaged no grab happens at all.
+- Without XDamage (Windows, Wayland, missing libXdamage) every tick grabs
+  the region as before and compares it tile by tile with the previous
+  frame.
+
+``DamageTracker`` keeps the latest frame of each region and grabs / copies
+only the dirty tiles / rectangles.  Dirty rectangles are
+``(x, y, width, height)`` relative to the region; an empty list means the
+frame is unchanged and the same array as last time is returned.
+
+Returned frames are read-only and never written to again: a change
+produces a new array (the previous frame with the dirty parts copied in),
+so frames still queued in the pipeline, or kept as the previous frame by
+later stages, stay intact however deep the queue is.
+
+The XDamage bindings have not been verified against a live X server yet,
+so the capture layer only enables them for ``capture.damage_tracking =
+'auto'``, which is not the default.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Rect = tuple[int, int, int, int]
+
+
+# ---------------------------------------------------------------------------
+# XDamage
+# ---------------------------------------------------------------------------
+
+class _XRectangle(ctypes.Structure):
+    _fields_ = [
+        ('x', ctypes.c_short), ('y', ctypes.c_short),
+        ('width', ctypes.c_ushort), ('height', ctypes.c_ushort),
+    ]
+
+
+class _XDamageNotifyEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('drawable', ctypes.c_ulong),
+        ('damage', ctypes.c_ulong),
+        ('level', ctypes.c_int),
+        ('more', ctypes.c_int),
+        ('timestamp', ctypes.c_ulong),
+        ('area', _XRectangle),
+        ('geometry', _XRectangle),
+    ]
+
+
+class _XEvent(ctypes.Union):
+    _fields_ = [('type', ctypes.c_int), ('pad', ctypes.c_long * 24)]
+
+
+_XDamageReportRawRectangles = 0
+_XDamageNotify = 0
+
+
+class XDamageMonitor:
+    """Damaged root-window rectangles, collected from XDamage events.
+
+    Uses its own display connection and must be polled from the thread
+    that created it.
+
+    Raises:
+        OSError: If libX11/libXdamage or the display are unavailable, or
+            the server has no DAMAGE extension.
+    """
+
+    def __init__(self, display: str | None = None):
+        x11_path = ctypes.util.find_library('X11')
+        xdamage_path = ctypes.util.find_library('Xdamage')
+        if not x11_path or not xdamage_path:
+            raise OSError("libX11 / libXdamage not found")
+        self._x11 = x11 = ctypes.CDLL(x11_path)
+        self._xdamage = xd = ctypes.CDLL(xdamage_path)
+
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XPending.argtypes = [ctypes.c_void_p]
+        x11.XPending.restype = ctypes.c_int
+        x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XEvent)]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        xd.XDamageQueryExtension.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+        xd.XDamageQueryExtension.restype = ctypes.c_int
+        xd.XDamageCreate.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int]
+        xd.XDamageCreate.restype = ctypes.c_ulong
+        xd.XDamageSubtract.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+        xd.XDamageDestroy.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+
+        self._display = x11.XOpenDisplay(display.encode() if display else None)
+        if not self._display:
+            raise OSError("cannot open X display")
+        event_base, error_base = ctypes.c_int(), ctypes.c_int()
+        if not xd.XDamageQueryExtension(
+                self._display, ctypes.byref(event_base), ctypes.byref(error_base)):
+            x11.XCloseDisplay(self._display)
+            self._display = None
+            raise OSError("X server has no DAMAGE extension")
+        self._notify_type = event_base.value + _XDamageNotify
+        root = x11.XDefaultRootWindow(self._display)
+        self._damage = xd.XDamageCreate(self._display, root, _XDamageReportRawRectangles)
+        self._event = _XEvent()
+
+    def poll(self) -> list[Rect]:
+        """Rectangles (root coordinates) damaged since the last poll."""
+        rects: list[Rect] = []
+        x11 = self._x11
+        event = self._event
+        while x11.XPending(self._display):
+            x11.XNextEvent(self._display, ctypes.byref(event))
+            if event.type == self._notify_type:
+                area = ctypes.cast(ctypes.byref(event),
+                                   ctypes.POINTER(_XDamageNotifyEvent)).contents.area
+                rects.append((area.x, area.y, area.width, area.height))
+        if rects:
+            # Raw-rectangle reports still accumulate a damage region; clear it
+            self._xdamage.XDamageSubtract(self._display, self._damage, 0, 0)
+        return rects
+
+    def close(self) -> None:
+        if self._display:
+            self._xdamage.XDamageDestroy(self._display, self._damage)
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+# ---------------------------------------------------------------------------
+# Rectangle helpers
+# ---------------------------------------------------------------------------
+
+def changed_tiles(previous: np.ndarray, current: np.ndarray, tile_size: int) -> list[Rect]:
+    """Tiles of *current* that differ from *previous*, merged along rows."""
+    h, w = current.shape[:2]
+    channels = current.shape[2] if current.ndim == 3 else 1
+    diff = (previous != current).reshape(h, w * channels)
+    rows = np.logical_or.reduceat(diff, np.arange(0, h, tile_size), axis=0)
+    tiles = np.logical_or.reduceat(rows, np.arange(0, w * channels, tile_size * channels), axis=1)
+
+    rects: list[Rect] = []
+    for ty, tx in zip(*np.nonzero(tiles)):
+        x, y = int(tx) * tile_size, int(ty) * tile_size
+        rect = (x, y, min(tile_size, w - x), min(tile_size, h - y))
+        last = rects[-1] if rects else None
+        # Extend the previous rect if this tile continues it on the same row
+        if last is not None and last[1] == y and last[0] + last[2] == x:
+            rects[-1] = (last[0], y, last[2] + rect[2], rect[3])
+        else:
+            rects.append(rect)
+    return rects
+
+
+def _clip(rect: Rect, width: int, height: int) -> Rect | None:
+    x0, y0 = max(rect[0], 0), max(rect[1], 0)
+    x1, y1 = min(rect[0] + rect[2], width), min(rect[1] + rect[3], height)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+def _copy_rects(dst: np.ndarray, src: np.ndarray, rects: list[Rect]) -> None:
+    for x, y, w, h in rects:
+        dst[y:y + h, x:x + w] = src[y:y + h, x:x + w]
+
+
+# ---------------------------------------------------------------------------
+# Tracker
+# ---------------------------------------------------------------------------
+
+class _RegionBuffer:
+    """Latest frame of one region; replaced on change, never written to."""
+
+    def __init__(self, frame: np.ndarray):
+        self.front = _frozen_copy(frame)
+        self.pending: list[Rect] = []      # XDamage rects not yet captured
+        self.last_full = time.monotonic()
+
+    def update(self, rects: list[Rect], source: np.ndarray | None = None,
+               grab_rect: Callable[[Rect], np.ndarray | None] | None = None) -> bool:
+        """Make a new front frame with *rects* copied in; False if a grab failed."""
+        frame = self.front.copy()
+        for x, y, w, h in rects:
+            if source is not None:
+                frame[y:y + h, x:x + w] = source[y:y + h, x:x + w]
+            else:
+                part = grab_rect((x, y, w, h))
+                if part is None or part.shape[:2] != (h, w):
+                    return False
+                frame[y:y + h, x:x + w] = part
+        frame.flags.writeable = False
+        self.front = frame
+        return True
+
+
+def _frozen_copy(frame: np.ndarray) -> np.ndarray:
+    frame = frame.copy()
+    frame.flags.writeable = False
+    return frame
+
+
+class DamageTracker:
+    """
+    Persistent per-region frame buffers updated from dirty rectangles.
+
+    Args:
+        tile_size: Tile edge in pixels for the tile-compare fallback
+        use_xdamage: Try the XDamage extension first (X11 only, not yet
+            verified against a live X server)
+        max_dirty_fraction: Above this share of the region, XDamage
+            rectangles are replaced by one full grab
+        refresh_interval: Seconds after which an XDamage region is grabbed
+            in full and tile-compared anyway, in case some drawing did not
+            generate damage events
+    """
+
+    _MAX_RECTS = 32
+
+    def __init__(self, tile_size: int = 64, use_xdamage: bool = False,
+                 max_dirty_fraction: float = 0.5, refresh_interval: float = 5.0):
+        self.tile_size = max(8, int(tile_size))
+        self.max_dirty_fraction = max_dirty_fraction
+        self.refresh_interval = refresh_interval
+        self._regions: dict[tuple, _RegionBuffer] = {}
+        self._xdamage: XDamageMonitor | None = None
+        if use_xdamage and self._xdamage_supported():
+            try:
+                self._xdamage = XDamageMonitor()
+                logger.info("Damage tracking: XDamage")
+            except OSError as e:
+                logger.info("Damage tracking: XDamage unavailable (%s), comparing tiles", e)
+        self.stats = {'frames': 0, 'unchanged': 0, 'full_grabs': 0,
+                      'partial_grabs': 0, 'grabbed_pixels': 0}
+
+    @property
+    def source(self) -> str:
+        """``'xdamage'`` or ``'tiles'``."""
+        return 'xdamage' if self._xdamage is not None else 'tiles'
+
+    @staticmethod
+    def _xdamage_supported() -> bool:
+        return (sys.platform.startswith('linux')
+                and bool(os.environ.get('DISPLAY'))
+                and os.environ.get('XDG_SESSION_TYPE', '').lower() != 'wayland')
+
+    def capture(self, region_data: dict,
+                grab: Callable[[dict], np.ndarray | None]) -> tuple[np.ndarray | None, list[Rect]]:
+        """
+        Return the region's current frame and its dirty rectangles.
+
+        Args:
+            region_data: Dict with keys ``x``, ``y``, ``width``, ``height``
+                (and optionally ``monitor_id``), as for ``capture_frame``
+            grab: Captures a region dict and returns a BGR array or None;
+                the array is only read until the next grab
+
+        Returns:
+            ``(frame, dirty_rects)``; frame is None if the grab failed.
+            A new region reports its whole area as dirty.
+        """
+        self.stats['frames'] += 1
+        x, y = region_data['x'], region_data['y']
+        width, height = region_data['width'], region_data['height']
+        key = (x, y, width, height, region_data.get('monitor_id', 0))
+
+        if self._xdamage is not None:
+            self._distribute(self._xdamage.poll())
+
+        buffer = self._regions.get(key)
+        if buffer is None:
+            frame = grab(region_data)
+            if frame is None:
+                return None, []
+            self._count_full(width, height)
+            buffer = self._regions[key] = _RegionBuffer(frame)
+            full = (0, 0, frame.shape[1], frame.shape[0])
+            return buffer.front, [full]
+
+        now = time.monotonic()
+        if self._xdamage is not None and now - buffer.last_full < self.refresh_interval:
+            rects, buffer.pending = buffer.pending, []
+            if not rects:
+                self.stats['unchanged'] += 1
+                return buffer.front, []
+            rects = self._merge(rects, width, height)
+            area = sum(w * h for _, _, w, h in rects)
+            if len(rects) <= self._MAX_RECTS and area <= self.max_dirty_fraction * width * height:
+                def grab_rect(rect: Rect) -> np.ndarray | None:
+                    rx, ry, rw, rh = rect
+                    return grab({**region_data, 'x': x + rx, 'y': y + ry,
+                                 'width': rw, 'height': rh})
+                if buffer.update(rects, grab_rect=grab_rect):
+                    self.stats['partial_grabs'] += len(rects)
+                    self.stats['grabbed_pixels'] += area
+                    return buffer.front, rects
+            # Too much damage (or a partial grab failed): grab everything
+
+        frame = grab(region_data)
+        if frame is None:
+            return None, []
+        self._count_full(width, height)
+        buffer.last_full = now
+        buffer.pending = []
+        if frame.shape != buffer.front.shape:
+            buffer = self._regions[key] = _RegionBuffer(frame)
+            return buffer.front, [(0, 0, frame.shape[1], frame.shape[0])]
+        rects = changed_tiles(buffer.front, frame, self.tile_size)
+        if not rects:
+            self.stats['unchanged'] += 1
+            return buffer.front, []
+        buffer.update(rects, source=frame)
+        return buffer.front, rects
+
+    def reset(self) -> None:
+        """Forget all regions (the next capture of each is a full grab)."""
+        self._regions.clear()
+
+    def close(self) -> None:
+        self.reset()
+        if self._xdamage is not None:
+            self._xdamage.close()
+            self._xdamage = None
+
+    # ------------------------------------------------------------------
+
+    def _distribute(self, damaged: list[Rect]) -> None:
+        """Hand root-coordinate damage to every region it touches."""
+        if not damaged:
+            return
+        for (x, y, width, height, _), buffer in self._regions.items():
+            for dx, dy, dw, dh in damaged:
+                rect = _clip((dx - x, dy - y, dw, dh), width, height)
+                if rect is not None:
+                    buffer.pending.append(rect)
+
+    def _merge(self, rects: list[Rect], width: int, height: int) -> list[Rect]:
+        """Snap rects to the tile grid and drop the ones already covered."""
+        t = self.tile_size
+        tiles = set()
+        for x, y, w, h in rects:
+            for ty in range(y // t, (y + h - 1) // t + 1):
+                for tx in range(x // t, (x + w - 1) // t + 1):
+                    tiles.add((ty, tx))
+        merged: list[Rect] = []
+        for ty, tx in sorted(tiles):
+            x, y = tx * t, ty * t
+            last = merged[-1] if merged else None
+            if last is not None and last[1] == y and last[0] + last[2] == x:
+                merged[-1] = (last[0], y, last[2] + t, t)
+            else:
+                merged.append((x, y, t, t))
+        # Tiles on the right / bottom edge may stick out of the region
+        return [c for c in (_clip(r, width, height) for r in merged) if c is not None]
+
+    def _count_full(self, width: int, height: int) -> None:
+        self.stats['full_grabs'] += 1
+        self.stats['grabbed_pixels'] += width * height
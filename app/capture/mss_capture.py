@@ -0,0 +1,130 @@
+"""
+Persistent MSS Screen Capture
+
+Long-lived CPU capture backend, tried before the PIL screenshot fallback.
+
+``ImageGrab.grab`` opens a new display connection and allocates a fresh
+full-size image, array and channel view for every frame.  ``MSSCapture``
+keeps one ``mss`` instance per capture thread instead -- on Linux/X11 that
+is one display connection and, with mss >= 10.2, one MIT-SHM segment the
+X server writes into -- and copies each grab straight into a preallocated
+BGR buffer.
+
+Buffers are kept per region size in a small ring, so a returned frame
+stays valid only while the next ``buffers - 1`` frames are captured.
+Frames leave the capture layer as copies: ``CapturePluginManager`` copies
+each grab unless the caller asks for the transient buffer (damage
+tracking, which copies the changed parts into its own frame right away).
+"""
+
+import logging
+import os
+import sys
+import threading
+
+import numpy as np
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    mss = None
+    MSS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class MSSCapture:
+    """Screen grabs through a persistent ``mss`` instance into reused buffers."""
+
+    _MAX_SIZES = 4
+
+    def __init__(self, buffers: int = 3):
+        self.buffers = max(1, buffers)
+        self._local = threading.local()
+        self._instances: list = []
+        self._instances_lock = threading.Lock()
+        # (height, width) -> (ring of BGR arrays, index of the next one)
+        self._rings: dict[tuple[int, int], tuple[list[np.ndarray], int]] = {}
+        self.stats = {'frames': 0, 'buffer_allocations': 0, 'connections': 0}
+
+    @staticmethod
+    def is_supported() -> bool:
+        """mss is installed and can see the screen contents.
+
+        Under a Wayland session mss only sees XWayland windows, so the PIL
+        path (which can use the desktop's screenshot tool) is kept there.
+        """
+        if not MSS_AVAILABLE:
+            return False
+        if sys.platform.startswith('linux'):
+            return (bool(os.environ.get('DISPLAY'))
+                    and os.environ.get('XDG_SESSION_TYPE', '').lower() != 'wayland')
+        return True
+
+    def grab(self, region_data: dict) -> np.ndarray:
+        """
+        Capture the specified region.
+
+        Args:
+            region_data: Dict with keys ``x``, ``y``, ``width``, ``height``.
+
+        Returns:
+            BGR uint8 array owned by this capture (see the module docstring).
+
+        Raises:
+            mss.exception.ScreenShotError: If the grab fails.
+        """
+        monitor = {
+            'left': region_data['x'],
+            'top': region_data['y'],
+            'width': region_data['width'],
+            'height': region_data['height'],
+        }
+        shot = self._instance().grab(monitor)
+        height, width = shot.height, shot.width
+        # mss delivers BGRA rows; dropping alpha gives BGR directly
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(height, width, 4)
+        out = self._next_buffer(height, width)
+        np.copyto(out, bgra[:, :, :3])
+        self.stats['frames'] += 1
+        return out
+
+    def close(self) -> None:
+        """Close every mss instance and drop the buffers."""
+        with self._instances_lock:
+            instances, self._instances = self._instances, []
+        for sct in instances:
+            try:
+                sct.close()
+            except Exception as e:
+                logger.debug("Error closing mss instance: %s", e)
+        self._local = threading.local()
+        self._rings.clear()
+
+    # ------------------------------------------------------------------
+
+    def _instance(self):
+        # mss instances must be used on the thread that created them
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+            with self._instances_lock:
+                self._instances.append(sct)
+            self.stats['connections'] += 1
+            logger.info("MSS capture opened (%s)", type(sct).__name__)
+        return sct
+
+    def _next_buffer(self, height: int, width: int) -> np.ndarray:
+        key = (height, width)
+        ring, index = self._rings.get(key, (None, 0))
+        if ring is None:
+            ring = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(self.buffers)]
+            self.stats['buffer_allocations'] += self.buffers
+            if len(self._rings) >= self._MAX_SIZES:
+                # Drop the smallest size: damage tracking grabs many small
+                # rectangles, but the full regions are the ones worth keeping
+                del self._rings[min(self._rings, key=lambda k: k[0] * k[1])]
+        self._rings[key] = (ring, (index + 1) % len(ring))
+        return ring[index]
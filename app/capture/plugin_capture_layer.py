@@ -3,6 +3,12 @@ Plugin-Based Capture Layer
 
 Adapts the CapturePluginManager to the ICaptureLayer interface used by the
 rest of the pipeline.
+
+With damage tracking on (``capture.damage_tracking``), frames come from a
+persistent per-region buffer and carry ``dirty_rects`` in their metadata:
+the rectangles (relative to the region) that changed since the previous
+frame of that region, ``[]`` when nothing changed.  See
+``app.capture.damage_tracking``.
 """
 
 import logging
@@ -14,10 +20,12 @@ try:
     from ..models import Frame, CaptureRegion, PerformanceProfile
     from ..interfaces import ICaptureLayer, CaptureSource
     from .capture_plugin_manager import CapturePluginManager
+    from .damage_tracking import DamageTracker
 except ImportError:
     from app.models import Frame, CaptureRegion, PerformanceProfile
     from app.interfaces import ICaptureLayer, CaptureSource
     from app.capture.capture_plugin_manager import CapturePluginManager
+    from app.capture.damage_tracking import DamageTracker
 
 
 class PluginCaptureLayer(ICaptureLayer):
@@ -48,6 +56,14 @@ class PluginCaptureLayer(ICaptureLayer):
         else:
             self.logger.warning("No capture plugins found")
 
+        # Damage tracking ('tiles' = tile compare, 'auto' = XDamage when available)
+        self._damage_mode = 'tiles'
+        self._damage_tile_size = 64
+        if self.config_manager:
+            self._damage_mode = self.config_manager.get_setting('capture.damage_tracking', 'tiles')
+            self._damage_tile_size = self.config_manager.get_setting('capture.damage_tile_size', 64)
+        self._damage_tracker: DamageTracker | None = None
+
         # State
         self._frame_rate = 30
         self._performance_profile = PerformanceProfile.NORMAL
@@ -58,6 +74,7 @@ class PluginCaptureLayer(ICaptureLayer):
             'successful_captures': 0,
             'failed_captures': 0,
             'average_capture_time': 0.0,
+            'unchanged_frames': 0,
         }
 
     # ------------------------------------------------------------------
@@ -79,7 +96,18 @@ class PluginCaptureLayer(ICaptureLayer):
             'monitor_id': region.monitor_id,
         }
 
-        frame_data: np.ndarray | None = self.plugin_manager.capture_frame(region_data)
+        metadata: dict[str, Any] = {
+            'source': source.value if hasattr(source, 'value') else str(source),
+        }
+        tracker = self._get_damage_tracker()
+        if tracker is not None:
+            frame_data, dirty_rects = tracker.capture(region_data, self._grab_transient)
+            metadata['dirty_rects'] = dirty_rects
+            metadata['damage_source'] = tracker.source
+            if frame_data is not None and not dirty_rects:
+                self._stats['unchanged_frames'] += 1
+        else:
+            frame_data = self.plugin_manager.capture_frame(region_data)
 
         if frame_data is None:
             self._stats['failed_captures'] += 1
@@ -89,7 +117,7 @@ class PluginCaptureLayer(ICaptureLayer):
             data=frame_data,
             timestamp=time.time(),
             source_region=region,
-            metadata={'source': source.value if hasattr(source, 'value') else str(source)},
+            metadata=metadata,
         )
 
         capture_time = time.perf_counter() - start_time
@@ -154,14 +182,22 @@ class PluginCaptureLayer(ICaptureLayer):
         stats['available_plugins'] = self.plugin_manager.get_available_plugins(self.config_manager)
         stats['frame_rate'] = self._frame_rate
         stats['performance_profile'] = self._performance_profile.value
+        if self._damage_tracker is not None:
+            stats['damage_tracking'] = dict(self._damage_tracker.stats,
+                                            source=self._damage_tracker.source)
         return stats
 
     def force_refresh(self, monitor_id: int = 0) -> None:
         """Force-recreate the capture backend to avoid stale DXGI frames."""
         self.plugin_manager.force_refresh(monitor_id)
+        if self._damage_tracker is not None:
+            self._damage_tracker.reset()
 
     def cleanup(self) -> None:
         try:
+            if self._damage_tracker is not None:
+                self._damage_tracker.close()
+                self._damage_tracker = None
             self.plugin_manager.cleanup()
         except Exception as e:
             self.logger.error("Cleanup error: %s", e)
@@ -170,6 +206,19 @@ class PluginCaptureLayer(ICaptureLayer):
     # Internal
     # ------------------------------------------------------------------
 
+    def _grab_transient(self, region_data: dict) -> np.ndarray | None:
+        # The tracker copies what it needs before the next grab
+        return self.plugin_manager.capture_frame(region_data, transient=True)
+
+    def _get_damage_tracker(self) -> DamageTracker | None:
+        # Created lazily: XDamage polling has to stay on the capture thread
+        if self._damage_tracker is None and self._damage_mode != 'off':
+            self._damage_tracker = DamageTracker(
+                tile_size=self._damage_tile_size,
+                use_xdamage=self._damage_mode == 'auto',
+            )
+        return self._damage_tracker
+
     def _update_stats(self, capture_time: float) -> None:
         self._stats['total_frames'] += 1
         self._stats['successful_captures'] += 1
@@ -245,6 +245,21 @@ class ConfigSchema:
             default=[],
             description='IDs of currently active capture regions'
         ))
+        self.add_option(ConfigOption(
+            name='capture.damage_tracking',
+            type=str,
+            default='tiles',
+            choices=['auto', 'tiles', 'off'],
+            description='Find changed parts of the region: tile comparison, XDamage if available (auto, experimental), or off'
+        ))
+        self.add_option(ConfigOption(
+            name='capture.damage_tile_size',
+            type=int,
+            default=64,
+            min_value=16,
+            max_value=256,
+            description='Tile size in pixels for damage tracking'
+        ))
         
         # OCR settings
         self.add_option(ConfigOption(
@@ -448,6 +463,28 @@ class ConfigSchema:
             default=True,
             description='Use context-aware translation when available'
         ))
+        self.add_option(ConfigOption(
+            name='translation.microbatch_enabled',
+            type=bool,
+            default=True,
+            description='Merge concurrent translation requests for local models (MarianMT, NLLB, Qwen3) into shared batches'
+        ))
+        self.add_option(ConfigOption(
+            name='translation.microbatch_window_ms',
+            type=int,
+            default=4,
+            min_value=0,
+            max_value=50,
+            description='How long a request for a local model may wait for others to join its batch (milliseconds)'
+        ))
+        self.add_option(ConfigOption(
+            name='translation.microbatch_max_texts',
+            type=int,
+            default=64,
+            min_value=1,
+            max_value=512,
+            description='Dispatch a shared batch as soon as this many texts are waiting'
+        ))
         
         self.add_option(ConfigOption(
             name='cache.translation_cache_size',
@@ -515,6 +552,20 @@ class ConfigSchema:
             max_value=500.0,
             description='Translation cache memory limit in MB'
         ))
+        self.add_option(ConfigOption(
+            name='cache.persistent_translation_cache',
+            type=bool,
+            default=True,
+            description='Keep learned translations in an on-disk tier that survives restarts'
+        ))
+        self.add_option(ConfigOption(
+            name='cache.translation_store_size',
+            type=int,
+            default=200000,
+            min_value=1000,
+            max_value=5000000,
+            description='Maximum entries in the on-disk translation cache tier'
+        ))
         
         self.add_option(ConfigOption(
             name='translation.quality_filter_enabled',
@@ -631,6 +682,14 @@ class ConfigSchema:
             description='Per-stage input queue depth for the async pipeline strategy'
         ))
         
+        self.add_option(ConfigOption(
+            name='pipeline.async_scheduling',
+            type=str,
+            default='fifo',
+            choices=['fifo', 'latest'],
+            description='Hand-off between async pipeline stages (fifo: bounded queues; latest: one slot per stage where newer frames replace waiting ones)'
+        ))
+        
         self.add_option(ConfigOption(
             name='pipeline.max_workers',
             type=int,
@@ -648,6 +707,62 @@ class ConfigSchema:
             description='Pipeline execution strategy (subprocess runs OCR in an isolated process for crash resilience)'
         ))
         
+        self.add_option(ConfigOption(
+            name='pipeline.adaptive_pacing',
+            type=bool,
+            default=True,
+            description='Pace frame capture to the slowest stage and back off exponentially while content is static'
+        ))
+        
+        self.add_option(ConfigOption(
+            name='pipeline.max_idle_interval',
+            type=float,
+            default=1.0,
+            min_value=0.1,
+            max_value=10.0,
+            description='Longest capture interval in seconds reached by static-content backoff'
+        ))
+        
+        self.add_option(ConfigOption(
+            name='pipeline.trace_enabled',
+            type=bool,
+            default=False,
+            description='Record per-frame stage, plugin and IPC spans into an in-memory ring buffer (exportable as Chrome trace JSON)'
+        ))
+        
+        self.add_option(ConfigOption(
+            name='pipeline.trace_buffer_size',
+            type=int,
+            default=4096,
+            min_value=256,
+            max_value=262144,
+            description='Number of spans kept by the pipeline tracer before the oldest are overwritten'
+        ))
+        
+        self.add_option(ConfigOption(
+            name='pipeline.trace_path',
+            type=str,
+            default='',
+            description='File the recorded trace is written to when the pipeline stops (empty = pipeline_trace.json in the logs directory)'
+        ))
+        
+        self.add_option(ConfigOption(
+            name='pipeline.subprocess_ipc_protocol',
+            type=str,
+            default='binary',
+            choices=['binary', 'json'],
+            description='Wire format for subprocess workers (binary: length-prefixed frames with raw payloads and pipelined requests; json: line-delimited JSON)'
+        ))
+        
+        self.add_option(ConfigOption(
+            name='pipeline.subprocess_workers',
+            type=int,
+            default=1,
+            min_value=1,
+            max_value=8,
+            description='OCR worker processes for the subprocess strategy (each loads its own engine; ROI crops are spread across them)'
+        ))
+        
         self.add_option(ConfigOption(
             name='pipeline.mode',
             type=str,
@@ -1149,6 +1264,14 @@ class ConfigSchema:
             description='Overlay positioning strategy'
         ))
         
+        self.add_option(ConfigOption(
+            name='overlay.renderer',
+            type=str,
+            default='widgets',
+            choices=['widgets', 'compositor'],
+            description='Overlay renderer: one window per translation, or one window painting all translations'
+        ))
+        
         self.add_option(ConfigOption(
             name='overlay.grid_cell_size',
             type=int,
@@ -1248,6 +1371,20 @@ class ConfigSchema:
             default={'x': 0, 'y': 0, 'width': 800, 'height': 600},
             description='Overlay placement region {x, y, width, height}'
         ))
+        self.add_option(ConfigOption(
+            name='overlay.stream_partial_text',
+            type=bool,
+            default=True,
+            description='Show translations while streaming engines are still generating them'
+        ))
+        self.add_option(ConfigOption(
+            name='overlay.stream_interval_ms',
+            type=int,
+            default=50,
+            min_value=0,
+            max_value=1000,
+            description='Minimum time between partial overlay updates of one text in milliseconds'
+        ))
         
         # High-priority hardcoded values - Thresholds
         self.add_option(ConfigOption(
@@ -1744,6 +1881,12 @@ class ConfigSchema:
             max_value=9999999,
             description='Maximum dictionary entries per language pair'
         ))
+        self.add_option(ConfigOption(
+            name='dictionary.binary_store',
+            type=bool,
+            default=True,
+            description='Keep dictionaries in memory-mapped binary stores with a change journal'
+        ))
         
         # Storage settings
         self.add_option(ConfigOption(
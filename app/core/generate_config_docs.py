@@ -26,6 +26,8 @@ class ConfigDocGenerator:
         'capture.quality': 'Higher quality produces clearer text for OCR but increases processing time and memory usage. Lower quality is faster but may reduce OCR accuracy.',
         'capture.timeout_ms': 'Longer timeout allows more time for capture but may delay the pipeline. Shorter timeout improves responsiveness but may cause capture failures.',
         'capture.method': 'Auto selects the best method for your system. DirectX is fastest on Windows with GPU. Screenshot is most compatible but slower.',
+        'capture.damage_tracking': 'Tiles grabs every frame but compares it tile by tile, so unchanged frames skip change detection downstream. Auto (X11 with XDamage, experimental) skips the grab entirely while nothing on screen changes and only grabs the changed rectangles otherwise. Off grabs and hands on full frames as before.',
+        'capture.damage_tile_size': 'Smaller tiles grab and report less unchanged area around a change but cost more bookkeeping per frame. Larger tiles are cheaper to compare but mark more of the region dirty.',
         
         'ocr.engine': 'EasyOCR provides good accuracy for multiple languages. PaddleOCR is faster but less accurate. Tesseract is lightweight. Manga OCR specializes in Japanese text.',
         'ocr.confidence_threshold': 'Higher threshold reduces false positives but may miss valid text. Lower threshold captures more text but may include noise.',
@@ -41,16 +43,23 @@ class ConfigDocGenerator:
         'translation.preserve_formatting': 'When enabled, engines attempt to retain original formatting (bold, italic, line breaks). Disabling may improve speed for engines that support it.',
         'translation.quality_filter_enabled': 'When enabled, low-quality translations are filtered out before saving to the smart dictionary. Disabling allows all translations to be saved.',
         'translation.quality_filter_mode': 'Balanced mode (0) allows most reasonable translations. Strict mode (1) raises thresholds, saving only high-confidence translations to the dictionary.',
+        'translation.microbatch_enabled': 'Requests from capture regions, audio and image batches that hit a local model at the same time are translated in one model call, which raises throughput on CPU-only machines. Disable to give every caller its own engine call.',
+        'translation.microbatch_window_ms': 'Longer windows merge more requests per model call but add up to this much latency to every local translation. 0 still merges requests that queue up while the model is busy.',
+        'translation.microbatch_max_texts': 'Upper bound on a merged batch; larger batches amortize more per-call overhead but take longer to finish and use more memory.',
         'cache.translation_cache_size': 'Larger cache reduces API calls and improves speed for repeated text. Smaller cache uses less memory but may require more API calls.',
         'cache.translation_cache_ttl': 'Longer TTL keeps cached translations available longer, reducing repeat API calls. Shorter TTL ensures fresher translations at the cost of more API requests.',
+        'cache.persistent_translation_cache': 'Translations are appended to the on-disk tier as they are learned, so nothing is lost on a crash and shutdown does not stall on a full save. Disable to keep the cache in memory only.',
+        'cache.translation_store_size': 'Upper bound on the on-disk tier; the oldest translations are dropped first. Larger values keep more history at the cost of startup time and disk space.',
         
         'pipeline.queue_size': 'Larger queues absorb burst latency spikes but increase memory usage. Smaller queues reduce memory but may drop frames under load.',
+        'pipeline.async_scheduling': 'Latest-frame-wins keeps the overlay close to what is on screen when OCR is slower than capture, at the cost of skipping intermediate frames. FIFO processes every queued frame but the overlay can lag by up to a full queue.',
         'pipeline.max_workers': 'More workers improve parallelism but increase CPU and memory usage. Fewer workers reduce resource usage but may bottleneck throughput.',
         
         'performance.enable_gpu': 'GPU acceleration significantly speeds up OCR and translation but requires CUDA-capable GPU. Disable if GPU unavailable or causing issues.',
         'performance.enable_frame_skip': 'Frame skipping improves performance by processing fewer frames. Disable for maximum accuracy at cost of higher resource usage.',
         'performance.enable_translation_cache': 'Caching avoids re-translating identical text, saving time and API costs. Disable only for testing or if memory is constrained.',
         'performance.enable_smart_dictionary': 'Smart dictionary improves translation quality for technical terms and proper nouns. Minimal performance impact.',
+        'dictionary.binary_store': 'Binary stores open large wordbooks almost instantly and only decode the entries that are looked up. Disable to read and rewrite the .json.gz files directly, at the cost of slower startup and more memory.',
         
         'translation.google_api_key': 'Required for Google Translate API. Obtain from Google Cloud Console. Stored encrypted using Windows DPAPI.',
         'translation.deepl_api_key': 'Required for DeepL API. Obtain from DeepL website. Stored encrypted using Windows DPAPI.',
@@ -91,6 +100,9 @@ class ConfigDocGenerator:
         
         'overlay.disappear_timeout_seconds': 'Time before translation overlay disappears. Increase to read translations longer. Decrease for less screen clutter.',
         'overlay.save_interval': 'Number of translations before auto-save. Lower values save more frequently but may impact performance.',
+        'overlay.renderer': 'widgets opens one animated window per translation. compositor paints all translations in a single click-through window and repaints only changed boxes, which keeps frame time flat with many bubbles (no show/hide animations). Takes effect on restart.',
+        'overlay.stream_partial_text': 'Streaming engines (Qwen3 translation, Qwen3 LLM) update the overlay while generating, so the first words show up much sooner. Only the longest text of each frame is streamed; the others are still translated in one batch.',
+        'overlay.stream_interval_ms': 'Minimum time between partial overlay updates. Lower values look smoother but repaint more often.',
         
         'thresholds.queue_get_timeout_seconds': 'Timeout for internal queue operations. Increase for slower systems. Decrease to improve responsiveness.',
         'thresholds.worker_scale_timeout_seconds': 'Timeout for worker thread scaling. Increase on slow systems. Decrease to improve responsiveness.',
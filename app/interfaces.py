@@ -75,6 +75,10 @@ class IOCRLayer(ABC):
         """Extract text from frame using specified or default OCR engine."""
         ...
 
+    def extract_text_batch(self, frames: list[Frame], engine: str | None = None, options: dict[str, Any] | None = None) -> list[list[TextBlock]]:
+        """Extract text from several frames; one text-block list per frame."""
+        return [self.extract_text(frame, engine, options) for frame in frames]
+
     @abstractmethod
     def register_engine(self, engine_name: str, engine_instance: Any) -> bool:
         """Register a new OCR engine."""
@@ -0,0 +1,330 @@
+"""
+Batched generation with a cached prompt prefix for causal LMs.
+
+Both Qwen3 plugins wrap every text in the same chat template and system
+prompt, so most of each prompt is identical across texts and calls.
+:class:`PrefixCachedGenerator` runs that shared prefix through the model
+once, keeps its KV cache, and for each call only encodes the per-text
+suffixes, several texts per ``generate`` run.
+
+Layout of one batch row (suffixes are left-padded *after* the prefix)::
+
+    [prefix tokens (cached)] [pad ... pad] [suffix tokens]
+     mask 1 ... 1             0 ... 0       1 ... 1
+
+``generate`` derives position ids from the attention mask, so padded rows
+continue right after the prefix exactly like an unpadded prompt would.
+
+Prefix caches are keyed by the prefix text and kept in a small LRU, so a
+cache stays valid until the system prompt, template or language pair
+changes.  Prompts that do not tokenize to the cached prefix tokens (a
+merge across the prefix boundary) are generated without the cache.
+
+:meth:`PrefixCachedGenerator.stream` generates a single prompt the same
+way but hands the decoded text out while it is produced, through a
+``TextIteratorStreamer`` fed by ``generate`` on a helper thread.
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from typing import Any
+
+try:
+    import torch
+    from transformers import (
+        DynamicCache,
+        StoppingCriteria,
+        StoppingCriteriaList,
+        TextIteratorStreamer,
+    )
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    torch = None
+    DynamicCache = None
+    StoppingCriteria = object
+    StoppingCriteriaList = None
+    TextIteratorStreamer = None
+    TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_PREFIX_PROBE = "\x00PREFIX_PROBE\x00"
+
+
+def shared_prefix(render: Callable[[str], str]) -> str:
+    """Return the part of a rendered prompt that precedes the text.
+
+    *render* builds the full prompt string for one text; it is called
+    once with a probe string to find where the text starts.
+    """
+    prompt = render(_PREFIX_PROBE)
+    index = prompt.find(_PREFIX_PROBE)
+    return prompt[:index] if index > 0 else ""
+
+
+class _StopOnEvent(StoppingCriteria):
+    """Ends ``generate`` once the stream consumer has gone away."""
+
+    def __init__(self, event: threading.Event) -> None:
+        self.event = event
+
+    def __call__(self, input_ids: Any, scores: Any, **kwargs: Any) -> Any:
+        return torch.full(
+            (input_ids.shape[0],), self.event.is_set(),
+            dtype=torch.bool, device=input_ids.device,
+        )
+
+
+class PrefixCachedGenerator:
+    """Batched ``model.generate`` that reuses the KV cache of a shared prompt prefix."""
+
+    def __init__(self, model: Any, tokenizer: Any, max_prefixes: int = 4) -> None:
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_prefixes = max_prefixes
+        self._prefixes: OrderedDict[str, tuple[list[int], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"prefix_builds": 0, "prefix_hits": 0, "uncached_prompts": 0}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._prefixes.clear()
+
+    def generate(
+        self,
+        prompts: list[str],
+        prefix: str = "",
+        max_batch_size: int = 8,
+        max_input_tokens: int | None = None,
+        **generate_kwargs: Any,
+    ) -> list[list[int]]:
+        """
+        Generate a continuation for every prompt.
+
+        Args:
+            prompts: Full prompt strings; those starting with *prefix* share
+                its cached KV state
+            prefix: Prompt text common to all prompts ("" disables caching)
+            max_batch_size: Prompts per ``generate`` run
+            max_input_tokens: Prompts longer than this are cut at the end
+            **generate_kwargs: Passed to ``model.generate``
+
+        Returns:
+            The generated token ids of each prompt, without the prompt and
+            without padding after the end-of-sequence token
+        """
+        if not prompts:
+            return []
+        encoded = self.tokenizer(prompts)["input_ids"]
+        if max_input_tokens:
+            encoded = [ids[:max_input_tokens] for ids in encoded]
+
+        prefix_ids: list[int] = []
+        prefix_cache = None
+        if prefix:
+            prefix_ids, prefix_cache = self._get_prefix(prefix)
+
+        cached: list[int] = []
+        uncached: list[int] = []
+        plen = len(prefix_ids)
+        for i, ids in enumerate(encoded):
+            if prefix_cache is not None and len(ids) > plen and ids[:plen] == prefix_ids:
+                cached.append(i)
+            else:
+                uncached.append(i)
+        self.stats["uncached_prompts"] += len(uncached) if prefix else 0
+
+        outputs: list[list[int]] = [[] for _ in prompts]
+        for indices, ids_prefix, cache in (
+            (cached, prefix_ids, prefix_cache),
+            (uncached, [], None),
+        ):
+            # Similar lengths share a batch to keep padding small
+            indices = sorted(indices, key=lambda i: len(encoded[i]), reverse=True)
+            for start in range(0, len(indices), max_batch_size):
+                chunk = indices[start:start + max_batch_size]
+                suffixes = [encoded[i][len(ids_prefix):] for i in chunk]
+                for i, generated in zip(chunk, self._generate_batch(
+                        ids_prefix, cache, suffixes, generate_kwargs)):
+                    outputs[i] = generated
+        return outputs
+
+    def stream(
+        self,
+        prompt: str,
+        prefix: str = "",
+        max_input_tokens: int | None = None,
+        timeout: float | None = 60.0,
+        **generate_kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Generate a continuation for one prompt, yielding text as it is decoded.
+
+        ``generate`` runs on a helper thread and feeds a
+        ``TextIteratorStreamer``, which hands out text at word boundaries.
+        Closing the iterator early stops generation after the current token.
+
+        Args:
+            prompt: Full prompt string
+            prefix: Prompt text whose cached KV state is reused ("" disables caching)
+            max_input_tokens: The prompt is cut at the end beyond this length
+            timeout: Seconds to wait for the next piece before giving up
+            **generate_kwargs: Passed to ``model.generate``
+
+        Yields:
+            Decoded text pieces; joined, they are the whole continuation
+            with special tokens skipped
+        """
+        ids = self.tokenizer(prompt)["input_ids"]
+        if max_input_tokens:
+            ids = ids[:max_input_tokens]
+
+        prefix_ids: list[int] = []
+        prefix_cache = None
+        if prefix:
+            prefix_ids, prefix_cache = self._get_prefix(prefix)
+            plen = len(prefix_ids)
+            if not (len(ids) > plen and ids[:plen] == prefix_ids):
+                prefix_ids, prefix_cache = [], None
+                self.stats["uncached_prompts"] += 1
+
+        input_ids, attention_mask, kwargs = self._prepare_batch(
+            prefix_ids, prefix_cache, [ids[len(prefix_ids):]], generate_kwargs,
+        )
+        streamer = TextIteratorStreamer(
+            self.tokenizer, skip_prompt=True, skip_special_tokens=True, timeout=timeout,
+        )
+        stop = threading.Event()
+        kwargs["streamer"] = streamer
+        kwargs["stopping_criteria"] = StoppingCriteriaList(
+            list(kwargs.get("stopping_criteria") or []) + [_StopOnEvent(stop)]
+        )
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                with torch.inference_mode():
+                    self.model.generate(
+                        input_ids=input_ids, attention_mask=attention_mask, **kwargs,
+                    )
+            except BaseException as exc:
+                errors.append(exc)
+                # Unblock the consumer; generate() only ends the stream on success
+                streamer.end()
+
+        thread = threading.Thread(target=run, name="llm-stream", daemon=True)
+        thread.start()
+        try:
+            for piece in streamer:
+                if piece:
+                    yield piece
+        finally:
+            stop.set()
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    # ------------------------------------------------------------------
+
+    def _get_prefix(self, prefix: str) -> tuple[list[int], Any]:
+        with self._lock:
+            entry = self._prefixes.get(prefix)
+            if entry is not None:
+                self._prefixes.move_to_end(prefix)
+                self.stats["prefix_hits"] += 1
+                return entry
+
+        prefix_ids = self.tokenizer(prefix)["input_ids"]
+        device = self.model.device
+        with torch.inference_mode():
+            out = self.model(
+                input_ids=torch.tensor([prefix_ids], device=device),
+                past_key_values=DynamicCache(config=self.model.config),
+                use_cache=True,
+            )
+        entry = (prefix_ids, out.past_key_values)
+        with self._lock:
+            self._prefixes[prefix] = entry
+            self._prefixes.move_to_end(prefix)
+            while len(self._prefixes) > self.max_prefixes:
+                self._prefixes.popitem(last=False)
+            self.stats["prefix_builds"] += 1
+        logger.debug("Cached prompt prefix of %d tokens", len(prefix_ids))
+        return entry
+
+    def _prepare_batch(
+        self,
+        prefix_ids: list[int],
+        prefix_cache: Any,
+        suffixes: list[list[int]],
+        generate_kwargs: dict[str, Any],
+    ) -> tuple[Any, Any, dict[str, Any]]:
+        """Lay out one batch (see the module docstring) and its ``generate`` kwargs."""
+        pad_id = generate_kwargs.get("pad_token_id")
+        if pad_id is None:
+            pad_id = self.tokenizer.pad_token_id
+        if pad_id is None:
+            pad_id = self.tokenizer.eos_token_id
+
+        width = max(len(s) for s in suffixes)
+        input_ids = []
+        attention_mask = []
+        for suffix in suffixes:
+            pad = width - len(suffix)
+            input_ids.append(prefix_ids + [pad_id] * pad + suffix)
+            attention_mask.append([1] * len(prefix_ids) + [0] * pad + [1] * len(suffix))
+
+        kwargs = dict(generate_kwargs)
+        kwargs.setdefault("pad_token_id", pad_id)
+        if prefix_cache is not None:
+            # generate() appends to the cache, so every run gets its own copy
+            cache = copy.deepcopy(prefix_cache)
+            if len(suffixes) > 1:
+                cache.batch_repeat_interleave(len(suffixes))
+            kwargs["past_key_values"] = cache
+
+        device = self.model.device
+        return (
+            torch.tensor(input_ids, device=device),
+            torch.tensor(attention_mask, device=device),
+            kwargs,
+        )
+
+    def _generate_batch(
+        self,
+        prefix_ids: list[int],
+        prefix_cache: Any,
+        suffixes: list[list[int]],
+        generate_kwargs: dict[str, Any],
+    ) -> list[list[int]]:
+        input_ids, attention_mask, kwargs = self._prepare_batch(
+            prefix_ids, prefix_cache, suffixes, generate_kwargs,
+        )
+        with torch.inference_mode():
+            out = self.model.generate(
+                input_ids=input_ids, attention_mask=attention_mask, **kwargs,
+            )
+
+        eos = self._eos_ids(kwargs)
+        prompt_len = input_ids.shape[1]
+        results = []
+        for row in out[:, prompt_len:].tolist():
+            for j, token in enumerate(row):
+                if token in eos:
+                    row = row[:j]
+                    break
+            results.append(row)
+        return results
+
+    def _eos_ids(self, kwargs: dict[str, Any]) -> set[int]:
+        eos = kwargs.get("eos_token_id")
+        if eos is None:
+            eos = getattr(getattr(self.model, "generation_config", None), "eos_token_id", None)
+        if eos is None:
+            eos = self.tokenizer.eos_token_id
+        if eos is None:
+            return set()
+        return set(eos) if isinstance(eos, (list, tuple)) else {eos}
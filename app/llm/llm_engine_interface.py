@@ -7,6 +7,7 @@ implementations (e.g. Qwen3, custom models).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 from enum import Enum
@@ -158,6 +159,25 @@ class ILLMEngine(ABC):
         """
         ...
 
+    def process_text_stream(
+        self, text: str, options: LLMProcessingOptions,
+    ) -> Iterator[str]:
+        """
+        Process text, yielding the output while it is generated.
+
+        Every item is the output so far (not a delta) and the last item is
+        the final output.  Engines with ``capabilities.supports_streaming``
+        override this; the default yields ``process_text()`` once.
+
+        Args:
+            text: Input text to process
+            options: Processing options and prompt configuration
+
+        Yields:
+            Partial outputs, ending with the final one
+        """
+        yield self.process_text(text, options)
+
     @abstractmethod
     def set_system_prompt(self, prompt: str) -> None:
         """
@@ -12,6 +12,7 @@ is selected as both the translation engine and the LLM engine).
 
 import time
 import threading
+from collections.abc import Iterator
 from typing import Any
 from dataclasses import dataclass, field
 from enum import Enum
@@ -353,6 +354,57 @@ class LLMLayer:
             self._logger.error(f"Batch LLM processing failed: {e}")
             return list(texts)
 
+    def process_text_stream(
+        self,
+        text: str,
+        engine: str | None = None,
+        options: LLMProcessingOptions | None = None,
+    ) -> Iterator[str]:
+        """
+        Process text, yielding the output while the engine generates it.
+
+        Every item is the output so far and the last one is final.  When the
+        engine is not ready this falls back to ``process_text()`` (and its
+        fallback engines) and yields once.
+
+        Args:
+            text: Input text to process
+            engine: Optional engine name override
+            options: Optional processing options
+
+        Yields:
+            Partial outputs, ending with the final one
+        """
+        if options is None:
+            options = LLMProcessingOptions(
+                mode=self.config.default_mode,
+                temperature=self.config.default_temperature,
+                max_tokens=self.config.default_max_tokens,
+            )
+
+        target_engine = engine or self._current_engine
+        llm_engine = self.plugin_manager.get_engine(target_engine) if target_engine else None
+        if not llm_engine or not llm_engine.is_ready() or self.status != LLMLayerStatus.READY:
+            yield self.process_text(text, engine, options)
+            return
+
+        with self._lock:
+            self.status = LLMLayerStatus.PROCESSING
+        try:
+            yield from llm_engine.process_text_stream(text, options)
+        except Exception as e:
+            self._logger.error(f"Streaming LLM processing failed: {e}")
+            yield text
+        finally:
+            with self._lock:
+                self.status = LLMLayerStatus.READY
+
+    def supports_streaming(self, engine: str | None = None) -> bool:
+        """Whether ``process_text_stream()`` yields partial outputs for *engine*."""
+        target_engine = engine or self._current_engine
+        llm_engine = self.plugin_manager.get_engine(target_engine) if target_engine else None
+        return bool(llm_engine and llm_engine.get_capabilities().supports_streaming)
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
@@ -0,0 +1,87 @@
+"""
+Helpers for batched OCR over many small crops.
+
+Engines with real batch support (EasyOCR, PaddleOCR, DocTR) need
+same-sized inputs or at least a single call with all crops; engines
+without it (Tesseract) can instead OCR one vertical montage of all crops.
+Padding always goes to the bottom/right edge so OCR coordinates inside
+each crop remain valid without any remapping.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+# Give up on padding when the padded batch would be this many times
+# larger than the crops themselves (one huge crop among tiny ones).
+MAX_PADDING_RATIO = 4.0
+
+
+def border_fill(image: np.ndarray) -> np.ndarray | int:
+    """Return the median border colour of *image* (used as padding fill)."""
+    border = np.concatenate([
+        image[0].reshape(-1, *image.shape[2:]),
+        image[-1].reshape(-1, *image.shape[2:]),
+        image[:, 0].reshape(-1, *image.shape[2:]),
+        image[:, -1].reshape(-1, *image.shape[2:]),
+    ])
+    fill = np.median(border, axis=0).astype(image.dtype)
+    return fill if image.ndim == 3 else int(fill)
+
+
+def can_pad_batch(images: Sequence[np.ndarray], max_dimension: int | None = None) -> bool:
+    """Return ``True`` when *images* can share one padded batch.
+
+    Requires matching channel layout, no image above *max_dimension*,
+    and padding overhead within ``MAX_PADDING_RATIO``.
+    """
+    if len(images) < 2:
+        return False
+    if len({img.shape[2:] for img in images}) != 1:
+        return False
+    max_h = max(img.shape[0] for img in images)
+    max_w = max(img.shape[1] for img in images)
+    if max_dimension is not None and max(max_h, max_w) > max_dimension:
+        return False
+    total = sum(img.shape[0] * img.shape[1] for img in images)
+    return max_h * max_w * len(images) <= total * MAX_PADDING_RATIO
+
+
+def pad_to_common_size(images: Sequence[np.ndarray]) -> np.ndarray:
+    """Stack *images* into one ``(N, H, W[, C])`` array.
+
+    Each image is padded at the bottom/right with its own border colour
+    so the padding does not introduce edges the detector could pick up.
+    """
+    max_h = max(img.shape[0] for img in images)
+    max_w = max(img.shape[1] for img in images)
+    batch = np.empty((len(images), max_h, max_w, *images[0].shape[2:]), dtype=images[0].dtype)
+    for i, img in enumerate(images):
+        h, w = img.shape[:2]
+        batch[i] = border_fill(img)
+        batch[i, :h, :w] = img
+    return batch
+
+
+def stack_vertically(
+    images: Sequence[np.ndarray], gap: int = 32,
+) -> tuple[np.ndarray, list[int]]:
+    """Stack *images* top to bottom with *gap* rows of padding between.
+
+    Returns:
+        ``(montage, y_offsets)`` where ``y_offsets[i]`` is the row at
+        which image *i* starts.
+    """
+    max_w = max(img.shape[1] for img in images)
+    total_h = sum(img.shape[0] for img in images) + gap * (len(images) - 1)
+    montage = np.empty((total_h, max_w, *images[0].shape[2:]), dtype=images[0].dtype)
+    offsets: list[int] = []
+    y = 0
+    for img in images:
+        h, w = img.shape[:2]
+        band_end = min(total_h, y + h + gap)
+        montage[y:band_end] = border_fill(img)
+        montage[y:y + h, :w] = img
+        offsets.append(y)
+        y += h + gap
+    return montage, offsets
@@ -245,7 +245,122 @@ class OCRLayer(IOCRLayer):
             self._logger.error(f"OCR extraction failed: {error_msg}")
         
         return result.text_blocks
-    
+
+    def extract_text_batch(self, frames: list[Frame], engine: str | None = None,
+                           options: OCRProcessingOptions | None = None) -> list[list[TextBlock]]:
+        """
+        Extract text from several frames (e.g. ROI crops) in one engine call.
+
+        Cached frames are answered from the cache; the remaining frames are
+        handed to the engine's ``extract_text_batch`` together so engines
+        with real batch support can run them through one forward pass.
+
+        Args:
+            frames: Input frames
+            engine: Optional specific engine name to use
+            options: Optional processing options
+
+        Returns:
+            One list of text blocks per input frame, in input order
+        """
+        if self.status != OCRLayerStatus.READY:
+            raise RuntimeError(f"OCR layer not ready (status: {self.status})")
+
+        if options is None:
+            options = OCRProcessingOptions()
+
+        results: list[list[TextBlock] | None] = [None] * len(frames)
+        pending: list[int] = []
+        for i, frame in enumerate(frames):
+            cached_result = self._cache.get(frame, options) if self._cache else None
+            if cached_result and cached_result.success:
+                results[i] = cached_result.text_blocks
+            else:
+                pending.append(i)
+
+        if pending:
+            target_engine = engine or self._current_engine
+            if not target_engine:
+                raise ValueError("No OCR engine specified and no default engine set")
+
+            engines = [target_engine]
+            if self.config.auto_fallback_enabled:
+                engines += [e for e in self.config.fallback_engines if e != target_engine]
+
+            # Like extract_text, every frame the engine failed on moves on
+            # to the next fallback engine; the frames it answered stay put
+            for engine_name in engines:
+                if engine_name != target_engine:
+                    self._logger.info(f"Trying fallback engine: {engine_name} for {len(pending)} frame(s)")
+                batch_results = self._process_batch_with_engine(
+                    [frames[i] for i in pending], engine_name, options)
+                if batch_results is None:
+                    continue
+                failed = []
+                for i, result in zip(pending, batch_results):
+                    if result.success:
+                        if self._cache:
+                            self._cache.put(frames[i], options, result)
+                        results[i] = result.text_blocks
+                    else:
+                        failed.append(i)
+                pending = failed
+                if not pending:
+                    break
+
+            if pending:
+                self._logger.error(f"Batch OCR extraction failed for {len(pending)} frame(s)")
+                for i in pending:
+                    results[i] = []
+
+        return results
+
+    def _process_batch_with_engine(self, frames: list[Frame], engine_name: str,
+                                   options: OCRProcessingOptions) -> list[OCRResult] | None:
+        """
+        Process several frames with one ``extract_text_batch`` call.
+
+        Returns:
+            One result per frame, or None if the engine is unavailable or
+            the batch call failed
+        """
+        start_time = time.perf_counter()
+
+        engine = self.plugin_manager.get_engine(engine_name)
+        if not engine or not engine.is_ready():
+            return None
+
+        valid = [i for i, frame in enumerate(frames) if engine.validate_frame(frame)]
+        try:
+            with self._lock:
+                self.status = OCRLayerStatus.PROCESSING
+            batch_blocks = engine.extract_text_batch([frames[i] for i in valid], options)
+        except Exception as e:
+            self._logger.error(f"Batch OCR with {engine_name} failed: {e}")
+            return None
+        finally:
+            with self._lock:
+                self.status = OCRLayerStatus.READY
+
+        per_frame_ms = (time.perf_counter() - start_time) * 1000 / max(1, len(frames))
+        results = [
+            OCRResult(text_blocks=[], engine_used=engine_name, processing_time_ms=0,
+                      success=False, error_message="Frame validation failed for engine")
+            for _ in frames
+        ]
+        for i, text_blocks in zip(valid, batch_blocks):
+            confidence_score = 0.0
+            if text_blocks:
+                confidence_score = sum(block.confidence for block in text_blocks) / len(text_blocks)
+            results[i] = OCRResult(
+                text_blocks=text_blocks,
+                engine_used=engine_name,
+                processing_time_ms=per_frame_ms,
+                success=True,
+                confidence_score=confidence_score
+            )
+        return results
+
     def _process_with_engine(self, frame: Frame, engine_name: str, 
                            options: OCRProcessingOptions) -> OCRResult:
         """
@@ -4,6 +4,11 @@ Intelligent Positioning Engine
 Provides smart overlay positioning with collision avoidance.
 Uses a spiral search pattern to handle dense text layouts (e.g. manga pages
 with many speech bubbles in close proximity).
+
+Placed rectangles are kept in a uniform grid, so each candidate is only
+tested against the rectangles near it instead of every overlay placed so
+far.  Overlays are placed largest first so big bubbles keep their spot;
+results keep the input order.
 """
 
 from dataclasses import dataclass
@@ -25,6 +30,63 @@ class PositioningContext:
     screen_height: int = 1080
 
 
+# Unit offsets of the spiral candidates of one ring, in search order:
+# above, below, left, right, top-right, top-left, bottom-right, bottom-left
+_SPIRAL_UNITS = [(0, -1), (0, 1), (-1, 0), (1, 0), (1, -1), (-1, -1), (1, 1), (-1, 1)]
+
+
+class _RectGrid:
+    """Uniform grid of placed rectangles, as (x0, y0, x1, y1) boxes.
+
+    Cells are keyed by one int (``cy * _ROW + cx``) rather than a tuple;
+    the collision test is dominated by cell lookups.
+    """
+
+    _ROW = 1 << 20
+
+    def __init__(self, cell_size: int):
+        self.cell_size = max(1, int(cell_size))
+        self.cells: dict[int, list[tuple[int, int, int, int]]] = {}
+
+    def add(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        box = (x0, y0, x1, y1)
+        c = self.cell_size
+        cells = self.cells
+        for cy in range(y0 // c, y1 // c + 1):
+            row = cy * self._ROW
+            for cx in range(x0 // c, x1 // c + 1):
+                bucket = cells.get(row + cx)
+                if bucket is None:
+                    cells[row + cx] = [box]
+                else:
+                    bucket.append(box)
+
+    def collides(self, x0: int, y0: int, x1: int, y1: int, padding: int) -> bool:
+        """True if a placed box comes within *padding* of (x0, y0)-(x1, y1).
+
+        Only the cells under the padded area are visited, and the scan
+        stops at the first hit; a box spanning several of those cells may
+        be tested more than once, which is cheaper than deduplicating.
+        """
+        c = self.cell_size
+        cells = self.cells
+        # Pad the query once instead of every box
+        x0 -= padding
+        y0 -= padding
+        x1 += padding
+        y1 += padding
+        cx0, cx1 = x0 // c, x1 // c + 1
+        for cy in range(y0 // c, y1 // c + 1):
+            row = cy * self._ROW
+            for cx in range(cx0, cx1):
+                bucket = cells.get(row + cx)
+                if bucket:
+                    for bx0, by0, bx1, by1 in bucket:
+                        if x1 >= bx0 and bx1 >= x0 and y1 >= by0 and by1 >= y0:
+                            return True
+        return False
+
+
 class IntelligentPositioningEngine:
     """
     Positioning engine with collision avoidance for translation overlays.
@@ -59,13 +121,28 @@ class IntelligentPositioningEngine:
 
     def _apply_intelligent_positioning(self, translations):
         """Apply intelligent positioning with collision avoidance."""
-        positioned = []
-        existing_rects = []
-
-        for translation in translations:
+        positioned = [None] * len(translations)
+        if not translations:
+            return []
+        sizes = sorted(max(t.position.width, t.position.height) for t in translations)
+        # Cells of about twice the median overlay: a padded candidate then
+        # spans one to four cells (measured fastest at 1.5-2x)
+        grid = _RectGrid(2 * max(sizes[len(sizes) // 2], 16) + self.collision_padding)
+        bounds = self._placement_bounds()
+
+        # Largest first; sorted() is stable, so equal areas keep input order
+        order = sorted(range(len(translations)),
+                       key=lambda i: -translations[i].position.area)
+        for index in order:
+            translation = translations[index]
             original_rect = translation.position
 
-            best_rect = self._find_best_position(original_rect, existing_rects)
+            best_rect = self._find_best_position(original_rect, grid, bounds)
+            grid.add(best_rect.x, best_rect.y,
+                     best_rect.x + best_rect.width, best_rect.y + best_rect.height)
+            if best_rect is original_rect:
+                positioned[index] = translation
+                continue
 
             positioned_translation = Translation(
                 original_text=translation.original_text,
@@ -83,72 +160,44 @@ class IntelligentPositioningEngine:
             if hasattr(translation, 'estimated_font_size'):
                 positioned_translation.estimated_font_size = translation.estimated_font_size
 
-            positioned.append(positioned_translation)
-            existing_rects.append(best_rect)
+            positioned[index] = positioned_translation
 
         return positioned
 
-    def _find_best_position(self, original_rect, existing_rects):
-        """Find best position avoiding collisions using spiral search."""
-        if not self._has_collision(original_rect, existing_rects):
-            return original_rect
+    def _find_best_position(self, original_rect, grid, bounds=None):
+        """Find best position avoiding collisions using spiral search.
 
-        gap = self.collision_padding + 5
+        Returns the first candidate, in spiral order, that is on screen and
+        does not collide with the rectangles already in *grid*.  Ring 1
+        holds the 4 cardinal + 4 diagonal neighbours; each further ring
+        moves them one overlay size (plus gap) further out.
+        """
+        p = self.collision_padding
+        x, y, w, h = original_rect.x, original_rect.y, original_rect.width, original_rect.height
+        if not grid.collides(x, y, x + w, y + h, p):
+            return original_rect
 
+        left, top, right, bottom = bounds or self._placement_bounds()
+        gap = p + 5
+        step_x, step_y = w + gap, h + gap
         for ring in range(1, self._MAX_SPIRAL_RINGS + 1):
-            candidates = self._generate_spiral_candidates(original_rect, gap, ring)
-            for candidate in candidates:
-                if self._is_on_screen(candidate) and not self._has_collision(candidate, existing_rects):
-                    return candidate
+            dx, dy = step_x * ring, step_y * ring
+            for ux, uy in _SPIRAL_UNITS:
+                cx, cy = x + ux * dx, y + uy * dy
+                if (cx >= left and cy >= top and cx + w <= right and cy + h <= bottom
+                        and not grid.collides(cx, cy, cx + w, cy + h, p)):
+                    return Rectangle(cx, cy, w, h)
 
         return original_rect
 
-    def _generate_spiral_candidates(self, rect, gap, ring):
-        """Generate candidate positions in a spiral ring around *rect*.
-
-        Ring 1 produces the 4 cardinal + 4 diagonal neighbours (8 total).
-        Each subsequent ring extends the offset further out.
-        """
-        dx = (rect.width + gap) * ring
-        dy = (rect.height + gap) * ring
-        cx, cy = rect.x, rect.y
-        w, h = rect.width, rect.height
-
-        return [
-            Rectangle(cx, cy - dy, w, h),          # above
-            Rectangle(cx, cy + dy, w, h),           # below
-            Rectangle(cx - dx, cy, w, h),           # left
-            Rectangle(cx + dx, cy, w, h),           # right
-            Rectangle(cx + dx, cy - dy, w, h),      # top-right
-            Rectangle(cx - dx, cy - dy, w, h),      # top-left
-            Rectangle(cx + dx, cy + dy, w, h),      # bottom-right
-            Rectangle(cx - dx, cy + dy, w, h),      # bottom-left
-        ]
-
-    def _has_collision(self, rect, existing_rects):
-        """Check if rectangle collides with any existing rectangles."""
-        p = self.collision_padding
-        for existing in existing_rects:
-            if not (rect.x + rect.width + p < existing.x or
-                    existing.x + existing.width + p < rect.x or
-                    rect.y + rect.height + p < existing.y or
-                    existing.y + existing.height + p < rect.y):
-                return True
-        return False
-
-    def _is_on_screen(self, rect):
-        """Check if rectangle is within the overlay region (if set) or screen bounds."""
+    def _placement_bounds(self):
+        """(left, top, right, bottom) an overlay must stay within, margins applied."""
         m = self.screen_margin
         ov = self.overlay_region
         if ov and ov.get('width', 0) > 0 and ov.get('height', 0) > 0:
-            return (rect.x >= ov.get('x', 0) + m and
-                    rect.y >= ov.get('y', 0) + m and
-                    rect.x + rect.width <= ov['x'] + ov['width'] - m and
-                    rect.y + rect.height <= ov['y'] + ov['height'] - m)
-        return (rect.x >= m and
-                rect.y >= m and
-                rect.x + rect.width <= self.context.screen_width - m and
-                rect.y + rect.height <= self.context.screen_height - m)
+            return (ov.get('x', 0) + m, ov.get('y', 0) + m,
+                    ov['x'] + ov['width'] - m, ov['y'] + ov['height'] - m)
+        return (m, m, self.context.screen_width - m, self.context.screen_height - m)
 
     def update_context(self, context: PositioningContext):
         """Update positioning context."""
@@ -45,6 +45,7 @@ class DifferenceConfig:
     max_change_percentage: float = 0.8  # Maximum percentage of frame that can be "changed"
     enable_noise_reduction: bool = True
     enable_morphology: bool = True
+    pyramid_levels: int = 0  # Halve resolution this many times before differencing (0-3)
     
     def __post_init__(self):
         """Validate configuration parameters."""
@@ -56,6 +57,8 @@ class DifferenceConfig:
             raise ValueError("Morphology kernel size must be odd")
         if not 0.0 <= self.max_change_percentage <= 1.0:
             raise ValueError("Max change percentage must be between 0.0 and 1.0")
+        if not 0 <= self.pyramid_levels <= 3:
+            raise ValueError("Pyramid levels must be between 0 and 3")
 
 
 @dataclass
@@ -166,6 +169,8 @@ class FrameDifferenceEngine:
             # Convert to grayscale if needed
             current_gray = self._prepare_frame(current_frame.data)
             previous_gray = self._prepare_frame(previous_frame.data)
+            frame_h, frame_w = current_frame.data.shape[:2]
+            scale = max(1, round(frame_w / current_gray.shape[1]))
             
             # Calculate difference based on method
             if self.config.method == DifferenceMethod.ABSOLUTE:
@@ -191,8 +196,10 @@ class FrameDifferenceEngine:
             threshold = self._get_threshold_value()
             binary_diff = (diff_map > threshold).astype(np.uint8) * 255
             
-            # Find change regions
-            change_regions = self._find_change_regions(binary_diff, diff_map)
+            # Find change regions (mapped back to full resolution)
+            change_regions = self._find_change_regions(binary_diff, diff_map, scale)
+            if scale > 1:
+                change_regions = self._upscale_regions(change_regions, scale, frame_w, frame_h)
             
             # Calculate change percentage
             total_pixels = diff_map.size
@@ -240,9 +247,19 @@ class FrameDifferenceEngine:
             # Convert BGR to grayscale
             gray = cv2.cvtColor(frame_data, cv2.COLOR_BGR2GRAY)
         else:
-            gray = frame_data.copy()
+            gray = frame_data
+        
+        # Pyramid mode: downscale while still 8-bit (area averaging keeps
+        # small changes visible as lower-intensity pixels)
+        for _ in range(self.config.pyramid_levels):
+            if min(gray.shape[:2]) < 32:
+                break
+            gray = cv2.resize(
+                gray, (gray.shape[1] // 2, gray.shape[0] // 2),
+                interpolation=cv2.INTER_AREA,
+            )
         
-        # Normalize to 0-1 range
+        # Normalize to 0-1 range (always a new array)
         return gray.astype(np.float32) / 255.0
     
     def _calculate_absolute_difference(self, current: np.ndarray, previous: np.ndarray) -> np.ndarray:
@@ -335,13 +352,16 @@ class FrameDifferenceEngine:
         else:  # CUSTOM
             return self.config.threshold
     
-    def _find_change_regions(self, binary_diff: np.ndarray, diff_map: np.ndarray) -> list[ChangeRegion]:
+    def _find_change_regions(self, binary_diff: np.ndarray, diff_map: np.ndarray,
+                             scale: int = 1) -> list[ChangeRegion]:
         """
         Find and analyze change regions in the difference map.
         
         Args:
             binary_diff: Binary difference map
             diff_map: Original difference map with intensity values
+            scale: Downscale factor of the maps; areas are reported in
+                full-resolution pixels (rectangles stay in map coordinates)
             
         Returns:
             list[ChangeRegion]: List of detected change regions
@@ -351,34 +371,40 @@ class FrameDifferenceEngine:
         try:
             # Find connected components
             num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(binary_diff, connectivity=8)
-            
-            for i in range(1, num_labels):  # Skip background (label 0)
-                # Get component statistics
-                x, y, w, h, area = stats[i]
-                
-                # Filter out small regions
-                if area < self.config.min_change_area:
-                    continue
-                
-                # Create mask for this component
-                component_mask = (labels == i)
-                
-                # Calculate change intensity for this region
-                region_diff_values = diff_map[component_mask]
-                change_intensity = np.mean(region_diff_values)
-                
-                # Calculate confidence based on area and intensity
-                confidence = min(1.0, (area / 1000.0) * change_intensity * 2.0)
-                
-                # Create change region
-                region = ChangeRegion(
+            if num_labels <= 1:
+                return regions
+            
+            # Per-label intensity sums in one pass instead of one
+            # full-frame mask per component; only foreground pixels carry
+            # a label, so gather those first (changes are usually sparse)
+            foreground = np.flatnonzero(binary_diff)
+            sums = np.bincount(
+                labels.ravel()[foreground],
+                weights=diff_map.ravel()[foreground],
+                minlength=num_labels,
+            )
+            areas = stats[:, cv2.CC_STAT_AREA]
+            full_areas = areas * (scale * scale)
+            
+            # Skip background (label 0) and filter out small regions
+            keep = np.flatnonzero(full_areas[1:] >= self.config.min_change_area) + 1
+            if keep.size == 0:
+                return regions
+            
+            intensities = sums[keep] / areas[keep]
+            # Confidence based on area and intensity
+            confidences = np.minimum(1.0, (full_areas[keep] / 1000.0) * intensities * 2.0)
+            
+            for label, change_intensity, confidence in zip(
+                keep.tolist(), intensities.tolist(), confidences.tolist(),
+            ):
+                x, y, w, h = stats[label, :4].tolist()
+                regions.append(ChangeRegion(
                     rectangle=Rectangle(x, y, w, h),
                     change_intensity=change_intensity,
-                    pixel_count=area,
+                    pixel_count=int(full_areas[label]),
                     confidence=confidence
-                )
-                
-                regions.append(region)
+                ))
             
             # Sort regions by confidence (highest first)
             regions.sort(key=lambda r: r.confidence, reverse=True)
@@ -388,6 +414,24 @@ class FrameDifferenceEngine:
         
         return regions
     
+    @staticmethod
+    def _upscale_regions(regions: list[ChangeRegion], factor: int,
+                         frame_w: int, frame_h: int) -> list[ChangeRegion]:
+        """Map regions found on a downscaled pyramid level back to the full frame."""
+        scaled = []
+        for region in regions:
+            rect = region.rectangle
+            x, y = rect.x * factor, rect.y * factor
+            w = min(rect.width * factor, frame_w - x)
+            h = min(rect.height * factor, frame_h - y)
+            scaled.append(ChangeRegion(
+                rectangle=Rectangle(x, y, w, h),
+                change_intensity=region.change_intensity,
+                pixel_count=region.pixel_count,
+                confidence=region.confidence,
+            ))
+        return scaled
+    
     def _update_performance_stats(self, processing_time: float) -> None:
         """Update performance statistics."""
         self._processing_times.append(processing_time)
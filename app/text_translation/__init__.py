@@ -23,6 +23,13 @@ except ImportError as e:
     AbstractTranslationEngine = None
     TranslationEngineRegistry = None
 
+try:
+    from .tiered_cache import TieredTranslationCache, get_translation_cache
+except ImportError as e:
+    print(f"Warning: Could not import tiered_cache: {e}")
+    TieredTranslationCache = None
+    get_translation_cache = None
+
 try:
     from .layer import (
         TranslationLayer,
@@ -78,6 +85,8 @@ __all__ = [
     
     # Caching
     'TranslationCache',
+    'TieredTranslationCache',
+    'get_translation_cache',
     
     # Data classes and enums
     'TranslationOptions',
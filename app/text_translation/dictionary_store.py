@@ -0,0 +1,468 @@
+"""
+Memory-mapped binary store for SmartDictionary language pairs.
+
+A ``*.json.gz`` wordbook has to be parsed completely into nested dicts
+before the first lookup.  The ``.optidict`` store next to it is opened with
+``mmap`` instead and only decodes the entries that are actually read.
+
+File layout (little-endian)::
+
+    header   b"OPTIDICT", u32 meta length, meta JSON (languages, counts,
+             region offsets), zero padding to 8 bytes
+    records  per entry: u64 key offset, u64 value offset,
+             u64 (key length | value length << 32) -- sorted by key bytes
+    table    u32 record index per slot (0xFFFFFFFF = empty), open
+             addressing with linear probing on ``zlib.crc32(key)``
+    keys     UTF-8 keys, concatenated
+    values   compact UTF-8 JSON per entry, concatenated
+
+Changes made after the store was written (learned entries, edits,
+deletions) live in an in-memory overlay and are appended to a line-based
+JSON journal (``<store>.journal``) so they survive a crash.  Once the
+journal grows past a threshold a background thread compacts base + journal
+into a new store file; unchanged values are copied as raw bytes, never
+decoded.
+
+``MappedDictionary`` is a ``MutableMapping`` so ``SmartDictionary`` (and
+code that reaches into ``_dictionaries``) can use it like the plain dict
+it replaces.  The gzip JSON format stays the import/export format.
+"""
+
+import gzip
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STORE_SUFFIX = ".optidict"
+JOURNAL_SUFFIX = ".journal"
+
+_MAGIC = b"OPTIDICT"
+_VERSION = 1
+_EMPTY = 0xFFFFFFFF
+_MISSING = object()
+
+# Journal operations before a background compaction is started
+DEFAULT_COMPACT_THRESHOLD = 5000
+
+
+def store_path_for(json_path: str | Path) -> Path:
+    """Return the store path used for a ``<src>_<tgt>.json.gz`` wordbook."""
+    json_path = Path(json_path)
+    name = json_path.name
+    for suffix in (".json.gz", ".json"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    return json_path.with_name(name + STORE_SUFFIX)
+
+
+def _encode_value(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_store(
+    path: str | Path,
+    items: Iterable[tuple[str, bytes]],
+    source_language: str,
+    target_language: str,
+) -> int:
+    """
+    Write a store file atomically.
+
+    Args:
+        path: Destination ``.optidict`` path
+        items: ``(key, encoded value)`` pairs; values are compact JSON bytes
+        source_language: Source language code
+        target_language: Target language code
+
+    Returns:
+        Number of entries written
+    """
+    path = Path(path)
+    entries = sorted((key.encode("utf-8"), value) for key, value in items)
+    count = len(entries)
+    table_size = 8
+    while table_size < count * 2:
+        table_size *= 2
+    mask = table_size - 1
+
+    records = bytearray(count * 24)
+    table = bytearray(b"\xff" * (table_size * 4))
+    table_view = memoryview(table).cast("I")
+    key_offset = value_offset = 0
+    for i, (key, value) in enumerate(entries):
+        struct.pack_into("<QQQ", records, i * 24, key_offset, value_offset,
+                         len(key) | (len(value) << 32))
+        key_offset += len(key)
+        value_offset += len(value)
+        slot = zlib.crc32(key) & mask
+        while table_view[slot] != _EMPTY:
+            slot = (slot + 1) & mask
+        table_view[slot] = i
+    table_view.release()
+
+    meta = {
+        "version": _VERSION,
+        "source_language": source_language,
+        "target_language": target_language,
+        "count": count,
+        "table_size": table_size,
+    }
+    # Offsets depend on the meta length, so reserve fixed-width fields
+    for name in ("records", "table", "keys", "values"):
+        meta[name] = 0
+    header_len = _align(len(_MAGIC) + 4 + len(json.dumps(meta)) + 4 * 20)
+    meta["records"] = header_len
+    meta["table"] = _align(meta["records"] + len(records))
+    meta["keys"] = _align(meta["table"] + len(table))
+    meta["values"] = _align(meta["keys"] + key_offset)
+    meta_bytes = json.dumps(meta).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_MAGIC + struct.pack("<I", len(meta_bytes)) + meta_bytes)
+            for region, start in ((records, meta["records"]), (table, meta["table"])):
+                f.write(b"\0" * (start - f.tell()))
+                f.write(region)
+            f.write(b"\0" * (meta["keys"] - f.tell()))
+            for key, _ in entries:
+                f.write(key)
+            f.write(b"\0" * (meta["values"] - f.tell()))
+            for _, value in entries:
+                f.write(value)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return count
+
+
+def import_json_gz(json_path: str | Path, store_path: str | Path | None = None,
+                   source_language: str = "", target_language: str = "") -> Path:
+    """Convert a gzip JSON wordbook into a store; return the store path."""
+    with gzip.open(json_path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "translations" in data:
+        source_language = data.get("source_language", source_language)
+        target_language = data.get("target_language", target_language)
+        data = data["translations"]
+    store_path = Path(store_path) if store_path else store_path_for(json_path)
+    write_store(store_path, ((k, _encode_value(v)) for k, v in data.items()),
+                source_language, target_language)
+    return store_path
+
+
+class MappedDictionary(MutableMapping):
+    """``MutableMapping`` view of a store plus its journal."""
+
+    def __init__(self, path: str | Path, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        self.path = Path(path)
+        self.journal_path = Path(str(self.path) + JOURNAL_SUFFIX)
+        self._compacting_path = Path(str(self.journal_path) + ".compacting")
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._compactor: threading.Thread | None = None
+        # Called with the store after every compaction (e.g. to re-export JSON)
+        self.on_compacted: Callable[["MappedDictionary"], None] | None = None
+
+        self._overlay: dict[str, Any] = {}
+        self._new_keys: set[str] = set()    # overlay keys missing from the base
+        self._deleted: set[str] = set()     # base keys deleted since
+        self._compaction_deletes: set[str] | None = None  # deleted while compacting
+        self._journal_ops = 0
+
+        self._open_base()
+        for journal in (self._compacting_path, self.journal_path):
+            self._replay(journal)
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+    # -- base store ------------------------------------------------------------
+
+    def _open_base(self) -> None:
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(_MAGIC)] != _MAGIC:
+            self._close_base()
+            raise ValueError(f"Not a dictionary store: {self.path}")
+        (meta_len,) = struct.unpack_from("<I", self._mm, len(_MAGIC))
+        start = len(_MAGIC) + 4
+        meta = json.loads(self._mm[start:start + meta_len])
+        if meta.get("version") != _VERSION:
+            self._close_base()
+            raise ValueError(f"Unsupported dictionary store version: {meta.get('version')}")
+        self.meta = meta
+        self.source_language = meta["source_language"]
+        self.target_language = meta["target_language"]
+        self._count = meta["count"]
+        self._mask = meta["table_size"] - 1
+        self._keys_off = meta["keys"]
+        self._values_off = meta["values"]
+        view = memoryview(self._mm)
+        self._records = view[meta["records"]:meta["records"] + self._count * 24].cast("Q")
+        self._table = view[meta["table"]:meta["table"] + meta["table_size"] * 4].cast("I")
+        view.release()
+
+    def _close_base(self) -> None:
+        for attr in ("_records", "_table"):
+            view = getattr(self, attr, None)
+            if view is not None:
+                view.release()
+                setattr(self, attr, None)
+        self._mm.close()
+        self._file.close()
+
+    def _base_find(self, key_bytes: bytes) -> int:
+        """Return the record index of *key_bytes* in the base, or -1."""
+        table, records, mm = self._table, self._records, self._mm
+        slot = zlib.crc32(key_bytes) & self._mask
+        key_len = len(key_bytes)
+        while True:
+            index = table[slot]
+            if index == _EMPTY:
+                return -1
+            lens = records[index * 3 + 2]
+            if lens & 0xFFFFFFFF == key_len:
+                start = self._keys_off + records[index * 3]
+                if mm[start:start + key_len] == key_bytes:
+                    return index
+            slot = (slot + 1) & self._mask
+
+    def _base_value(self, index: int) -> bytes:
+        records = self._records
+        start = self._values_off + records[index * 3 + 1]
+        return self._mm[start:start + (records[index * 3 + 2] >> 32)]
+
+    def _base_key(self, index: int) -> str:
+        records = self._records
+        start = self._keys_off + records[index * 3]
+        return self._mm[start:start + (records[index * 3 + 2] & 0xFFFFFFFF)].decode("utf-8")
+
+    def _in_base(self, key: str) -> bool:
+        return self._base_find(key.encode("utf-8")) >= 0
+
+    # -- journal ---------------------------------------------------------------
+
+    def _replay(self, journal: Path) -> None:
+        if not journal.exists():
+            return
+        with open(journal, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    # Torn final line after a crash
+                    logger.warning("Ignoring corrupt journal line in %s", journal)
+                    continue
+                if "d" in op:
+                    self._apply_delete(op["k"])
+                else:
+                    self._apply_set(op["k"], op["v"])
+                self._journal_ops += 1
+
+    def _append(self, op: dict[str, Any]) -> None:
+        self._journal.write(json.dumps(op, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        self._journal_ops += 1
+        if self._journal_ops >= self.compact_threshold:
+            self.compact_async()
+
+    def _apply_set(self, key: str, value: Any) -> None:
+        self._deleted.discard(key)
+        if key not in self._overlay and not self._in_base(key):
+            self._new_keys.add(key)
+        self._overlay[key] = value
+
+    def _apply_delete(self, key: str) -> bool:
+        if key in self._new_keys:
+            self._new_keys.discard(key)
+            del self._overlay[key]
+            return True
+        if key in self._deleted or not self._in_base(key):
+            return False
+        self._overlay.pop(key, None)
+        self._deleted.add(key)
+        return True
+
+    # -- Mapping protocol ------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            value = self._overlay.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            if key in self._deleted:
+                raise KeyError(key)
+            index = self._base_find(key.encode("utf-8"))
+            if index < 0:
+                raise KeyError(key)
+            raw = self._base_value(index)
+        return json.loads(raw)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            if key in self._overlay:
+                return True
+            return key not in self._deleted and self._in_base(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._apply_set(key, value)
+            self._append({"k": key, "v": value})
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if not self._apply_delete(key):
+                raise KeyError(key)
+            if self._compaction_deletes is not None:
+                self._compaction_deletes.add(key)
+            self._append({"k": key, "d": 1})
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = [k for k in map(self._base_key, range(self._count)) if k not in self._deleted]
+            keys.extend(self._new_keys)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count - len(self._deleted) + len(self._new_keys)
+
+    def __repr__(self) -> str:
+        return f"MappedDictionary({str(self.path)!r}, entries={len(self)})"
+
+    # -- maintenance -----------------------------------------------------------
+
+    @property
+    def journal_ops(self) -> int:
+        """Operations journaled since the last compaction."""
+        return self._journal_ops
+
+    def compact(self) -> None:
+        """Merge the journal into a new store file and reopen it."""
+        with self._lock:
+            if not self._journal_ops:
+                return
+            # Rotate the journal so writes can continue during the rewrite
+            self._journal.close()
+            if self._compacting_path.exists():
+                # A previous compaction died: keep its ops, append ours
+                with open(self._compacting_path, "a", encoding="utf-8") as dst, \
+                        open(self.journal_path, encoding="utf-8") as src:
+                    dst.write(src.read())
+                os.unlink(self.journal_path)
+            else:
+                os.replace(self.journal_path, self._compacting_path)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal_ops = 0
+            overlay = dict(self._overlay)
+            deleted = set(self._deleted)
+            base_keys = [self._base_key(i) for i in range(self._count)]
+            self._compaction_deletes = set()
+
+        def items() -> Iterator[tuple[str, bytes]]:
+            for index, key in enumerate(base_keys):
+                if key in deleted or key in overlay:
+                    continue
+                with self._lock:
+                    raw = self._base_value(index)
+                yield key, raw
+            for key, value in overlay.items():
+                yield key, _encode_value(value)
+
+        tmp_path = self.path.with_name(self.path.name + ".new")
+        try:
+            write_store(tmp_path, items(), self.source_language, self.target_language)
+        except BaseException:
+            with self._lock:
+                self._compaction_deletes = None
+            raise
+
+        with self._lock:
+            # Drop the overlay entries that are now in the base, unless they
+            # changed again while the new file was written
+            for key, value in overlay.items():
+                if self._overlay.get(key, _MISSING) is value:
+                    del self._overlay[key]
+            for key in deleted:
+                self._deleted.discard(key)
+            # Windows cannot replace a file that is still mapped
+            self._close_base()
+            os.replace(tmp_path, self.path)
+            self._open_base()
+            os.unlink(self._compacting_path)
+            self._new_keys = {k for k in self._overlay if not self._in_base(k)}
+            # Keys deleted during the rewrite may have been written from the
+            # snapshot; they are journaled already, mark them deleted again
+            for key in self._compaction_deletes:
+                if key not in self._overlay and self._in_base(key):
+                    self._deleted.add(key)
+            self._compaction_deletes = None
+            self._deleted = {k for k in self._deleted if self._in_base(k)}
+        logger.info("Compacted dictionary store %s: %d entries", self.path, len(self))
+        if self.on_compacted is not None:
+            self.on_compacted(self)
+
+    def compact_async(self) -> None:
+        """Start a background compaction unless one is already running."""
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(
+                target=self._compact_logged, name="DictStoreCompactor", daemon=True,
+            )
+            self._compactor.start()
+
+    def _compact_logged(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.error("Dictionary store compaction failed for %s: %s", self.path, e)
+
+    def wait_for_compaction(self, timeout: float | None = None) -> None:
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join(timeout)
+
+    def discard_journal(self) -> None:
+        """Forget all changes made since the last compaction."""
+        self.wait_for_compaction()
+        with self._lock:
+            self._journal.close()
+            for journal in (self.journal_path, self._compacting_path):
+                if journal.exists():
+                    os.unlink(journal)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._overlay.clear()
+            self._new_keys.clear()
+            self._deleted.clear()
+            self._journal_ops = 0
+
+    def close(self) -> None:
+        """Close the journal and unmap the store."""
+        self.wait_for_compaction()
+        with self._lock:
+            if self._journal.closed:
+                return
+            self._journal.close()
+            self._close_base()
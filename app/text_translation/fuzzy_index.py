@@ -0,0 +1,189 @@
+"""
+Candidate index for SmartDictionary fuzzy lookups.
+
+Scoring a dictionary entry (difflib ratio, token overlap, substring check)
+is expensive, so ``fuzzy_lookup`` only scores the entries this index
+proposes instead of the whole language pair:
+
+- Character trigram postings (padded, so short keys still get grams)
+  rank entries by shared trigrams.  Query grams are scanned rarest first
+  and the very common ones never generate candidates (they only count
+  when the shortlist is re-scored), so a query touches a handful of short
+  posting lists.
+- A length filter drops entries whose length ratio to the query is below
+  what ``fuzzy_lookup`` would accept anyway.
+- A SymSpell-style deletion index covers short keys (a single edit in a
+  3-character key can destroy every trigram): each short key is indexed
+  under itself and all its single-character deletions, so keys within
+  edit distance 1 of a short query are found by hashing.
+
+The index is not thread-safe; ``SmartDictionary`` calls it under its lock.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+_PAD = "\x02"
+_PAD_END = "\x03"
+
+# Keys up to this length also go into the deletion index
+SHORT_KEY_LENGTH = 6
+
+# Posting lists longer than this do not generate candidates
+_MAX_GENERATING_POSTINGS = 2000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_key(key: str) -> str:
+    """Return the text fuzzy matching compares for a dictionary key.
+
+    Keys may be stored as ``"en:de:text"``; the prefix is dropped.
+    """
+    if ':' in key:
+        parts = key.split(':', 2)
+        if len(parts) > 2:
+            key = parts[2]
+    return _WHITESPACE_RE.sub(' ', key.lower().strip())
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the padded character trigrams of *text*."""
+    padded = f"{_PAD}{_PAD}{text}{_PAD_END}{_PAD_END}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _deletions(text: str) -> set[str]:
+    return {text[:i] + text[i + 1:] for i in range(len(text))}
+
+
+class FuzzyIndex:
+    """Trigram + deletion index over the keys of one language-pair dictionary."""
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._keys: list[str | None] = []
+        self._texts: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._deletes: dict[str, list[int]] = {}
+        self._dead = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+    def add(self, key: str) -> None:
+        """Index *key* (no-op if it is already indexed)."""
+        if key in self._ids:
+            return
+        text = normalize_key(key)
+        entry_id = len(self._keys)
+        self._keys.append(key)
+        self._texts.append(text)
+        self._ids[key] = entry_id
+
+        postings = self._postings
+        for gram in trigrams(text):
+            bucket = postings.get(gram)
+            if bucket is None:
+                postings[gram] = [entry_id]
+            else:
+                bucket.append(entry_id)
+
+        if len(text) <= SHORT_KEY_LENGTH:
+            deletes = self._deletes
+            for variant in _deletions(text) | {text}:
+                bucket = deletes.get(variant)
+                if bucket is None:
+                    deletes[variant] = [entry_id]
+                else:
+                    bucket.append(entry_id)
+
+    def remove(self, key: str) -> None:
+        """Drop *key*; its postings are purged on the next compaction."""
+        entry_id = self._ids.pop(key, None)
+        if entry_id is None:
+            return
+        self._keys[entry_id] = None
+        self._dead += 1
+        if self._dead > 1024 and self._dead > len(self._ids):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        keys = [k for k in self._keys if k is not None]
+        self.__init__(keys)
+
+    def candidates(self, text: str, limit: int = 50, min_length_ratio: float = 0.3) -> list[str]:
+        """
+        Return up to *limit* keys most likely to match *text*.
+
+        Args:
+            text: Query text (normalized the same way as keys)
+            limit: Maximum number of keys to return
+            min_length_ratio: Shortest/longest length ratio below which an
+                entry can not match and is skipped
+
+        Returns:
+            Dictionary keys, best trigram overlap first
+        """
+        query = normalize_key(text)
+        if not query or not self._ids:
+            return []
+
+        query_len = len(query)
+        min_len = query_len * min_length_ratio
+        max_len = query_len / min_length_ratio if min_length_ratio > 0 else float('inf')
+        texts = self._texts
+        keys = self._keys
+
+        grams = trigrams(query)
+        lists = sorted(
+            (self._postings.get(g, ()) for g in grams),
+            key=len,
+        )
+
+        # Generate from the rare lists only; the frequent grams are counted
+        # when the shortlisted candidates are re-scored below
+        counts: Counter[int] = Counter()
+        for posting in lists:
+            if not posting:
+                continue
+            if counts and len(posting) > _MAX_GENERATING_POSTINGS:
+                break
+            counts.update(posting)
+
+        neighbours = self._edit_neighbours(query)
+        for entry_id in neighbours:
+            counts[entry_id] = len(grams)
+
+        shortlist = [
+            entry_id for entry_id, _ in counts.most_common(limit * 8)
+            if keys[entry_id] is not None and min_len <= len(texts[entry_id]) <= max_len
+        ][:limit * 4]
+
+        scored = []
+        for entry_id in shortlist:
+            entry_grams = trigrams(texts[entry_id])
+            # Dice coefficient over the full trigram sets
+            dice = 2.0 * len(grams & entry_grams) / (len(grams) + len(entry_grams))
+            if entry_id in neighbours:
+                dice += 1.0  # within one edit: always worth scoring
+            scored.append((dice, entry_id))
+
+        scored.sort(reverse=True)
+        return [keys[entry_id] for _, entry_id in scored[:limit]]
+
+    def _edit_neighbours(self, query: str) -> set[int]:
+        """Ids of short keys within edit distance 1 of *query*."""
+        if len(query) > SHORT_KEY_LENGTH + 1:
+            return set()
+        found: set[int] = set()
+        deletes = self._deletes
+        for variant in _deletions(query) | {query}:
+            found.update(deletes.get(variant, ()))
+        return found
@@ -0,0 +1,280 @@
+"""
+Micro-batching scheduler for local translation engines.
+
+Multi-region capture, the audio pipeline and the image batch processor
+all call the translation layer from their own threads, each with a few
+texts.  A local model serializes those calls and pays its fixed per-call
+cost (tokenization, padding, one ``generate`` run) every time.  The
+scheduler puts one worker thread in front of every local engine:
+
+- Callers submit texts and wait on a ``concurrent.futures.Future``.
+- The worker keeps collecting for ``window_ms`` after the oldest pending
+  request arrived (the latency bound), or until ``max_texts`` texts are
+  waiting, then merges every request for the same language pair and
+  options into one ``translate_batch`` call.  Requests that arrive while
+  a batch is running are merged into the next one.
+- Identical texts from different callers are translated once.
+- Each caller gets a ``BatchTranslationResult`` for exactly its own
+  texts, laid out as the engine lays out its own results; an engine
+  exception is raised in every caller of that batch.
+
+Requirements: 3.1
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.text_translation.translation_engine_interface import (
+    AbstractTranslationEngine,
+    BatchTranslationResult,
+    TranslationOptions,
+)
+
+
+@dataclass
+class _Request:
+    """Texts one caller submitted, waiting for the next merged batch."""
+    key: tuple
+    texts: list[str]
+    options: TranslationOptions | None
+    future: Future
+    enqueued: float = field(default_factory=time.perf_counter)
+
+
+def _group_key(src_lang: str, tgt_lang: str, options: TranslationOptions | None) -> tuple:
+    """Requests with equal keys can share one engine call."""
+    if options is None:
+        return (src_lang, tgt_lang, None)
+    return (
+        src_lang, tgt_lang, options.quality, options.preserve_formatting,
+        options.context, options.domain,
+    )
+
+
+class _EngineQueue:
+    """Pending requests and the worker thread of one engine."""
+
+    def __init__(self, scheduler: "TranslationBatchScheduler",
+                 engine: AbstractTranslationEngine) -> None:
+        self.engine = engine
+        self.pending: deque[_Request] = deque()
+        self.pending_texts = 0
+        self.closed = False
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(
+            target=scheduler._run, args=(self,),
+            name=f"translation-batch-{engine.engine_name}", daemon=True,
+        )
+        self.thread.start()
+
+
+class TranslationBatchScheduler:
+    """Merges concurrent requests for local engines into shared batches."""
+
+    def __init__(self, window_ms: float = 4.0, max_texts: int = 64) -> None:
+        """
+        Args:
+            window_ms: How long a request may wait for others to join its
+                batch before the batch is dispatched
+            max_texts: Dispatch as soon as this many texts are waiting
+        """
+        self._logger = logging.getLogger(__name__)
+        self.window_s = max(0.0, window_ms) / 1000.0
+        self.max_texts = max(1, int(max_texts))
+        self._queues: dict[int, _EngineQueue] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "texts": 0,
+            "batches": 0,
+            "batch_texts": 0,
+            "deduplicated": 0,
+            "queue_wait_ms": 0.0,
+        }
+
+    # -- submission -------------------------------------------------------------
+
+    def submit(
+        self,
+        engine: AbstractTranslationEngine,
+        texts: list[str],
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None = None,
+    ) -> Future:
+        """Queue *texts* for *engine*; the future yields a BatchTranslationResult."""
+        future: Future = Future()
+        if not texts:
+            future.set_result(BatchTranslationResult(
+                results=[], total_processing_time_ms=0.0, cache_hit_rate=0.0,
+            ))
+            return future
+
+        request = _Request(_group_key(src_lang, tgt_lang, options), list(texts), options, future)
+        with self._lock:
+            queue = self._queues.get(id(engine))
+            if queue is None or queue.closed:
+                queue = _EngineQueue(self, engine)
+                self._queues[id(engine)] = queue
+            self._stats["requests"] += 1
+            self._stats["texts"] += len(texts)
+            # Enqueue under the scheduler lock so release() can not close
+            # the queue in between
+            with queue.cond:
+                queue.pending.append(request)
+                queue.pending_texts += len(texts)
+                queue.cond.notify()
+        return future
+
+    def translate_batch(
+        self,
+        engine: AbstractTranslationEngine,
+        texts: list[str],
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None = None,
+    ) -> BatchTranslationResult:
+        """Blocking ``engine.translate_batch`` that shares the engine call with other callers."""
+        return self.submit(engine, texts, src_lang, tgt_lang, options).result()
+
+    # -- worker -------------------------------------------------------------------
+
+    def _run(self, queue: _EngineQueue) -> None:
+        while True:
+            with queue.cond:
+                while not queue.pending and not queue.closed:
+                    queue.cond.wait()
+                if not queue.pending:
+                    return
+                # Collect until the oldest request has waited the window out
+                deadline = queue.pending[0].enqueued + self.window_s
+                while not queue.closed and queue.pending_texts < self.max_texts:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    queue.cond.wait(remaining)
+                batch = self._take_batch(queue)
+            self._dispatch(queue.engine, batch)
+
+    def _take_batch(self, queue: _EngineQueue) -> list[_Request]:
+        """Pop the oldest request and every queued request compatible with it."""
+        key = queue.pending[0].key
+        batch: list[_Request] = []
+        kept: deque[_Request] = deque()
+        texts = 0
+        while queue.pending:
+            request = queue.pending.popleft()
+            if request.key == key and (not batch or texts + len(request.texts) <= self.max_texts):
+                batch.append(request)
+                texts += len(request.texts)
+            else:
+                kept.append(request)
+        queue.pending = kept
+        queue.pending_texts -= texts
+        return batch
+
+    def _dispatch(self, engine: AbstractTranslationEngine, batch: list[_Request]) -> None:
+        start = time.perf_counter()
+        unique: dict[str, int] = {}
+        for request in batch:
+            for text in request.texts:
+                unique.setdefault(text, len(unique))
+        merged = list(unique)
+        submitted = sum(len(r.texts) for r in batch)
+        src_lang, tgt_lang = batch[0].key[:2]
+
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["batch_texts"] += len(merged)
+            self._stats["deduplicated"] += submitted - len(merged)
+            self._stats["queue_wait_ms"] += sum(start - r.enqueued for r in batch) * 1000.0
+
+        try:
+            result = engine.translate_batch(merged, src_lang, tgt_lang, batch[0].options)
+            by_index, errors = self._align(result, len(merged))
+        except Exception as exc:
+            self._logger.debug("Merged batch of %d texts for %s failed: %s",
+                               len(merged), engine.engine_name, exc)
+            for request in batch:
+                if not request.future.cancelled():
+                    request.future.set_exception(exc)
+            return
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        for request in batch:
+            results = []
+            failed = []
+            for i, text in enumerate(request.texts):
+                slot = unique[text]
+                if slot in errors:
+                    failed.append((i, errors[slot]))
+                if slot in by_index:
+                    results.append(by_index[slot])
+            hits = sum(1 for r in results if r.from_cache)
+            if not request.future.cancelled():
+                request.future.set_result(BatchTranslationResult(
+                    results=results,
+                    total_processing_time_ms=elapsed_ms,
+                    cache_hit_rate=hits / len(results) if results else 0.0,
+                    failed_translations=failed,
+                ))
+
+    @staticmethod
+    def _align(result: BatchTranslationResult, count: int) -> tuple[dict, dict[int, str]]:
+        """Map input positions to results.
+
+        Local engines return a fallback result for every failed text, the
+        default ``translate_batch`` leaves failed texts out; both layouts
+        are accepted and passed on to the callers unchanged.
+        """
+        errors = {index: error for index, error in result.failed_translations}
+        if len(result.results) == count:
+            return dict(enumerate(result.results)), errors
+        positions = [i for i in range(count) if i not in errors]
+        if len(positions) != len(result.results):
+            raise RuntimeError(
+                f"engine returned {len(result.results)} results for {count} texts"
+            )
+        return dict(zip(positions, result.results)), errors
+
+    # -- lifecycle / stats -------------------------------------------------------
+
+    def release(self, engine: AbstractTranslationEngine) -> None:
+        """Stop the worker of *engine* once its queued requests are done."""
+        with self._lock:
+            queue = self._queues.pop(id(engine), None)
+        if queue is not None:
+            self._close(queue)
+
+    def shutdown(self) -> None:
+        """Drain every queue and stop all worker threads."""
+        with self._lock:
+            queues = list(self._queues.values())
+            self._queues.clear()
+        for queue in queues:
+            self._close(queue)
+
+    @staticmethod
+    def _close(queue: _EngineQueue) -> None:
+        with queue.cond:
+            queue.closed = True
+            queue.cond.notify_all()
+        if queue.thread is not threading.current_thread():
+            queue.thread.join(timeout=5.0)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        batches = stats["batches"]
+        stats["avg_batch_size"] = stats["batch_texts"] / batches if batches else 0.0
+        stats["requests_per_batch"] = stats["requests"] / batches if batches else 0.0
+        stats["avg_queue_wait_ms"] = (
+            stats.pop("queue_wait_ms") / stats["requests"] if stats["requests"] else 0.0
+        )
+        stats["window_ms"] = self.window_s * 1000.0
+        stats["max_texts"] = self.max_texts
+        return stats
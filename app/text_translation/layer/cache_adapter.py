@@ -1,8 +1,9 @@
 """
 Translation Cache Adapter.
 
-Wraps the existing TranslationCache for use by the TranslationFacade,
-providing a thin delegation layer.
+Wraps the shared TieredTranslationCache for use by the TranslationFacade,
+providing a thin delegation layer.  Facade keys carry the engine and
+options, which become the cached entry's variant.
 
 Requirements: 3.1
 """
@@ -10,18 +11,24 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from app.text_translation.translation_engine_interface import (
-    TranslationCache,
-    TranslationOptions,
-)
+from app.text_translation.tiered_cache import TieredTranslationCache, get_translation_cache
+from app.text_translation.translation_engine_interface import TranslationOptions
 
 
 class TranslationCacheAdapter:
-    """Adapter around TranslationCache for the translation facade."""
+    """Adapter around the shared translation cache for the translation facade."""
 
-    def __init__(self, max_size: int = 10000, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: int = 3600,
+        cache: TieredTranslationCache | None = None,
+        config_manager: Any = None,
+    ):
         self._logger = logging.getLogger(__name__)
-        self._cache = TranslationCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._cache = cache if cache is not None else get_translation_cache(
+            max_size=max_size, ttl_seconds=ttl_seconds, config_manager=config_manager
+        )
 
     # -- public API -----------------------------------------------------------
 
@@ -33,8 +40,12 @@ class TranslationCacheAdapter:
         engine: str,
         options: TranslationOptions | None = None,
     ) -> tuple:
-        """Pre-compute a cache key for use with :meth:`get_by_key` / :meth:`put_by_key`."""
-        return self._cache.generate_key(text, src_lang, tgt_lang, engine, options)
+        """Pre-compute a cache key for use with :meth:`get_by_key` / :meth:`put_by_key`.
+
+        The key is the shared cache key followed by the variant tag.
+        """
+        return (*self._cache.make_key(text, src_lang, tgt_lang),
+                self._cache.variant(engine, options))
 
     def get(
         self,
@@ -45,11 +56,13 @@ class TranslationCacheAdapter:
         options: TranslationOptions | None = None,
     ) -> str | None:
         """Get cached translation if available and not expired."""
-        return self._cache.get(text, src_lang, tgt_lang, engine, options)
+        return self._cache.get(
+            text, src_lang, tgt_lang, self._cache.variant(engine, options)
+        )
 
     def get_by_key(self, cache_key: tuple) -> str | None:
         """Get cached translation using a pre-computed key."""
-        return self._cache.get_by_key(cache_key)
+        return self._cache.get_by_key(cache_key[:3], cache_key[3])
 
     def put(
         self,
@@ -61,25 +74,31 @@ class TranslationCacheAdapter:
         options: TranslationOptions | None = None,
     ) -> None:
         """Cache a translation result."""
-        self._cache.put(text, src_lang, tgt_lang, engine, translation, options)
+        self._cache.put(
+            text, src_lang, tgt_lang, translation, self._cache.variant(engine, options)
+        )
 
     def put_by_key(self, cache_key: tuple, translation: str) -> None:
         """Cache a translation result using a pre-computed key."""
-        self._cache.put_by_key(cache_key, translation)
+        self._cache.put_by_key(cache_key[:3], translation, cache_key[3])
 
     def clear(self) -> None:
-        """Clear all cached translations."""
+        """Clear all cached translations, including the persistent tier."""
         self._cache.clear()
         self._logger.info("Translation cache cleared")
 
+    def flush(self) -> bool:
+        """Push pending writes to the persistent tier."""
+        return self._cache.flush()
+
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         return self._cache.get_stats()
 
     def save_to_disk(self, file_path: Path | str) -> bool:
-        """Persist cache to a gzip-compressed JSON file."""
+        """Export the cache to a gzip-compressed JSON file."""
         return self._cache.save_to_disk(file_path)
 
     def load_from_disk(self, file_path: Path | str) -> int:
-        """Load cache entries from a gzip-compressed JSON file."""
+        """Merge cache entries from a gzip-compressed JSON file."""
         return self._cache.load_from_disk(file_path)
@@ -8,6 +8,7 @@ Requirements: 3.1
 import logging
 from typing import Any
 
+from app.text_translation.dictionary_store import MappedDictionary
 from app.text_translation.translation_engine_interface import TranslationEngineRegistry
 
 
@@ -109,13 +110,21 @@ class DictionaryOps:
 
             if hasattr(dict_internal, "_dictionaries"):
                 if lang_pair in dict_internal._dictionaries:
-                    dict_internal._dictionaries[lang_pair] = {}
-
                     from app.utils.path_utils import get_dictionary_file
 
                     dict_path = get_dictionary_file(source, target)
-                    dict_path.parent.mkdir(parents=True, exist_ok=True)
-                    dict_internal._save_dictionary(lang_pair, dict_path)
+                    with dict_internal._lock:
+                        current = dict_internal._dictionaries[lang_pair]
+                        if isinstance(current, MappedDictionary):
+                            # Pending journal entries would be replayed onto
+                            # the re-imported (empty) wordbook otherwise
+                            current.discard_journal()
+                        # Closes the replaced binary store
+                        dict_internal._set_dictionary(lang_pair, {}, str(dict_path), None)
+                    dict_internal.cache.clear()
+                    dict_internal.save_dictionary(
+                        str(dict_path), source, target, auto_cleanup=False,
+                    )
 
                     self._logger.info(f"Cleared dictionary for {source} → {target}")
         except Exception as e:
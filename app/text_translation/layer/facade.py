@@ -10,18 +10,21 @@ Requirements: 3.2
 import time
 import logging
 import threading
+from collections.abc import Iterator
 from typing import Any
 
 from app.interfaces import ITranslationLayer
 from app.text_translation.translation_engine_interface import (
     AbstractTranslationEngine,
     TranslationOptions,
+    TranslationResult,
     LanguageDetectionResult,
 )
 from app.text_translation.layer.engine_manager import EngineManager
 from app.text_translation.layer.cache_adapter import TranslationCacheAdapter
 from app.text_translation.layer.language_detector import LanguageDetectorService
 from app.text_translation.layer.dictionary_ops import DictionaryOps
+from app.text_translation.layer.batch_scheduler import TranslationBatchScheduler
 
 
 class TranslationFacade(ITranslationLayer):
@@ -58,7 +61,7 @@ class TranslationFacade(ITranslationLayer):
         # Sub-modules
         self._engine_mgr = EngineManager(config_manager=config_manager)
         self._cache_adapter = TranslationCacheAdapter(
-            max_size=cache_size, ttl_seconds=cache_ttl
+            max_size=cache_size, ttl_seconds=cache_ttl, config_manager=config_manager
         )
         self._lang_detector = LanguageDetectorService(config_manager=config_manager)
         self._dict_ops = DictionaryOps(
@@ -66,6 +69,19 @@ class TranslationFacade(ITranslationLayer):
             config_manager=config_manager,
         )
 
+        # Concurrent callers of in-process models share engine batches
+        microbatch_enabled, window_ms, max_texts = True, 4, 64
+        if config_manager:
+            microbatch_enabled = config_manager.get_setting(
+                "translation.microbatch_enabled", True
+            )
+            window_ms = config_manager.get_setting("translation.microbatch_window_ms", 4)
+            max_texts = config_manager.get_setting("translation.microbatch_max_texts", 64)
+        self._batch_scheduler: TranslationBatchScheduler | None = (
+            TranslationBatchScheduler(window_ms=window_ms, max_texts=max_texts)
+            if microbatch_enabled else None
+        )
+
         # Performance tracking
         self._performance_stats = {
             "total_translations": 0,
@@ -74,6 +90,10 @@ class TranslationFacade(ITranslationLayer):
             "failed_translations": 0,
             "avg_translation_time_ms": 0.0,
         }
+        # Hits/misses per lookup tier, in the order a text falls through them
+        self._tier_stats: dict[str, dict[str, int]] = {
+            tier: {"hits": 0, "misses": 0} for tier in ("cache", "dictionary", "engine")
+        }
 
         # Log-throttle: avoid flooding console with identical errors
         self._last_error_msg: str = ""
@@ -128,6 +148,9 @@ class TranslationFacade(ITranslationLayer):
         return self._engine_mgr.load_engine(engine_name, config)
 
     def unload_engine(self, engine_name: str) -> bool:
+        engine = self._engine_mgr.get_engine(engine_name)
+        if engine is not None and self._batch_scheduler is not None:
+            self._batch_scheduler.release(engine)
         return self._engine_mgr.unload_engine(engine_name)
 
     def set_default_engine(self, engine_name: str) -> bool:
@@ -170,126 +193,95 @@ class TranslationFacade(ITranslationLayer):
                     f"(confidence: {detection_result.confidence})"
                 )
 
-            # Pre-compute cache key once for the initial engine
-            initial_cache_key = None
-            if translation_options.use_cache:
-                initial_cache_key = self._cache_adapter.generate_key(
-                    text, src_lang, tgt_lang, engine, translation_options
-                )
-                cached = self._cache_adapter.get_by_key(initial_cache_key)
-                if cached and cached != text:
-                    self._update_performance_stats(True, time.time() - start_time)
-                    return cached
+            known, initial_cache_key = self._known_translation(
+                text, engine, src_lang, tgt_lang, translation_options, start_time
+            )
+            if known is not None:
+                return known
 
-            # Try dictionary engine first
-            dict_engine = self._engine_mgr.get_engine("dictionary")
-            if dict_engine and dict_engine.is_available():
-                try:
-                    dict_result = dict_engine.translate_text(
-                        text, src_lang, tgt_lang, translation_options
-                    )
-                    if dict_result.confidence > 0:
-                        self._logger.debug(
-                            f"Using dictionary translation: {text} -> "
-                            f"{dict_result.translated_text}"
-                        )
-                        if translation_options.use_cache:
-                            self._cache_adapter.put(
-                                text,
-                                src_lang,
-                                tgt_lang,
-                                "dictionary",
-                                dict_result.translated_text,
-                                translation_options,
-                            )
-                        self._update_performance_stats(
-                            False, time.time() - start_time
-                        )
-                        return dict_result.translated_text
-                except Exception as e:
-                    self._logger.debug(
-                        f"Dictionary lookup failed, falling back to {engine}: {e}"
-                    )
+            translation_engine, engine_name = self._resolve_engine(
+                engine, src_lang, tgt_lang
+            )
+            result = self._engine_translate(
+                translation_engine, text, src_lang, tgt_lang, translation_options
+            )
+            self._store_translation(
+                text, src_lang, tgt_lang, engine, engine_name, initial_cache_key,
+                result.translated_text, translation_options, start_time,
+            )
+            return result.translated_text
 
-            # Get translation engine
-            engine_name = engine
-            translation_engine = self._engine_mgr.get_engine(engine_name)
-
-            # Config may store "marianmt_gpu"/"marianmt_cpu" but engine
-            # registers under its base name "marianmt".  Try stripped variant.
-            if not translation_engine or not translation_engine.is_available():
-                for suffix in ("_gpu", "_cpu"):
-                    if engine_name.endswith(suffix):
-                        base_name = engine_name[: -len(suffix)]
-                        candidate = self._engine_mgr.get_engine(base_name)
-                        if candidate and candidate.is_available():
-                            translation_engine = candidate
-                            engine_name = base_name
-                            break
-
-            # Fall back to the default engine if the requested one isn't loaded
-            if not translation_engine or not translation_engine.is_available():
-                default = self._engine_mgr.default_engine
-                if default and default != engine_name:
-                    candidate = self._engine_mgr.get_engine(default)
-                    if candidate and candidate.is_available():
-                        self._logger.info(
-                            "Engine '%s' not available, using default '%s'",
-                            engine_name, default,
-                        )
-                        translation_engine = candidate
-                        engine_name = default
+        except Exception as e:
+            self._record_failure(e)
+            return text
 
-            if not translation_engine or not translation_engine.is_available():
-                translation_engine = self._engine_mgr.get_fallback_engine(
-                    src_lang, tgt_lang
-                )
-                if not translation_engine:
-                    raise RuntimeError(
-                        f"No available translation engine for {src_lang} -> {tgt_lang}"
-                    )
-                engine_name = translation_engine.engine_name
+    def translate_stream(
+        self,
+        text: str,
+        engine: str,
+        src_lang: str,
+        tgt_lang: str,
+        options: dict[str, Any] | None = None,
+    ) -> Iterator[str]:
+        """
+        Translate *text*, yielding partial translations from streaming engines.
+
+        Every item is the translation so far and the last one is final.
+        Cache and dictionary hits and engines without streaming support
+        yield one item.  Streamed translations skip the micro-batching
+        scheduler and are cached like ``translate()`` results.
+        """
+        if not text or not text.strip():
+            yield text
+            return
 
-            result = translation_engine.translate_text(
-                text, src_lang, tgt_lang, translation_options
+        start_time = time.time()
+        try:
+            translation_options = self._lang_detector.parse_translation_options(
+                options or {}
             )
+            if src_lang == "auto":
+                src_lang = self._lang_detector.detect_language(text).language_code
 
-            if translation_options.use_cache and result.translated_text and result.translated_text != text:
-                if engine_name == engine and initial_cache_key is not None:
-                    self._cache_adapter.put_by_key(
-                        initial_cache_key, result.translated_text
-                    )
-                else:
-                    self._cache_adapter.put(
-                        text,
-                        src_lang,
-                        tgt_lang,
-                        engine_name,
-                        result.translated_text,
-                        translation_options,
-                    )
+            known, initial_cache_key = self._known_translation(
+                text, engine, src_lang, tgt_lang, translation_options, start_time
+            )
+            if known is not None:
+                yield known
+                return
 
-            self._update_performance_stats(False, time.time() - start_time)
-            return result.translated_text
+            translation_engine, engine_name = self._resolve_engine(
+                engine, src_lang, tgt_lang
+            )
+            if translation_engine.supports_streaming:
+                translated = text
+                for translated in translation_engine.translate_text_stream(
+                    text, src_lang, tgt_lang, translation_options
+                ):
+                    yield translated
+            else:
+                translated = self._engine_translate(
+                    translation_engine, text, src_lang, tgt_lang, translation_options
+                ).translated_text
+                yield translated
+            self._store_translation(
+                text, src_lang, tgt_lang, engine, engine_name, initial_cache_key,
+                translated, translation_options, start_time,
+            )
 
         except Exception as e:
-            self._performance_stats["failed_translations"] += 1
-            err_str = str(e)
-            now = time.time()
-            if err_str != self._last_error_msg or (now - self._last_error_time) >= self._ERROR_LOG_COOLDOWN:
-                if self._suppressed_error_count > 0:
-                    self._logger.error(
-                        f"Translation failed: {e} "
-                        f"(repeated {self._suppressed_error_count} more time(s) since last log)"
-                    )
-                else:
-                    self._logger.error(f"Translation failed: {e}")
-                self._last_error_msg = err_str
-                self._last_error_time = now
-                self._suppressed_error_count = 0
-            else:
-                self._suppressed_error_count += 1
-            return text
+            self._record_failure(e)
+            yield text
+
+    def supports_streaming(self, engine: str, src_lang: str, tgt_lang: str) -> bool:
+        """Whether ``translate_stream()`` yields partial translations for *engine*."""
+        try:
+            translation_engine, _ = self._resolve_engine(
+                engine, src_lang, tgt_lang, log_fallback=False
+            )
+        except RuntimeError:
+            return False
+        return translation_engine.supports_streaming
 
     def translate_batch(
         self,
@@ -311,44 +303,20 @@ class TranslationFacade(ITranslationLayer):
                     f"Auto-detected language for batch: {src_lang}"
                 )
 
-            engine_name = engine
-            translation_engine = self._engine_mgr.get_engine(engine_name)
-
-            if not translation_engine or not translation_engine.is_available():
-                for suffix in ("_gpu", "_cpu"):
-                    if engine_name.endswith(suffix):
-                        base_name = engine_name[: -len(suffix)]
-                        candidate = self._engine_mgr.get_engine(base_name)
-                        if candidate and candidate.is_available():
-                            translation_engine = candidate
-                            engine_name = base_name
-                            break
-
-            if not translation_engine or not translation_engine.is_available():
-                default = self._engine_mgr.default_engine
-                if default and default != engine_name:
-                    candidate = self._engine_mgr.get_engine(default)
-                    if candidate and candidate.is_available():
-                        translation_engine = candidate
-                        engine_name = default
-
-            if not translation_engine or not translation_engine.is_available():
-                translation_engine = self._engine_mgr.get_fallback_engine(
-                    src_lang, tgt_lang
-                )
-                if not translation_engine:
-                    raise RuntimeError(
-                        f"No available translation engine for {src_lang} -> {tgt_lang}"
-                    )
+            translation_engine, _ = self._resolve_engine(
+                engine, src_lang, tgt_lang, log_fallback=False
+            )
 
             cached_results = {}
             texts_to_translate = []
             indices_to_translate = []
             miss_cache_keys: dict[int, tuple] = {}
+            blank_indices = []
 
             for i, text in enumerate(texts):
                 if not text or not text.strip():
                     cached_results[i] = text
+                    blank_indices.append(i)
                     continue
 
                 key = self._cache_adapter.generate_key(
@@ -362,24 +330,75 @@ class TranslationFacade(ITranslationLayer):
                     texts_to_translate.append(text)
                     indices_to_translate.append(i)
 
+            self._count_tier(
+                "cache", hits=len(cached_results) - len(blank_indices),
+                misses=len(texts_to_translate),
+            )
+
+            # Dictionary tier: one lookup_many call for all cache misses, so
+            # learned entries never reach the model
+            dictionary_results: dict[int, str] = {}
+            dict_engine = self._engine_mgr.get_engine("dictionary")
+            if (texts_to_translate and dict_engine is not None
+                    and dict_engine is not translation_engine and dict_engine.is_available()):
+                try:
+                    dict_batch = dict_engine.translate_batch(
+                        texts_to_translate, src_lang, tgt_lang
+                    )
+                    remaining_texts = []
+                    remaining_indices = []
+                    for idx, text, result in zip(
+                        indices_to_translate, texts_to_translate, dict_batch.results
+                    ):
+                        if result.confidence > 0:
+                            dictionary_results[idx] = result.translated_text
+                            self._cache_adapter.put(
+                                text, src_lang, tgt_lang, "dictionary",
+                                result.translated_text,
+                            )
+                        else:
+                            remaining_texts.append(text)
+                            remaining_indices.append(idx)
+                    self._count_tier(
+                        "dictionary", hits=len(dictionary_results),
+                        misses=len(remaining_texts),
+                    )
+                    texts_to_translate = remaining_texts
+                    indices_to_translate = remaining_indices
+                except Exception as e:
+                    self._logger.debug(f"Dictionary batch lookup failed: {e}")
+
             translated_results = []
             if texts_to_translate:
                 options = self._parse_translation_options({})
-                batch_result = translation_engine.translate_batch(
-                    texts_to_translate, src_lang, tgt_lang, options=options
-                )
+                if self._uses_batch_scheduler(translation_engine):
+                    batch_result = self._batch_scheduler.translate_batch(
+                        translation_engine, texts_to_translate, src_lang, tgt_lang, options
+                    )
+                else:
+                    batch_result = translation_engine.translate_batch(
+                        texts_to_translate, src_lang, tgt_lang, options=options
+                    )
                 translated_results = batch_result.results
 
+                engine_hits = 0
                 for idx, result in zip(indices_to_translate, translated_results):
                     original_text = texts[idx] if idx < len(texts) else ""
                     if result.translated_text and result.translated_text != original_text:
+                        engine_hits += 1
                         self._cache_adapter.put_by_key(
                             miss_cache_keys[idx], result.translated_text
                         )
+                self._count_tier(
+                    "engine", hits=engine_hits,
+                    misses=len(texts_to_translate) - engine_hits,
+                )
 
             final_results = [""] * len(texts)
             for i, translation in cached_results.items():
                 final_results[i] = translation
+            for i, translation in dictionary_results.items():
+                final_results[i] = translation
             for i, result in enumerate(translated_results):
                 original_index = indices_to_translate[i]
                 final_results[original_index] = result.translated_text
@@ -490,9 +509,15 @@ class TranslationFacade(ITranslationLayer):
 
     def get_performance_stats(self) -> dict[str, Any]:
         cache_stats = self._cache_adapter.get_stats()
+        with self._lock:
+            tier_stats = {tier: dict(counts) for tier, counts in self._tier_stats.items()}
         return {
             "translation_stats": self._performance_stats.copy(),
+            "tier_stats": tier_stats,
             "cache_stats": cache_stats,
+            "microbatch_stats": (
+                self._batch_scheduler.get_stats() if self._batch_scheduler else {}
+            ),
             "available_engines": self.get_available_engines(),
             "default_engine": self._engine_mgr.default_engine,
             "fallback_engines": self._engine_mgr.fallback_engines,
@@ -573,6 +598,7 @@ class TranslationFacade(ITranslationLayer):
 
         return {
             "translation_stats": stats.get("translation_stats", {}),
+            "tier_stats": stats.get("tier_stats", {}),
             "cache_stats": stats.get("cache_stats", {}),
             "cache_config": cache_cfg,
             "engines": engines_summary,
@@ -581,6 +607,189 @@ class TranslationFacade(ITranslationLayer):
 
     # -- Internal helpers (kept private, same logic as original) --------------
 
+    def _known_translation(
+        self,
+        text: str,
+        engine: str,
+        src_lang: str,
+        tgt_lang: str,
+        translation_options: TranslationOptions,
+        start_time: float,
+    ) -> tuple[str | None, tuple | None]:
+        """Look *text* up in the cache and dictionary tiers.
+
+        Returns the translation (None on a miss) and the cache key for
+        *engine*, which ``_store_translation`` reuses.
+        """
+        # Pre-compute cache key once for the initial engine
+        initial_cache_key = None
+        if translation_options.use_cache:
+            initial_cache_key = self._cache_adapter.generate_key(
+                text, src_lang, tgt_lang, engine, translation_options
+            )
+            cached = self._cache_adapter.get_by_key(initial_cache_key)
+            if cached and cached != text:
+                self._count_tier("cache", hits=1)
+                self._update_performance_stats(True, time.time() - start_time)
+                return cached, initial_cache_key
+            self._count_tier("cache", misses=1)
+
+        # Try dictionary engine first
+        dict_engine = self._engine_mgr.get_engine("dictionary")
+        if dict_engine and dict_engine.is_available():
+            try:
+                dict_result = dict_engine.translate_text(
+                    text, src_lang, tgt_lang, translation_options
+                )
+                self._count_tier(
+                    "dictionary",
+                    hits=int(dict_result.confidence > 0),
+                    misses=int(dict_result.confidence <= 0),
+                )
+                if dict_result.confidence > 0:
+                    self._logger.debug(
+                        f"Using dictionary translation: {text} -> "
+                        f"{dict_result.translated_text}"
+                    )
+                    if translation_options.use_cache:
+                        self._cache_adapter.put(
+                            text,
+                            src_lang,
+                            tgt_lang,
+                            "dictionary",
+                            dict_result.translated_text,
+                            translation_options,
+                        )
+                    self._update_performance_stats(
+                        False, time.time() - start_time
+                    )
+                    return dict_result.translated_text, initial_cache_key
+            except Exception as e:
+                self._logger.debug(
+                    f"Dictionary lookup failed, falling back to {engine}: {e}"
+                )
+        return None, initial_cache_key
+
+    def _resolve_engine(
+        self, engine: str, src_lang: str, tgt_lang: str, log_fallback: bool = True
+    ) -> tuple[AbstractTranslationEngine, str]:
+        """Return a loaded engine for *engine* and the name it is registered under.
+
+        Raises:
+            RuntimeError: If no engine is available for the language pair
+        """
+        engine_name = engine
+        translation_engine = self._engine_mgr.get_engine(engine_name)
+
+        # Config may store "marianmt_gpu"/"marianmt_cpu" but engine
+        # registers under its base name "marianmt".  Try stripped variant.
+        if not translation_engine or not translation_engine.is_available():
+            for suffix in ("_gpu", "_cpu"):
+                if engine_name.endswith(suffix):
+                    base_name = engine_name[: -len(suffix)]
+                    candidate = self._engine_mgr.get_engine(base_name)
+                    if candidate and candidate.is_available():
+                        translation_engine = candidate
+                        engine_name = base_name
+                        break
+
+        # Fall back to the default engine if the requested one isn't loaded
+        if not translation_engine or not translation_engine.is_available():
+            default = self._engine_mgr.default_engine
+            if default and default != engine_name:
+                candidate = self._engine_mgr.get_engine(default)
+                if candidate and candidate.is_available():
+                    if log_fallback:
+                        self._logger.info(
+                            "Engine '%s' not available, using default '%s'",
+                            engine_name, default,
+                        )
+                    translation_engine = candidate
+                    engine_name = default
+
+        if not translation_engine or not translation_engine.is_available():
+            translation_engine = self._engine_mgr.get_fallback_engine(
+                src_lang, tgt_lang
+            )
+            if not translation_engine:
+                raise RuntimeError(
+                    f"No available translation engine for {src_lang} -> {tgt_lang}"
+                )
+            engine_name = translation_engine.engine_name
+        return translation_engine, engine_name
+
+    def _engine_translate(
+        self,
+        translation_engine: AbstractTranslationEngine,
+        text: str,
+        src_lang: str,
+        tgt_lang: str,
+        translation_options: TranslationOptions,
+    ) -> TranslationResult:
+        if self._uses_batch_scheduler(translation_engine):
+            batch = self._batch_scheduler.translate_batch(
+                translation_engine, [text], src_lang, tgt_lang, translation_options
+            )
+            if not batch.results:
+                raise RuntimeError(batch.failed_translations[0][1])
+            return batch.results[0]
+        return translation_engine.translate_text(
+            text, src_lang, tgt_lang, translation_options
+        )
+
+    def _store_translation(
+        self,
+        text: str,
+        src_lang: str,
+        tgt_lang: str,
+        engine: str,
+        engine_name: str,
+        initial_cache_key: tuple | None,
+        translated_text: str,
+        translation_options: TranslationOptions,
+        start_time: float,
+    ) -> None:
+        """Count an engine result and cache it under the engine that produced it."""
+        translated = bool(translated_text) and translated_text != text
+        self._count_tier("engine", hits=int(translated), misses=int(not translated))
+
+        if translation_options.use_cache and translated:
+            if engine_name == engine and initial_cache_key is not None:
+                self._cache_adapter.put_by_key(initial_cache_key, translated_text)
+            else:
+                self._cache_adapter.put(
+                    text,
+                    src_lang,
+                    tgt_lang,
+                    engine_name,
+                    translated_text,
+                    translation_options,
+                )
+
+        self._update_performance_stats(False, time.time() - start_time)
+
+    def _record_failure(self, e: Exception) -> None:
+        self._performance_stats["failed_translations"] += 1
+        err_str = str(e)
+        now = time.time()
+        if err_str != self._last_error_msg or (now - self._last_error_time) >= self._ERROR_LOG_COOLDOWN:
+            if self._suppressed_error_count > 0:
+                self._logger.error(
+                    f"Translation failed: {e} "
+                    f"(repeated {self._suppressed_error_count} more time(s) since last log)"
+                )
+            else:
+                self._logger.error(f"Translation failed: {e}")
+            self._last_error_msg = err_str
+            self._last_error_time = now
+            self._suppressed_error_count = 0
+        else:
+            self._suppressed_error_count += 1
+
+    def _uses_batch_scheduler(self, engine: Any) -> bool:
+        """Whether calls to *engine* go through the micro-batching scheduler."""
+        return self._batch_scheduler is not None and getattr(engine, "runs_locally", False)
+
     def _parse_translation_options(self, options: dict[str, Any]) -> TranslationOptions:
         return self._lang_detector.parse_translation_options(options)
 
@@ -589,6 +798,12 @@ class TranslationFacade(ITranslationLayer):
     ) -> AbstractTranslationEngine | None:
         return self._engine_mgr.get_fallback_engine(src_lang, tgt_lang)
 
+    def _count_tier(self, tier: str, hits: int = 0, misses: int = 0) -> None:
+        with self._lock:
+            counts = self._tier_stats[tier]
+            counts["hits"] += hits
+            counts["misses"] += misses
+
     def _update_performance_stats(self, cache_hit: bool, duration: float) -> None:
         with self._lock:
             self._performance_stats["total_translations"] += 1
@@ -608,14 +823,20 @@ class TranslationFacade(ITranslationLayer):
     def save_cache_to_disk(self, file_path: str | None = None) -> bool:
         """Persist the translation cache to disk.
 
+        Entries are written to the persistent cache tier as they are
+        learned, so with no *file_path* this only flushes pending writes.
+        Without a persistent tier the cache is exported instead.
+
         Args:
-            file_path: Target path.  When *None*, uses the default location
-                       ``system_data/cache/translation_cache.json.gz``.
+            file_path: Export path.  When *None* and there is no persistent
+                       tier, uses ``system_data/cache/translation_cache.json.gz``.
 
         Returns:
             True on success, False on error.
         """
         if file_path is None:
+            if self._cache_adapter.flush():
+                return True
             from app.utils.path_utils import ensure_dir
             file_path = str(ensure_dir("cache") / "translation_cache.json.gz")
         return self._cache_adapter.save_to_disk(file_path)
@@ -639,8 +860,10 @@ class TranslationFacade(ITranslationLayer):
 
     def cleanup(self) -> None:
         try:
+            if self._batch_scheduler is not None:
+                self._batch_scheduler.shutdown()
             self._engine_mgr.cleanup()
-            self._cache_adapter.clear()
+            self._cache_adapter.flush()
             self._logger.info("Translation layer cleaned up")
         except Exception as e:
             self._logger.error(f"Error during cleanup: {e}")
@@ -23,11 +23,21 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from threading import RLock
 from collections import defaultdict
+from collections.abc import MutableMapping
 import difflib
 
 # Import path utilities for EXE compatibility
 from app.utils.path_utils import get_dictionary_dir
 
+from app.text_translation.dictionary_store import (
+    STORE_SUFFIX,
+    MappedDictionary,
+    import_json_gz,
+    store_path_for,
+)
+from app.text_translation.fuzzy_index import FuzzyIndex
+from app.utils.cache import LRUCache
+
 # Placeholder pattern used by the Context Manager to mask locked terms.
 # Entries containing these markers must be rejected to avoid polluting
 # the dictionary with transient placeholder artifacts.
@@ -184,47 +194,14 @@ class DictionaryStats:
 _CACHE_MISS = object()
 
 
-class DictionaryLookupCache:
-    """Simple LRU cache for dictionary lookups."""
-    
-    def __init__(self, max_size: int = 1000):
-        """Initialize cache."""
-        self.max_size = max_size
-        self._cache: dict[str, object] = {}
-        self._access_order: list[str] = []
-        self._lock = RLock()
-    
-    def get(self, key: str):
-        """Get cached entry. Returns _CACHE_MISS sentinel for negative hits, None if not in cache."""
-        with self._lock:
-            if key in self._cache:
-                # Move to end (most recently used)
-                self._access_order.remove(key)
-                self._access_order.append(key)
-                return self._cache[key]
-        return None
-    
-    def put(self, key: str, entry):
-        """Cache entry. Use _CACHE_MISS sentinel for negative cache entries."""
-        with self._lock:
-            # Remove if already exists
-            if key in self._cache:
-                self._access_order.remove(key)
-            
-            # Add to cache
-            self._cache[key] = entry
-            self._access_order.append(key)
-            
-            # Evict oldest if over limit
-            while len(self._cache) > self.max_size:
-                oldest_key = self._access_order.pop(0)
-                del self._cache[oldest_key]
-    
-    def clear(self):
-        """Clear cache."""
-        with self._lock:
-            self._cache.clear()
-            self._access_order.clear()
+class DictionaryLookupCache(LRUCache[str, object]):
+    """LRU cache for dictionary lookups.
+
+    Entries are ``DictionaryEntry`` objects (or the ``_CACHE_MISS``
+    sentinel for negative hits) bound to this dictionary's live data, so
+    they are memoized in-process with the same ``LRUCache`` policy as the
+    shared translation cache's L1 rather than stored in it.
+    """
 
 
 class SmartDictionary:
@@ -241,6 +218,17 @@ class SmartDictionary:
     
     This is the main dictionary system used by OptikR.
     
+    Fuzzy lookups only score the candidates proposed by a per-pair
+    ``FuzzyIndex`` (trigram postings + deletion index), which is built
+    when a dictionary is loaded and kept current by ``add_entry``.
+    
+    With ``dictionary.binary_store`` enabled each wordbook is converted to
+    a memory-mapped ``.optidict`` store (see ``dictionary_store``) and
+    entries are only decoded when read; learned entries go to the store's
+    journal.  Every compaction (``save_dictionary`` or the store's own
+    background one) re-exports the ``*.json.gz`` file, so code that reads or
+    edits the JSON directly sees the same entries as the store.
+    
     Reads from compressed JSON dictionary files in the format:
     {
         "source_text": {
@@ -252,6 +240,9 @@ class SmartDictionary:
     }
     """
     
+    # Entries scored per fuzzy lookup
+    FUZZY_CANDIDATE_LIMIT = 50
+    
     def __init__(self, dictionary_path: str | None = None, cache_size: int = None, config_manager=None):
         """
         Initialize local dictionary.
@@ -271,16 +262,23 @@ class SmartDictionary:
         self.cache = DictionaryLookupCache(cache_size)
         self._lock = RLock()
         
+        self.use_binary_store = (
+            config_manager.get_setting('dictionary.binary_store', True) if config_manager else True
+        )
+        
         # Statistics
         self.total_lookups = 0
         self.cache_hits = 0
         
-        # Dictionary data
-        self._dictionaries: dict[tuple[str, str], dict[str, dict]] = {}
+        # Dictionary data (plain dicts, or MappedDictionary for binary stores)
+        self._dictionaries: dict[tuple[str, str], MutableMapping[str, dict]] = {}
         
         # Track which file path is loaded for each language pair
         self._dictionary_paths: dict[tuple[str, str], str] = {}
         
+        # Fuzzy candidate index per language pair, with the dict it indexes
+        self._fuzzy_indexes: dict[tuple[str, str], tuple[dict, FuzzyIndex]] = {}
+        
         # Load dictionary if path provided
         if dictionary_path:
             self.load_dictionary(dictionary_path)
@@ -296,7 +294,7 @@ class SmartDictionary:
             return
         
         # Find all dictionary files
-        for dict_file in dict_dir.glob("*.json.gz"):
+        for dict_file in self._dictionary_files(dict_dir):
             try:
                 # Parse filename: en_de.json.gz
                 filename = dict_file.stem  # Remove .gz
@@ -315,6 +313,81 @@ class SmartDictionary:
             except Exception as e:
                 self.logger.error(f"Failed to load dictionary {dict_file}: {e}")
     
+    def _dictionary_files(self, dict_dir: Path) -> list[Path]:
+        """Wordbook paths in *dict_dir*, including pairs that only have a binary store."""
+        dict_files = {f.name: f for f in dict_dir.glob("*.json.gz")}
+        if self.use_binary_store:
+            for store in dict_dir.glob(f"*{STORE_SUFFIX}"):
+                name = store.name[:-len(STORE_SUFFIX)] + ".json.gz"
+                dict_files.setdefault(name, store.with_name(name))
+        return list(dict_files.values())
+    
+    def _read_dictionary_file(self, dict_path: Path) -> tuple[MutableMapping, str | None, str | None]:
+        """
+        Read a wordbook, preferring its binary store.
+        
+        The ``*.json.gz`` file is (re)imported into ``<pair>.optidict`` when
+        the store is missing or older than it; otherwise the store is mapped
+        without touching the JSON. A re-import keeps the store's journal, so
+        changes not compacted yet are replayed on top of the edited JSON.
+        Falls back to parsing the JSON if the binary store is disabled or
+        can not be used.
+        
+        Returns:
+            (dictionary data, source language, target language); languages
+            are None when the file does not record them
+        """
+        if self.use_binary_store:
+            store_path = store_path_for(dict_path)
+            try:
+                stale = not store_path.exists() or (
+                    dict_path.exists() and dict_path.stat().st_mtime > store_path.stat().st_mtime
+                )
+                with self._lock:
+                    for lang_pair, current in list(self._dictionaries.items()):
+                        if isinstance(current, MappedDictionary) and current.path == store_path:
+                            if not stale:
+                                return current, current.source_language, current.target_language
+                            # Unmap before the import replaces the file
+                            del self._dictionaries[lang_pair]
+                            self._fuzzy_indexes.pop(lang_pair, None)
+                            current.close()
+                if stale:
+                    import_json_gz(dict_path, store_path)
+                store = MappedDictionary(store_path)
+                store.on_compacted = lambda compacted: self._export_store(compacted, dict_path)
+                return store, store.source_language or None, store.target_language or None
+            except Exception as e:
+                self.logger.warning(f"Binary store unavailable for {dict_path}, reading JSON: {e}")
+        
+        with gzip.open(dict_path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if isinstance(data, dict) and 'translations' in data:
+            return data['translations'], data.get('source_language'), data.get('target_language')
+        return data, None, None
+    
+    def _set_dictionary(self, lang_pair: tuple[str, str], dictionary_data: MutableMapping,
+                        file_path: str, index: FuzzyIndex | None) -> None:
+        """Install a loaded dictionary for *lang_pair*. Must hold ``self._lock``."""
+        previous = self._dictionaries.get(lang_pair)
+        if isinstance(previous, MappedDictionary) and previous is not dictionary_data:
+            previous.close()
+        self._dictionaries[lang_pair] = dictionary_data
+        self._dictionary_paths[lang_pair] = file_path
+        if index is not None:
+            self._fuzzy_indexes[lang_pair] = (dictionary_data, index)
+        else:
+            # Mapped stores are indexed on the first fuzzy lookup
+            self._fuzzy_indexes.pop(lang_pair, None)
+    
+    @staticmethod
+    def _build_fuzzy_index(dictionary_data: MutableMapping) -> FuzzyIndex | None:
+        # Indexing decodes every key, which would undo the lazy store open
+        if isinstance(dictionary_data, MappedDictionary):
+            return None
+        return FuzzyIndex(dictionary_data)
+    
     def load_dictionary(self, dictionary_path: str, source_lang: str = "en", target_lang: str = "de"):
         """
         Load dictionary from file or directory.
@@ -327,13 +400,13 @@ class SmartDictionary:
         try:
             dict_path = Path(dictionary_path)
             
-            if not dict_path.exists():
+            if not dict_path.exists() and not (self.use_binary_store and store_path_for(dict_path).exists()):
                 self.logger.warning(f"Dictionary path not found: {dictionary_path}")
                 return
             
             if dict_path.is_dir():
                 self.logger.info(f"Loading dictionaries from directory: {dictionary_path}")
-                dict_files = list(dict_path.glob("*.json.gz"))
+                dict_files = self._dictionary_files(dict_path)
                 
                 if not dict_files:
                     self.logger.info(f"No dictionary files found in directory: {dictionary_path}")
@@ -352,15 +425,10 @@ class SmartDictionary:
                             src_lang = parts[0]
                             tgt_lang = parts[1]
                             
-                            with gzip.open(dict_file, 'rt', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            if isinstance(data, dict) and 'translations' in data:
-                                dictionary_data = data['translations']
-                            else:
-                                dictionary_data = data
+                            dictionary_data, _, _ = self._read_dictionary_file(dict_file)
                             
-                            loaded_pairs.append(((src_lang, tgt_lang), dictionary_data, str(dict_file)))
+                            loaded_pairs.append(((src_lang, tgt_lang), dictionary_data, str(dict_file),
+                                                 self._build_fuzzy_index(dictionary_data)))
                             self.logger.info(f"Loaded dictionary {src_lang}→{tgt_lang}: {len(dictionary_data)} entries from {dict_file}")
                         else:
                             continue
@@ -369,31 +437,24 @@ class SmartDictionary:
                 
                 # Update shared state under lock
                 with self._lock:
-                    for lang_pair, dictionary_data, file_path in loaded_pairs:
-                        self._dictionaries[lang_pair] = dictionary_data
-                        self._dictionary_paths[lang_pair] = file_path
+                    for lang_pair, dictionary_data, file_path, index in loaded_pairs:
+                        self._set_dictionary(lang_pair, dictionary_data, file_path, index)
                 
                 self.cache.clear()
                 return
             
             # Single file: read outside lock
-            with gzip.open(dict_path, 'rt', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if isinstance(data, dict) and 'translations' in data:
-                dictionary_data = data['translations']
-                if 'source_language' in data and 'target_language' in data:
-                    source_lang = data['source_language']
-                    target_lang = data['target_language']
-            else:
-                dictionary_data = data
+            dictionary_data, file_source, file_target = self._read_dictionary_file(dict_path)
+            if file_source and file_target:
+                source_lang = file_source
+                target_lang = file_target
             
             lang_pair = (source_lang, target_lang)
+            index = self._build_fuzzy_index(dictionary_data)
             
             # Update shared state under lock
             with self._lock:
-                self._dictionaries[lang_pair] = dictionary_data
-                self._dictionary_paths[lang_pair] = str(dict_path)
+                self._set_dictionary(lang_pair, dictionary_data, str(dict_path), index)
             
             self.logger.info(f"Loaded dictionary {source_lang}→{target_lang}: {len(dictionary_data)} entries from {dict_path}")
             self.cache.clear()
@@ -416,59 +477,79 @@ class SmartDictionary:
             DictionaryEntry if found, None otherwise
         """
         with self._lock:
-            self.total_lookups += 1
-            
-            # Create cache key
-            cache_key = f"{source_language}:{target_language}:{text}"
-            
-            # Check cache first
-            cached = self.cache.get(cache_key)
-            if cached is _CACHE_MISS:
-                # Negative cache hit — we already know this key isn't in the dictionary
-                return None
-            if cached is not None:
-                self.cache_hits += 1
-                return cached
-            
-            # Look up in dictionary
-            lang_pair = (source_language, target_language)
-            if lang_pair not in self._dictionaries:
-                # Cache negative result
-                self.cache.put(cache_key, _CACHE_MISS)
-                return None
-            
-            dictionary = self._dictionaries[lang_pair]
-            
-            # Try exact match with text
-            text_lower = text.lower()
-            
-            # Try different key formats
-            possible_keys = [
-                text,  # Exact match
-                text_lower,  # Lowercase
-                f"{source_language}:{target_language}:{text_lower}",  # Full key format
-            ]
-            
-            for key in possible_keys:
-                if key in dictionary:
-                    entry_data = dictionary[key]
-                    # Dictionary format with metadata
-                    entry = DictionaryEntry(
-                        source_text=entry_data.get('original', text),
-                        translation=entry_data.get('translation', text),
-                        source_language=source_language,
-                        target_language=target_language,
-                        usage_count=entry_data.get('usage_count', 1),
-                        confidence=entry_data.get('confidence', 0.9),
-                        last_used=entry_data.get('last_used', datetime.now().isoformat()),
-                        source_engine=entry_data.get('engine', 'dictionary')
-                        )
-                    self.cache.put(cache_key, entry)
-                    return entry
+            return self._lookup_locked(text, source_language, target_language)
+    
+    def lookup_many(self, texts: list[str], source_language: str = "en",
+                    target_language: str = "de") -> list[DictionaryEntry | None]:
+        """
+        Look up several texts with a single lock acquisition.
+        
+        Args:
+            texts: Source texts to translate
+            source_language: Source language code
+            target_language: Target language code
             
-            # Not found — cache negative result
+        Returns:
+            One DictionaryEntry or None per text, in order
+        """
+        with self._lock:
+            return [self._lookup_locked(text, source_language, target_language) for text in texts]
+    
+    def _lookup_locked(self, text: str, source_language: str, target_language: str) -> DictionaryEntry | None:
+        """Body of ``lookup``; caller must hold ``self._lock``."""
+        self.total_lookups += 1
+        
+        # Create cache key
+        cache_key = f"{source_language}:{target_language}:{text}"
+        
+        # Check cache first
+        cached = self.cache.get(cache_key)
+        if cached is _CACHE_MISS:
+            # Negative cache hit — we already know this key isn't in the dictionary
+            return None
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        
+        # Look up in dictionary
+        lang_pair = (source_language, target_language)
+        if lang_pair not in self._dictionaries:
+            # Cache negative result
             self.cache.put(cache_key, _CACHE_MISS)
             return None
+        
+        dictionary = self._dictionaries[lang_pair]
+        
+        # Try exact match with text
+        text_lower = text.lower()
+        
+        # Try different key formats
+        possible_keys = [
+            text,  # Exact match
+            text_lower,  # Lowercase
+            f"{source_language}:{target_language}:{text_lower}",  # Full key format
+        ]
+        
+        for key in possible_keys:
+            if key in dictionary:
+                entry_data = dictionary[key]
+                # Dictionary format with metadata
+                entry = DictionaryEntry(
+                    source_text=entry_data.get('original', text),
+                    translation=entry_data.get('translation', text),
+                    source_language=source_language,
+                    target_language=target_language,
+                    usage_count=entry_data.get('usage_count', 1),
+                    confidence=entry_data.get('confidence', 0.9),
+                    last_used=entry_data.get('last_used', datetime.now().isoformat()),
+                    source_engine=entry_data.get('engine', 'dictionary')
+                    )
+                self.cache.put(cache_key, entry)
+                return entry
+        
+        # Not found — cache negative result
+        self.cache.put(cache_key, _CACHE_MISS)
+        return None
     
     def fuzzy_lookup(self, text: str, source_language: str = "en", target_language: str = "de", 
                     threshold: float = 0.8, context: str | None = None) -> list[tuple[DictionaryEntry, float]]:
@@ -497,14 +578,24 @@ class SmartDictionary:
             if lang_pair not in self._dictionaries:
                 return []
             
-            dictionary = dict(self._dictionaries[lang_pair])
+            dictionary = self._dictionaries[lang_pair]
+            index = self._get_fuzzy_index(lang_pair, dictionary)
+            candidates = [
+                (key, dictionary[key])
+                for key in index.candidates(text, self.FUZZY_CANDIDATE_LIMIT)
+                if key in dictionary
+            ]
         matches = []
         
         text_lower = text.lower().strip()
+        if not text_lower:
+            return []
         text_tokens = set(re.findall(r'\w+', text_lower))
         context_tokens = set(re.findall(r'\w+', context.lower())) if context else set()
+        # Largest factor the quality/confidence boosts (and context) can add
+        max_context = 0.1 if context_tokens else 0.0
         
-        for dict_key, entry_data in dictionary.items():
+        for dict_key, entry_data in candidates:
             # Extract source text from key (format: "en:de:hello" or just "hello")
             if ':' in dict_key:
                 parts = dict_key.split(':', 2)
@@ -537,6 +628,11 @@ class SmartDictionary:
                 substring_score = min(len(text_lower), len(source_lower)) / max(len(text_lower), len(source_lower))
                 scores.append(('substring', substring_score, 0.2))  # 20% weight
             
+            # Skip building the entry when even full boosts cannot reach threshold
+            partial = sum(score * weight for _, score, weight in scores)
+            if (partial + max_context) * 1.2 * 1.1 < threshold:
+                continue
+            
             # Create entry from data
             if isinstance(entry_data, str):
                 # Old format: direct translation string
@@ -585,6 +681,23 @@ class SmartDictionary:
         
         return matches
     
+    def _get_fuzzy_index(self, lang_pair: tuple[str, str], dictionary: dict) -> FuzzyIndex:
+        """
+        Return the fuzzy index for *dictionary*, rebuilding it if stale.
+        
+        Callers outside this class sometimes replace or fill
+        ``_dictionaries[lang_pair]`` directly, so the index is checked
+        against the dict object and its size. Must hold ``self._lock``.
+        """
+        cached = self._fuzzy_indexes.get(lang_pair)
+        if cached is not None:
+            indexed, index = cached
+            if indexed is dictionary and len(index) == len(dictionary):
+                return index
+        index = FuzzyIndex(dictionary)
+        self._fuzzy_indexes[lang_pair] = (dictionary, index)
+        return index
+    
     @staticmethod
     def _contains_placeholder(text: str) -> bool:
         """Return True if *text* contains a Context Manager placeholder."""
@@ -712,6 +825,10 @@ class SmartDictionary:
             entry.add_context(context)
         
         dictionary[source_text] = entry.to_dict()
+        
+        cached = self._fuzzy_indexes.get((source_lang, target_lang))
+        if cached is not None and cached[0] is dictionary:
+            cached[1].add(source_text)
     
     def learn_from_translation(self, source_text: str, translation: str, 
                               source_language: str, target_language: str,
@@ -903,19 +1020,13 @@ class SmartDictionary:
                 return
             
             # Read outside lock
-            with gzip.open(dict_path, 'rt', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if isinstance(data, dict) and 'translations' in data:
-                dictionary_data = data['translations']
-            else:
-                dictionary_data = data
+            dictionary_data, _, _ = self._read_dictionary_file(dict_path)
             
             # Update state under lock
             lang_pair = (source_language, target_language)
+            index = self._build_fuzzy_index(dictionary_data)
             with self._lock:
-                self._dictionaries[lang_pair] = dictionary_data
-                self._dictionary_paths[lang_pair] = str(dict_path)
+                self._set_dictionary(lang_pair, dictionary_data, str(dict_path), index)
             
             self.cache.clear()
             
@@ -962,8 +1073,12 @@ class SmartDictionary:
                     pass
             
             # Remove stale entries
+            cached = self._fuzzy_indexes.get(lang_pair)
+            index = cached[1] if cached is not None and cached[0] is dictionary else None
             for source_text in to_remove:
                 del dictionary[source_text]
+                if index is not None:
+                    index.remove(source_text)
             
             if to_remove:
                 self.logger.info(f"Cleaned up {len(to_remove)} stale entries from {source_language}→{target_language}")
@@ -1039,11 +1154,21 @@ class SmartDictionary:
         
         return recommendations[:limit]
     
+    def _close_stores(self, discard_journal: bool = False) -> None:
+        """Unmap all binary stores, optionally dropping their journals first."""
+        for dictionary in self._dictionaries.values():
+            if isinstance(dictionary, MappedDictionary):
+                if discard_journal:
+                    dictionary.discard_journal()
+                dictionary.close()
+    
     def clear_all_entries(self):
         """Clear all dictionaries and the lookup cache."""
         with self._lock:
+            self._close_stores()
             self._dictionaries.clear()
             self._dictionary_paths.clear()
+            self._fuzzy_indexes.clear()
             self.cache.clear()
             self.logger.info("All dictionary entries cleared")
 
@@ -1052,10 +1177,14 @@ class SmartDictionary:
 
         Clears all in-memory data and reloads from the dictionary files,
         effectively discarding any entries learned during the current session.
+        For binary stores this drops the journal, i.e. changes made since the
+        store was last compacted.
         """
         with self._lock:
+            self._close_stores(discard_journal=True)
             self._dictionaries.clear()
             self._dictionary_paths.clear()
+            self._fuzzy_indexes.clear()
             self.cache.clear()
         self._auto_load_dictionaries()
         self.logger.info("Discarded unsaved dictionary changes — reloaded from disk")
@@ -1084,50 +1213,76 @@ class SmartDictionary:
                 if lang_pair not in self._dictionaries:
                     self.logger.warning(f"No dictionary to save for {source_language}→{target_language}")
                     return
-                dictionary = dict(self._dictionaries[lang_pair])
-            
-            dict_path = Path(dictionary_path)
-            dict_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Create backup if file exists
-            if dict_path.exists():
-                backup_path = Path(str(dict_path) + '.bak')
-                import shutil
-                shutil.copy2(dict_path, backup_path)
-            
-            dict_file_data = {
-                "version": "1.0",
-                "last_updated": datetime.now().isoformat(),
-                "total_entries": len(dictionary),
-                "compressed": True,
-                "source_language": source_language,
-                "target_language": target_language,
-                "translations": dictionary
-            }
-            
-            # Atomic write: write to temp file, then rename into place
-            fd, tmp_path = tempfile.mkstemp(
-                dir=str(dict_path.parent),
-                suffix='.tmp'
-            )
-            os.close(fd)
-            try:
-                with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
-                    json.dump(dict_file_data, f, indent=2, ensure_ascii=False)
-                os.replace(tmp_path, str(dict_path))
-            except BaseException:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
+                current = self._dictionaries[lang_pair]
+                if isinstance(current, MappedDictionary) and current.path == store_path_for(dictionary_path):
+                    store = current
+                else:
+                    store = None
+                    dictionary = dict(current)
+            
+            if store is not None:
+                # Compaction re-exports the JSON through on_compacted; with
+                # an empty journal only the export is needed
+                if store.journal_ops:
+                    store.compact()
+                else:
+                    self._export_store(store, Path(dictionary_path))
+                self.logger.info(f"Saved dictionary {source_language}→{target_language}: {len(store)} entries to {store.path}")
+                return
             
+            self._write_json(Path(dictionary_path), dictionary, source_language, target_language)
             self.logger.info(f"Saved dictionary {source_language}→{target_language}: {len(dictionary)} entries to {dictionary_path}")
             
         except Exception as e:
             self.logger.error(f"Failed to save dictionary: {e}")
             import traceback
             traceback.print_exc()
+    
+    def _export_store(self, store: MappedDictionary, dict_path: Path) -> None:
+        """Rewrite *dict_path* from a binary store after it was compacted."""
+        self._write_json(dict_path, dict(store), store.source_language, store.target_language)
+        # Same mtime as the JSON, so the next load does not re-import it
+        mtime = dict_path.stat().st_mtime
+        os.utime(store.path, (mtime, mtime))
+    
+    @staticmethod
+    def _write_json(dict_path: Path, dictionary: dict, source_language: str,
+                    target_language: str) -> None:
+        """Write a gzip JSON wordbook atomically, keeping a ``.bak`` of the old one."""
+        dict_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Create backup if file exists
+        if dict_path.exists():
+            backup_path = Path(str(dict_path) + '.bak')
+            import shutil
+            shutil.copy2(dict_path, backup_path)
+        
+        dict_file_data = {
+            "version": "1.0",
+            "last_updated": datetime.now().isoformat(),
+            "total_entries": len(dictionary),
+            "compressed": True,
+            "source_language": source_language,
+            "target_language": target_language,
+            "translations": dictionary
+        }
+        
+        # Atomic write: write to temp file, then rename into place
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(dict_path.parent),
+            suffix='.tmp'
+        )
+        os.close(fd)
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(dict_file_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, str(dict_path))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
 
 def create_smart_dictionary(dictionary_path: str | None = None, cache_size: int = 1000) -> 'SmartDictionary':
@@ -12,6 +12,7 @@ from typing import Any
 
 from app.text_translation.translation_engine_interface import (
     AbstractTranslationEngine,
+    BatchTranslationResult,
     TranslationOptions,
     TranslationResult,
 )
@@ -61,7 +62,47 @@ class SmartDictionaryEngine(AbstractTranslationEngine):
                               (time.time() - start) * 1000)
 
         elapsed_ms = (time.time() - start) * 1000
+        return self._to_result(text, entry, src_lang, tgt_lang, elapsed_ms)
 
+    def translate_batch(
+        self,
+        texts: list[str],
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None = None,
+    ) -> BatchTranslationResult:
+        """Look up all *texts* with one ``SmartDictionary.lookup_many`` call.
+
+        Results stay index-aligned with *texts*; misses have confidence 0.
+        """
+        start = time.time()
+        entries: list[Any] = [None] * len(texts)
+        if self._dictionary and texts:
+            try:
+                lookup_many = getattr(self._dictionary, "lookup_many", None)
+                if lookup_many is not None:
+                    entries = lookup_many(texts, src_lang, tgt_lang)
+                else:
+                    entries = [self._dictionary.lookup(t, src_lang, tgt_lang) for t in texts]
+            except Exception as exc:
+                logger.debug("Dictionary batch lookup error: %s", exc)
+
+        elapsed_ms = (time.time() - start) * 1000
+        per_text_ms = elapsed_ms / max(len(texts), 1)
+        results = [
+            self._to_result(text, entry, src_lang, tgt_lang, per_text_ms)
+            for text, entry in zip(texts, entries)
+        ]
+        hits = sum(1 for r in results if r.confidence > 0)
+        return BatchTranslationResult(
+            results=results,
+            total_processing_time_ms=elapsed_ms,
+            cache_hit_rate=hits / len(results) if results else 0.0,
+        )
+
+    def _to_result(
+        self, text: str, entry: Any, src_lang: str, tgt_lang: str, elapsed_ms: float,
+    ) -> TranslationResult:
         if entry and entry.translation and entry.translation != text:
             return TranslationResult(
                 original_text=text,
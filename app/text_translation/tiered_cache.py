@@ -0,0 +1,386 @@
+"""
+Shared tiered translation cache.
+
+One cache instance per process backs every component that remembers
+translations: the translation facade (through ``TranslationCacheAdapter``),
+the ``translation_cache`` optimizer plugin and ``PipelineCacheManager``.
+A string translated once is therefore stored once, under one key schema,
+with one eviction policy and one set of statistics.
+
+Tiers:
+
+- **L1** - in-process ``LRUCache`` bounded by entry count and memory,
+  with TTL expiration.
+- **L2** - optional ``TranslationStore`` on disk: checksummed log
+  segments that entries are appended to as they are learned.  It is
+  indexed on first use and compacted in the background; L2 hits are
+  promoted to L1.
+
+Keys are ``(text, src_lang, tgt_lang)``.  The producer of a translation
+(engine name plus quality/domain, see :meth:`TieredTranslationCache.variant`)
+is stored alongside the value: lookups that name a variant only accept
+translations from that producer, lookups without one accept any.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from app.text_translation.translation_engine_interface import TranslationOptions
+from app.text_translation.translation_store import STORE_DIRNAME, CacheKey, TranslationStore
+from app.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+LEGACY_CACHE_FILENAME = "translation_cache.json.gz"
+
+
+class TieredTranslationCache:
+    """L1 LRU + L2 persistent translation cache."""
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: int = 3600,
+        max_memory_mb: float | None = None,
+        store: TranslationStore | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of L1 entries
+            ttl_seconds: Time-to-live for entries in both tiers
+            max_memory_mb: Optional L1 memory limit
+            store: Persistent L2 tier (None for memory only)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._l1: LRUCache[CacheKey, tuple[str, str]] = LRUCache(
+            max_size=max_size,
+            ttl_seconds=ttl_seconds or None,
+            max_memory_mb=max_memory_mb or None,
+        )
+        self._store = store
+        self._lock = threading.RLock()
+        self._stats = {'l1_hits': 0, 'l2_hits': 0, 'misses': 0}
+
+    # -- key schema ------------------------------------------------------------
+
+    @staticmethod
+    def make_key(text: str, src_lang: str, tgt_lang: str) -> CacheKey:
+        """Return the cache key for *text* in a language pair.
+
+        The text is stripped and lowercased, so every client finds entries
+        that differ only in case or surrounding whitespace.
+        """
+        return (text.strip().lower(), src_lang, tgt_lang)
+
+    @staticmethod
+    def variant(engine: str, options: TranslationOptions | None = None) -> str:
+        """Return the producer tag stored with a translation."""
+        if options:
+            return f"{engine}:{options.quality.value}:{options.domain or ''}"
+        return engine
+
+    # -- lookups ---------------------------------------------------------------
+
+    def get(self, text: str, src_lang: str, tgt_lang: str,
+            variant: str | None = None) -> str | None:
+        """Get a cached translation, or None on a miss."""
+        return self.get_by_key(self.make_key(text, src_lang, tgt_lang), variant)
+
+    def get_by_key(self, key: CacheKey, variant: str | None = None) -> str | None:
+        """Get a cached translation using a key from :meth:`make_key`."""
+        with self._lock:
+            return self._lookup(key, variant)
+
+    def get_many(self, texts: Iterable[str], src_lang: str, tgt_lang: str,
+                 variant: str | None = None) -> list[str | None]:
+        """Look up several texts under one lock acquisition (index-aligned)."""
+        with self._lock:
+            return [self._lookup(self.make_key(text, src_lang, tgt_lang), variant) for text in texts]
+
+    def _lookup(self, key: CacheKey, variant: str | None) -> str | None:
+        cached = self._l1.get(key)
+        if cached is not None:
+            if variant is None or cached[1] == variant:
+                self._stats['l1_hits'] += 1
+                return cached[0]
+            self._stats['misses'] += 1
+            return None
+
+        if self._store is not None:
+            stored = self._store.get(key)
+            if stored is not None and not self._expired(stored[2]):
+                translation, stored_variant, _ = stored
+                if variant is None or stored_variant == variant:
+                    self._l1.put(key, (translation, stored_variant))
+                    self._stats['l2_hits'] += 1
+                    return translation
+
+        self._stats['misses'] += 1
+        return None
+
+    # -- writes ----------------------------------------------------------------
+
+    def put(self, text: str, src_lang: str, tgt_lang: str, translation: str,
+            variant: str | None = None) -> None:
+        """
+        Cache a translation.
+
+        Args:
+            variant: Producer tag (see :meth:`variant`).  None keeps the tag
+                of an identical cached translation, otherwise stores ``""``.
+        """
+        self.put_by_key(self.make_key(text, src_lang, tgt_lang), translation, variant)
+
+    def put_by_key(self, key: CacheKey, translation: str, variant: str | None = None) -> None:
+        """Cache a translation using a key from :meth:`make_key`."""
+        with self._lock:
+            now = time.time()
+            current = self._l1.get(key)
+            if current is None and self._store is not None:
+                stored = self._store.get(key)
+                current = stored[:2] if stored is not None else None
+            if variant is None:
+                variant = current[1] if current is not None and current[0] == translation else ""
+
+            self._l1.put(key, (translation, variant))
+
+            # Re-learning the same translation only rewrites the log record
+            # once half its TTL has passed, so hot strings do not grow it
+            if self._store is not None:
+                stored_at = self._store.timestamp(key) if current == (translation, variant) else None
+                if stored_at is None or (self.ttl_seconds and now - stored_at > self.ttl_seconds / 2):
+                    self._store.put(key, translation, variant, now)
+
+    def remove(self, text: str, src_lang: str, tgt_lang: str) -> None:
+        """Forget a translation in both tiers."""
+        key = self.make_key(text, src_lang, tgt_lang)
+        with self._lock:
+            self._l1.remove(key)
+            if self._store is not None:
+                self._store.remove(key)
+
+    def clear(self, persistent: bool = True) -> None:
+        """
+        Clear cached translations and reset statistics.
+
+        Args:
+            persistent: Also wipe the L2 store
+        """
+        with self._lock:
+            self._l1.clear()
+            if persistent and self._store is not None:
+                self._store.clear()
+            self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters without dropping entries."""
+        with self._lock:
+            self._stats = {'l1_hits': 0, 'l2_hits': 0, 'misses': 0}
+
+    # -- persistence -----------------------------------------------------------
+
+    @property
+    def store(self) -> TranslationStore | None:
+        """The persistent tier, if any."""
+        return self._store
+
+    def flush(self) -> bool:
+        """Push pending L2 writes to disk.  Returns False without a store."""
+        with self._lock:
+            if self._store is None:
+                return False
+            self._store.flush()
+            return True
+
+    def close(self) -> None:
+        """Seal and close the L2 store (it reopens on the next write)."""
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+
+    def save_to_disk(self, file_path: Path | str) -> bool:
+        """Export live entries as a gzip JSON snapshot (``TranslationCache`` format).
+
+        Returns True on success, False on error (logged, never raises).
+        """
+        file_path = Path(file_path)
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            now = time.time()
+            with self._lock:
+                entries = []
+                if self._store is not None:
+                    for key, (translation, variant, timestamp) in self._store.items():
+                        if self._expired(timestamp):
+                            continue
+                        entries.append({"k": list(key), "v": translation, "e": variant, "t": timestamp})
+                else:
+                    for item in self._l1.to_dict()["entries"]:
+                        translation, variant = item["value"]
+                        entries.append({"k": list(item["key"]), "v": translation, "e": variant,
+                                        "t": item["created_at"]})
+                payload = {
+                    "max_size": self.max_size,
+                    "ttl_seconds": self.ttl_seconds,
+                    "entries": entries,
+                }
+
+            tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False)
+            tmp_path.replace(file_path)
+            logger.info("Translation cache exported: %d entries -> %s", len(entries), file_path)
+            return True
+        except Exception as exc:
+            logger.error("Failed to export translation cache: %s", exc)
+            return False
+
+    def load_from_disk(self, file_path: Path | str) -> int:
+        """Merge a gzip JSON snapshot into the cache.
+
+        Accepts both this cache's export format and files written by
+        ``TranslationCache.save_to_disk`` (engine and options in the key).
+        Expired entries and keys already cached are skipped.
+
+        Returns the number of entries loaded.
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            logger.debug("No translation cache file found at %s", file_path)
+            return 0
+        try:
+            with gzip.open(file_path, "rt", encoding="utf-8") as fh:
+                payload = json.load(fh)
+        except Exception as exc:
+            logger.error("Failed to load translation cache from disk: %s", exc)
+            return 0
+
+        entries = payload.get("entries", [])
+        now = time.time()
+        loaded = 0
+        with self._lock:
+            for entry in entries:
+                try:
+                    raw_key = entry["k"]
+                    key = self.make_key(raw_key[0], raw_key[1], raw_key[2])
+                    translation = entry["v"]
+                    timestamp = entry.get("t", now)
+                except (KeyError, IndexError, TypeError):
+                    continue
+                if self.ttl_seconds and now - timestamp > self.ttl_seconds:
+                    continue
+                if self._store is not None and key in self._store:
+                    continue
+                variant = entry.get("e")
+                if variant is None:
+                    # TranslationCache key: (text, src, tgt, engine[, quality, domain])
+                    variant = ":".join(str(part) for part in raw_key[3:])
+                self._l1.put(key, (translation, variant))
+                if self._store is not None:
+                    self._store.put(key, translation, variant, timestamp)
+                loaded += 1
+
+        logger.info(
+            "Translation cache loaded from disk: %d entries from %s "
+            "(%d skipped as expired or duplicate)",
+            loaded, file_path, len(entries) - loaded,
+        )
+        return loaded
+
+    # -- statistics ------------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics for both tiers."""
+        with self._lock:
+            l1 = self._l1.get_stats()
+            hits = self._stats['l1_hits'] + self._stats['l2_hits']
+            total = hits + self._stats['misses']
+            stats = {
+                'size': l1['size'],
+                'max_size': self.max_size,
+                'hits': hits,
+                'misses': self._stats['misses'],
+                'evictions': l1['evictions'],
+                'hit_rate': hits / total if total > 0 else 0.0,
+                'ttl_seconds': self.ttl_seconds,
+                'l1_hits': self._stats['l1_hits'],
+                'l2_hits': self._stats['l2_hits'],
+                'persistent_size': len(self._store) if self._store is not None else 0,
+            }
+            if 'memory_mb' in l1:
+                stats['memory_mb'] = l1['memory_mb']
+            return stats
+
+    def _expired(self, timestamp: float) -> bool:
+        return bool(self.ttl_seconds) and time.time() - timestamp > self.ttl_seconds
+
+
+_shared_cache: TieredTranslationCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_translation_cache(
+    max_size: int | None = None,
+    ttl_seconds: int | None = None,
+    config_manager: Any = None,
+) -> TieredTranslationCache:
+    """
+    Return the process-wide translation cache, creating it on first use.
+
+    Settings are taken from the arguments, then *config_manager*
+    (``cache.translation_cache_*`` and ``cache.persistent_translation_cache``),
+    then defaults.  They only apply to the call that creates the cache.
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is not None:
+            return _shared_cache
+
+        _get = (lambda key, default: config_manager.get_setting(key, default)) if config_manager else (lambda _k, d: d)
+        if max_size is None:
+            max_size = _get('cache.translation_cache_size', 10000)
+        if ttl_seconds is None:
+            ttl_seconds = _get('cache.translation_cache_ttl', 3600)
+        max_memory_mb = _get('cache.translation_cache_memory_mb', 10.0)
+
+        store = None
+        if _get('cache.persistent_translation_cache', True):
+            try:
+                from app.utils.path_utils import ensure_dir
+                cache_dir = ensure_dir("cache")
+                store = TranslationStore(
+                    cache_dir / STORE_DIRNAME,
+                    max_entries=_get('cache.translation_store_size', 200_000),
+                )
+            except Exception as exc:
+                logger.warning("Persistent translation cache unavailable: %s", exc)
+                cache_dir = None
+
+        _shared_cache = TieredTranslationCache(
+            max_size=max_size,
+            ttl_seconds=ttl_seconds,
+            max_memory_mb=max_memory_mb,
+            store=store,
+        )
+
+        if store is not None:
+            # One-time migration of the former gzip cache.  Checking for it
+            # does not touch the store, which is indexed on first use.
+            legacy = cache_dir / LEGACY_CACHE_FILENAME
+            if legacy.exists() and not len(store):
+                _shared_cache.load_from_disk(legacy)
+            store.flush()
+            atexit.register(_shared_cache.close)
+
+        return _shared_cache
+
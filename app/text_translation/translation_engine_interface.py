@@ -6,6 +6,7 @@ for translation functionality including batch processing, caching, and language
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 from enum import Enum
 from dataclasses import dataclass, field
@@ -295,6 +296,14 @@ class TranslationCache:
 class AbstractTranslationEngine(ABC):
     """Abstract base class for translation engines."""
     
+    # In-process models set this so the translation layer merges concurrent
+    # requests into shared batches (see layer.batch_scheduler)
+    runs_locally = False
+    
+    # Engines that can hand out partial translations while decoding set this
+    # and override translate_text_stream()
+    supports_streaming = False
+    
     def __init__(self, engine_name: str):
         """
         Initialize translation engine.
@@ -338,6 +347,26 @@ class AbstractTranslationEngine(ABC):
         """
         raise NotImplementedError("Translation engine plugins must implement translate_text()")
     
+    def translate_text_stream(self, text: str, src_lang: str, tgt_lang: str,
+                              options: TranslationOptions | None = None) -> Iterator[str]:
+        """
+        Translate single text, yielding partial translations while decoding.
+        
+        Every item is the translation so far (not a delta) and the last item
+        is the final translation.  Default implementation yields the result
+        of translate_text() once.
+        
+        Args:
+            text: Text to translate
+            src_lang: Source language code
+            tgt_lang: Target language code
+            options: Translation options
+            
+        Yields:
+            Partial translations, ending with the final one
+        """
+        yield self.translate_text(text, src_lang, tgt_lang, options).translated_text
+    
     def translate_batch(self, texts: list[str], src_lang: str, tgt_lang: str,
                        options: TranslationOptions | None = None) -> BatchTranslationResult:
         """
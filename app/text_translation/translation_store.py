@@ -0,0 +1,496 @@
+"""
+Persistent tier (L2) of the shared translation cache.
+
+Translations are appended to log segments as they are learned, so saving
+costs a buffered ``write`` per new entry and a crash loses at most the
+unflushed tail.  Nothing is dumped at shutdown and nothing is parsed at
+startup.
+
+Directory layout::
+
+    <dir>/00000001.seg   records, append-only
+    <dir>/00000001.idx   index of a sealed segment
+    <dir>/00000002.seg   active segment (no .idx yet)
+
+Record (little-endian)::
+
+    u32 crc32   over the rest of the header and the payload
+    u32 payload length
+    u64 key hash (blake2b-64 of the key)
+    f64 timestamp
+    u8  flags   (1 = removal)
+    payload     compact UTF-8 JSON: [text, src, tgt, translation, variant],
+                or [text, src, tgt] for a removal
+
+A segment is sealed once it reaches ``segment_bytes`` (or the store is
+closed) and gets an ``.idx`` sidecar: ``b"TCIX"``, u32 count, one
+``(hash, offset, length, timestamp, flags)`` entry per record and a crc32
+trailer.  Opening the store only lists the directory.  The in-memory index
+(key hash -> segment, offset, length, timestamp) is built on first use
+from the sidecars plus a checksum scan of the active segment, which also
+cuts off a record torn by a crash.  Values are read from disk when looked
+up and never decoded while indexing.
+
+Superseded records are garbage.  Once they outnumber the live entries, or
+there are too many segments, a background thread copies the live records
+(as raw bytes) into one new segment and deletes the old ones.  The new
+segment's id sorts after the segments it replaces and before the active
+one, so replay order stays correct if the process dies mid-compaction.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = "translation_cache"
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+# Compact once this many superseded records have accumulated and they
+# outnumber the live entries, or once there are more segments than this
+_COMPACT_MIN_GARBAGE = 1000
+_MAX_SEGMENTS = 16
+
+# Push buffered records to the OS after this many writes
+_FLUSH_EVERY = 64
+
+_HEADER = struct.Struct("<IIQdB")
+_INDEX_ENTRY = struct.Struct("<QIIdB")
+_INDEX_MAGIC = b"TCIX"
+_FLAG_REMOVED = 1
+
+CacheKey = tuple[str, str, str]
+StoredEntry = tuple[str, str, float]  # (translation, variant, timestamp)
+_Location = tuple[int, int, int, float]  # (segment, offset, length, timestamp)
+
+
+def key_hash(key: CacheKey) -> int:
+    """Return the stable 64-bit hash a key is indexed under."""
+    data = "\x00".join(key).encode("utf-8", "surrogatepass")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _encode_record(key_id: int, timestamp: float, flags: int, payload: list) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8", "surrogatepass")
+    rest = _HEADER.pack(0, len(body), key_id, timestamp, flags)[4:]
+    crc = zlib.crc32(body, zlib.crc32(rest))
+    return struct.pack("<I", crc) + rest + body
+
+
+def _segment_name(segment_id: int) -> str:
+    return f"{segment_id:08d}"
+
+
+class TranslationStore:
+    """Append-only, checksummed segment log keyed by ``(text, src_lang, tgt_lang)``."""
+
+    def __init__(self, path: Path | str, max_entries: int = 200_000,
+                 segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        """
+        Open (or create on first write) the store in directory *path*.
+
+        Args:
+            path: Store directory
+            max_entries: Live entries kept; the oldest are dropped first
+            segment_bytes: Size at which the active segment is sealed
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.segment_bytes = segment_bytes
+        self._lock = threading.RLock()
+        self._compactor: threading.Thread | None = None
+
+        self._index: dict[int, _Location] | None = None
+        self._segment_records: dict[int, int] = {}
+        self._readers: dict[int, object] = {}
+
+        self._active_id: int | None = None
+        self._active_fh = None
+        self._active_size = 0
+        self._active_entries: list[tuple[int, int, int, float, int]] = []
+        self._unflushed = 0
+
+        self._segments = self._list_segments()
+        self._next_id = (self._segments[-1] + 1) if self._segments else 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ensure_index())
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key_hash(key) in self._ensure_index()
+
+    @property
+    def indexed(self) -> bool:
+        """Whether the index has been built yet."""
+        return self._index is not None
+
+    # -- reads ---------------------------------------------------------------
+
+    def get(self, key: CacheKey) -> StoredEntry | None:
+        """Return ``(translation, variant, timestamp)`` for *key*, or None."""
+        with self._lock:
+            location = self._ensure_index().get(key_hash(key))
+            if location is None:
+                return None
+            record = self._read(location)
+        if record is None or tuple(record[:3]) != key:
+            return None
+        return record[3], record[4], location[3]
+
+    def timestamp(self, key: CacheKey) -> float | None:
+        """Return when *key* was stored, without reading its record."""
+        with self._lock:
+            location = self._ensure_index().get(key_hash(key))
+        return location[3] if location is not None else None
+
+    def items(self) -> list[tuple[CacheKey, StoredEntry]]:
+        """Return a snapshot of all entries, oldest first."""
+        with self._lock:
+            locations = list(self._ensure_index().values())
+            result = []
+            for location in locations:
+                record = self._read(location)
+                if record is not None:
+                    result.append((tuple(record[:3]), (record[3], record[4], location[3])))
+        return result
+
+    # -- writes --------------------------------------------------------------
+
+    def put(self, key: CacheKey, translation: str, variant: str, timestamp: float) -> None:
+        """Record *translation* for *key*, evicting the oldest entry when full."""
+        with self._lock:
+            index = self._ensure_index()
+            key_id = key_hash(key)
+            location = self._append(key_id, timestamp, 0, [*key, translation, variant])
+            if location is None:
+                return
+            index.pop(key_id, None)
+            index[key_id] = location
+            while len(index) > self.max_entries:
+                index.pop(next(iter(index)))
+            self._maybe_compact()
+
+    def remove(self, key: CacheKey) -> bool:
+        """Drop *key*.  Returns True if it was stored."""
+        with self._lock:
+            index = self._ensure_index()
+            key_id = key_hash(key)
+            if key_id not in index:
+                return False
+            self._append(key_id, 0.0, _FLAG_REMOVED, list(key))
+            del index[key_id]
+            self._maybe_compact()
+            return True
+
+    def clear(self) -> None:
+        """Remove every entry and delete all segments."""
+        self.wait_for_compaction()
+        with self._lock:
+            self._close_files()
+            for segment_id in self._segments:
+                self._unlink_segment(segment_id)
+            self._segments = []
+            self._segment_records = {}
+            self._index = {}
+            self._active_id = None
+            self._active_entries = []
+            self._active_size = 0
+
+    def flush(self) -> None:
+        """Push buffered records to the OS."""
+        with self._lock:
+            if self._active_fh is not None:
+                self._active_fh.flush()
+                self._unflushed = 0
+
+    def close(self) -> None:
+        """Seal the active segment and close all files; the store reopens on use."""
+        self.wait_for_compaction()
+        with self._lock:
+            self._seal_active()
+            self._close_files()
+
+    # -- compaction ----------------------------------------------------------
+
+    @property
+    def garbage(self) -> int:
+        """Superseded records across all segments."""
+        with self._lock:
+            return sum(self._segment_records.values()) - len(self._ensure_index())
+
+    def compact(self) -> None:
+        """Rewrite all sealed data as one segment of live records."""
+        with self._lock:
+            index = self._ensure_index()
+            self._seal_active()
+            old_segments = list(self._segments)
+            if not old_segments:
+                return
+            new_id = self._next_id
+            self._next_id += 1
+            live = list(index.items())
+
+        tmp_path = self._segment_path(new_id).with_suffix(SEGMENT_SUFFIX + ".tmp")
+        entries = []
+        readers: dict[int, object] = {}
+        try:
+            with open(tmp_path, "wb") as out:
+                offset = 0
+                for key_id, (segment_id, src_offset, length, timestamp) in live:
+                    reader = readers.get(segment_id)
+                    if reader is None:
+                        reader = readers[segment_id] = open(self._segment_path(segment_id), "rb")
+                    reader.seek(src_offset)
+                    out.write(reader.read(length))
+                    entries.append((key_id, offset, length, timestamp, 0))
+                    offset += length
+                out.flush()
+                os.fsync(out.fileno())
+        finally:
+            for reader in readers.values():
+                reader.close()
+        os.replace(tmp_path, self._segment_path(new_id))
+        self._write_index_file(new_id, entries)
+
+        with self._lock:
+            index = self._ensure_index()
+            moved = 0
+            for (key_id, old_location), (_, offset, length, timestamp, _) in zip(live, entries):
+                # Keep entries rewritten or removed while we were copying
+                if index.get(key_id) is old_location:
+                    index[key_id] = (new_id, offset, length, timestamp)
+                    moved += 1
+            for segment_id in old_segments:
+                reader = self._readers.pop(segment_id, None)
+                if reader is not None:
+                    reader.close()
+                self._unlink_segment(segment_id)
+                self._segment_records.pop(segment_id, None)
+            self._segments = sorted({new_id, *(s for s in self._segments if s not in old_segments)})
+            self._segment_records[new_id] = len(entries)
+        logger.info("Compacted translation store %s: %d live entries, %d segments replaced",
+                    self.path, moved, len(old_segments))
+
+    def compact_async(self) -> None:
+        """Start a background compaction unless one is already running."""
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(
+                target=self._compact_logged, name="TranslationStoreCompactor", daemon=True,
+            )
+            self._compactor.start()
+
+    def _compact_logged(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.error("Translation store compaction failed for %s: %s", self.path, e)
+
+    def wait_for_compaction(self, timeout: float | None = None) -> None:
+        compactor = self._compactor
+        if compactor is not None and compactor is not threading.current_thread():
+            compactor.join(timeout)
+
+    def _maybe_compact(self) -> None:
+        live = len(self._index)
+        garbage = sum(self._segment_records.values()) - live
+        if (garbage >= _COMPACT_MIN_GARBAGE and garbage > live) or len(self._segments) > _MAX_SEGMENTS:
+            self.compact_async()
+
+    # -- indexing ------------------------------------------------------------
+
+    def _ensure_index(self) -> dict[int, _Location]:
+        if self._index is not None:
+            return self._index
+        index: dict[int, _Location] = {}
+        for segment_id in self._segments:
+            entries = self._read_index_file(segment_id)
+            if entries is None:
+                entries = self._scan_segment(segment_id)
+                if segment_id == self._segments[-1]:
+                    # Unsealed tail segment: keep appending to it
+                    self._active_id = segment_id
+                    self._active_entries = entries
+                    self._active_size = (entries[-1][1] + entries[-1][2]) if entries else 0
+            self._segment_records[segment_id] = len(entries)
+            for key_id, offset, length, timestamp, flags in entries:
+                index.pop(key_id, None)
+                if not flags & _FLAG_REMOVED:
+                    index[key_id] = (segment_id, offset, length, timestamp)
+        while len(index) > self.max_entries:
+            index.pop(next(iter(index)))
+        self._index = index
+        logger.debug("Translation store indexed: %d entries in %d segments from %s",
+                     len(index), len(self._segments), self.path)
+        return index
+
+    def _scan_segment(self, segment_id: int) -> list[tuple[int, int, int, float, int]]:
+        """Index a segment by checking every record; cut off a torn tail."""
+        path = self._segment_path(segment_id)
+        try:
+            data = path.read_bytes()
+        except OSError as exc:
+            logger.error("Failed to read translation store segment %s: %s", path, exc)
+            return []
+        entries = []
+        offset = 0
+        header_size = _HEADER.size
+        while offset + header_size <= len(data):
+            crc, length, key_id, timestamp, flags = _HEADER.unpack_from(data, offset)
+            end = offset + header_size + length
+            if end > len(data) or zlib.crc32(data[offset + 4:end]) != crc:
+                break
+            entries.append((key_id, offset, end - offset, timestamp, flags))
+            offset = end
+        if offset < len(data):
+            logger.warning("Translation store segment %s: dropping %d corrupt trailing bytes",
+                           path, len(data) - offset)
+            try:
+                with open(path, "r+b") as fh:
+                    fh.truncate(offset)
+            except OSError as exc:
+                logger.error("Failed to truncate %s: %s", path, exc)
+        return entries
+
+    def _read_index_file(self, segment_id: int) -> list[tuple[int, int, int, float, int]] | None:
+        path = self._index_path(segment_id)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if len(data) < 12 or data[:4] != _INDEX_MAGIC:
+            return None
+        (count,) = struct.unpack_from("<I", data, 4)
+        body_end = 8 + count * _INDEX_ENTRY.size
+        if len(data) != body_end + 4 or struct.unpack_from("<I", data, body_end)[0] != zlib.crc32(data[:body_end]):
+            logger.warning("Translation store index %s is damaged; rescanning its segment", path)
+            return None
+        return list(_INDEX_ENTRY.iter_unpack(data[8:body_end]))
+
+    def _write_index_file(self, segment_id: int, entries: list[tuple[int, int, int, float, int]]) -> None:
+        body = _INDEX_MAGIC + struct.pack("<I", len(entries)) + b"".join(
+            _INDEX_ENTRY.pack(*entry) for entry in entries
+        )
+        path = self._index_path(segment_id)
+        tmp_path = path.with_suffix(INDEX_SUFFIX + ".tmp")
+        with open(tmp_path, "wb") as fh:
+            fh.write(body + struct.pack("<I", zlib.crc32(body)))
+        os.replace(tmp_path, path)
+
+    # -- segment files -------------------------------------------------------
+
+    def _append(self, key_id: int, timestamp: float, flags: int, payload: list) -> _Location | None:
+        record = _encode_record(key_id, timestamp, flags, payload)
+        if self._active_fh is None:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                if self._active_id is None:
+                    self._active_id = self._next_id
+                    self._next_id += 1
+                    self._segments.append(self._active_id)
+                    self._segment_records[self._active_id] = 0
+                    self._active_entries = []
+                    self._active_size = 0
+                self._active_fh = open(self._segment_path(self._active_id), "ab")
+            except OSError as exc:
+                logger.error("Failed to open translation store segment in %s: %s", self.path, exc)
+                return None
+
+        offset = self._active_size
+        self._active_fh.write(record)
+        self._active_size += len(record)
+        self._active_entries.append((key_id, offset, len(record), timestamp, flags))
+        self._segment_records[self._active_id] += 1
+        location = (self._active_id, offset, len(record), timestamp)
+
+        self._unflushed += 1
+        if self._unflushed >= _FLUSH_EVERY:
+            self.flush()
+        if self._active_size >= self.segment_bytes:
+            self._seal_active()
+        return location
+
+    def _seal_active(self) -> None:
+        """Close the active segment and write its index sidecar."""
+        if self._active_id is None:
+            return
+        if self._active_fh is not None:
+            self._active_fh.close()
+            self._active_fh = None
+            self._unflushed = 0
+        if self._active_entries:
+            try:
+                self._write_index_file(self._active_id, self._active_entries)
+            except OSError as exc:
+                # The segment is still valid; it is rescanned on next start
+                logger.warning("Failed to write index for %s: %s", self._segment_path(self._active_id), exc)
+        self._active_id = None
+        self._active_entries = []
+        self._active_size = 0
+
+    def _read(self, location: _Location) -> list | None:
+        segment_id, offset, length, _ = location
+        if segment_id == self._active_id and self._unflushed:
+            self.flush()
+        reader = self._readers.get(segment_id)
+        try:
+            if reader is None:
+                reader = self._readers[segment_id] = open(self._segment_path(segment_id), "rb")
+            reader.seek(offset)
+            raw = reader.read(length)
+        except OSError as exc:
+            logger.error("Failed to read translation store record: %s", exc)
+            return None
+        if len(raw) != length or zlib.crc32(raw[4:]) != struct.unpack_from("<I", raw)[0]:
+            logger.warning("Translation store record at %s:%d failed its checksum", segment_id, offset)
+            return None
+        return json.loads(raw[_HEADER.size:].decode("utf-8", "surrogatepass"))
+
+    def _list_segments(self) -> list[int]:
+        if not self.path.is_dir():
+            return []
+        segments = []
+        for child in self.path.iterdir():
+            if child.suffix == SEGMENT_SUFFIX and child.stem.isdigit():
+                segments.append(int(child.stem))
+            elif child.suffix == ".tmp":
+                # Left behind by an interrupted compaction or seal
+                child.unlink(missing_ok=True)
+        return sorted(segments)
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.path / (_segment_name(segment_id) + SEGMENT_SUFFIX)
+
+    def _index_path(self, segment_id: int) -> Path:
+        return self.path / (_segment_name(segment_id) + INDEX_SUFFIX)
+
+    def _unlink_segment(self, segment_id: int) -> None:
+        for path in (self._segment_path(segment_id), self._index_path(segment_id)):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("Could not delete %s: %s", path, exc)
+
+    def _close_files(self) -> None:
+        if self._active_fh is not None:
+            try:
+                self._active_fh.close()
+            except OSError as exc:
+                logger.warning("Error closing translation store segment: %s", exc)
+            self._active_fh = None
+            self._unflushed = 0
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
@@ -3,7 +3,10 @@ Base Subprocess - Foundation for all pipeline stage subprocesses.
 
 Provides:
 - Subprocess lifecycle management (start/stop/restart)
-- JSON message communication (stdin/stdout)
+- Message communication over stdin/stdout, either line-delimited JSON
+  or binary length-prefixed frames (see ``ipc_protocol``)
+- Pipelined requests tagged with request IDs (``submit``/``collect``)
+- Optional shared-memory frame transport (see ``shared_frame_ring``)
 - Crash detection and automatic restart
 - Error handling and logging
 """
@@ -16,10 +19,17 @@ import queue
 import time
 import sys
 import os
+import itertools
+from collections import deque
 from typing import Any
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from .ipc_protocol import (
+    PROTOCOL_BINARY, PROTOCOL_ENV_VAR, PROTOCOL_JSON, read_message, write_message,
+)
+from .shared_frame_ring import SharedFrameRing
+
 logger = logging.getLogger(__name__)
 
 # Import EXE compatibility helpers
@@ -34,13 +44,18 @@ except ImportError:
 class BaseSubprocess(ABC):
     """Base class for all pipeline stage subprocesses."""
     
-    def __init__(self, name: str, worker_script: str):
+    def __init__(self, name: str, worker_script: str, shared_memory: bool = False,
+                 protocol: str = PROTOCOL_JSON):
         """
         Initialize subprocess wrapper.
         
         Args:
             name: Human-readable name for this subprocess
             worker_script: Path to worker script (relative to project root)
+            shared_memory: Negotiate a shared-memory frame ring at init so
+                frames can be passed by slot index instead of base64
+            protocol: Wire framing, ``"json"`` (line-delimited text) or
+                ``"binary"`` (length-prefixed frames with raw payloads)
         """
         self.name = name
         self.worker_script = worker_script
@@ -51,9 +66,23 @@ class BaseSubprocess(ABC):
         self.max_restarts = 3
         self.last_config = {}
         
+        # Shared-memory frame transport (negotiated in start())
+        self.shared_memory = shared_memory
+        self.frame_ring: SharedFrameRing | None = None
+        
         # Communication
+        self.protocol = protocol
         self.reader_thread: threading.Thread | None = None
+        self._stderr_thread: threading.Thread | None = None
+        self._stderr_tail: deque[str] = deque(maxlen=50)
         self.output_queue = queue.Queue()
+        self._send_lock = threading.Lock()
+        
+        # In-flight requests: request id -> single-slot reply queue
+        self._request_ids = itertools.count(1)
+        self._pending: dict[int, queue.Queue] = {}
+        self._pending_slots: dict[int, int] = {}
+        self._pending_lock = threading.Lock()
         
         # Metrics
         self.messages_sent = 0
@@ -85,24 +114,46 @@ class BaseSubprocess(ABC):
             # Get subprocess arguments (EXE-compatible)
             args = get_subprocess_args(self.worker_script)
             
-            # Start subprocess
-            self.process = subprocess.Popen(
-                args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
+            # Start subprocess (the worker picks its framing from the env)
+            env = dict(os.environ, **{PROTOCOL_ENV_VAR: self.protocol})
+            if self.protocol == PROTOCOL_BINARY:
+                self.process = subprocess.Popen(
+                    args,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=env,
+                )
+            else:
+                self.process = subprocess.Popen(
+                    args,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True,
+                    env=env,
+                )
+            self._start_stderr_drain()
             
-            # Send initial configuration
-            self._send_message({'type': 'init', 'config': config})
+            # Send initial configuration, offering a frame ring if enabled
+            init_message = {'type': 'init', 'config': config}
+            if self.shared_memory:
+                self.frame_ring = SharedFrameRing.create()
+                if self.frame_ring is not None:
+                    init_message['shm'] = self.frame_ring.describe()
+            self._send_message(init_message)
             
             # Wait for ready signal (with timeout)
             response = self._receive_message_sync(timeout=10.0)
             
             if response and response.get('type') == 'ready':
+                if self.frame_ring is not None and not response.get('shm'):
+                    # Worker could not attach -- fall back to base64 frames
+                    logger.info("[%s] Worker declined shared memory, using base64 frames", self.name)
+                    self.frame_ring.close()
+                    self.frame_ring = None
                 self.running = True
                 self.crashed = False
                 self.start_time = time.time()
@@ -130,14 +181,11 @@ class BaseSubprocess(ABC):
                 logger.error("[%s] Subprocess failed to initialize", self.name)
                 logger.error("[%s] Response: %s", self.name, response)
                 
-                # Try to read stderr for error messages
-                if self.process and self.process.stderr:
-                    try:
-                        stderr_output = self.process.stderr.read()
-                        if stderr_output:
-                            logger.error("[%s] STDERR: %s", self.name, stderr_output)
-                    except Exception:
-                        pass
+                # Report the worker's last stderr lines (kept by the drain thread)
+                if self._stderr_thread is not None:
+                    self._stderr_thread.join(timeout=1.0)
+                if self._stderr_tail:
+                    logger.error("[%s] STDERR:\n%s", self.name, "\n".join(self._stderr_tail))
                 
                 self._cleanup_process()
                 return False
@@ -189,60 +237,112 @@ class BaseSubprocess(ABC):
         Returns:
             Processed result or None on error
         """
-        if not self.running:
-            if self.crashed and self.restart_count < self.max_restarts:
-                logger.info("[%s] Attempting restart (%d/%d)...", self.name, self.restart_count + 1, self.max_restarts)
-                if self.restart():
-                    self.restart_count += 1
-                else:
-                    logger.error("[%s] Restart failed", self.name)
-                    return None
-            else:
-                logger.warning("[%s] Subprocess not running", self.name)
-                return None
+        request_id = self.submit(data)
+        if request_id is None:
+            return None
+        return self.collect(request_id, timeout)
+    
+    def submit(self, data: Any) -> int | None:
+        """
+        Send data to the subprocess without waiting for the result.
+        
+        Several requests may be in flight at once; the worker answers
+        them in order and each reply is routed back by its request ID.
+        
+        Args:
+            data: Data to process
+            
+        Returns:
+            Request ID to pass to ``collect()``, or None on error
+        """
+        if not self._ensure_running():
+            return None
         
+        request_id = next(self._request_ids)
         try:
             # Prepare message data
             prepared_data = self._prepare_message(data)
             
-            # Create process message with data field
-            message = {
+            with self._pending_lock:
+                self._pending[request_id] = queue.Queue(maxsize=1)
+                slot = prepared_data.get('shm_slot')
+                if slot is not None:
+                    self._pending_slots[request_id] = slot
+            
+            self._send_message({
                 'type': 'process',
+                'id': request_id,
                 'data': prepared_data
-            }
-            
-            # Send data
-            self._send_message(message)
-            
-            # Wait for result using deadline-based timeout
-            deadline = time.monotonic() + timeout
-            remaining = timeout
-            while remaining > 0:
-                try:
-                    result = self.output_queue.get(timeout=remaining)
-                    
-                    if result.get('type') == 'result':
-                        self.messages_received += 1
-                        return self._parse_result(result)
-                    elif result.get('type') == 'error':
-                        self.errors_count += 1
-                        logger.error("[%s] Error: %s", self.name, result.get('error'))
-                        return None
-                    else:
-                        self.output_queue.put(result)
-                        
-                except queue.Empty:
-                    pass
-                remaining = deadline - time.monotonic()
-            
-            logger.warning("[%s] Timeout waiting for result", self.name)
-            return None
+            })
+            return request_id
                 
         except Exception as e:
             logger.error("[%s] Processing error: %s", self.name, e, exc_info=True)
+            self._finish_request(request_id)
             self.crashed = True
             return None
     
+    def collect(self, request_id: int, timeout: float = 5.0) -> Any | None:
+        """
+        Wait for the result of a request made with ``submit()``.
+        
+        Args:
+            request_id: ID returned by ``submit()``
+            timeout: Maximum time to wait for result (seconds)
+            
+        Returns:
+            Processed result or None on error/timeout
+        """
+        with self._pending_lock:
+            reply_queue = self._pending.get(request_id)
+        if reply_queue is None:
+            return None
+        
+        try:
+            result = reply_queue.get(timeout=timeout)
+        except queue.Empty:
+            logger.warning("[%s] Timeout waiting for result", self.name)
+            # Keep the frame slot reserved: the worker may still read it.
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            return None
+        
+        self._finish_request(request_id)
+        
+        if result.get('type') == 'error':
+            self.errors_count += 1
+            logger.error("[%s] Error: %s", self.name, result.get('error'))
+            return None
+        
+        self.messages_received += 1
+        try:
+            return self._parse_result(result)
+        except Exception as e:
+            logger.error("[%s] Result parsing error: %s", self.name, e, exc_info=True)
+            return None
+    
+    def _ensure_running(self) -> bool:
+        """Restart a crashed subprocess if allowed; return whether it runs."""
+        if self.running:
+            return True
+        if self.crashed and self.restart_count < self.max_restarts:
+            logger.info("[%s] Attempting restart (%d/%d)...", self.name, self.restart_count + 1, self.max_restarts)
+            if self.restart():
+                self.restart_count += 1
+                return True
+            logger.error("[%s] Restart failed", self.name)
+            return False
+        logger.warning("[%s] Subprocess not running", self.name)
+        return False
+    
+    def _finish_request(self, request_id: int) -> None:
+        """Forget a request and free its shared-memory frame slot."""
+        with self._pending_lock:
+            self._pending.pop(request_id, None)
+            slot = self._pending_slots.pop(request_id, None)
+        if slot is not None and self.frame_ring is not None:
+            self.frame_ring.release(slot)
+    
     def restart(self) -> bool:
         """Restart crashed subprocess."""
         logger.info("[%s] Restarting subprocess...", self.name)
@@ -257,25 +357,37 @@ class BaseSubprocess(ABC):
         return self.process.poll() is None
     
     def _send_message(self, message: dict):
-        """Send JSON message to subprocess."""
+        """Send a message to the subprocess in the configured framing."""
         try:
             if not self.process or not self.process.stdin:
                 raise RuntimeError("Process not running")
             
-            json_str = json.dumps(message)
-            self.process.stdin.write(json_str + '\n')
-            self.process.stdin.flush()
-            self.messages_sent += 1
+            with self._send_lock:
+                if self.protocol == PROTOCOL_BINARY:
+                    write_message(self.process.stdin, message)
+                else:
+                    self.process.stdin.write(json.dumps(message) + '\n')
+                self.process.stdin.flush()
+                self.messages_sent += 1
             
         except Exception as e:
             logger.error("[%s] Send error: %s", self.name, e)
             self.crashed = True
             raise
     
+    def _read_message(self) -> dict | None:
+        """Read one message from stdout (blocking); ``None`` on EOF."""
+        if self.protocol == PROTOCOL_BINARY:
+            return read_message(self.process.stdout)
+        line = self.process.stdout.readline()
+        if not line:
+            return None
+        return json.loads(line.strip())
+    
     def _receive_message_sync(self, timeout: float = 5.0) -> dict | None:
-        """Receive JSON message from subprocess (synchronous with timeout).
+        """Receive a message from subprocess (synchronous with timeout).
 
-        Uses a background thread to avoid blocking indefinitely on readline().
+        Uses a background thread to avoid blocking indefinitely on a read.
         """
         try:
             if not self.process or not self.process.stdout:
@@ -285,11 +397,7 @@ class BaseSubprocess(ABC):
 
             def _reader():
                 try:
-                    line = self.process.stdout.readline()
-                    if line:
-                        result_queue.put(json.loads(line.strip()))
-                    else:
-                        result_queue.put(None)
+                    result_queue.put(self._read_message())
                 except Exception as exc:
                     result_queue.put(exc)
 
@@ -314,21 +422,71 @@ class BaseSubprocess(ABC):
         """Background thread to read subprocess output."""
         while self.running and self.is_alive():
             try:
-                line = self.process.stdout.readline()
-                if not line:
+                message = self._read_message()
+                if message is None:
                     break
-                
-                # Parse JSON message
-                message = json.loads(line.strip())
-                self.output_queue.put(message)
+                self._dispatch_message(message)
                 
             except json.JSONDecodeError as e:
-                logger.warning("[%s] Invalid JSON: %s", self.name, line)
+                logger.warning("[%s] Invalid JSON: %s", self.name, e)
+                if self.protocol == PROTOCOL_BINARY:
+                    # A corrupt frame header means the stream is out of sync
+                    self.crashed = True
+                    break
             except Exception as e:
                 logger.error("[%s] Reader error: %s", self.name, e)
                 break
         
         logger.debug("[%s] Reader thread stopped", self.name)
+    
+    def _start_stderr_drain(self):
+        """Forward the worker's stderr to the logger from a background thread.
+
+        The worker also points stdout at stderr, so library prints end up
+        here too; without a reader the pipe fills (~64 KB) and the worker
+        blocks on its next write.
+        """
+        self._stderr_tail.clear()
+        self._stderr_thread = threading.Thread(
+            target=self._drain_stderr,
+            args=(self.process.stderr,),
+            daemon=True,
+            name=f"{self.name}-Stderr"
+        )
+        self._stderr_thread.start()
+
+    def _drain_stderr(self, stream):
+        """Background thread: log stderr lines until the worker closes it."""
+        try:
+            for line in stream:
+                if isinstance(line, bytes):
+                    line = line.decode('utf-8', errors='replace')
+                line = line.rstrip()
+                if line:
+                    self._stderr_tail.append(line)
+                    logger.info("[%s] %s", self.name, line)
+        except (OSError, ValueError):
+            pass  # stream closed
+        finally:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _dispatch_message(self, message: dict):
+        """Route a reply to the request waiting for it."""
+        request_id = message.get('id')
+        if request_id is None:
+            self.output_queue.put(message)
+            return
+        with self._pending_lock:
+            reply_queue = self._pending.get(request_id)
+        if reply_queue is not None:
+            reply_queue.put(message)
+        else:
+            # Reply to a request that already timed out
+            logger.debug("[%s] Dropping late reply for request %s", self.name, request_id)
+            self._finish_request(request_id)
 
     def _parent_death_watchdog(self):
         """Background thread that monitors parent process liveness."""
@@ -374,12 +532,23 @@ class BaseSubprocess(ABC):
             try:
                 if self.process.stdin:
                     self.process.stdin.close()
-                if self.process.stderr:
-                    self.process.stderr.close()
             except Exception:
                 pass
-            
-            self.process = None
+
+        # stderr is closed by the drain thread when the worker exits
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=1.0)
+            self._stderr_thread = None
+
+        self.process = None
+
+        with self._pending_lock:
+            self._pending.clear()
+            self._pending_slots.clear()
+
+        if self.frame_ring is not None:
+            self.frame_ring.close()
+            self.frame_ring = None
     
     @abstractmethod
     def _prepare_message(self, data: Any) -> dict:
@@ -421,4 +590,7 @@ class BaseSubprocess(ABC):
             'messages_sent': self.messages_sent,
             'messages_received': self.messages_received,
             'errors_count': self.errors_count,
+            'shared_memory': self.frame_ring is not None,
+            'protocol': self.protocol,
+            'in_flight': len(self._pending),
         }
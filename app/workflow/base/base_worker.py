@@ -2,17 +2,25 @@
 Base Worker - Foundation for all worker scripts that run as subprocesses.
 
 Provides:
-- Message loop (read from stdin, write to stdout)
+- Message loop (read from stdin, write to stdout) in line-delimited JSON
+  or binary length-prefixed framing, as chosen by the parent
+- Request IDs echoed on every reply so the parent can pipeline requests
 - Initialization and shutdown handling
 - Error reporting
 - Logging
+- Shared-memory frame slots negotiated at init
 """
 
+import os
 import sys
 import json
-from typing import Any
+import threading
+from typing import Any, Iterator
 from abc import ABC, abstractmethod
 
+from .ipc_protocol import PROTOCOL_BINARY, PROTOCOL_ENV_VAR, read_message, write_message
+from .shared_frame_ring import SharedFrameRing
+
 
 class BaseWorker(ABC):
     """Base class for worker scripts that run as subprocesses."""
@@ -28,24 +36,35 @@ class BaseWorker(ABC):
         self.running = False
         self.initialized = False
         self._cleaned_up = False
+        self._frame_ring: SharedFrameRing | None = None
+        self._binary = os.environ.get(PROTOCOL_ENV_VAR) == PROTOCOL_BINARY
+        self._out = None
+        self._write_lock = threading.Lock()
+        self._request_id: int | None = None
     
     def run(self):
         """
         Main worker loop.
         
-        Reads JSON messages from stdin and processes them.
-        Writes JSON responses to stdout.
-        """
+        Reads messages from stdin and processes them.
+        Writes responses to stdout.
+        """
+        if self._binary:
+            # Keep the real stdout for framed messages and point fd 1 at
+            # stderr, so stray prints from libraries cannot corrupt frames.
+            self._out = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+            sys.stdout.flush()
+            os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+            sys.stdout = sys.stderr
+        
         try:
-            # Read messages from stdin
-            for line in sys.stdin:
+            for message in self._read_messages():
                 try:
-                    # Parse message
-                    message = json.loads(line.strip())
                     msg_type = message.get('type')
                     
                     # Handle message
                     if msg_type == 'init':
+                        self._frame_ring = SharedFrameRing.attach(message.get('shm'))
                         self._handle_init(message.get('config', {}))
                     elif msg_type == 'process':
                         self._handle_process(message)
@@ -55,8 +74,6 @@ class BaseWorker(ABC):
                     else:
                         self.send_error(f"Unknown message type: {msg_type}")
                         
-                except json.JSONDecodeError as e:
-                    self.send_error(f"Invalid JSON: {e}")
                 except Exception as e:
                     self.send_error(f"Message handling error: {e}")
                     import traceback
@@ -70,6 +87,25 @@ class BaseWorker(ABC):
             traceback.print_exc(file=sys.stderr)
         finally:
             self.cleanup()
+            if self._frame_ring is not None:
+                self._frame_ring.close()
+                self._frame_ring = None
+    
+    def _read_messages(self) -> Iterator[dict]:
+        """Yield decoded messages from stdin in the negotiated framing."""
+        if self._binary:
+            stdin = sys.stdin.buffer
+            while True:
+                message = read_message(stdin)
+                if message is None:
+                    return
+                yield message
+        else:
+            for line in sys.stdin:
+                try:
+                    yield json.loads(line.strip())
+                except json.JSONDecodeError as e:
+                    self.send_error(f"Invalid JSON: {e}")
     
     def _handle_init(self, config: dict):
         """Handle initialization message."""
@@ -92,14 +128,22 @@ class BaseWorker(ABC):
             self.send_error("Worker not initialized")
             return
         
+        self._request_id = message.get('id')
         try:
             data = message.get('data', {})
+            if 'shm_slot' in data and self._frame_ring is not None:
+                # Map the shared slot in place of the base64 payload
+                data['frame'] = self._frame_ring.read(
+                    data.pop('shm_slot'), data.get('shape', []), data.get('dtype', 'uint8'),
+                )
             result = self.process(data)
             self.send_result(result)
         except Exception as e:
             self.send_error(f"Processing error: {e}")
             import traceback
             traceback.print_exc(file=sys.stderr)
+        finally:
+            self._request_id = None
     
     def _handle_shutdown(self):
         """Handle shutdown message."""
@@ -144,21 +188,34 @@ class BaseWorker(ABC):
     
     def send_message(self, message: dict):
         """
-        Send JSON message to parent process.
+        Send message to parent process.
+        
+        Replies sent while handling a ``process`` request carry its
+        request ID.
         
         Args:
             message: Message dictionary
         """
-        try:
-            json_str = json.dumps(message)
-            print(json_str, flush=True)
-        except Exception as e:
-            # Can't send error via send_message if JSON encoding fails
-            print(json.dumps({'type': 'error', 'error': str(e)}), flush=True)
+        if self._request_id is not None:
+            message = dict(message, id=self._request_id)
+        with self._write_lock:
+            if self._binary:
+                try:
+                    write_message(self._out, message)
+                except Exception as e:
+                    write_message(self._out, {'type': 'error', 'error': str(e), 'id': message.get('id')})
+                self._out.flush()
+                return
+            try:
+                json_str = json.dumps(message)
+                print(json_str, flush=True)
+            except Exception as e:
+                # Can't send error via send_message if JSON encoding fails
+                print(json.dumps({'type': 'error', 'error': str(e), 'id': message.get('id')}), flush=True)
     
     def send_ready(self):
-        """Send ready signal to parent."""
-        self.send_message({'type': 'ready'})
+        """Send ready signal to parent (acknowledging shared memory if attached)."""
+        self.send_message({'type': 'ready', 'shm': self._frame_ring is not None})
     
     def send_result(self, result: dict):
         """
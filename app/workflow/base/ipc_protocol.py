@@ -0,0 +1,126 @@
+"""
+Binary length-prefixed framing for subprocess IPC.
+
+Each message on the wire is::
+
+    <uint32 header_len> <uint32 payload_len> <header JSON> <payload bytes>
+
+The header is the compact JSON form of the message dict.  Top-level
+binary values of ``message['data']`` (``bytes``, ``bytearray``,
+``memoryview`` or contiguous numpy arrays) are lifted out of the JSON
+and sent back-to-back as the raw payload; the header records their keys
+and lengths under ``_buffers`` so the reader can slice them back in as
+``memoryview`` objects.  Nothing is base64-encoded and nothing is parsed
+line by line.
+
+The mode is selected by the parent through the ``OPTIKR_IPC_PROTOCOL``
+environment variable so that ``BaseWorker`` knows which framing to use
+before the first message arrives.
+"""
+
+import json
+import struct
+from typing import Any, BinaryIO
+
+PROTOCOL_ENV_VAR = "OPTIKR_IPC_PROTOCOL"
+PROTOCOL_JSON = "json"
+PROTOCOL_BINARY = "binary"
+
+_HEADER = struct.Struct("<II")
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+
+def _as_buffer(value: Any) -> memoryview | None:
+    """Return a flat byte view of *value* if it is a binary buffer."""
+    if isinstance(value, _BUFFER_TYPES):
+        return memoryview(value).cast("B")
+    if hasattr(value, "__array_interface__"):
+        # numpy array -- must be C-contiguous to be sent without a copy
+        return memoryview(value).cast("B")
+    return None
+
+
+def encode_message(message: dict) -> list[Any]:
+    """Encode *message* into a list of byte chunks ready for ``write``.
+
+    Returns:
+        ``[prefix, header, *buffers]`` -- written sequentially, these form
+        one framed message.
+    """
+    data = message.get("data")
+    buffers: list[memoryview] = []
+    if isinstance(data, dict):
+        buffer_index = []
+        plain = {}
+        for key, value in data.items():
+            buf = _as_buffer(value)
+            if buf is None:
+                plain[key] = value
+            else:
+                buffer_index.append([key, buf.nbytes])
+                buffers.append(buf)
+        if buffers:
+            message = dict(message)
+            plain["_buffers"] = buffer_index
+            message["data"] = plain
+
+    header = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    payload_len = sum(b.nbytes for b in buffers)
+    return [_HEADER.pack(len(header), payload_len), header, *buffers]
+
+
+def write_message(stream: BinaryIO, message: dict) -> None:
+    """Frame *message* and write it to *stream* (caller flushes)."""
+    for chunk in encode_message(message):
+        stream.write(chunk)
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes | None:
+    """Read exactly *size* bytes, or return ``None`` on EOF."""
+    if size == 0:
+        return b""
+    data = stream.read(size)
+    if not data:
+        return None
+    if len(data) == size:
+        return data
+    # Short read (pipe delivered a partial chunk) -- keep going
+    chunks = [data]
+    remaining = size - len(data)
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_message(stream: BinaryIO) -> dict | None:
+    """Read one framed message from *stream*.
+
+    Returns:
+        The decoded message dict, or ``None`` on EOF.
+    """
+    prefix = _read_exact(stream, _HEADER.size)
+    if prefix is None:
+        return None
+    header_len, payload_len = _HEADER.unpack(prefix)
+
+    header = _read_exact(stream, header_len)
+    if header is None:
+        return None
+    message = json.loads(header)
+
+    if payload_len:
+        payload = _read_exact(stream, payload_len)
+        if payload is None:
+            return None
+        view = memoryview(payload)
+        data = message.get("data", {})
+        offset = 0
+        for key, length in data.pop("_buffers", []):
+            data[key] = view[offset:offset + length]
+            offset += length
+
+    return message
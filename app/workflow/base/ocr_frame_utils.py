@@ -1,8 +1,9 @@
 """
 Shared frame-decoding utilities for OCR plugin workers.
 
-Every OCR subprocess worker receives frames as base64-encoded numpy arrays.
-This module extracts the repetitive decode-and-convert boilerplate so each
+OCR subprocess workers receive frames as a numpy view onto a shared-memory
+slot (already mapped by ``BaseWorker``), as a raw byte payload (binary IPC
+protocol) or, as a fallback, as base64-encoded numpy arrays.  This module extracts the repetitive decode-and-convert boilerplate so each
 worker only needs a one-liner.
 """
 import base64
@@ -12,20 +13,26 @@ import numpy as np
 
 
 def decode_frame(data: dict[str, Any]) -> tuple[np.ndarray | None, str | None]:
-    """Decode a base64-encoded frame from the subprocess protocol.
+    """Decode a frame from the subprocess protocol.
 
     Args:
-        data: Message dict with keys ``frame`` (base64 str),
-              ``shape`` (list[int]), and ``dtype`` (str).
+        data: Message dict with keys ``frame`` (base64 str, raw bytes, or
+              an ndarray mapped from shared memory), ``shape`` (list[int]),
+              and ``dtype`` (str).
 
     Returns:
         ``(frame, None)`` on success, or ``(None, error_message)`` on failure.
     """
     frame_b64 = data.get("frame")
+    if isinstance(frame_b64, np.ndarray):
+        return frame_b64, None
     if not frame_b64:
         return None, "No frame provided"
 
-    frame_bytes = base64.b64decode(frame_b64)
+    if isinstance(frame_b64, (bytes, bytearray, memoryview)):
+        frame_bytes = frame_b64
+    else:
+        frame_bytes = base64.b64decode(frame_b64)
     shape = data.get("shape", [600, 800, 3])
     dtype = data.get("dtype", "uint8")
     frame = np.frombuffer(frame_bytes, dtype=dtype).reshape(shape)
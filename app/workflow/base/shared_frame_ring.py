@@ -0,0 +1,180 @@
+"""
+Shared-memory frame ring for subprocess frame transport.
+
+The parent process owns a single ``multiprocessing.shared_memory`` block
+split into fixed-size slots.  Each ``process`` message then only carries
+a slot index plus shape/dtype, and the worker maps the slot straight into
+a numpy array instead of base64-decoding a JSON string.
+
+Frames larger than a slot, frames sent while every slot is in flight, and
+platforms without shared memory fall back to sending the pixels inline
+(see ``ocr_frame_utils.decode_frame``).
+"""
+
+import logging
+import sys
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    from multiprocessing import shared_memory
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    shared_memory = None
+    SHARED_MEMORY_AVAILABLE = False
+
+# Default slot size fits a 4K BGR frame.  Pages are only committed when
+# touched, so unused capacity costs address space rather than RAM.
+DEFAULT_SLOT_BYTES = 3840 * 2160 * 3
+DEFAULT_SLOT_COUNT = 2
+
+
+class SharedFrameRing:
+    """Fixed-size ring of frame slots backed by one shared-memory block."""
+
+    def __init__(self, shm: Any, slot_count: int, slot_bytes: int, owner: bool):
+        self._shm = shm
+        self.slot_count = slot_count
+        self.slot_bytes = slot_bytes
+        self._owner = owner
+        self._next_slot = 0
+        self._busy: set[int] = set()
+        self._lock = threading.Lock()
+
+    # -- construction --------------------------------------------------
+
+    @classmethod
+    def create(cls, slot_count: int = DEFAULT_SLOT_COUNT,
+               slot_bytes: int = DEFAULT_SLOT_BYTES) -> "SharedFrameRing | None":
+        """Create a new ring in the parent process.
+
+        Returns:
+            The ring, or ``None`` if shared memory is unavailable.
+        """
+        if not SHARED_MEMORY_AVAILABLE:
+            return None
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=slot_count * slot_bytes)
+        except Exception as e:
+            logger.warning("Shared-memory frame ring unavailable: %s", e)
+            return None
+        return cls(shm, slot_count, slot_bytes, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor: dict) -> "SharedFrameRing | None":
+        """Attach to an existing ring from a worker process.
+
+        Args:
+            descriptor: Dict produced by :meth:`describe` in the parent.
+
+        Returns:
+            The attached ring, or ``None`` if attaching failed.
+        """
+        if not SHARED_MEMORY_AVAILABLE or not descriptor:
+            return None
+        try:
+            shm = shared_memory.SharedMemory(name=descriptor["name"])
+        except Exception:
+            return None
+        _untrack(shm)
+        return cls(shm, int(descriptor["slot_count"]), int(descriptor["slot_bytes"]), owner=False)
+
+    def describe(self) -> dict:
+        """Return the JSON-serialisable descriptor sent with ``init``."""
+        return {
+            "name": self._shm.name,
+            "slot_count": self.slot_count,
+            "slot_bytes": self.slot_bytes,
+        }
+
+    # -- frame I/O -----------------------------------------------------
+
+    def write(self, frame: Any) -> int | None:
+        """Copy *frame* into the next free slot and mark it busy.
+
+        The slot stays busy until :meth:`release` is called, so a worker
+        still reading a slot never sees it overwritten by a pipelined
+        request.
+
+        Returns:
+            The slot index, or ``None`` if the frame does not fit or every
+            slot is in flight.
+        """
+        nbytes = frame.nbytes
+        if nbytes > self.slot_bytes:
+            return None
+
+        import numpy as np
+
+        with self._lock:
+            for i in range(self.slot_count):
+                slot = (self._next_slot + i) % self.slot_count
+                if slot not in self._busy:
+                    break
+            else:
+                return None
+            self._busy.add(slot)
+            self._next_slot = (slot + 1) % self.slot_count
+
+        offset = slot * self.slot_bytes
+        target = np.ndarray(frame.shape, dtype=frame.dtype,
+                            buffer=self._shm.buf, offset=offset)
+        np.copyto(target, frame, casting="no")
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Mark *slot* free once the worker has answered its request."""
+        with self._lock:
+            self._busy.discard(slot)
+
+    def read(self, slot: int, shape: list[int], dtype: str) -> Any:
+        """Return a read-only numpy view of *slot* (no copy)."""
+        import numpy as np
+
+        if not 0 <= slot < self.slot_count:
+            raise ValueError(f"Invalid frame slot: {slot}")
+        view = np.ndarray(tuple(shape), dtype=np.dtype(dtype),
+                          buffer=self._shm.buf, offset=slot * self.slot_bytes)
+        view.flags.writeable = False
+        return view
+
+    # -- teardown ------------------------------------------------------
+
+    def close(self) -> None:
+        """Release the mapping (and unlink the block if this is the owner)."""
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+        except BufferError:
+            # A numpy view of a slot is still alive; the mapping is
+            # released when the process exits.
+            pass
+        except Exception as e:
+            logger.debug("Frame ring close error: %s", e)
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug("Frame ring unlink error: %s", e)
+        self._shm = None
+
+
+def _untrack(shm: Any) -> None:
+    """Stop the worker's resource tracker from unlinking the parent's block.
+
+    Before Python 3.13 every ``SharedMemory`` attach is registered with the
+    resource tracker, which unlinks it when the worker exits -- pulling the
+    block out from under the parent.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
@@ -4,15 +4,15 @@ Pipeline Cache Manager
 Manages translation caching (memory + persistent dictionary) and
 dictionary persistence.
 
-Uses the unified ``LRUCache`` from ``app.utils.cache`` as the backing store.
+Translations are kept in the process-wide ``TieredTranslationCache``
+shared with the translation layer and the ``translation_cache`` plugin.
 """
 
-import hashlib
 import logging
 import threading
 from typing import Any
 
-from app.utils.cache import LRUCache
+from app.text_translation.tiered_cache import TieredTranslationCache, get_translation_cache
 
 
 class PipelineCacheManager:
@@ -28,11 +28,7 @@ class PipelineCacheManager:
         """Initialize cache manager."""
         self.logger = logging.getLogger(__name__)
 
-        _get = (lambda key, default: config_manager.get_setting(key, default)) if config_manager else (lambda _k, d: d)
-        trans_cache_size = _get('cache.translation_cache_size', 10000)
-        trans_cache_memory = _get('cache.translation_cache_memory_mb', 10.0)
-
-        self.translation_cache: LRUCache[str, str] = LRUCache(max_size=trans_cache_size, max_memory_mb=trans_cache_memory)
+        self.translation_cache: TieredTranslationCache = get_translation_cache(config_manager=config_manager)
 
         self.persistent_dictionary = None
         if enable_persistent_dictionary:
@@ -67,8 +63,7 @@ class PipelineCacheManager:
             confidence: Translation confidence score
             save_to_dictionary: Whether to save to persistent dictionary
         """
-        key = self._make_translation_key(text, source_lang, target_lang)
-        self.translation_cache.put(key, translation)
+        self.translation_cache.put(text, source_lang, target_lang, translation)
 
         if save_to_dictionary and self.persistent_dictionary:
             try:
@@ -87,11 +82,11 @@ class PipelineCacheManager:
         """
         Get cached translation from memory cache OR persistent dictionary.
 
-        Two-tier lookup: memory LRU first, then persistent SmartDictionary.
-        Dictionary hits are promoted to memory cache for subsequent lookups.
+        Shared translation cache first, then persistent SmartDictionary.
+        Dictionary hits are promoted to the cache for subsequent lookups.
         """
-        key = self._make_translation_key(text, source_lang, target_lang)
-        cached = self.translation_cache.get(key)
+        key = self.translation_cache.make_key(text, source_lang, target_lang)
+        cached = self.translation_cache.get_by_key(key)
         if cached:
             return cached
 
@@ -99,19 +94,13 @@ class PipelineCacheManager:
             try:
                 entry = self.persistent_dictionary.lookup(text, source_lang, target_lang)
                 if entry:
-                    self.translation_cache.put(key, entry.translation)
+                    self.translation_cache.put_by_key(key, entry.translation, "dictionary")
                     return entry.translation
             except Exception as e:
                 self.logger.debug(f"Dictionary lookup failed: {e}")
 
         return None
 
-    @staticmethod
-    def _make_translation_key(text: str, source_lang: str, target_lang: str) -> str:
-        """Create cache key for translation."""
-        normalized = text.strip().lower()
-        return f"{source_lang}:{target_lang}:{hashlib.md5(normalized.encode()).hexdigest()}"
-
     # ── Cache management ──────────────────────────────────────────
 
     def clear_all(self, clear_dictionary: bool = False):
@@ -214,9 +203,10 @@ class PipelineCacheManager:
                     "Dictionary save deferred — waiting for user decision"
                 )
 
+            # The shared cache outlives the pipeline; just persist pending writes
             try:
-                self.translation_cache.clear()
+                self.translation_cache.flush()
             except Exception as e:
-                self.logger.warning("Error clearing translation cache during cleanup: %s", e)
+                self.logger.warning("Error flushing translation cache during cleanup: %s", e)
 
         self.logger.info("PipelineCacheManager cleaned up")
@@ -7,6 +7,9 @@ this class to route pipeline stages to isolated child processes.
 
 Only OCR is supported initially; the other attributes remain ``None``
 so SubprocessStrategy falls back to in-process execution for those.
+
+The OCR stage runs ``pipeline.subprocess_workers`` worker processes
+behind a ``SubprocessPool``, each with its own loaded engine.
 """
 
 import logging
@@ -14,6 +17,7 @@ import os
 from typing import Any
 
 from app.workflow.subprocesses.ocr_subprocess import OCRSubprocess
+from app.workflow.subprocesses.subprocess_pool import SubprocessPool
 
 
 logger = logging.getLogger(__name__)
@@ -26,14 +30,14 @@ class SubprocessManager:
         self._config_manager = config_manager
         self._started = False
 
-        self.ocr_subprocess: OCRSubprocess | None = None
+        self.ocr_subprocess: SubprocessPool | None = None
         self.capture_subprocess = None
         self.translation_subprocess = None
 
     # -- public API ----------------------------------------------------
 
     def start(self, ocr_plugin_name: str, ocr_plugin_path: str) -> bool:
-        """Start the OCR subprocess.
+        """Start the OCR worker pool.
 
         Args:
             ocr_plugin_name: Human-readable plugin name (e.g. ``"easyocr"``).
@@ -41,7 +45,7 @@ class SubprocessManager:
                 contains ``worker.py``.
 
         Returns:
-            ``True`` if the subprocess started and reported ready.
+            ``True`` if at least one worker started and reported ready.
         """
         worker_script = os.path.join(ocr_plugin_path, "worker.py")
         if not os.path.exists(worker_script):
@@ -50,12 +54,21 @@ class SubprocessManager:
             )
             return False
 
-        self.ocr_subprocess = OCRSubprocess(ocr_plugin_name, worker_script)
+        protocol = self._ipc_protocol()
+        pool_size = self._pool_size()
+        self.ocr_subprocess = SubprocessPool(
+            lambda i: OCRSubprocess(
+                ocr_plugin_name if pool_size == 1 else f"{ocr_plugin_name}-{i}",
+                worker_script,
+                protocol=protocol,
+            ),
+            size=pool_size,
+        )
         config = self._build_ocr_config()
 
         logger.info(
-            "Starting OCR subprocess for %s (worker=%s)",
-            ocr_plugin_name, worker_script,
+            "Starting %d OCR subprocess(es) for %s (worker=%s)",
+            pool_size, ocr_plugin_name, worker_script,
         )
         success = self.ocr_subprocess.start(config)
         self._started = success
@@ -84,6 +97,22 @@ class SubprocessManager:
 
     # -- internals -----------------------------------------------------
 
+    def _pool_size(self) -> int:
+        """Return the configured number of OCR worker processes."""
+        if self._config_manager is None:
+            return 1
+        return max(1, int(self._config_manager.get_setting(
+            "pipeline.subprocess_workers", 1,
+        )))
+
+    def _ipc_protocol(self) -> str:
+        """Return the configured wire framing for worker IPC."""
+        if self._config_manager is None:
+            return "binary"
+        return self._config_manager.get_setting(
+            "pipeline.subprocess_ipc_protocol", "binary",
+        )
+
     def _build_ocr_config(self) -> dict:
         """Build the init config dict sent to the OCR worker."""
         config: dict[str, Any] = {}
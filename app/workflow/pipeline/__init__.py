@@ -36,6 +36,8 @@ from .strategies import (
     SubprocessStrategy,
 )
 from .base_pipeline import BasePipeline
+from .frame_context import FrameContext
+from .tracing import SpanTracer, get_tracer
 
 __all__ = [
     # Types & protocols
@@ -60,6 +62,8 @@ __all__ = [
     "TTSStage",
     # Plugin wrapper
     "PluginAwareStage",
+    # Per-frame data
+    "FrameContext",
     # Strategies
     "SequentialStrategy",
     "AsyncStrategy",
@@ -67,4 +71,7 @@ __all__ = [
     "SubprocessStrategy",
     # Pipeline engine
     "BasePipeline",
+    # Tracing
+    "SpanTracer",
+    "get_tracer",
 ]
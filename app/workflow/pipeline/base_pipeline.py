@@ -5,7 +5,8 @@ Base pipeline engine.
 stages and delegates their execution to a pluggable ``ExecutionStrategy``.
 It manages the full lifecycle (start / stop / pause / resume), runs a
 background frame loop with FPS limiting and automatic error-based shutdown,
-and exposes callbacks for translation results, errors, and state changes.
+and exposes callbacks for translation results, partial (streamed)
+translations, errors, and state changes.
 
 Cleanup always runs in reverse stage order so late-initialised resources
 are released first.
@@ -17,8 +18,11 @@ import threading
 import time
 from typing import Any, Callable
 
+from .frame_pacer import FramePacer
+from .tracing import get_tracer
 from .types import (
     ErrorCallback,
+    ExecutionMode,
     ExecutionStrategy,
     PipelineConfig,
     PipelineStageProtocol,
@@ -65,11 +69,16 @@ class BasePipeline(ResourceOwner):
 
         self._stats = PipelineStats()
         self._stats_lock = threading.Lock()
+        self._first_text_ms_total = 0.0
+        self._first_text_frames = 0
         self._consecutive_skips = 0
         self._skip_log_interval = 50
 
+        self._pacer: FramePacer | None = None
+
         self._overlay_positions: list = []
         self._on_translation: TranslationCallback | None = None
+        self._on_partial_translation: TranslationCallback | None = None
         self._on_error: ErrorCallback | None = None
         self._on_state_change: StateChangeCallback | None = None
         self._pending_state_callback = None
@@ -86,6 +95,19 @@ class BasePipeline(ResourceOwner):
     def on_translation(self, cb: TranslationCallback | None) -> None:
         self._on_translation = cb
 
+    @property
+    def on_partial_translation(self) -> TranslationCallback | None:
+        """Called with the frame data while streaming stages are still decoding.
+
+        ``data["translations"]`` holds the text so far for every block and
+        ``data["partial_index"]`` the block that changed.
+        """
+        return self._on_partial_translation
+
+    @on_partial_translation.setter
+    def on_partial_translation(self, cb: TranslationCallback | None) -> None:
+        self._on_partial_translation = cb
+
     @property
     def on_error(self) -> ErrorCallback | None:
         return self._on_error
@@ -137,20 +159,42 @@ class BasePipeline(ResourceOwner):
                 pass
 
         with self._stats_lock:
+            frames = self._stats.frames_processed
             return PipelineStats(
-                frames_processed=self._stats.frames_processed,
+                frames_processed=frames,
                 frames_skipped=self._stats.frames_skipped,
+                frames_static=self._stats.frames_static,
                 frames_dropped=self._stats.frames_dropped + strategy_dropped,
                 consecutive_errors=self._stats.consecutive_errors,
                 total_errors=self._stats.total_errors,
                 total_duration_ms=self._stats.total_duration_ms,
+                average_latency_ms=self._stats.total_duration_ms / frames if frames else 0.0,
+                average_first_text_ms=(
+                    self._first_text_ms_total / self._first_text_frames
+                    if self._first_text_frames else 0.0
+                ),
                 stage_times_ms=stage_times,
             )
 
+    def get_pacing_stats(self) -> dict[str, Any]:
+        """Return the adaptive pacer's current interval and estimates."""
+        pacer = self._pacer
+        return pacer.get_stats() if pacer is not None else {}
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
+    def export_trace(self, path: str) -> int:
+        """Write buffered per-frame spans to *path* as Chrome trace JSON.
+
+        Returns the number of spans written (0 when tracing is disabled).
+        Open the file in ``chrome://tracing`` or https://ui.perfetto.dev.
+        ``stop()`` calls this with ``PipelineConfig.trace_path`` while
+        tracing is enabled.
+        """
+        return get_tracer().export_chrome_trace(path)
+
     def start(self) -> bool:
         """Start the pipeline's background frame loop.
 
@@ -216,8 +260,27 @@ class BasePipeline(ResourceOwner):
             self._set_state(PipelineState.IDLE)
         self._flush_state_callback()
 
+        self._export_trace_on_stop()
         logger.info("BasePipeline stopped")
 
+    def _export_trace_on_stop(self) -> None:
+        """Write the trace of the finished run when tracing is enabled.
+
+        Goes to ``PipelineConfig.trace_path``, or ``pipeline_trace.json``
+        in the logs directory; each run overwrites the previous file.
+        """
+        if not get_tracer().enabled:
+            return
+        path = self._config.trace_path
+        try:
+            if not path:
+                from app.utils.path_utils import ensure_dir
+                path = str(ensure_dir("logs") / "pipeline_trace.json")
+            count = self.export_trace(path)
+            logger.info("Pipeline trace (%d spans) written to %s", count, path)
+        except Exception as exc:
+            logger.warning("Could not write pipeline trace to %s: %s", path, exc)
+
     def _reset_plugins(self) -> None:
         """Reset all stage plugins and inner-stage caches so stale state
         doesn't carry across runs."""
@@ -346,9 +409,22 @@ class BasePipeline(ResourceOwner):
     # ------------------------------------------------------------------
 
     def _frame_loop(self) -> None:
-        """Background loop: execute all stages once per frame, FPS-limited."""
+        """Background loop: execute all stages once per frame, FPS-limited.
+
+        With ``adaptive_pacing`` the interval comes from ``FramePacer``
+        (bottleneck-stage throughput, exponential backoff on static
+        content); otherwise it is a fixed ``1 / target_fps``.
+        """
         frame_interval = 1.0 / max(self._config.target_fps, 1)
         last_frame_time = 0.0
+        pacer = None
+        if self._config.adaptive_pacing:
+            pacer = FramePacer(
+                self._config.target_fps,
+                pipelined=self._config.execution_mode == ExecutionMode.ASYNC,
+                max_idle_interval=self._config.max_idle_interval,
+            )
+        self._pacer = pacer
 
         while not self._stop_event.is_set():
             # Respect pause
@@ -361,6 +437,8 @@ class BasePipeline(ResourceOwner):
             # FPS limiting
             now = time.monotonic()
             elapsed_since_last = now - last_frame_time
+            if pacer is not None:
+                frame_interval = pacer.next_interval()
             if elapsed_since_last < frame_interval:
                 sleep_for = frame_interval - elapsed_since_last
                 with self._stats_lock:
@@ -377,8 +455,11 @@ class BasePipeline(ResourceOwner):
                     initial_data["region"] = self._config.capture_region
                     initial_data["source"] = "custom_region"
                 initial_data["_overlay_positions"] = self._overlay_positions
+                initial_data["_pipeline_start"] = time.perf_counter()
                 result = self._strategy.run_pipeline(self._stages, initial_data)
                 self._record_frame_result(result)
+                if pacer is not None:
+                    self._update_pacer(pacer, result)
                 if result.success and result.data:
                     new_pos = result.data.get("_overlay_positions")
                     if new_pos is not None:
@@ -419,13 +500,32 @@ class BasePipeline(ResourceOwner):
     # Frame result handling
     # ------------------------------------------------------------------
 
+    def _update_pacer(self, pacer: FramePacer, result: StageResult) -> None:
+        """Feed stage timings and the static-content flag to *pacer*."""
+        stage_times = None
+        if hasattr(self._strategy, "get_stats"):
+            try:
+                s_stats = self._strategy.get_stats()
+                if isinstance(s_stats, dict):
+                    stage_times = s_stats.get("avg_stage_times_ms")
+            except Exception:
+                pass
+        static = pacer.observe(stage_times, result.data if result.success else None)
+        if static:
+            with self._stats_lock:
+                self._stats.frames_static += 1
+
     def _record_frame_result(self, result: StageResult) -> None:
         if result.success and not result.data and result.duration_ms == 0.0:
             return
 
+        first_text_ms = result.data.get("first_text_ms") if result.data else None
         with self._stats_lock:
             self._stats.frames_processed += 1
             self._stats.total_duration_ms += result.duration_ms
+            if first_text_ms is not None:
+                self._first_text_ms_total += first_text_ms
+                self._first_text_frames += 1
             if result.success:
                 self._stats.consecutive_errors = 0
             else:
@@ -489,6 +589,14 @@ class BasePipeline(ResourceOwner):
             except Exception as exc:
                 logger.warning("on_translation callback error: %s", exc)
 
+    def _fire_partial_translation(self, data: dict[str, Any]) -> None:
+        if self._stop_event.is_set() or self._on_partial_translation is None:
+            return
+        try:
+            self._on_partial_translation(data)
+        except Exception as exc:
+            logger.warning("on_partial_translation callback error: %s", exc)
+
     def _fire_error(self, message: str) -> None:
         if self._on_error is not None:
             try:
@@ -0,0 +1,106 @@
+"""
+Copy-on-write per-frame data for stage hand-offs.
+
+``FrameContext`` is a ``MutableMapping`` made of stacked layers.  Handing a
+frame to the next stage is ``ctx.fork()``: the child gets an empty layer on
+top of the parent, so the hop allocates one small object instead of a copy
+of every key.  Reads walk the layers top-down; writes and deletes only
+touch the top layer, so a stage can never change what an earlier stage
+saw.  A layer must not be written once it has been forked -- strategies
+fork at the hand-off and never touch the parent again.
+
+Pixel buffers are shared, not copied: ``CaptureStage`` marks the captured
+array read-only and stages that paint on it (e.g. overlay masking in
+``OCRStage``) copy just the region they modify.
+"""
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+_MISSING = object()
+_DELETED = object()
+
+
+class FrameContext(MutableMapping):
+    """Layered, copy-on-write mapping used as the per-frame data dict."""
+
+    __slots__ = ("_layer", "_parent", "_depth")
+
+    # Reads walk every layer, so collapse chains longer than this on fork
+    _MAX_DEPTH = 8
+
+    def __init__(
+        self,
+        initial: dict[str, Any] | None = None,
+        *,
+        parent: "FrameContext | None" = None,
+    ) -> None:
+        self._layer: dict[str, Any] = dict(initial) if initial else {}
+        self._parent = parent
+        self._depth = parent._depth + 1 if parent is not None else 0
+
+    def fork(self) -> "FrameContext":
+        """Return a child context sharing (not copying) this one's data."""
+        if self._depth >= self._MAX_DEPTH:
+            return FrameContext(self.to_dict())
+        return FrameContext(parent=self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten all layers into a plain ``dict``."""
+        chain = []
+        node: FrameContext | None = self
+        while node is not None:
+            chain.append(node._layer)
+            node = node._parent
+        merged: dict[str, Any] = {}
+        for layer in reversed(chain):
+            merged.update(layer)
+        return {k: v for k, v in merged.items() if v is not _DELETED}
+
+    def copy(self) -> "FrameContext":
+        return self.fork()
+
+    # -- Mapping protocol ----------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        node: FrameContext | None = self
+        while node is not None:
+            value = node._layer.get(key, _MISSING)
+            if value is _DELETED:
+                raise KeyError(key)
+            if value is not _MISSING:
+                return value
+            node = node._parent
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore[index]
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._layer[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if self._parent is None:
+            del self._layer[key]
+        else:
+            self._layer[key] = _DELETED
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"FrameContext({self.to_dict()!r})"
@@ -0,0 +1,87 @@
+"""
+Adaptive frame pacing for ``BasePipeline``.
+
+A fixed ``1 / target_fps`` cadence keeps capturing frames that the
+pipeline cannot absorb (they are dropped at the first full queue) and
+keeps polling static pages at full rate.  ``FramePacer`` instead derives
+the interval from the per-stage service times the strategy reports
+(``avg_stage_times_ms``, already averaged over its recent frames, so
+the pacer does not smooth them again):
+
+* pipelined strategies (async) are limited by their slowest stage,
+  so the cadence follows the bottleneck stage's throughput;
+* serial strategies are limited by the sum of all stages.
+
+On top of that, frames reported static (``content_static`` set by
+``FrameSkipOptimizer``) double the interval, up to ``max_idle_interval``,
+and the first changed frame snaps it back to the service-time cadence.
+"""
+from typing import Any
+
+
+class FramePacer:
+    """Compute the delay between frame submissions."""
+
+    def __init__(
+        self,
+        target_fps: int,
+        *,
+        pipelined: bool = False,
+        max_idle_interval: float = 1.0,
+    ) -> None:
+        self._min_interval = 1.0 / max(target_fps, 1)
+        self._pipelined = pipelined
+        self._max_idle_interval = max(max_idle_interval, self._min_interval)
+        self._service_ms: dict[str, float] = {}
+        self._static_level = 0
+
+    def observe(
+        self,
+        stage_times_ms: dict[str, float] | None,
+        data: dict[str, Any] | None,
+    ) -> bool | None:
+        """Take the current service times and one frame's outcome.
+
+        *stage_times_ms* are the strategy's current per-stage averages;
+        *data* is the completed frame's result data (``None`` or empty
+        while frames are still in flight).  Returns whether the frame was
+        static, or ``None`` if there was no completed frame.
+        """
+        if stage_times_ms:
+            self._service_ms = dict(stage_times_ms)
+
+        if not data:
+            return None
+        static = bool(data.get("content_static", False))
+        if static:
+            self._static_level += 1
+        else:
+            self._static_level = 0
+        return static
+
+    @property
+    def service_interval(self) -> float:
+        """Seconds per frame the stages can sustain."""
+        if not self._service_ms:
+            return 0.0
+        values = self._service_ms.values()
+        total_ms = max(values) if self._pipelined else sum(values)
+        return total_ms / 1000.0
+
+    def next_interval(self) -> float:
+        """Seconds to wait between the start of consecutive frames."""
+        interval = max(self._min_interval, self.service_interval)
+        if self._static_level:
+            # Cap the exponent so 2 ** level cannot overflow on long idles
+            interval *= 2 ** min(self._static_level, 16)
+            interval = min(interval, max(self._max_idle_interval, self.service_interval))
+        return interval
+
+    def get_stats(self) -> dict[str, Any]:
+        bottleneck = max(self._service_ms, key=self._service_ms.get) if self._service_ms else None
+        return {
+            "interval_ms": self.next_interval() * 1000.0,
+            "service_ms": dict(self._service_ms),
+            "bottleneck_stage": bottleneck,
+            "static_backoff_level": self._static_level,
+        }
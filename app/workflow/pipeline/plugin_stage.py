@@ -15,6 +15,7 @@ import logging
 import time
 from typing import Any
 
+from .tracing import get_tracer
 from .types import PipelineStageProtocol, StageResult
 
 logger = logging.getLogger('optikr.pipeline.plugin_stage')
@@ -59,13 +60,16 @@ class PluginAwareStage:
         """Run pre-plugins, the inner stage, then post-plugins."""
         data = input_data
         total_plugin_ms = 0.0
+        tracer = get_tracer()
+        trace_id = input_data.get("_frame_seq")
 
         # --- Pre-plugins ---
         for plugin in self._pre_plugins:
             plugin_name = type(plugin).__name__
             try:
                 t0 = time.perf_counter()
-                data = plugin.process(data)
+                with tracer.span(f"{self.name}.{plugin_name}", "plugin", trace_id):
+                    data = plugin.process(data)
                 elapsed_ms = (time.perf_counter() - t0) * 1000
                 total_plugin_ms += elapsed_ms
             except Exception as exc:
@@ -91,7 +95,8 @@ class PluginAwareStage:
                 )
 
         # --- Inner stage ---
-        result = self._stage.execute(data)
+        with tracer.span(f"{self.name}.inner", "stage", trace_id):
+            result = self._stage.execute(data)
         logger.debug(
             "[%s] inner stage  %.1fms  success=%s",
             self.name, result.duration_ms, result.success,
@@ -105,7 +110,8 @@ class PluginAwareStage:
             plugin_name = type(plugin).__name__
             try:
                 t0 = time.perf_counter()
-                post_data = plugin.process(post_data)
+                with tracer.span(f"{self.name}.{plugin_name}", "plugin", trace_id):
+                    post_data = plugin.process(post_data)
                 elapsed_ms = (time.perf_counter() - t0) * 1000
                 total_plugin_ms += elapsed_ms
             except Exception as exc:
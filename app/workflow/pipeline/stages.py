@@ -14,13 +14,15 @@ still be injected for testing or custom backends.
 
 Requirements: 2.1, 2.2
 """
+import hashlib
 import logging
 import os
 import threading
 import time
+from collections.abc import Callable, Iterable
 from typing import Any
 
-from .types import StageResult
+from .types import StageResult, TranslationCallback
 
 from app.models import Frame, Rectangle
 import numpy as np
@@ -54,6 +56,7 @@ class CaptureStage:
             if region is not None:
                 args.append(region)
             frame = self._capture_layer.capture_frame(*args) if args else self._capture_layer.capture_frame()
+            self._share_read_only(frame)
             elapsed = (time.perf_counter() - start) * 1000
             shape = getattr(frame, "shape", None)
             dtype = getattr(frame, "dtype", type(frame).__name__)
@@ -67,6 +70,22 @@ class CaptureStage:
             logger.error("CaptureStage failed: [%s] %s", type(exc).__name__, exc)
             return StageResult(success=False, error=str(exc), duration_ms=elapsed)
 
+    @staticmethod
+    def _share_read_only(frame: Any) -> None:
+        """Swap the frame's pixels for a read-only view.
+
+        Downstream stages share the captured buffer without copying it;
+        a stage that needs to paint on it must copy (see
+        ``OCRStage._mask_overlay_regions``).  Capture hands out frames it
+        no longer writes to, so queued frames and references kept by
+        later stages stay valid.
+        """
+        data = getattr(frame, "data", None)
+        if isinstance(data, np.ndarray) and data.flags.writeable:
+            view = data.view()
+            view.flags.writeable = False
+            frame.data = view
+
     def cleanup(self) -> None:
         if self._capture_layer is not None and hasattr(self._capture_layer, "cleanup"):
             self._capture_layer.cleanup()
@@ -358,21 +377,32 @@ class OCRStage:
         data: np.ndarray,
         positions: list,
         margin: int = 4,
+        origin: tuple[int, int] = (0, 0),
     ) -> np.ndarray:
-        """Return a copy of *data* with previous-frame overlay regions whited out.
+        """Return *data* with previous-frame overlay regions whited out.
 
         Painting overlay areas white prevents the OCR engine from
         re-reading its own rendered translations (feedback loop).
+        *data* may be a crop whose top-left sits at *origin* in frame
+        coordinates.  The (read-only, shared) input is only copied when
+        at least one overlay actually intersects it; otherwise it is
+        returned as-is.
         """
-        masked = data.copy()
-        h, w = masked.shape[:2]
+        h, w = data.shape[:2]
+        ox, oy = origin
+        boxes = []
         for pos in positions:
-            x0 = max(0, getattr(pos, "x", 0) - margin)
-            y0 = max(0, getattr(pos, "y", 0) - margin)
-            x1 = min(w, getattr(pos, "x", 0) + getattr(pos, "width", 0) + margin)
-            y1 = min(h, getattr(pos, "y", 0) + getattr(pos, "height", 0) + margin)
+            x0 = max(0, getattr(pos, "x", 0) - margin - ox)
+            y0 = max(0, getattr(pos, "y", 0) - margin - oy)
+            x1 = min(w, getattr(pos, "x", 0) + getattr(pos, "width", 0) + margin - ox)
+            y1 = min(h, getattr(pos, "y", 0) + getattr(pos, "height", 0) + margin - oy)
             if x1 > x0 and y1 > y0:
-                masked[y0:y1, x0:x1] = 255
+                boxes.append((x0, y0, x1, y1))
+        if not boxes:
+            return data
+        masked = data.copy()
+        for x0, y0, x1, y1 in boxes:
+            masked[y0:y1, x0:x1] = 255
         return masked
 
     # ------------------------------------------------------------------
@@ -422,6 +452,191 @@ class OCRStage:
             height=pos.height,
         )
 
+    # ------------------------------------------------------------------
+    # Region OCR
+    # ------------------------------------------------------------------
+
+    def engine_has_text_detection(self) -> bool:
+        """Return True when the current OCR engine finds text itself (e.g. Mokuro)."""
+        return bool(
+            hasattr(self._ocr_layer, "engine_has_text_detection")
+            and self._ocr_layer.engine_has_text_detection()
+        )
+
+    def _extract_text_batch(self, frames: list[Frame]) -> list[list[Any]]:
+        if hasattr(self._ocr_layer, "extract_text_batch"):
+            return self._ocr_layer.extract_text_batch(frames, options=self._ocr_options)
+        return [self._ocr_layer.extract_text(f, options=self._ocr_options) for f in frames]
+
+    @classmethod
+    def ocr_regions(
+        cls,
+        frame: Frame,
+        overlay_positions: list,
+        extract_text: Callable[[Frame], list[Any]],
+        extract_text_batch: Callable[[list[Frame]], list[list[Any]]],
+        engine_has_detection: bool = False,
+    ) -> tuple[list[Any], Frame]:
+        """OCR the frame's ROI crops, or the whole frame, in frame coordinates.
+
+        Shared by ``execute`` and ``SubprocessStrategy`` so in-process and
+        subprocess OCR select, filter and mask regions the same way.
+        Applies the ROI size filters, skips cropping for engines with
+        built-in detection, masks previous-frame overlays, maps crop
+        bboxes back with ``_offset_position`` and falls back to the full
+        frame when no region produced text.
+
+        Args:
+            frame: Captured frame; ROIs come from ``metadata["roi_regions"]``
+            overlay_positions: Previous-frame overlay rectangles to mask
+            extract_text: OCRs one frame
+            extract_text_batch: OCRs a list of crops, one block list each
+            engine_has_detection: Feed the full frame even if ROIs exist
+
+        Returns:
+            ``(text_blocks, frame)`` where *frame* is the (possibly masked)
+            frame used for a full-frame pass, else the input frame.
+        """
+        roi_regions: list[Rectangle] = []
+        if isinstance(getattr(frame, "metadata", None), dict):
+            roi_regions = frame.metadata.get("roi_regions") or []
+
+        # --- Mask previous-frame overlay regions to prevent feedback ---
+        # Masking is copy-on-write: ROI crops are masked individually
+        # below and only crops touching an overlay get copied, so the
+        # full frame is copied only when it is OCR'd as a whole.
+        unmasked_frame = frame
+        masked_frame: Frame | None = None
+
+        def full_frame() -> Frame:
+            nonlocal masked_frame
+            if masked_frame is None:
+                masked_frame = unmasked_frame
+                if overlay_positions:
+                    masked_data = cls._mask_overlay_regions(
+                        unmasked_frame.data, overlay_positions,
+                        cls._OVERLAY_MASK_MARGIN,
+                    )
+                    if masked_data is not unmasked_frame.data:
+                        masked_frame = Frame(
+                            data=masked_data,
+                            timestamp=unmasked_frame.timestamp,
+                            source_region=unmasked_frame.source_region,
+                            metadata=unmasked_frame.metadata,
+                        )
+                        logger.debug(
+                            "[OCRStage] masked %d overlay region(s) from previous frame",
+                            len(overlay_positions),
+                        )
+            return masked_frame
+
+        # --- Check if the engine has built-in text detection ---
+        # Engines like Mokuro include their own text detector that
+        # outperforms the generic bubble detector.  When available,
+        # skip per-region cropping and feed the full frame directly.
+        if engine_has_detection:
+            if roi_regions:
+                logger.debug(
+                    "[OCRStage] engine has built-in detection — "
+                    "ignoring %d ROI region(s), using full frame",
+                    len(roi_regions),
+                )
+            roi_regions = []
+
+        if roi_regions:
+            logger.info(
+                "[OCRStage] %d ROI region(s) from preprocessing: %s",
+                len(roi_regions),
+                ", ".join(
+                    f"({r.x},{r.y},{r.width}x{r.height})"
+                    for r in roi_regions[:5]
+                )
+                + ("..." if len(roi_regions) > 5 else ""),
+            )
+
+        # --- Filter oversized ROI regions (panel-level, not bubble-level) --
+        if roi_regions:
+            frame_area = frame.data.shape[0] * frame.data.shape[1]
+            max_area = frame_area * cls._MAX_ROI_AREA_RATIO
+            small = [r for r in roi_regions if r.width * r.height <= max_area]
+            if small:
+                dropped = len(roi_regions) - len(small)
+                if dropped:
+                    logger.debug(
+                        "[OCRStage] dropped %d oversized ROI region(s) (>%.0f%% frame)",
+                        dropped, cls._MAX_ROI_AREA_RATIO * 100,
+                    )
+                roi_regions = small
+
+        # --- Filter undersized ROI regions (noise, tiny fragments) ---
+        if roi_regions:
+            before = len(roi_regions)
+            roi_regions = [
+                r for r in roi_regions
+                if r.width >= cls._MIN_ROI_WIDTH
+                and r.height >= cls._MIN_ROI_HEIGHT
+                and r.width * r.height >= cls._MIN_ROI_AREA
+            ]
+            dropped = before - len(roi_regions)
+            if dropped:
+                logger.debug(
+                    "[OCRStage] dropped %d undersized ROI region(s) (<%dx%d or area<%d)",
+                    dropped, cls._MIN_ROI_WIDTH, cls._MIN_ROI_HEIGHT,
+                    cls._MIN_ROI_AREA,
+                )
+
+        if roi_regions:
+            # All crops of the frame go through one batch call so
+            # engines with real batching run a single forward pass.
+            sub_frames = [
+                Frame(
+                    data=cls._mask_overlay_regions(
+                        frame.data[
+                            region.y : region.y + region.height,
+                            region.x : region.x + region.width,
+                        ],
+                        overlay_positions,
+                        cls._OVERLAY_MASK_MARGIN,
+                        origin=(region.x, region.y),
+                    ),
+                    timestamp=frame.timestamp,
+                    source_region=frame.source_region,
+                )
+                for region in roi_regions
+            ]
+            batch_blocks = extract_text_batch(sub_frames)
+            all_blocks: list[Any] = []
+            for region, sub_frame, blocks in zip(roi_regions, sub_frames, batch_blocks):
+                crop_h, crop_w = sub_frame.data.shape[:2]
+                for blk in blocks:
+                    pos = getattr(blk, "position", None)
+                    if pos is not None:
+                        blk.position = cls._offset_position(
+                            pos, region, crop_w, crop_h,
+                        )
+                    all_blocks.append(blk)
+            logger.debug(
+                "[OCRStage] per-region OCR: %d regions -> %d blocks",
+                len(roi_regions), len(all_blocks),
+            )
+            text_blocks = all_blocks if all_blocks else extract_text(full_frame())
+        else:
+            frame = full_frame()
+            text_blocks = extract_text(frame)
+
+        # Centre-correct any full-frame bboxes from the fallback path
+        if not roi_regions and not engine_has_detection:
+            fh, fw = frame.data.shape[:2]
+            for blk in text_blocks:
+                pos = getattr(blk, "position", None)
+                if pos is not None and cls._is_full_input_bbox(pos, fw, fh):
+                    blk.position = Rectangle(
+                        x=fw // 4, y=fh // 4,
+                        width=fw // 2, height=fh // 2,
+                    )
+
+        return text_blocks, frame
+
     # ------------------------------------------------------------------
     # execute
     # ------------------------------------------------------------------
@@ -478,123 +693,15 @@ class OCRStage:
                     "-> forcing fresh OCR (similarity=%.4f)", similarity,
                 )
 
-            # --- Mask previous-frame overlay regions to prevent feedback ---
             overlay_positions = input_data.get("_overlay_positions", [])
-            if overlay_positions:
-                masked_data = self._mask_overlay_regions(
-                    frame.data, overlay_positions, self._OVERLAY_MASK_MARGIN,
-                )
-                frame = Frame(
-                    data=masked_data,
-                    timestamp=frame.timestamp,
-                    source_region=frame.source_region,
-                    metadata=frame.metadata,
-                )
-                logger.debug(
-                    "[OCRStage] masked %d overlay region(s) from previous frame",
-                    len(overlay_positions),
-                )
-
-            # --- Check if the engine has built-in text detection ---
-            # Engines like Mokuro include their own text detector that
-            # outperforms the generic bubble detector.  When available,
-            # skip per-region cropping and feed the full frame directly.
-            engine_has_detection = (
-                hasattr(self._ocr_layer, "engine_has_text_detection")
-                and self._ocr_layer.engine_has_text_detection()
+            text_blocks, frame = self.ocr_regions(
+                frame,
+                overlay_positions,
+                lambda f: self._ocr_layer.extract_text(f, options=self._ocr_options),
+                self._extract_text_batch,
+                engine_has_detection=self.engine_has_text_detection(),
             )
 
-            if engine_has_detection:
-                if roi_regions:
-                    logger.debug(
-                        "[OCRStage] engine has built-in detection — "
-                        "ignoring %d ROI region(s), using full frame",
-                        len(roi_regions),
-                    )
-                roi_regions = []
-
-            if roi_regions:
-                logger.info(
-                    "[OCRStage] %d ROI region(s) from preprocessing: %s",
-                    len(roi_regions),
-                    ", ".join(
-                        f"({r.x},{r.y},{r.width}x{r.height})"
-                        for r in roi_regions[:5]
-                    )
-                    + ("..." if len(roi_regions) > 5 else ""),
-                )
-
-            # --- Filter oversized ROI regions (panel-level, not bubble-level) --
-            if roi_regions:
-                frame_area = frame.data.shape[0] * frame.data.shape[1]
-                max_area = frame_area * self._MAX_ROI_AREA_RATIO
-                small = [r for r in roi_regions if r.width * r.height <= max_area]
-                if small:
-                    dropped = len(roi_regions) - len(small)
-                    if dropped:
-                        logger.debug(
-                            "[OCRStage] dropped %d oversized ROI region(s) (>%.0f%% frame)",
-                            dropped, self._MAX_ROI_AREA_RATIO * 100,
-                        )
-                    roi_regions = small
-
-            # --- Filter undersized ROI regions (noise, tiny fragments) ---
-            if roi_regions:
-                before = len(roi_regions)
-                roi_regions = [
-                    r for r in roi_regions
-                    if r.width >= self._MIN_ROI_WIDTH
-                    and r.height >= self._MIN_ROI_HEIGHT
-                    and r.width * r.height >= self._MIN_ROI_AREA
-                ]
-                dropped = before - len(roi_regions)
-                if dropped:
-                    logger.debug(
-                        "[OCRStage] dropped %d undersized ROI region(s) (<%dx%d or area<%d)",
-                        dropped, self._MIN_ROI_WIDTH, self._MIN_ROI_HEIGHT,
-                        self._MIN_ROI_AREA,
-                    )
-
-            if roi_regions:
-                all_blocks: list[Any] = []
-                for region in roi_regions:
-                    crop = frame.data[
-                        region.y : region.y + region.height,
-                        region.x : region.x + region.width,
-                    ]
-                    crop_h, crop_w = crop.shape[:2]
-                    sub_frame = Frame(
-                        data=crop,
-                        timestamp=frame.timestamp,
-                        source_region=frame.source_region,
-                    )
-                    blocks = self._ocr_layer.extract_text(sub_frame, options=self._ocr_options)
-                    for blk in blocks:
-                        pos = getattr(blk, "position", None)
-                        if pos is not None:
-                            blk.position = self._offset_position(
-                                pos, region, crop_w, crop_h,
-                            )
-                        all_blocks.append(blk)
-                logger.debug(
-                    "[OCRStage] per-region OCR: %d regions -> %d blocks",
-                    len(roi_regions), len(all_blocks),
-                )
-                text_blocks = all_blocks if all_blocks else self._ocr_layer.extract_text(frame, options=self._ocr_options)
-            else:
-                text_blocks = self._ocr_layer.extract_text(frame, options=self._ocr_options)
-
-            # Centre-correct any full-frame bboxes from the fallback path
-            if not roi_regions and not engine_has_detection:
-                fh, fw = frame.data.shape[:2]
-                for blk in text_blocks:
-                    pos = getattr(blk, "position", None)
-                    if pos is not None and self._is_full_input_bbox(pos, fw, fh):
-                        blk.position = Rectangle(
-                            x=fw // 4, y=fh // 4,
-                            width=fw // 2, height=fh // 2,
-                        )
-
             filtered = [
                 b for b in text_blocks
                 if getattr(b, "confidence", 1.0) >= self._confidence_threshold
@@ -632,12 +739,75 @@ class OCRStage:
             self._ocr_layer.cleanup()
 
 
+# ---------------------------------------------------------------------------
+# Partial text streaming (TranslationStage / LLMStage -> OverlayStage)
+# ---------------------------------------------------------------------------
+
+class _PartialTextStream:
+    """Forwards the partial texts a streaming engine yields for one frame.
+
+    ``on_partial`` receives a copy of the frame data whose ``translations``
+    hold the text so far for every block, plus ``partial_index``.  Updates
+    for a block are throttled to one per ``interval_ms``; its first and
+    final text always go out.  ``first_text_ms`` is measured from the
+    frame's ``_pipeline_start`` (or *start*).
+    """
+
+    def __init__(
+        self,
+        on_partial: TranslationCallback,
+        input_data: dict[str, Any],
+        translations: list[Any],
+        interval_ms: float,
+        start: float,
+    ) -> None:
+        self._on_partial = on_partial
+        self._input_data = input_data
+        self._interval_s = max(0.0, interval_ms) / 1000.0
+        self._origin = input_data.get("_pipeline_start", start)
+        self.translations = list(translations)
+        self.first_text_ms: float | None = None
+
+    def consume(self, index: int, stream: Iterable[str]) -> str:
+        """Drain *stream* for block *index* and return its final text."""
+        text = ""
+        sent = ""
+        last_sent = 0.0
+        for text in stream:
+            now = time.perf_counter()
+            if text and (not sent or now - last_sent >= self._interval_s):
+                self._send(index, text, now)
+                sent, last_sent = text, now
+        if text and text != sent:
+            self._send(index, text, time.perf_counter())
+        self.translations[index] = text
+        return text
+
+    def _send(self, index: int, text: str, now: float) -> None:
+        if self.first_text_ms is None:
+            self.first_text_ms = (now - self._origin) * 1000
+        self.translations[index] = text
+        data = dict(self._input_data)
+        data["translations"] = list(self.translations)
+        data["partial_index"] = index
+        try:
+            self._on_partial(data)
+        except Exception as exc:
+            logger.warning("Partial text callback failed: %s", exc)
+
+
 # ---------------------------------------------------------------------------
 # TranslationStage
 # ---------------------------------------------------------------------------
 
 class TranslationStage:
-    """Translates text blocks via the injected translation layer."""
+    """Translates text blocks via the injected translation layer.
+
+    With an ``on_partial`` callback and an engine that streams (see
+    ``translate_stream``), the longest text of a frame is streamed and its
+    partial translations are handed to the callback as they are decoded;
+    the other texts still go through ``translate_batch``.
+    """
 
     name = "translation"
 
@@ -647,11 +817,16 @@ class TranslationStage:
         source_lang: str = "en",
         target_lang: str = "de",
         bidirectional: bool = False,
+        *,
+        on_partial: TranslationCallback | None = None,
+        partial_interval_ms: float = 50.0,
     ) -> None:
         self._translation_layer = translation_layer
         self._source_lang = source_lang
         self._target_lang = target_lang
         self._bidirectional = bidirectional
+        self._on_partial = on_partial
+        self._partial_interval_ms = partial_interval_ms
 
     def execute(self, input_data: dict[str, Any]) -> StageResult:
         start = time.perf_counter()
@@ -701,19 +876,45 @@ class TranslationStage:
 
             skip_count = len(text_blocks) - len(texts_to_translate)
 
+            first_text_ms = None
             if texts_to_translate:
                 batch_fn = getattr(self._translation_layer, "translate_batch", None)
                 engine_mode: str
-                if batch_fn is not None:
-                    engine = self._resolve_engine(input_data)
+                engine = self._resolve_engine(input_data)
+                if self._streams(engine, source_lang, target_lang):
+                    # Stream only the longest text, the one the frame waits
+                    # on; the rest keep the batched path (dictionary tier,
+                    # micro-batching, batched generation)
+                    engine_mode = f"stream+batch (engine={engine or 'default'})"
+                    lead = max(
+                        range(len(texts_to_translate)),
+                        key=lambda k: len(texts_to_translate[k]),
+                    )
+                    lead_idx = indices_to_translate.pop(lead)
+                    lead_text = texts_to_translate.pop(lead)
+                    partials = _PartialTextStream(
+                        self._on_partial, input_data, translations,
+                        self._partial_interval_ms, start,
+                    )
+                    translations[lead_idx] = partials.consume(
+                        lead_idx,
+                        self._translation_layer.translate_stream(
+                            lead_text, engine, source_lang, target_lang,
+                        ),
+                    )
+                    first_text_ms = partials.first_text_ms
+                elif batch_fn is not None:
                     engine_mode = f"batch (engine={engine or 'default'})"
+                else:
+                    engine_mode = "single"
+
+                if texts_to_translate and batch_fn is not None:
                     batch_results = batch_fn(
                         texts_to_translate, engine, source_lang, target_lang,
                     )
                     for idx, result in zip(indices_to_translate, batch_results):
                         translations[idx] = result
-                else:
-                    engine_mode = "single"
+                elif texts_to_translate:
                     for idx, text in zip(indices_to_translate, texts_to_translate):
                         result = self._translation_layer.translate(
                             text=text,
@@ -730,7 +931,7 @@ class TranslationStage:
             logger.debug(
                 "[TranslationStage] blocks=%d  translate=%d  skipped=%d  "
                 "mode=%s  %s->%s  %.1fms",
-                len(text_blocks), len(texts_to_translate), skip_count,
+                len(text_blocks), len(text_blocks) - skip_count, skip_count,
                 engine_mode, source_lang, target_lang, elapsed,
             )
             for i, t in enumerate(translations):
@@ -757,24 +958,34 @@ class TranslationStage:
                     )
 
             translated_text = " ".join(str(t) for t in translations if t) if translations else ""
-            return StageResult(
-                success=True,
-                data={
-                    "translations": translations,
-                    "text_blocks": text_blocks,
-                    "source_lang": source_lang,
-                    "target_lang": target_lang,
-                    "source_language": source_lang,
-                    "target_language": target_lang,
-                    "translated_text": translated_text,
-                },
-                duration_ms=elapsed,
-            )
+            data = {
+                "translations": translations,
+                "text_blocks": text_blocks,
+                "source_lang": source_lang,
+                "target_lang": target_lang,
+                "source_language": source_lang,
+                "target_language": target_lang,
+                "translated_text": translated_text,
+            }
+            if first_text_ms is not None:
+                data["first_text_ms"] = first_text_ms
+            return StageResult(success=True, data=data, duration_ms=elapsed)
         except Exception as exc:
             elapsed = (time.perf_counter() - start) * 1000
             logger.error("TranslationStage failed: [%s] %s", type(exc).__name__, exc)
             return StageResult(success=False, error=str(exc), duration_ms=elapsed)
 
+    def _streams(self, engine: str, source_lang: str, target_lang: str) -> bool:
+        """Whether this frame's texts are streamed to ``on_partial``."""
+        if self._on_partial is None:
+            return False
+        supports = getattr(self._translation_layer, "supports_streaming", None)
+        return (
+            supports is not None
+            and hasattr(self._translation_layer, "translate_stream")
+            and supports(engine, source_lang, target_lang)
+        )
+
     def _resolve_engine(self, input_data: dict[str, Any]) -> str:
         """Determine the translation engine name for batch calls."""
         engine = input_data.get("engine", "")
@@ -844,6 +1055,11 @@ class LLMStage:
     * ``"translate"`` – LLM-based translation replacing the previous
                         translation stage output
     * ``"custom"``   – freeform prompt driven by ``custom_prompt``
+
+    Blocks are processed with one ``process_batch`` call.  With an
+    ``on_partial`` callback and a streaming engine, the longest block is
+    streamed to the callback while it is generated and the rest are
+    batched; blocks not processed yet keep their previous text.
     """
 
     name = "llm"
@@ -856,12 +1072,16 @@ class LLMStage:
         custom_prompt: str = "",
         source_lang: str = "",
         target_lang: str = "",
+        on_partial: TranslationCallback | None = None,
+        partial_interval_ms: float = 50.0,
     ) -> None:
         self._llm_layer = llm_layer
         self._mode = mode
         self._custom_prompt = custom_prompt
         self._source_lang = source_lang
         self._target_lang = target_lang
+        self._on_partial = on_partial
+        self._partial_interval_ms = partial_interval_ms
 
     def execute(self, input_data: dict[str, Any]) -> StageResult:
         start = time.perf_counter()
@@ -900,24 +1120,44 @@ class LLMStage:
             if self._custom_prompt:
                 options.prompt_template = self._custom_prompt
 
-            refined: list[str] = []
+            indices: list[int] = []
+            texts: list[str] = []
             for i, translated_text in enumerate(translations):
                 if not translated_text:
-                    refined.append(translated_text)
                     continue
 
                 if self._mode == "translate":
                     block = text_blocks[i] if i < len(text_blocks) else None
-                    original = (
+                    text = (
                         block.get("text", str(block))
                         if isinstance(block, dict)
                         else getattr(block, "text", str(block))
                     ) if block else str(translated_text)
-                    result = self._llm_layer.process_text(original, options=options)
                 else:
-                    result = self._llm_layer.process_text(str(translated_text), options=options)
+                    text = str(translated_text)
+                indices.append(i)
+                texts.append(text)
+
+            refined: list[str] = list(translations)
+            partials = None
+            if texts and self._streams():
+                # Stream the longest block, the one the frame waits on; the
+                # rest still share one batched call
+                lead = max(range(len(texts)), key=lambda k: len(texts[k]))
+                lead_idx = indices.pop(lead)
+                partials = _PartialTextStream(
+                    self._on_partial, input_data, translations,
+                    self._partial_interval_ms, start,
+                )
+                refined[lead_idx] = partials.consume(
+                    lead_idx,
+                    self._llm_layer.process_text_stream(texts.pop(lead), options=options),
+                )
 
-                refined.append(result)
+            if texts:
+                results = self._llm_layer.process_batch(texts, options=options)
+                for i, result in zip(indices, results):
+                    refined[i] = result
 
             elapsed = (time.perf_counter() - start) * 1000
             logger.debug(
@@ -927,6 +1167,9 @@ class LLMStage:
 
             output = dict(input_data)
             output["translations"] = refined
+            if partials is not None and partials.first_text_ms is not None:
+                # A streamed translation stage showed text earlier still
+                output.setdefault("first_text_ms", partials.first_text_ms)
             return StageResult(success=True, data=output, duration_ms=elapsed)
 
         except Exception as exc:
@@ -934,6 +1177,17 @@ class LLMStage:
             logger.error("LLMStage failed: [%s] %s", type(exc).__name__, exc)
             return StageResult(success=True, data=input_data, duration_ms=elapsed)
 
+    def _streams(self) -> bool:
+        """Whether block outputs are streamed to ``on_partial``."""
+        if self._on_partial is None:
+            return False
+        supports = getattr(self._llm_layer, "supports_streaming", None)
+        return (
+            supports is not None
+            and hasattr(self._llm_layer, "process_text_stream")
+            and supports()
+        )
+
     def cleanup(self) -> None:
         if self._llm_layer is not None and hasattr(self._llm_layer, "cleanup"):
             self._llm_layer.cleanup()
@@ -1041,13 +1295,87 @@ class VisionTranslateStage:
 # ---------------------------------------------------------------------------
 
 class OverlayStage:
-    """Renders translated text as an overlay."""
+    """Renders translated text as an overlay.
+
+    Overlays are keyed by a hash of the block's source text plus its
+    position quantized to ``key_cell_size`` pixels, so the same bubble
+    keeps its overlay across frames.  Renderers with
+    ``reconcile_translations`` get the whole frame at once and only
+    create or hide windows for bubbles that appeared or disappeared;
+    other renderers are cleared and redrawn every frame.
+
+    ``show_partial`` is the ``on_partial`` callback of streaming stages: it
+    updates the overlay of one block in place while its text is still being
+    generated, and the final ``execute`` keeps those overlays instead of
+    hiding and re-creating them.
+    """
 
     name = "overlay"
 
-    def __init__(self, overlay_renderer: Any = None, stop_event: "threading.Event | None" = None) -> None:
+    def __init__(
+        self,
+        overlay_renderer: Any = None,
+        stop_event: "threading.Event | None" = None,
+        key_cell_size: int = 32,
+    ) -> None:
         self._overlay_renderer = overlay_renderer
         self._stop_event = stop_event
+        self._key_cell_size = max(1, int(key_cell_size))
+        self._partial_listener: TranslationCallback | None = None
+        self._partial_lock = threading.Lock()
+        self._partial_ids: set[str] = set()
+        self._shown_ids: set[str] = set()
+
+    def set_partial_listener(self, listener: TranslationCallback | None) -> None:
+        """Also pass partial frame data to *listener* (e.g. the pipeline's callback)."""
+        self._partial_listener = listener
+
+    def show_partial(self, data: dict[str, Any]) -> None:
+        """Show the text so far of block ``data["partial_index"]``."""
+        if self._stop_event is not None and self._stop_event.is_set():
+            return
+        index = data.get("partial_index")
+        translations = data.get("translations", [])
+        if self._overlay_renderer is not None and index is not None and index < len(translations):
+            text_blocks = data.get("text_blocks", [])
+            block = text_blocks[index] if index < len(text_blocks) else None
+            local_pos = self._extract_position(block)
+            region_offset = self._get_region_offset(data)
+            tid = self._overlay_keys(translations, text_blocks)[index]
+            with self._partial_lock:
+                self._partial_ids.add(tid)
+                self._shown_ids.add(tid)
+            self._overlay_renderer.show_translation(
+                str(translations[index]),
+                (local_pos[0] + region_offset[0], local_pos[1] + region_offset[1]),
+                tid,
+            )
+        if self._partial_listener is not None:
+            self._partial_listener(data)
+
+    def _overlay_keys(self, translations: list[Any], text_blocks: list[Any]) -> list[str]:
+        """Stable overlay ID per block: source text hash + quantized position."""
+        cell = self._key_cell_size
+        keys: list[str] = []
+        seen: set[str] = set()
+        for i, translated in enumerate(translations):
+            block = text_blocks[i] if i < len(text_blocks) else None
+            if block is None:
+                source = str(translated)
+            elif isinstance(block, dict):
+                source = str(block.get("text", ""))
+            else:
+                source = str(getattr(block, "text", ""))
+            x, y = self._extract_position(block)
+            digest = hashlib.blake2b(source.encode("utf-8"), digest_size=6).hexdigest()
+            key = base = f"ov_{digest}_{x // cell}_{y // cell}"
+            suffix = 0
+            while key in seen:
+                suffix += 1
+                key = f"{base}_{suffix}"
+            seen.add(key)
+            keys.append(key)
+        return keys
 
     @staticmethod
     def _extract_position(block: Any) -> tuple[int, int]:
@@ -1160,9 +1488,38 @@ class OverlayStage:
             text_blocks = input_data.get("text_blocks", [])
 
             region_offset = self._get_region_offset(input_data)
+            keys = self._overlay_keys(translations, text_blocks)
 
+            overlays: list[tuple[str, str, tuple[int, int]]] = []
             overlay_positions: list[Rectangle] = []
-            if not translations or all(not t for t in translations):
+            for i, translated_text in enumerate(translations):
+                if not translated_text:
+                    continue
+                block = text_blocks[i] if i < len(text_blocks) else None
+                local_pos = self._extract_position(block)
+                screen_pos = (
+                    local_pos[0] + region_offset[0],
+                    local_pos[1] + region_offset[1],
+                )
+                overlays.append((keys[i], str(translated_text), screen_pos))
+                full_pos = self._extract_full_position(block)
+                if full_pos is not None:
+                    overlay_positions.append(full_pos)
+
+            with self._partial_lock:
+                streamed = self._partial_ids
+                previous = self._shown_ids
+                self._partial_ids = set()
+                self._shown_ids = {key for key, _, _ in overlays}
+
+            if hasattr(self._overlay_renderer, "reconcile_translations"):
+                self._overlay_renderer.reconcile_translations(overlays)
+                elapsed = (time.perf_counter() - start) * 1000
+                logger.debug(
+                    "[OverlayStage] reconciled %d overlay(s) (%d kept)  %.1fms",
+                    len(overlays), len(previous & self._shown_ids), elapsed,
+                )
+            elif not overlays:
                 if hasattr(self._overlay_renderer, "hide_all_translations"):
                     self._overlay_renderer.hide_all_translations()
                 elif hasattr(self._overlay_renderer, "clear"):
@@ -1170,31 +1527,25 @@ class OverlayStage:
                 elapsed = (time.perf_counter() - start) * 1000
                 logger.debug("[OverlayStage] cleared  %.1fms", elapsed)
             else:
-                if hasattr(self._overlay_renderer, "hide_all_translations"):
+                if streamed and hasattr(self._overlay_renderer, "hide_translation"):
+                    # Streamed overlays already show (part of) this frame's
+                    # text; update them in place and drop only stale ones
+                    for tid in previous - self._shown_ids:
+                        self._overlay_renderer.hide_translation(tid)
+                elif hasattr(self._overlay_renderer, "hide_all_translations"):
                     self._overlay_renderer.hide_all_translations(immediate=True)
-                for i, translated_text in enumerate(translations):
-                    if not translated_text:
-                        continue
-                    t_str = str(translated_text)
-                    block = text_blocks[i] if i < len(text_blocks) else None
-                    local_pos = self._extract_position(block)
-                    screen_pos = (
-                        local_pos[0] + region_offset[0],
-                        local_pos[1] + region_offset[1],
-                    )
-                    tid = f"t_{i}"
+                for tid, t_str, screen_pos in overlays:
                     self._overlay_renderer.show_translation(t_str, screen_pos, tid)
                     logger.info(
                         "[Overlay] '%s' at screen(%d, %d)",
                         t_str[:50], screen_pos[0], screen_pos[1],
                     )
-                    full_pos = self._extract_full_position(block)
-                    if full_pos is not None:
-                        overlay_positions.append(full_pos)
                 elapsed = (time.perf_counter() - start) * 1000
+                first_text_ms = input_data.get("first_text_ms")
                 logger.debug(
-                    "[OverlayStage] rendered %d overlay(s)  %.1fms",
-                    len([t for t in translations if t]), elapsed,
+                    "[OverlayStage] rendered %d overlay(s)  %.1fms%s",
+                    len(overlays), elapsed,
+                    f"  first text after {first_text_ms:.0f}ms" if first_text_ms is not None else "",
                 )
             return StageResult(
                 success=True,
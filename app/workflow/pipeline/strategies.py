@@ -14,6 +14,7 @@ Requirements: 2.2
 import logging
 import threading
 import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from queue import Empty, Full, Queue
 from typing import Any
@@ -22,6 +23,8 @@ from app.workflow.managers.pipeline_error_handler import (
     PipelineErrorHandler,
     ErrorSeverity,
 )
+from .frame_context import FrameContext
+from .tracing import get_tracer
 from .types import ExecutionMode, PipelineStageProtocol, StageResult
 
 
@@ -30,6 +33,63 @@ logger = logging.getLogger('optikr.pipeline.strategies')
 _POISON = object()
 
 
+def _trace_id(data: dict[str, Any]) -> Any:
+    """Return the frame's trace ID, assigning one when tracing is enabled."""
+    trace_id = data.get("_frame_seq")
+    if trace_id is None:
+        tracer = get_tracer()
+        if tracer.enabled:
+            trace_id = data["_frame_seq"] = tracer.next_trace_id()
+    return trace_id
+
+SCHEDULING_FIFO = "fifo"
+SCHEDULING_LATEST = "latest"
+
+
+class _LatestSlot:
+    """Single-item hand-off where a newer put overwrites the waiting item.
+
+    Exposes the subset of the ``queue.Queue`` API that ``AsyncStrategy``
+    uses, so FIFO and latest-frame-wins modes share one worker loop.
+    ``put`` never blocks; it returns the displaced item (or ``None``) so
+    the caller can count it as dropped.
+    """
+
+    _EMPTY = object()
+
+    def __init__(self) -> None:
+        self._item: Any = self._EMPTY
+        self._cond = threading.Condition()
+
+    def put(self, item: Any, timeout: float | None = None) -> Any:
+        with self._cond:
+            displaced = self._item
+            self._item = item
+            self._cond.notify()
+        return None if displaced is self._EMPTY else displaced
+
+    put_nowait = put
+
+    def get(self, timeout: float | None = None) -> Any:
+        with self._cond:
+            if self._item is self._EMPTY:
+                self._cond.wait(timeout)
+                if self._item is self._EMPTY:
+                    raise Empty
+            item, self._item = self._item, self._EMPTY
+            return item
+
+    def get_nowait(self) -> Any:
+        with self._cond:
+            if self._item is self._EMPTY:
+                raise Empty
+            item, self._item = self._item, self._EMPTY
+            return item
+
+    def qsize(self) -> int:
+        return 0 if self._item is self._EMPTY else 1
+
+
 # ---------------------------------------------------------------------------
 # SequentialStrategy
 # ---------------------------------------------------------------------------
@@ -59,11 +119,14 @@ class SequentialStrategy:
     ) -> StageResult:
         current_data = dict(initial_input)
         last_result = StageResult(success=True, data=current_data)
+        tracer = get_tracer()
+        trace_id = _trace_id(current_data)
 
         for stage in stages:
             stage_name = getattr(stage, "name", type(stage).__name__)
             try:
-                result = stage.execute(current_data)
+                with tracer.span(stage_name, "stage", trace_id):
+                    result = stage.execute(current_data)
             except Exception as exc:
                 logger.error("[Pipeline] Stage '%s' raised: %s", stage_name, exc)
                 self._record_error(stage_name, exc, ErrorSeverity.HIGH)
@@ -151,6 +214,8 @@ class AsyncStrategy:
     Each stage gets a dedicated worker thread and a bounded input queue.
     Data flows between stages via queue hand-offs, allowing stage *N+1*
     to process frame *K* while stage *N* already processes frame *K+1*.
+    Each hand-off forks the frame's ``FrameContext`` instead of copying
+    the dict; it is flattened once when the frame leaves the last stage.
 
     Pipeline-cleanup-fixes baked in from scratch:
 
@@ -164,6 +229,12 @@ class AsyncStrategy:
     * **PCF 1.4** -- the internal ``ThreadPoolExecutor`` is shut down
       with ``wait=False, cancel_futures=True`` to prevent indefinite
       blocking on hung futures.
+
+    *scheduling* selects the hand-off between stages: ``"fifo"`` uses
+    bounded queues of *queue_size*, ``"latest"`` gives every stage a
+    single slot where a newer frame overwrites the one still waiting
+    (counted in ``frames_dropped``), so a slow stage always picks up the
+    freshest frame instead of working through a backlog.
     """
 
     def __init__(
@@ -172,12 +243,16 @@ class AsyncStrategy:
         queue_size: int = 16,
         max_workers: int = 4,
         thread_join_timeout: float = 2.0,
+        scheduling: str = SCHEDULING_FIFO,
     ) -> None:
+        if scheduling not in (SCHEDULING_FIFO, SCHEDULING_LATEST):
+            raise ValueError(f"Unknown async scheduling mode: {scheduling!r}")
         self._error_handler = error_handler
         self._queue_size = queue_size
         self._thread_join_timeout = thread_join_timeout
+        self._scheduling = scheduling
 
-        self._stage_queues: dict[str, Queue] = {}
+        self._stage_queues: dict[str, Queue | _LatestSlot] = {}
         self._stage_threads: dict[str, threading.Thread] = {}
         self._stage_names: list[str] = []
         self._result_queue: Queue = Queue()
@@ -191,6 +266,9 @@ class AsyncStrategy:
         self._total_processed: int = 0
         self._frames_dropped: int = 0
         self._stage_times: dict[str, list[float]] = {}
+        # Submit-to-completion age of each finished frame (ms), i.e. how
+        # old the capture is when its overlay result becomes available
+        self._result_ages: deque[float] = deque(maxlen=self._MAX_TIMING_SAMPLES)
 
         # Monotonic frame sequencing to discard stale out-of-order results
         self._frame_seq: int = 0
@@ -217,12 +295,12 @@ class AsyncStrategy:
         if self._stage_names:
             first_queue = self._stage_queues.get(self._stage_names[0])
             if first_queue is not None:
-                data = dict(initial_input)
+                data = FrameContext(initial_input)
                 data["_pipeline_start"] = time.perf_counter()
                 self._frame_seq += 1
                 data["_frame_seq"] = self._frame_seq
                 try:
-                    first_queue.put_nowait(data)
+                    displaced = first_queue.put_nowait(data)
                 except Full:
                     with self._stats_lock:
                         self._frames_dropped += 1
@@ -230,6 +308,9 @@ class AsyncStrategy:
                         "Frame %d dropped: queue '%s' full (size %d)",
                         self._frame_seq, self._stage_names[0], self._queue_size,
                     )
+                else:
+                    if displaced is not None:
+                        self._count_displaced(self._stage_names[0], displaced)
 
         latest: StageResult | None = None
         try:
@@ -303,17 +384,34 @@ class AsyncStrategy:
             self.stop()
 
     def get_stats(self) -> dict[str, Any]:
-        """Return a snapshot of async-pipeline statistics."""
+        """Return a snapshot of async-pipeline statistics.
+
+        ``capture_to_overlay_age_ms`` summarises how old a frame is (from
+        submission to the first stage) when the last stage finishes it,
+        including time spent waiting in inter-stage queues.
+        """
         with self._stats_lock:
             avg_times: dict[str, float] = {}
             for stage_name, times in self._stage_times.items():
                 if times:
                     avg_times[stage_name] = sum(times) / len(times)
+            ages = sorted(self._result_ages)
+            age_stats: dict[str, float] = {}
+            if ages:
+                age_stats = {
+                    "avg": sum(ages) / len(ages),
+                    "p50": ages[len(ages) // 2],
+                    "p95": ages[min(len(ages) - 1, int(len(ages) * 0.95))],
+                    "max": ages[-1],
+                    "last": self._result_ages[-1],
+                }
             return {
+                "scheduling": self._scheduling,
                 "total_processed": self._total_processed,
                 "frames_dropped": self._frames_dropped,
                 "active_stages": len(self._stage_threads),
                 "avg_stage_times_ms": avg_times,
+                "capture_to_overlay_age_ms": age_stats,
                 "queue_sizes": {
                     n: q.qsize() for n, q in self._stage_queues.items()
                 },
@@ -328,7 +426,10 @@ class AsyncStrategy:
             while name in self._stage_queues:
                 name = f"{name}_{i}"
             names.append(name)
-            self._stage_queues[name] = Queue(maxsize=self._queue_size)
+            if self._scheduling == SCHEDULING_LATEST:
+                self._stage_queues[name] = _LatestSlot()
+            else:
+                self._stage_queues[name] = Queue(maxsize=self._queue_size)
 
         self._stage_names = names
         self._running = True
@@ -345,8 +446,10 @@ class AsyncStrategy:
             )
             self._stage_threads[name] = thread
             logger.debug(
-                "Worker created: thread=%s  stage=%s  queue_size=%d  next=%s",
-                thread_name, name, self._queue_size, next_name or "(result)",
+                "Worker created: thread=%s  stage=%s  queue_size=%d  "
+                "scheduling=%s  next=%s",
+                thread_name, name, self._queue_size, self._scheduling,
+                next_name or "(result)",
             )
             thread.start()
 
@@ -370,6 +473,7 @@ class AsyncStrategy:
 
         local_times: list[float] = []
         local_completed = 0
+        tracer = get_tracer()
 
         logger.debug("Worker '%s' started, waiting for frames", stage_name)
 
@@ -392,7 +496,8 @@ class AsyncStrategy:
 
             start = time.perf_counter()
             try:
-                result = stage.execute(data)
+                with tracer.span(stage_name, "stage", frame_seq):
+                    result = stage.execute(data)
             except Exception as exc:
                 self._record_error(stage_name, exc, ErrorSeverity.HIGH)
                 self._result_queue.put(
@@ -418,7 +523,9 @@ class AsyncStrategy:
                 output_queue = self._stage_queues.get(next_stage_name)
                 if output_queue is not None:
                     try:
-                        output_queue.put(dict(data), timeout=0.5)
+                        displaced = output_queue.put(data.fork(), timeout=0.5)
+                        if displaced is not None:
+                            self._count_displaced(next_stage_name, displaced)
                         logger.debug(
                             "Worker '%s' frame %s -> queue '%s' (%.1fms)",
                             stage_name, frame_seq, next_stage_name, elapsed_ms,
@@ -432,7 +539,7 @@ class AsyncStrategy:
                         )
             else:
                 local_completed += 1
-                final_data = dict(data)
+                final_data = data.to_dict()
                 pipeline_start = final_data.pop("_pipeline_start", None)
                 final_data.pop("_frame_seq", None)
                 total_ms = (
@@ -440,6 +547,8 @@ class AsyncStrategy:
                     if pipeline_start is not None
                     else elapsed_ms
                 )
+                with self._stats_lock:
+                    self._result_ages.append(total_ms)
                 self._result_queue.put(
                     StageResult(success=True, data=final_data, duration_ms=total_ms)
                 )
@@ -474,6 +583,17 @@ class AsyncStrategy:
             if completed:
                 self._total_processed += completed
 
+    def _count_displaced(self, stage_name: str, displaced: Any) -> None:
+        """Record a frame overwritten in a latest-frame-wins slot."""
+        if displaced is _POISON:
+            return
+        with self._stats_lock:
+            self._frames_dropped += 1
+        logger.debug(
+            "Frame %s superseded in slot '%s'",
+            displaced.get("_frame_seq", "?"), stage_name,
+        )
+
     def _log_queue_sizes(self) -> None:
         """Periodic snapshot of all stage queue depths."""
         sizes = {n: q.qsize() for n, q in self._stage_queues.items()}
@@ -537,6 +657,8 @@ class CustomStrategy:
     ) -> StageResult:
         current_data = dict(initial_input)
         last_result = StageResult(success=True, data=current_data)
+        tracer = get_tracer()
+        trace_id = _trace_id(current_data)
 
         for stage in stages:
             stage_name = getattr(stage, "name", type(stage).__name__)
@@ -548,15 +670,16 @@ class CustomStrategy:
             stage_start = time.perf_counter()
 
             try:
-                if mode == ExecutionMode.ASYNC:
-                    future = self._executor.submit(stage.execute, current_data)
-                    try:
-                        result = future.result(timeout=self._async_timeout)
-                    except Exception:
-                        future.cancel()
-                        raise
-                else:
-                    result = stage.execute(current_data)
+                with tracer.span(stage_name, "stage", trace_id):
+                    if mode == ExecutionMode.ASYNC:
+                        future = self._executor.submit(stage.execute, current_data)
+                        try:
+                            result = future.result(timeout=self._async_timeout)
+                        except Exception:
+                            future.cancel()
+                            raise
+                    else:
+                        result = stage.execute(current_data)
             except Exception as exc:
                 self._record_error(stage_name, exc, ErrorSeverity.HIGH)
                 return StageResult(
@@ -645,6 +768,11 @@ class SubprocessStrategy:
     corresponding subprocess.  Stages without a matching subprocess, or
     when no manager is configured, fall back to in-process sequential
     execution.
+
+    OCR stages share ``OCRStage.ocr_regions`` with in-process execution
+    (ROI filters, overlay masking, position mapping, full-frame
+    fallback).  Each ROI crop becomes its own request, so a worker pool
+    OCRs them in parallel.
     """
 
     _STAGE_SUBPROCESS_MAP = {
@@ -653,6 +781,8 @@ class SubprocessStrategy:
         "translat": "translation_subprocess",
     }
 
+    _MAX_TIMING_SAMPLES = 100
+
     def __init__(
         self,
         error_handler: PipelineErrorHandler | None = None,
@@ -663,6 +793,8 @@ class SubprocessStrategy:
         self._subprocess_manager = subprocess_manager
         self._process_timeout = process_timeout
         self._fallback = SequentialStrategy(error_handler=error_handler)
+        self._stats_lock = threading.Lock()
+        self._stage_times: dict[str, list[float]] = {}
 
     def run_pipeline(
         self,
@@ -674,11 +806,14 @@ class SubprocessStrategy:
 
         current_data = dict(initial_input)
         last_result = StageResult(success=True, data=current_data)
+        tracer = get_tracer()
+        trace_id = _trace_id(current_data)
 
         for stage in stages:
             stage_name = getattr(stage, "name", type(stage).__name__)
             try:
-                result = self._run_stage(stage, stage_name, current_data)
+                with tracer.span(stage_name, "stage", trace_id):
+                    result = self._run_stage(stage, stage_name, current_data)
             except Exception as exc:
                 self._record_error(stage_name, exc, ErrorSeverity.HIGH)
                 return StageResult(
@@ -696,15 +831,34 @@ class SubprocessStrategy:
                 )
                 return result
 
+            with self._stats_lock:
+                times = self._stage_times.setdefault(stage_name, [])
+                times.append(result.duration_ms)
+                if len(times) > self._MAX_TIMING_SAMPLES:
+                    del times[:len(times) - self._MAX_TIMING_SAMPLES]
+
             current_data.update(result.data)
             last_result = StageResult(
                 success=True,
-                data=dict(current_data),
+                data=current_data,
                 duration_ms=last_result.duration_ms + result.duration_ms,
             )
 
         return last_result
 
+    def get_stats(self) -> dict[str, Any]:
+        """Return a snapshot of subprocess strategy statistics."""
+        if self._subprocess_manager is None:
+            return self._fallback.get_stats()
+        with self._stats_lock:
+            avg_times: dict[str, float] = {}
+            for stage_name, times in self._stage_times.items():
+                if times:
+                    avg_times[stage_name] = sum(times) / len(times)
+            return {
+                'avg_stage_times_ms': avg_times,
+            }
+
     def _run_stage(
         self,
         stage: PipelineStageProtocol,
@@ -714,7 +868,11 @@ class SubprocessStrategy:
         subprocess = self._resolve_subprocess(name)
         if subprocess is not None and getattr(subprocess, "is_alive", lambda: False)():
             start = time.perf_counter()
-            result_data = subprocess.process_data(data, timeout=self._process_timeout)
+            with get_tracer().span(f"{name}.ipc", "ipc", data.get("_frame_seq")):
+                if "ocr" in name.lower() and data.get("frame") is not None:
+                    result_data = self._run_ocr(subprocess, stage, data)
+                else:
+                    result_data = subprocess.process_data(data, timeout=self._process_timeout)
             elapsed = (time.perf_counter() - start) * 1000
             if result_data is not None:
                 return StageResult(success=True, data=result_data, duration_ms=elapsed)
@@ -725,6 +883,60 @@ class SubprocessStrategy:
             )
         return stage.execute(data)
 
+    def _run_ocr(
+        self,
+        subprocess: Any,
+        stage: PipelineStageProtocol,
+        data: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """OCR through the subprocess with ``OCRStage``'s region handling.
+
+        ROI filtering, overlay masking, position mapping and the
+        full-frame fallback come from ``OCRStage.ocr_regions``; only the
+        engine calls go over IPC.  ROI crops are sent as one batch, so a
+        worker pool OCRs them in parallel.  Returns None when no request
+        was answered.
+        """
+        from .stages import OCRStage
+
+        answered = False
+
+        def extract_text_batch(frames: list[Any]) -> list[list[Any]]:
+            nonlocal answered
+            if not frames:
+                return []
+            payloads = [{**data, "frame": frame} for frame in frames]
+            if hasattr(subprocess, "process_batch"):
+                results = subprocess.process_batch(payloads, timeout=self._process_timeout)
+            else:
+                results = [
+                    subprocess.process_data(payload, timeout=self._process_timeout)
+                    for payload in payloads
+                ]
+            answered = answered or any(r is not None for r in results)
+            return [(r or {}).get("text_blocks", []) for r in results]
+
+        def extract_text(frame: Any) -> list[Any]:
+            nonlocal answered
+            result = subprocess.process_data(
+                {**data, "frame": frame}, timeout=self._process_timeout,
+            )
+            answered = answered or result is not None
+            return (result or {}).get("text_blocks", [])
+
+        inner = getattr(stage, "inner_stage", stage)
+        has_detection = getattr(inner, "engine_has_text_detection", None)
+        text_blocks, _ = OCRStage.ocr_regions(
+            data["frame"],
+            data.get("_overlay_positions", []),
+            extract_text,
+            extract_text_batch,
+            engine_has_detection=bool(has_detection and has_detection()),
+        )
+        if not answered:
+            return None
+        return {"text_blocks": text_blocks}
+
     def _resolve_subprocess(self, stage_name: str) -> Any:
         name_lower = stage_name.lower()
         for keyword, attr in self._STAGE_SUBPROCESS_MAP.items():
@@ -0,0 +1,141 @@
+"""
+Per-frame span tracing for the pipeline.
+
+Strategies, ``PluginAwareStage`` and the subprocess path record one span
+per unit of work (stage, plugin, inner stage, IPC round trip), tagged with
+the frame's trace ID (``_frame_seq``).  Spans land in a fixed-size ring
+buffer and can be exported as Chrome trace-event JSON for
+``chrome://tracing`` / Perfetto.
+
+Recording is lock-free: a slot index comes from ``itertools.count`` (atomic
+under the GIL) and the span tuple is stored with a single list assignment,
+so worker threads never contend.  When tracing is disabled ``span()``
+returns a shared no-op context manager and costs one attribute check.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any
+
+DEFAULT_CAPACITY = 4096
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """Context manager recording one span on exit."""
+
+    __slots__ = ("_tracer", "_name", "_cat", "_trace_id", "_start")
+
+    def __init__(self, tracer: "SpanTracer", name: str, cat: str, trace_id: Any) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._trace_id = trace_id
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._tracer.record(
+            self._name, self._cat, self._trace_id,
+            self._start, time.perf_counter_ns(),
+        )
+
+
+class SpanTracer:
+    """Fixed-capacity ring buffer of pipeline spans."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._capacity = max(1, capacity)
+        self._buffer: list[tuple | None] = [None] * self._capacity
+        self._counter = itertools.count()
+        self._thread_names: dict[int, str] = {}
+        self._trace_ids = itertools.count(1)
+
+    def configure(self, enabled: bool | None = None, capacity: int | None = None) -> None:
+        """Enable/disable tracing and optionally resize (which clears) the buffer."""
+        if capacity is not None and max(1, capacity) != self._capacity:
+            self._capacity = max(1, capacity)
+            self.clear()
+        if enabled is not None:
+            self.enabled = enabled
+
+    def clear(self) -> None:
+        self._buffer = [None] * self._capacity
+        self._counter = itertools.count()
+
+    def next_trace_id(self) -> int:
+        """Return a fresh trace ID for strategies that do not number frames."""
+        return next(self._trace_ids)
+
+    def span(self, name: str, cat: str = "stage", trace_id: Any = None):
+        """Return a context manager that records *name* for *trace_id*."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, trace_id)
+
+    def record(self, name: str, cat: str, trace_id: Any, start_ns: int, end_ns: int) -> None:
+        """Store a finished span (``perf_counter_ns`` timestamps)."""
+        if not self.enabled:
+            return
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        buffer = self._buffer
+        buffer[next(self._counter) % len(buffer)] = (
+            name, cat, trace_id, start_ns, end_ns - start_ns, tid,
+        )
+
+    def spans(self) -> list[dict[str, Any]]:
+        """Return buffered spans, oldest first."""
+        entries = [e for e in list(self._buffer) if e is not None]
+        entries.sort(key=lambda e: e[3])
+        return [
+            {
+                "name": name, "cat": cat, "trace_id": trace_id,
+                "start_ns": start, "duration_ns": dur, "tid": tid,
+            }
+            for name, cat, trace_id, start, dur, tid in entries
+        ]
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the buffer as a Chrome trace-event document."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+             "args": {"name": tname}}
+            for tid, tname in list(self._thread_names.items())
+        ]
+        for span in self.spans():
+            events.append({
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": span["start_ns"] / 1000.0,
+                "dur": span["duration_ns"] / 1000.0,
+                "pid": pid,
+                "tid": span["tid"],
+                "args": {"frame": span["trace_id"]},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write the buffer to *path* as Chrome trace JSON; return the span count."""
+        doc = self.to_chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(doc, f)
+        return sum(1 for e in doc["traceEvents"] if e["ph"] == "X")
+
+
+_tracer = SpanTracer()
+
+
+def get_tracer() -> SpanTracer:
+    """Return the process-wide pipeline tracer."""
+    return _tracer
@@ -67,6 +67,9 @@ class PipelineConfig:
     target_language: str = "en"
     capture_region: Any = None
     overlay_region: Any = None
+    adaptive_pacing: bool = True
+    max_idle_interval: float = 1.0
+    trace_path: str = ""
 
 
 @dataclass
@@ -74,12 +77,14 @@ class PipelineStats:
     """Runtime statistics collected by a pipeline."""
     frames_processed: int = 0
     frames_skipped: int = 0
+    frames_static: int = 0
     frames_dropped: int = 0
     consecutive_errors: int = 0
     total_errors: int = 0
     total_duration_ms: float = 0.0
     average_fps: float = 0.0
     average_latency_ms: float = 0.0
+    average_first_text_ms: float = 0.0
     total_translations: int = 0
     cache_hits: int = 0
     stage_times_ms: dict[str, float] = field(default_factory=dict)
@@ -33,6 +33,7 @@ from .pipeline.strategies import (
     SequentialStrategy,
     SubprocessStrategy,
 )
+from .pipeline.tracing import get_tracer
 from .pipeline.types import (
     ExecutionMode,
     PipelineConfig,
@@ -257,6 +258,21 @@ class PipelineFactory:
                 'llm.system_prompt', ''
             ) or self.config_manager.get_setting('llm.custom_prompt', '')
 
+        stream_partial_text = True
+        stream_interval_ms = 50.0
+        if self.config_manager is not None:
+            stream_partial_text = self.config_manager.get_setting(
+                'overlay.stream_partial_text', True,
+            )
+            stream_interval_ms = self.config_manager.get_setting(
+                'overlay.stream_interval_ms', 50,
+            )
+
+        # Rendering is handled by the on_translation callback; partial text
+        # from streaming engines goes through on_partial_translation
+        overlay_stage = OverlayStage(None)
+        on_partial = overlay_stage.show_partial if stream_partial_text else None
+
         stages: list[PipelineStageProtocol] = [
             CaptureStage(capture_layer),
             PreprocessingStage(
@@ -277,6 +293,8 @@ class PipelineFactory:
                 translation_layer,
                 source_lang=config.source_language,
                 target_lang=config.target_language,
+                on_partial=on_partial,
+                partial_interval_ms=stream_interval_ms,
             ),
             LLMStage(
                 llm_layer,
@@ -284,8 +302,10 @@ class PipelineFactory:
                 custom_prompt=llm_custom_prompt,
                 source_lang=config.source_language,
                 target_lang=config.target_language,
+                on_partial=on_partial,
+                partial_interval_ms=stream_interval_ms,
             ),
-            OverlayStage(None),  # rendering handled by on_translation callback
+            overlay_stage,
         ]
 
         cache_manager = self._create_cache_manager()
@@ -306,6 +326,7 @@ class PipelineFactory:
             len(wrapped), type(strategy).__name__,
         )
         pipeline = BasePipeline(stages=wrapped, strategy=strategy, config=config)
+        overlay_stage.set_partial_listener(pipeline._fire_partial_translation)
 
         pipeline._optimizer_loader = optimizer_loader
         pipeline._text_proc_loader = text_proc_loader
@@ -952,16 +973,28 @@ class PipelineFactory:
         queue_size = 16
         max_workers = 4
         thread_join_timeout = 2.0
+        scheduling = 'fifo'
         if self.config_manager is not None:
             queue_size = self.config_manager.get_setting(
                 'pipeline.queue_size', 16,
             )
+            scheduling = self.config_manager.get_setting(
+                'pipeline.async_scheduling', 'fifo',
+            )
             max_workers = self.config_manager.get_setting(
                 'pipeline.max_workers', 4,
             )
             thread_join_timeout = self.config_manager.get_setting(
                 'timeouts.thread_join_seconds', 2.0,
             )
+            get_tracer().configure(
+                enabled=bool(self.config_manager.get_setting(
+                    'pipeline.trace_enabled', False,
+                )),
+                capacity=int(self.config_manager.get_setting(
+                    'pipeline.trace_buffer_size', 4096,
+                )),
+            )
 
         if mode == ExecutionMode.SEQUENTIAL:
             return SequentialStrategy()
@@ -970,6 +1003,7 @@ class PipelineFactory:
                 queue_size=queue_size,
                 max_workers=max_workers,
                 thread_join_timeout=thread_join_timeout,
+                scheduling=scheduling,
             )
         if mode == ExecutionMode.CUSTOM:
             return CustomStrategy(
@@ -1065,6 +1099,7 @@ class PipelineFactory:
                 )
             lines.append(f"  Queue size   : {queue_size}")
             lines.append(f"  Max workers  : {max_workers}")
+            lines.append(f"  Scheduling   : {strategy.get_stats()['scheduling']}")
 
         debug_mode = False
         if self.config_manager is not None:
@@ -195,6 +195,9 @@ class OptimizerPluginLoader:
                         config["manga_mode"] = self.config_manager.get_setting(
                             "general.manga_mode", False,
                         )
+                    elif name == "translation_cache":
+                        # The shared cache is sized from cache.translation_cache_*
+                        config["config_manager"] = self.config_manager
 
                 optimizer = module.initialize(config)
 
@@ -91,6 +91,7 @@ class StartupPipeline(QObject):
 
         # Auto-hide-on-disappear state tracking
         self._overlay_last_seen: dict[str, float] = {}
+        self._overlay_shown: dict[str, tuple[str, tuple[int, int]]] = {}
         self._active_overlay_ids: set[str] = set()
 
         # Cached OCR reference dimensions — locked after the first
@@ -112,6 +113,9 @@ class StartupPipeline(QObject):
         # Subprocess manager (created when subprocess mode is selected)
         self._subprocess_manager = None
         self._vision_single_frame_lock = threading.Lock()
+        # Partial (streamed) and final translations of a frame can arrive
+        # from different threads in async mode
+        self._overlay_update_lock = threading.Lock()
         
         self.logger.info("Startup pipeline initialized")
     
@@ -837,6 +841,16 @@ class StartupPipeline(QObject):
                 source_language=source_lang,
                 target_language=target_lang,
             )
+            if self.config_manager:
+                config.adaptive_pacing = bool(
+                    self.config_manager.get_setting('pipeline.adaptive_pacing', True)
+                )
+                config.max_idle_interval = float(
+                    self.config_manager.get_setting('pipeline.max_idle_interval', 1.0)
+                )
+                config.trace_path = str(
+                    self.config_manager.get_setting('pipeline.trace_path', '') or ''
+                )
 
             # Determine execution preset from config (pipeline_mode already set above)
             preset = "sequential"
@@ -911,6 +925,7 @@ class StartupPipeline(QObject):
             
             # Set callbacks
             self.pipeline.on_translation = self._on_translation
+            self.pipeline.on_partial_translation = self._on_partial_translation
             self.pipeline.on_error = self._on_error
             
             # Store config reference for UI compatibility
@@ -1107,6 +1122,7 @@ class StartupPipeline(QObject):
 
         # Clear overlay tracking state
         self._overlay_last_seen.clear()
+        self._overlay_shown.clear()
         self._active_overlay_ids.clear()
         self._ocr_ref_size = None
 
@@ -2066,7 +2082,31 @@ class StartupPipeline(QObject):
     # ------------------------------------------------------------------
 
     def _on_translation(self, data):
-        """Handle translations from pipeline and display overlays.
+        """Handle translations from pipeline and display overlays."""
+        with self._overlay_update_lock:
+            self._display_translations(data)
+
+    def _on_partial_translation(self, data):
+        """Show the text streamed so far while the frame is still translating.
+
+        Only blocks that already have text are shown; overlays keep their
+        stable IDs, so the final ``_on_translation`` updates them in place.
+        """
+        if not isinstance(data, dict):
+            return
+        translations = data.get('translations', [])
+        text_blocks = data.get('text_blocks', [])
+        shown = [i for i, t in enumerate(translations) if t]
+        if not shown:
+            return
+        partial = dict(data)
+        partial['translations'] = [translations[i] for i in shown]
+        partial['text_blocks'] = [text_blocks[i] for i in shown if i < len(text_blocks)]
+        with self._overlay_update_lock:
+            self._display_translations(partial, partial=True)
+
+    def _display_translations(self, data, partial=False):
+        """Display overlays for the translations of one frame.
 
         Integrates:
         - Intelligent positioning (collision avoidance) when configured
@@ -2075,6 +2115,8 @@ class StartupPipeline(QObject):
 
         Args:
             data: Dict with 'translations' key from BasePipeline callback.
+            partial: *data* holds streamed text of some blocks only; overlays
+                of the other blocks are left alone.
         """
         translations = data.get('translations', []) if isinstance(data, dict) else data
         try:
@@ -2218,7 +2260,7 @@ class StartupPipeline(QObject):
                         positioned, cap_bounds, text_blocks,
                     )
 
-                # --- Phase 3: show overlays with stable IDs -------------------
+                # --- Phase 3: assign stable IDs --------------------------------
                 # Build IDs from OCR-relative positions (the coordinates
                 # in the preprocessed frame).  These are far more stable
                 # across frames than the final screen-mapped positions
@@ -2244,16 +2286,21 @@ class StartupPipeline(QObject):
                         overlay_id = f"{base_id}_{suffix}"
                     current_ids.add(overlay_id)
                     self._overlay_last_seen[overlay_id] = now
+                    self._overlay_shown[overlay_id] = (text, (x, y))
                     self.logger.info(
                         "[Overlay] '%s' at screen(%d, %d)  id=%s",
                         text[:50], x, y, overlay_id,
                     )
-                    self.overlay_system.show_translation(
-                        text, (x, y), translation_id=overlay_id,
-                        monitor_id=capture_monitor_id)
 
-                # --- Phase 4: manage stale overlays ---------------------------
-                if auto_hide_on_disappear:
+                # --- Phase 4: drop stale overlays, then show the frame --------
+                # Overlays of this frame plus those still within their
+                # disappear timeout (or untouched by a partial update) go
+                # to reconcile_translations in one call; it keeps unchanged
+                # overlays and hides the rest
+                previous_ids = set(self._overlay_shown)
+                if partial:
+                    current_ids |= self._active_overlay_ids
+                elif auto_hide_on_disappear:
                     stale = [
                         oid for oid, last_seen in self._overlay_last_seen.items()
                         if oid not in current_ids and (now - last_seen) >= disappear_timeout
@@ -2264,8 +2311,8 @@ class StartupPipeline(QObject):
                             len(stale), disappear_timeout, stale,
                         )
                     for oid in stale:
-                        self.overlay_system.hide_translation(oid)
                         del self._overlay_last_seen[oid]
+                        self._overlay_shown.pop(oid, None)
                 else:
                     gone = [oid for oid in self._overlay_last_seen if oid not in current_ids]
                     if gone:
@@ -2274,14 +2321,30 @@ class StartupPipeline(QObject):
                             len(gone), gone,
                         )
                     for oid in gone:
-                        self.overlay_system.hide_translation(oid)
                         del self._overlay_last_seen[oid]
+                        self._overlay_shown.pop(oid, None)
+
+                if hasattr(self.overlay_system, 'reconcile_translations'):
+                    self.overlay_system.reconcile_translations(
+                        [(oid, text, pos) for oid, (text, pos) in self._overlay_shown.items()],
+                        monitor_id=capture_monitor_id,
+                    )
+                else:
+                    for oid in previous_ids - set(self._overlay_shown):
+                        self.overlay_system.hide_translation(oid)
+                    for entry_id in current_ids - (self._active_overlay_ids if partial else set()):
+                        text, pos = self._overlay_shown[entry_id]
+                        self.overlay_system.show_translation(
+                            text, pos, translation_id=entry_id,
+                            monitor_id=capture_monitor_id)
 
                 self._active_overlay_ids = current_ids
                 self.logger.debug("Displayed %d overlays", len(positioned))
             else:
                 self.logger.warning("No overlay system available")
 
+            if partial:
+                return
             try:
                 self.translation_received.emit({'translations': translations})
             except Exception as e:
@@ -5,5 +5,6 @@ Concrete BaseSubprocess subclasses for crash-isolated stage execution.
 """
 
 from .ocr_subprocess import OCRSubprocess
+from .subprocess_pool import SubprocessPool
 
-__all__ = ["OCRSubprocess"]
+__all__ = ["OCRSubprocess", "SubprocessPool"]
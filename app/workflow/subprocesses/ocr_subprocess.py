@@ -2,16 +2,21 @@
 OCRSubprocess -- concrete BaseSubprocess for OCR stage isolation.
 
 Bridges the pipeline's Frame/TextBlock objects and the worker's
-base64/dict JSON protocol.  Serialises numpy frames on the way in
-and deserialises worker result dicts back into TextBlock instances
-on the way out.
+dict message protocol.  Frames go through the shared-memory frame ring
+when the worker accepted it (only a slot index travels over the pipe);
+otherwise they are sent as a raw payload (binary protocol) or
+base64-encoded (JSON protocol).  Worker result dicts are
+deserialised back into TextBlock instances on the way out.
 """
 
 import base64
 import logging
 from typing import Any
 
+import numpy as np
+
 from app.workflow.base.base_subprocess import BaseSubprocess
+from app.workflow.base.ipc_protocol import PROTOCOL_BINARY
 
 try:
     from app.models import Rectangle, TextBlock
@@ -25,8 +30,12 @@ logger = logging.getLogger(__name__)
 class OCRSubprocess(BaseSubprocess):
     """Subprocess wrapper specialised for OCR worker scripts."""
 
-    def __init__(self, plugin_name: str, worker_script: str) -> None:
-        super().__init__(f"OCR-{plugin_name}", worker_script)
+    def __init__(
+        self, plugin_name: str, worker_script: str, protocol: str = PROTOCOL_BINARY,
+    ) -> None:
+        super().__init__(
+            f"OCR-{plugin_name}", worker_script, shared_memory=True, protocol=protocol,
+        )
         self._plugin_name = plugin_name
 
     # -- BaseSubprocess hooks ------------------------------------------
@@ -44,6 +53,24 @@ class OCRSubprocess(BaseSubprocess):
 
         frame_array = frame.data if hasattr(frame, "data") else frame
 
+        if self.frame_ring is not None:
+            slot = self.frame_ring.write(frame_array)
+            if slot is not None:
+                return {
+                    "shm_slot": slot,
+                    "shape": list(frame_array.shape),
+                    "dtype": str(frame_array.dtype),
+                    "language": data.get("language", "en"),
+                }
+
+        if self.protocol == PROTOCOL_BINARY:
+            return {
+                "frame": np.ascontiguousarray(frame_array),
+                "shape": list(frame_array.shape),
+                "dtype": str(frame_array.dtype),
+                "language": data.get("language", "en"),
+            }
+
         return {
             "frame": base64.b64encode(frame_array.tobytes()).decode(),
             "shape": list(frame_array.shape),
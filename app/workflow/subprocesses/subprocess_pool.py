@@ -0,0 +1,146 @@
+"""
+SubprocessPool -- N identical worker processes behind one subprocess API.
+
+Each worker loads its own engine, so requests spread across the pool run
+on separate cores without GIL contention.  Requests are dispatched to the
+worker with the fewest outstanding requests, and ``process_batch``
+returns results in submission order regardless of which worker answered
+first.
+
+The pool exposes the same ``start``/``stop``/``is_alive``/``process_data``
+surface as a single ``BaseSubprocess``, so ``SubprocessStrategy`` can use
+either interchangeably.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.workflow.base.base_subprocess import BaseSubprocess
+
+
+logger = logging.getLogger(__name__)
+
+# (worker index, request id) -- returned by submit(), consumed by collect()
+Ticket = tuple[int, int]
+
+
+class SubprocessPool:
+    """Least-outstanding-requests pool of identical subprocess workers."""
+
+    def __init__(self, factory: Callable[[int], BaseSubprocess], size: int = 1) -> None:
+        """
+        Args:
+            factory: Called with the worker index to build each subprocess.
+            size: Number of worker processes to run.
+        """
+        self.workers: list[BaseSubprocess] = [factory(i) for i in range(max(1, size))]
+        self._outstanding = [0] * len(self.workers)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self.workers)
+
+    # -- lifecycle -----------------------------------------------------
+
+    def start(self, config: dict) -> bool:
+        """Start every worker in parallel; succeeds if at least one reports ready."""
+        with ThreadPoolExecutor(max_workers=len(self.workers)) as executor:
+            ready = list(executor.map(lambda w: w.start(config), self.workers))
+        started = [w for w, ok in zip(self.workers, ready) if ok]
+        if len(started) < len(self.workers):
+            logger.warning(
+                "Subprocess pool: %d/%d workers started",
+                len(started), len(self.workers),
+            )
+        self.workers = started
+        self._outstanding = [0] * len(started)
+        return bool(started)
+
+    def stop(self) -> None:
+        """Stop every worker."""
+        for worker in self.workers:
+            worker.stop()
+
+    def is_alive(self) -> bool:
+        """Return ``True`` if any worker is alive."""
+        return any(w.is_alive() for w in self.workers)
+
+    # -- request dispatch ------------------------------------------------
+
+    def submit(self, data: Any) -> Ticket | None:
+        """Send *data* to the least-loaded live worker without waiting."""
+        with self._lock:
+            candidates = [
+                i for i, w in enumerate(self.workers)
+                if w.running or (w.crashed and w.restart_count < w.max_restarts)
+            ]
+            if not candidates:
+                logger.warning("Subprocess pool: no workers available")
+                return None
+            index = min(candidates, key=lambda i: self._outstanding[i])
+            self._outstanding[index] += 1
+
+        request_id = self.workers[index].submit(data)
+        if request_id is None:
+            with self._lock:
+                self._outstanding[index] -= 1
+            return None
+        return index, request_id
+
+    def collect(self, ticket: Ticket, timeout: float = 5.0) -> Any | None:
+        """Wait for the result of a request made with :meth:`submit`."""
+        index, request_id = ticket
+        try:
+            return self.workers[index].collect(request_id, timeout)
+        finally:
+            with self._lock:
+                self._outstanding[index] -= 1
+
+    def process_data(self, data: Any, timeout: float = 5.0) -> Any | None:
+        """Process one request on the least-loaded worker."""
+        ticket = self.submit(data)
+        if ticket is None:
+            return None
+        return self.collect(ticket, timeout)
+
+    def process_batch(self, items: list[Any], timeout: float = 5.0) -> list[Any | None]:
+        """Fan *items* out across the pool and return results in order.
+
+        Args:
+            items: Request payloads (e.g. one per ROI crop or region).
+            timeout: Deadline for the whole batch (seconds).
+
+        Returns:
+            One result per item, ``None`` where a request failed.
+        """
+        tickets = [self.submit(item) for item in items]
+        deadline = time.monotonic() + timeout
+        results: list[Any | None] = []
+        for ticket in tickets:
+            if ticket is None:
+                results.append(None)
+                continue
+            remaining = max(0.0, deadline - time.monotonic())
+            results.append(self.collect(ticket, remaining))
+        return results
+
+    # -- metrics -------------------------------------------------------
+
+    def get_metrics(self) -> dict:
+        """Aggregate per-worker metrics."""
+        with self._lock:
+            outstanding = list(self._outstanding)
+        workers = [w.get_metrics() for w in self.workers]
+        return {
+            'size': len(workers),
+            'alive': sum(1 for w in self.workers if w.is_alive()),
+            'outstanding': outstanding,
+            'messages_sent': sum(m['messages_sent'] for m in workers),
+            'messages_received': sum(m['messages_received'] for m in workers),
+            'errors_count': sum(m['errors_count'] for m in workers),
+            'workers': workers,
+        }
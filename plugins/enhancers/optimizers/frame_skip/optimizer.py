@@ -5,10 +5,12 @@ Skips processing of unchanged frames to reduce CPU usage.
 Two content modes:
 - static:  For manga, wikipedia, etc. Uses MSE thumbnail comparison + adaptive
            backoff. Cheap and effective when content rarely changes.
-- dynamic: For games, video, live UIs. Uses the frame differencing engine to
-           detect which regions changed, enabling partial OCR on just those areas.
+- dynamic: For games, video, live UIs. Same comparison; changed frames are
+           passed on whole for full OCR.
 
-Both modes skip identical frames immediately (no warmup gate).
+Both modes skip identical frames immediately (no warmup gate).  Frames whose
+capture metadata reports no dirty rectangles (damage tracking) are treated as
+identical without comparing them.
 """
 
 import hashlib
@@ -26,9 +28,7 @@ class FrameSkipOptimizer:
         Best for content that stays still most of the time.
 
     content_mode='dynamic':
-        Same thumbnail check for full-skip, but when a change IS detected,
-        runs the frame differencing engine on the full frame to identify
-        which regions changed. Adds ~5-10ms but enables partial OCR.
+        Same thumbnail check for full-skip; a changed frame goes to full OCR.
     """
 
     # Backoff tiers: (skip_threshold, extra_sleep_seconds)
@@ -49,10 +49,6 @@ class FrameSkipOptimizer:
         self.content_mode = config.get('content_mode', 'static')
         self.manga_mode = config.get('manga_mode', False)
 
-        # Frame differencing engine (lazy-loaded, only used in dynamic mode)
-        self._diff_engine = None
-        self._previous_full_frame = None  # Full-res frame for differencing
-
         # State
         self.previous_frame = None  # Thumbnail for MSE
         self.previous_hash = None
@@ -62,80 +58,10 @@ class FrameSkipOptimizer:
         self.total_frames = 0
         self.skipped_frames = 0
         self.processed_frames = 0
-        self.partial_ocr_frames = 0
+        self.damage_skips = 0
 
         self.logger = logging.getLogger(__name__)
 
-    # ------------------------------------------------------------------
-    # Frame differencing (dynamic mode only)
-    # ------------------------------------------------------------------
-
-    def _get_diff_engine(self):
-        """Lazy-load the frame differencing engine."""
-        if self._diff_engine is None:
-            try:
-                from app.preprocessing.frame_differencing import (
-                    FrameDifferenceEngine, DifferenceConfig,
-                    DifferenceMethod, SensitivityLevel
-                )
-                diff_config = DifferenceConfig(
-                    method=DifferenceMethod.ABSOLUTE,
-                    sensitivity=SensitivityLevel.MEDIUM,
-                    enable_noise_reduction=True,
-                    enable_morphology=True,
-                    min_change_area=100,
-                )
-                self._diff_engine = FrameDifferenceEngine(config=diff_config)
-                self.logger.info("[FRAME SKIP] Frame differencing engine loaded (dynamic mode)")
-            except Exception as e:
-                self.logger.warning(f"[FRAME SKIP] Could not load frame differencing engine: {e}")
-                self._diff_engine = None
-        return self._diff_engine
-
-    def _detect_changed_regions(self, frame: np.ndarray) -> list[dict[str, Any]] | None:
-        """Use frame differencing to find which regions changed.
-
-        Returns a list of {'id': int, 'bbox': (x, y, w, h)} dicts suitable
-        for passing to ocr_layer.extract_text_from_regions(), or None if
-        differencing is unavailable or the whole frame changed.
-        """
-        engine = self._get_diff_engine()
-        if engine is None or self._previous_full_frame is None:
-            return None
-
-        try:
-            from app.models import Frame as FrameModel
-            current = FrameModel(data=frame, timestamp=0.0)
-            previous = FrameModel(data=self._previous_full_frame, timestamp=0.0)
-
-            result = engine.calculate_difference(current, previous)
-
-            if not result.has_changes:
-                return []  # Empty list = no changes (shouldn't happen since MSE said changed)
-
-            significant = result.significant_changes
-            if not significant:
-                return None  # No significant regions, fall back to full OCR
-
-            # If change covers most of the frame, not worth doing partial OCR
-            if result.change_percentage > 0.5:
-                return None
-
-            regions = []
-            for i, change in enumerate(significant):
-                r = change.rectangle
-                regions.append({
-                    'id': i,
-                    'bbox': (r.x, r.y, r.width, r.height),
-                })
-
-            self.partial_ocr_frames += 1
-            return regions
-
-        except Exception as e:
-            self.logger.debug(f"[FRAME SKIP] Region detection failed: {e}")
-            return None
-
     # ------------------------------------------------------------------
     # Comparison methods
     # ------------------------------------------------------------------
@@ -283,10 +209,6 @@ class FrameSkipOptimizer:
         """Decide if frame should be skipped.
 
         In both modes, skipping starts on the very first similar frame.
-
-        In dynamic mode, when a frame IS different, we additionally run
-        the frame differencing engine and attach 'changed_regions' to the
-        data dict so the pipeline can do partial OCR.
         """
         self.total_frames += 1
 
@@ -302,7 +224,15 @@ class FrameSkipOptimizer:
         if not isinstance(frame, np.ndarray):
             return data
 
-        is_similar = self._is_similar(frame)
+        # With damage tracking the capture layer already knows whether
+        # anything changed; an empty dirty list skips the comparison
+        metadata = getattr(raw_frame, 'metadata', None)
+        dirty_rects = metadata.get('dirty_rects') if isinstance(metadata, dict) else None
+        if dirty_rects == [] and self.previous_frame is not None:
+            is_similar = True
+            self.damage_skips += 1
+        else:
+            is_similar = self._is_similar(frame)
         should_skip = False
 
         if is_similar:
@@ -319,14 +249,6 @@ class FrameSkipOptimizer:
             if self.method == 'hash':
                 self.previous_hash = self._compute_hash(frame)
 
-            if self.content_mode == 'dynamic' and not is_similar:
-                changed_regions = self._detect_changed_regions(frame)
-                if changed_regions is not None:
-                    data['changed_regions'] = changed_regions
-
-            if self.content_mode == 'dynamic':
-                self._previous_full_frame = frame.copy()
-
         if should_skip:
             data['skip_processing'] = True
             self.skipped_frames += 1
@@ -335,6 +257,10 @@ class FrameSkipOptimizer:
             data['frame_changed'] = not is_similar
             self.processed_frames += 1
 
+        # Read by BasePipeline's FramePacer: static frames back off the
+        # capture cadence exponentially, a change snaps it back.
+        data['content_static'] = should_skip and self.enable_backoff
+
         return data
 
     # ------------------------------------------------------------------
@@ -358,9 +284,6 @@ class FrameSkipOptimizer:
             self.content_mode = new_config['content_mode']
             if old_mode != self.content_mode:
                 self.logger.info(f"[FRAME SKIP] Content mode changed: {old_mode} -> {self.content_mode}")
-                # Reset differencing state on mode change
-                self._diff_engine = None
-                self._previous_full_frame = None
 
     # ------------------------------------------------------------------
     # Stats / reset
@@ -373,7 +296,7 @@ class FrameSkipOptimizer:
             'total_frames': self.total_frames,
             'skipped_frames': self.skipped_frames,
             'processed_frames': self.processed_frames,
-            'partial_ocr_frames': self.partial_ocr_frames,
+            'damage_skips': self.damage_skips,
             'consecutive_skips': self.consecutive_skips,
             'adaptive_extra_sleep': self.get_adaptive_interval(),
             'content_mode': self.content_mode,
@@ -385,12 +308,11 @@ class FrameSkipOptimizer:
         """Reset optimizer state."""
         self.previous_frame = None
         self.previous_hash = None
-        self._previous_full_frame = None
         self.consecutive_skips = 0
         self.total_frames = 0
         self.skipped_frames = 0
         self.processed_frames = 0
-        self.partial_ocr_frames = 0
+        self.damage_skips = 0
     def cleanup(self):
         """Clean up optimizer resources."""
         self.reset()
@@ -20,6 +20,13 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    cv2 = None  # type: ignore[assignment]
+    CV2_AVAILABLE = False
+
 
 class MotionTrackerOptimizer:
     """
@@ -39,9 +46,14 @@ class MotionTrackerOptimizer:
         self.motion_smoothing = config.get('motion_smoothing', 0.3)
         self.reocr_after_stop = config.get('reocr_after_stop', True)
         self.stop_threshold_seconds = config.get('stop_threshold_seconds', 0.5)
+        self.phase_downscale = max(1, int(config.get('phase_downscale', 4)))
+        self.min_peak_response = config.get('min_peak_response', 0.1)
         
         # State
-        self.previous_frame = None
+        self._prev_spectrum = None
+        self._window = None
+        self._level_shape = None
+        self.last_peak_response = 0.0
         self.motion_vector = (0, 0)
         self.accumulated_offset = (0, 0)
         self.last_motion_time = 0
@@ -117,9 +129,6 @@ class MotionTrackerOptimizer:
                 self.accumulated_offset = (0, 0)
                 logger.debug("Motion stopped, re-OCR for verification")
         
-        # Store previous frame
-        self.previous_frame = current_frame.copy() if hasattr(current_frame, 'copy') else current_frame
-        
         return data
 
     
@@ -134,16 +143,18 @@ class MotionTrackerOptimizer:
         Returns:
             (motion_detected, motion_vector)
         """
-        if self.previous_frame is None:
+        if self._prev_spectrum is None:
+            self._prev_spectrum = self._frame_spectrum(current_frame)
             return False, (0, 0)
         
         # Use pre-computed frame difference if available
         if frame_diff is not None and frame_diff < self.motion_threshold:
-            # Very little change - no motion
+            # Very little change - no motion.  The reference spectrum is kept,
+            # so slow scrolling adds up until it is measurable
             return False, (0, 0)
         
-        # Estimate motion vector using simple correlation
-        motion_vector = self._estimate_motion_vector(self.previous_frame, current_frame)
+        # Estimate motion vector using phase correlation
+        motion_vector = self._estimate_motion_vector(current_frame)
         
         if motion_vector is None:
             return False, (0, 0)
@@ -169,91 +180,100 @@ class MotionTrackerOptimizer:
         
         return True, (dx, dy)
     
-    def _estimate_motion_vector(self, prev_frame, curr_frame) -> tuple[float, float] | None:
+    def _estimate_motion_vector(self, curr_frame) -> tuple[float, float] | None:
         """
-        Estimate motion vector between two frames.
+        Estimate the motion vector since the last analyzed frame.
         
-        Uses simple phase correlation for speed.
+        Phase correlation on a downscaled, Hann-windowed grayscale level:
+        the normalized cross-power spectrum of a pure translation inverts
+        to a single peak at the shift, so any scroll distance up to half the
+        frame costs the same two FFTs.  Only the spectrum of the reference
+        frame is kept -- never the frame itself, whose buffer capture may
+        reuse -- leaving one forward and one inverse FFT per frame.
         """
         try:
-            # Convert to numpy arrays if needed
-            if not isinstance(prev_frame, np.ndarray):
-                if hasattr(prev_frame, 'data'):
-                    prev_frame = prev_frame.data
-                else:
-                    return None
-            
-            if not isinstance(curr_frame, np.ndarray):
-                if hasattr(curr_frame, 'data'):
-                    curr_frame = curr_frame.data
-                else:
-                    return None
-            
-            # Ensure same shape
-            if prev_frame.shape != curr_frame.shape:
+            curr_spectrum = self._frame_spectrum(curr_frame)
+            if curr_spectrum is None:
+                return None
+            prev_spectrum, self._prev_spectrum = self._prev_spectrum, curr_spectrum
+            if prev_spectrum is None or prev_spectrum.shape != curr_spectrum.shape:
                 return None
             
-            # Convert to grayscale if needed
-            if len(prev_frame.shape) == 3:
-                prev_gray = np.mean(prev_frame, axis=2).astype(np.uint8)
-                curr_gray = np.mean(curr_frame, axis=2).astype(np.uint8)
-            else:
-                prev_gray = prev_frame
-                curr_gray = curr_frame
-            
-            # Downsample for speed (use every 4th pixel)
-            prev_small = prev_gray[::4, ::4]
-            curr_small = curr_gray[::4, ::4]
-            
-            # Simple cross-correlation to find shift
-            # This is a simplified version - full implementation would use FFT
-            h, w = prev_small.shape
-            best_score = -1
-            best_offset = (0, 0)
-            
-            # Search in a small window (±50 pixels)
-            search_range = 12  # pixels in downsampled space (48 pixels in original)
+            # Normalized cross-power spectrum -> correlation surface
+            cross = curr_spectrum * np.conj(prev_spectrum)
+            cross /= np.abs(cross) + 1e-9
+            surface = np.fft.irfft2(cross, s=self._level_shape)
             
-            for dy in range(-search_range, search_range + 1, 2):
-                for dx in range(-search_range, search_range + 1, 2):
-                    # Calculate overlap region
-                    y1_prev = max(0, -dy)
-                    y2_prev = min(h, h - dy)
-                    x1_prev = max(0, -dx)
-                    x2_prev = min(w, w - dx)
-                    
-                    y1_curr = max(0, dy)
-                    y2_curr = min(h, h + dy)
-                    x1_curr = max(0, dx)
-                    x2_curr = min(w, w + dx)
-                    
-                    if y2_prev <= y1_prev or x2_prev <= x1_prev:
-                        continue
-                    
-                    # Calculate correlation
-                    prev_region = prev_small[y1_prev:y2_prev, x1_prev:x2_prev]
-                    curr_region = curr_small[y1_curr:y2_curr, x1_curr:x2_curr]
-                    
-                    if prev_region.size == 0 or curr_region.size == 0:
-                        continue
-                    
-                    # Normalized cross-correlation
-                    score = np.sum(prev_region * curr_region) / (np.sqrt(np.sum(prev_region**2) * np.sum(curr_region**2)) + 1e-10)
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_offset = (dx * 4, dy * 4)  # Scale back to original resolution
+            peak_y, peak_x = np.unravel_index(int(np.argmax(surface)), surface.shape)
+            response = float(surface[peak_y, peak_x])
+            self.last_peak_response = response
+            if response < self.min_peak_response:
+                # No dominant translation - content changed rather than moved
+                return None
             
-            # Only return if correlation is strong enough
-            if best_score > 0.8:
-                return best_offset
+            h, w = surface.shape
+            dy = peak_y + self._subpixel_offset(surface[(peak_y - 1) % h, peak_x], response,
+                                                surface[(peak_y + 1) % h, peak_x])
+            dx = peak_x + self._subpixel_offset(surface[peak_y, (peak_x - 1) % w], response,
+                                                surface[peak_y, (peak_x + 1) % w])
+            # The surface is circular: peaks past the midpoint are negative shifts
+            if dy > h / 2:
+                dy -= h
+            if dx > w / 2:
+                dx -= w
             
-            return None
+            scale = self.phase_downscale
+            return (float(dx) * scale, float(dy) * scale)
             
         except Exception as e:
             logger.error("Error estimating motion: %s", e)
             return None
 
+    def _frame_spectrum(self, frame) -> np.ndarray | None:
+        """Return the FFT of the frame's windowed, downscaled grayscale level."""
+        if not isinstance(frame, np.ndarray):
+            frame = getattr(frame, 'data', None)
+            if not isinstance(frame, np.ndarray):
+                return None
+        
+        scale = self.phase_downscale
+        h, w = frame.shape[:2]
+        level_h, level_w = h // scale, w // scale
+        if level_h < 8 or level_w < 8:
+            return None
+        
+        if CV2_AVAILABLE:
+            gray = frame
+            if frame.ndim == 3:
+                code = cv2.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+                gray = cv2.cvtColor(frame, code)
+            if scale > 1:
+                gray = cv2.resize(gray, (level_w, level_h), interpolation=cv2.INTER_AREA)
+            level = gray.astype(np.float32)
+        else:
+            # Box-filter downscale: average each scale x scale block
+            cropped = frame[:level_h * scale, :level_w * scale]
+            axes = (1, 3, 4) if cropped.ndim == 3 else (1, 3)
+            level = cropped.reshape(level_h, scale, level_w, scale, *cropped.shape[2:]).mean(
+                axis=axes, dtype=np.float32)
+        
+        if self._window is None or self._window.shape != level.shape:
+            # Hann window suppresses the edge discontinuity the FFT wraps around
+            self._window = np.outer(np.hanning(level_h), np.hanning(level_w)).astype(np.float32)
+            self._level_shape = level.shape
+        
+        level -= level.mean()
+        level *= self._window
+        return np.fft.rfft2(level)
+
+    @staticmethod
+    def _subpixel_offset(left: float, center: float, right: float) -> float:
+        """Vertex of the parabola through three samples around a peak."""
+        denom = left - 2.0 * center + right
+        if denom >= 0:
+            return 0.0
+        return float(np.clip(0.5 * (left - right) / denom, -0.5, 0.5))
+
     
     def get_stats(self) -> dict[str, Any]:
         """Get motion tracker statistics."""
@@ -262,12 +282,13 @@ class MotionTrackerOptimizer:
             'overlays_moved': self.overlays_moved_count,
             'current_offset': self.accumulated_offset,
             'motion_vector': self.motion_vector,
-            'motion_stopped': self.motion_stopped
+            'motion_stopped': self.motion_stopped,
+            'peak_response': self.last_peak_response
         }
     
     def reset(self):
         """Reset motion tracker state."""
-        self.previous_frame = None
+        self._prev_spectrum = None
         self.motion_vector = (0, 0)
         self.accumulated_offset = (0, 0)
         self.last_motion_time = 0
@@ -3,99 +3,55 @@ Translation Cache Optimizer Plugin
 Caches translations for instant lookup of repeated text.
 
 Works as a pre/post plugin on the translation stage:
-- Pre (process): looks up each text_block in the in-memory cache and marks
-  cache-hit blocks with ``skip_translation=True`` so TranslationStage skips
-  them.
+- Pre (process): looks up each text_block in the shared translation cache
+  and marks cache-hit blocks with ``skip_translation=True`` so
+  TranslationStage skips them.
 - Post (post_process): stores new translations in the cache for future frames.
+
+The plugin keeps no storage of its own: it is a pipeline front-end for
+the process-wide ``TieredTranslationCache`` that the translation layer
+and ``PipelineCacheManager`` also use, so a translation learned by any
+of them is found by all.
 """
 
 import logging
-import time
-import hashlib
-from collections import OrderedDict
 from typing import Any, Dict, Optional
 
+from app.text_translation.tiered_cache import TieredTranslationCache, get_translation_cache
+
 logger = logging.getLogger(__name__)
 
 
 class TranslationCacheOptimizer:
-    """In-memory LRU translation cache with TTL expiration."""
+    """Pipeline hooks over the shared translation cache."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], cache: Optional[TieredTranslationCache] = None):
         self.config = config
         self.max_size = config.get('max_cache_size', 10000)
         self.ttl = config.get('ttl_seconds', 3600)
         self.fuzzy_match = config.get('enable_fuzzy_match', False)
 
-        self.cache: OrderedDict = OrderedDict()
-        self.timestamps: Dict[str, float] = {}
-
-        # Statistics
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
+        # The user's cache.translation_cache_* settings win over the plugin
+        # defaults; either only applies if this plugin creates the cache
+        config_manager = config.get('config_manager')
+        if cache is None:
+            if config_manager is not None:
+                cache = get_translation_cache(config_manager=config_manager)
+            else:
+                cache = get_translation_cache(max_size=self.max_size, ttl_seconds=self.ttl)
+        self.cache = cache
 
     # ------------------------------------------------------------------
     # Cache primitives
     # ------------------------------------------------------------------
 
-    def _make_key(self, text: str, source_lang: str, target_lang: str) -> str:
-        key_str = f"{source_lang}:{target_lang}:{text}"
-        return hashlib.md5(key_str.encode()).hexdigest()
-
-    def _is_expired(self, key: str) -> bool:
-        if key not in self.timestamps:
-            return True
-        return (time.time() - self.timestamps[key]) > self.ttl
-
-    def _evict_old_entries(self) -> None:
-        current_time = time.time()
-        keys_to_remove = [
-            k for k, ts in self.timestamps.items()
-            if current_time - ts > self.ttl
-        ]
-        for key in keys_to_remove:
-            self.cache.pop(key, None)
-            self.timestamps.pop(key, None)
-            self.evictions += 1
-
-    def _evict_lru(self) -> None:
-        if self.cache:
-            key, _ = self.cache.popitem(last=False)
-            self.timestamps.pop(key, None)
-            self.evictions += 1
-
     def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
         """Look up a cached translation."""
-        key = self._make_key(text, source_lang, target_lang)
-
-        if self._is_expired(key):
-            self.cache.pop(key, None)
-            self.timestamps.pop(key, None)
-            self.misses += 1
-            return None
-
-        if key in self.cache:
-            self.cache.move_to_end(key)
-            self.hits += 1
-            return self.cache[key]
-
-        self.misses += 1
-        return None
+        return self.cache.get(text, source_lang, target_lang)
 
     def put(self, text: str, source_lang: str, target_lang: str, translation: str) -> None:
         """Store a translation in the cache."""
-        key = self._make_key(text, source_lang, target_lang)
-
-        if len(self.cache) % 100 == 0:
-            self._evict_old_entries()
-
-        if len(self.cache) >= self.max_size:
-            self._evict_lru()
-
-        self.cache[key] = translation
-        self.timestamps[key] = time.time()
-        self.cache.move_to_end(key)
+        self.cache.put(text, source_lang, target_lang, translation)
 
     # ------------------------------------------------------------------
     # Pipeline hooks
@@ -122,12 +78,13 @@ class TranslationCacheOptimizer:
         source_lang = data.get("source_lang", "auto")
         target_lang = data.get("target_lang", "en")
 
-        for block in text_blocks:
-            text = self._block_text(block)
-            if not text:
-                continue
+        blocks = [(block, self._block_text(block)) for block in text_blocks]
+        blocks = [(block, text) for block, text in blocks if text]
+        cached_texts = self.cache.get_many(
+            [text for _, text in blocks], source_lang, target_lang
+        )
 
-            cached = self.get(text, source_lang, target_lang)
+        for (block, text), cached in zip(blocks, cached_texts):
             if cached is not None and cached != text:
                 if isinstance(block, dict):
                     block["skip_translation"] = True
@@ -176,31 +133,31 @@ class TranslationCacheOptimizer:
     # ------------------------------------------------------------------
 
     def get_stats(self) -> Dict[str, Any]:
-        total = self.hits + self.misses
-        hit_rate = (self.hits / total * 100) if total > 0 else 0
-
+        stats = self.cache.get_stats()
         return {
-            'hits': self.hits,
-            'misses': self.misses,
-            'hit_rate': f"{hit_rate:.1f}%",
-            'cache_size': len(self.cache),
-            'evictions': self.evictions,
+            'hits': stats['hits'],
+            'misses': stats['misses'],
+            'hit_rate': f"{stats['hit_rate'] * 100:.1f}%",
+            'cache_size': stats['size'],
+            'persistent_size': stats['persistent_size'],
+            'evictions': stats['evictions'],
         }
 
     def reset(self) -> None:
-        """Clear in-memory cache on pipeline restart.
+        """Reset statistics on pipeline restart.
+
+        The cached translations are shared with the translation layer and
+        persisted, so they outlive the pipeline.
+        """
+        self.cache.reset_stats()
+
+    def clear(self, persistent: bool = False) -> None:
+        """Forget the cached translations held in memory.
 
-        Disk-persisted translations are unaffected — they are loaded
-        separately by the startup pipeline.
+        The persistent tier is shared with the translation layer and
+        ``PipelineCacheManager``; it is only wiped with ``persistent=True``.
         """
-        self.clear()
-
-    def clear(self) -> None:
-        self.cache.clear()
-        self.timestamps.clear()
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
+        self.cache.clear(persistent=persistent)
 
 
 # Plugin interface
@@ -9,6 +9,7 @@ system prompts and processing modes.
 """
 
 import logging
+from collections.abc import Callable, Iterator
 from typing import Any
 
 try:
@@ -19,6 +20,7 @@ try:
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
+from app.llm.batched_generation import PrefixCachedGenerator, shared_prefix
 from app.llm.llm_engine_interface import (
     ILLMEngine,
     LLMEngineCapabilities,
@@ -89,6 +91,8 @@ class LLMEngine(ILLMEngine):
         self._max_tokens = 512
         self._temperature = 0.7
         self._system_prompt: str = ""
+        self._batch_size = 8
+        self._generator: PrefixCachedGenerator | None = None
         self._using_shared_model = False
 
     # ------------------------------------------------------------------
@@ -107,6 +111,7 @@ class LLMEngine(ILLMEngine):
             self.model_name = config.get("model_name", self.model_name)
             self._max_tokens = int(config.get("max_tokens", self._max_tokens))
             self._temperature = float(config.get("temperature", self._temperature))
+            self._batch_size = max(1, int(config.get("batch_size", self._batch_size)))
             quantization = config.get("quantization", "none")
             use_gpu = config.get("gpu", True) or config.get("use_gpu", True)
 
@@ -140,7 +145,7 @@ class LLMEngine(ILLMEngine):
                         ],
                         supports_gpu=self._device.type == "cuda",
                         supports_batch_processing=True,
-                        supports_streaming=False,
+                        supports_streaming=True,
                         max_context_length=4096,
                         memory_requirements_mb=self._estimate_memory_mb(),
                     )
@@ -200,7 +205,7 @@ class LLMEngine(ILLMEngine):
                 ],
                 supports_gpu=self._device.type == "cuda",
                 supports_batch_processing=True,
-                supports_streaming=False,
+                supports_streaming=True,
                 max_context_length=4096,
                 memory_requirements_mb=self._estimate_memory_mb(),
             )
@@ -243,6 +248,7 @@ class LLMEngine(ILLMEngine):
             )
 
         self._using_shared_model = False
+        self._generator = None
         self.status = LLMEngineStatus.UNINITIALIZED
 
     # ------------------------------------------------------------------
@@ -256,8 +262,7 @@ class LLMEngine(ILLMEngine):
 
         start_ms = self._record_processing_start()
         try:
-            messages = self._build_messages(text, options)
-            output = self._generate(messages, options)
+            output = self._generate([text], options)[0]
             self._record_processing_end(start_ms, success=True)
             return output
         except Exception as e:
@@ -268,14 +273,40 @@ class LLMEngine(ILLMEngine):
     def process_batch(
         self, texts: list[str], options: LLMProcessingOptions,
     ) -> list[str]:
-        results: list[str] = []
-        for i, text in enumerate(texts):
-            try:
-                results.append(self.process_text(text, options))
-            except Exception as e:
-                self._logger.error("Qwen3 LLM batch item %d failed: %s", i, e)
-                results.append(text)
-        return results
+        if not texts:
+            return []
+        if not self._is_available():
+            self._logger.error("Engine not available for processing")
+            return list(texts)
+
+        start_ms = self._record_processing_start()
+        try:
+            results = self._generate(texts, options)
+            self._record_processing_end(start_ms, success=True)
+            return results
+        except Exception as e:
+            self._logger.error("Qwen3 LLM batch processing failed: %s", e)
+            self._record_processing_end(start_ms, success=False)
+            return list(texts)
+
+    def process_text_stream(
+        self, text: str, options: LLMProcessingOptions,
+    ) -> Iterator[str]:
+        if not self._is_available():
+            self._logger.error("Engine not available for processing")
+            yield text
+            return
+
+        start_ms = self._record_processing_start()
+        success = False
+        try:
+            yield from self._generate_stream(text, options)
+            success = True
+        except Exception as e:
+            self._logger.error("Qwen3 LLM streaming failed: %s", e)
+            yield text
+        finally:
+            self._record_processing_end(start_ms, success=success)
 
     def set_system_prompt(self, prompt: str) -> None:
         self._system_prompt = prompt
@@ -322,40 +353,70 @@ class LLMEngine(ILLMEngine):
     # Generation
     # ------------------------------------------------------------------
 
+    def _get_generator(self) -> PrefixCachedGenerator:
+        if self._generator is None or self._generator.model is not self.model:
+            self._generator = PrefixCachedGenerator(self.model, self.tokenizer)
+        return self._generator
+
     def _generate(
         self,
-        messages: list[dict[str, str]],
+        texts: list[str],
         options: LLMProcessingOptions,
-    ) -> str:
-        prompt = self.tokenizer.apply_chat_template(
-            messages, tokenize=False, add_generation_prompt=True,
+    ) -> list[str]:
+        """Run *texts* in batched ``generate`` calls sharing the cached system prompt."""
+        render = self._prompt_renderer(options)
+        generated = self._get_generator().generate(
+            [render(text) for text in texts],
+            prefix=shared_prefix(render),
+            max_batch_size=self._batch_size,
+            max_input_tokens=self.capabilities.max_context_length,
+            **self._generation_kwargs(options),
         )
+        return [
+            self.tokenizer.decode(new_tokens, skip_special_tokens=True).strip()
+            for new_tokens in generated
+        ]
 
-        max_tokens = options.max_tokens or self._max_tokens
-        temperature = options.temperature if options.temperature > 0 else self._temperature
-
-        inputs = self.tokenizer(
-            prompt,
-            return_tensors="pt",
-            truncation=True,
-            max_length=self.capabilities.max_context_length,
-        ).to(self._device)
-
-        input_len = inputs["input_ids"].shape[1]
-
-        with torch.no_grad():
-            outputs = self.model.generate(
-                **inputs,
-                max_new_tokens=max_tokens,
-                temperature=temperature,
-                do_sample=temperature > 0,
-                top_p=options.top_p if options.top_p else 0.9,
-                repetition_penalty=1.1,
-                pad_token_id=self.tokenizer.eos_token_id,
+    def _generate_stream(
+        self, text: str, options: LLMProcessingOptions,
+    ) -> Iterator[str]:
+        """Yield the growing output for *text*; the last item matches ``_generate``."""
+        render = self._prompt_renderer(options)
+        generated = ""
+        last = None
+        for piece in self._get_generator().stream(
+            render(text),
+            prefix=shared_prefix(render),
+            max_input_tokens=self.capabilities.max_context_length,
+            **self._generation_kwargs(options),
+        ):
+            generated += piece
+            partial = generated.strip()
+            if partial and partial != last:
+                last = partial
+                yield partial
+        if generated.strip() != last:
+            yield generated.strip()
+
+    def _prompt_renderer(self, options: LLMProcessingOptions) -> Callable[[str], str]:
+        def render(text: str) -> str:
+            return self.tokenizer.apply_chat_template(
+                self._build_messages(text, options),
+                tokenize=False, add_generation_prompt=True,
             )
+        return render
 
-        new_tokens = outputs[0][input_len:]
-        return self.tokenizer.decode(new_tokens, skip_special_tokens=True).strip()
+    def _generation_kwargs(self, options: LLMProcessingOptions) -> dict[str, Any]:
+        max_tokens = options.max_tokens or self._max_tokens
+        temperature = options.temperature if options.temperature > 0 else self._temperature
+        return {
+            "max_new_tokens": max_tokens,
+            "temperature": temperature,
+            "do_sample": temperature > 0,
+            "top_p": options.top_p if options.top_p else 0.9,
+            "repetition_penalty": 1.1,
+            "pad_token_id": self.tokenizer.eos_token_id,
+        }
 
     # ------------------------------------------------------------------
     # Helpers
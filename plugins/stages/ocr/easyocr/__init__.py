@@ -35,6 +35,7 @@ class OCREngine(IOCREngine):
         
         self.reader = None
         self.current_language = 'en'
+        self._batch_size = 16
         self.logger = logging.getLogger(__name__)
     
     def initialize(self, config: dict) -> bool:
@@ -51,6 +52,7 @@ class OCREngine(IOCREngine):
             
             self.current_language = config.get('language', 'en')
             use_gpu = config.get('gpu', True)
+            self._batch_size = int(config.get('batch_size', self._batch_size))
             
             self.logger.info(f"Initializing EasyOCR (language={self.current_language}, gpu={use_gpu})")
             
@@ -91,57 +93,79 @@ class OCREngine(IOCREngine):
                 image = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
 
             results = self.reader.readtext(image, paragraph=True)
-            
-            # Convert to TextBlock objects
-            text_blocks = []
-            min_confidence = options.confidence_threshold if options else 0.5
-            inv_scale = 1.0 / scale
-
-            for entry in results:
-                # paragraph=True can return (bbox, text) without confidence
-                if len(entry) == 3:
-                    bbox, text, confidence = entry
-                elif len(entry) == 2:
-                    bbox, text = entry
-                    confidence = 1.0
-                else:
-                    continue
-
-                if confidence < min_confidence:
-                    continue
-
-                if not text or not text.strip():
-                    continue
-
-                x_coords = [point[0] for point in bbox]
-                y_coords = [point[1] for point in bbox]
-
-                # Map coordinates back to original resolution
-                x = int(min(x_coords) * inv_scale)
-                y = int(min(y_coords) * inv_scale)
-                width = int((max(x_coords) - min(x_coords)) * inv_scale)
-                height = int((max(y_coords) - min(y_coords)) * inv_scale)
-
-                text_block = TextBlock(
-                    text=text,
-                    position=Rectangle(x, y, width, height),
-                    confidence=confidence,
-                    language=options.language if options else self.current_language
-                )
-                text_blocks.append(text_block)
-            
-            return text_blocks
+            return self._to_text_blocks(results, options, 1.0 / scale)
             
         except Exception as e:
             self.logger.error(f"OCR processing failed: {e}")
             return []
+
+    def _to_text_blocks(self, results: list, options: OCRProcessingOptions,
+                        inv_scale: float = 1.0) -> list[TextBlock]:
+        """Convert EasyOCR ``readtext`` output to TextBlock objects."""
+        text_blocks = []
+        min_confidence = options.confidence_threshold if options else 0.5
+
+        for entry in results:
+            # paragraph=True can return (bbox, text) without confidence
+            if len(entry) == 3:
+                bbox, text, confidence = entry
+            elif len(entry) == 2:
+                bbox, text = entry
+                confidence = 1.0
+            else:
+                continue
+
+            if confidence < min_confidence:
+                continue
+
+            if not text or not text.strip():
+                continue
+
+            x_coords = [point[0] for point in bbox]
+            y_coords = [point[1] for point in bbox]
+
+            # Map coordinates back to original resolution
+            x = int(min(x_coords) * inv_scale)
+            y = int(min(y_coords) * inv_scale)
+            width = int((max(x_coords) - min(x_coords)) * inv_scale)
+            height = int((max(y_coords) - min(y_coords)) * inv_scale)
+
+            text_block = TextBlock(
+                text=text,
+                position=Rectangle(x, y, width, height),
+                confidence=confidence,
+                language=options.language if options else self.current_language
+            )
+            text_blocks.append(text_block)
+        
+        return text_blocks
     
     def extract_text_batch(self, frames: list[Frame], options: OCRProcessingOptions) -> list[list[TextBlock]]:
-        """Extract text from multiple frames (required by IOCREngine)."""
-        results = []
-        for frame in frames:
-            results.append(self.extract_text(frame, options))
-        return results
+        """Extract text from multiple frames (required by IOCREngine).
+
+        Crops (e.g. ROI speech bubbles) are padded to a common size and
+        run through ``readtext_batched`` so detection and recognition
+        each see one batch.  Falls back to per-frame OCR when the crops
+        are too large or too uneven to pad efficiently.
+        """
+        if not self.is_ready():
+            return [[] for _ in frames]
+
+        from app.ocr.batch_utils import can_pad_batch, pad_to_common_size
+
+        images = [frame.data for frame in frames]
+        if not hasattr(self.reader, 'readtext_batched') or not can_pad_batch(images, self._MAX_DIMENSION):
+            return [self.extract_text(frame, options) for frame in frames]
+
+        try:
+            batch = pad_to_common_size(images)
+            batch_results = self.reader.readtext_batched(
+                batch, paragraph=True, batch_size=self._batch_size,
+            )
+            return [self._to_text_blocks(results, options) for results in batch_results]
+        except Exception as e:
+            self.logger.warning(f"Batched OCR failed, falling back to per-frame OCR: {e}")
+            return [self.extract_text(frame, options) for frame in frames]
     
     def set_language(self, language: str) -> bool:
         """Set the OCR language (required by IOCREngine)."""
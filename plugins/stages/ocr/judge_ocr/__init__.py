@@ -117,7 +117,21 @@ class OCREngine(IOCREngine):
     def extract_text_batch(
         self, frames: list[Frame], options: OCRProcessingOptions
     ) -> list[list[TextBlock]]:
-        return [self.extract_text(f, options) for f in frames]
+        """Run each sub-engine's batch path once, then vote per frame."""
+        if not self.is_ready():
+            return [[] for _ in frames]
+
+        try:
+            batch_results = self._run_all_engines_batch(frames, options)
+            return [
+                self._vote(self._match_regions(engine_results))
+                if engine_results else []
+                for engine_results in batch_results
+            ]
+
+        except Exception:
+            logger.error("Judge OCR batch failed", exc_info=True)
+            return [[] for _ in frames]
 
     def set_language(self, language: str) -> bool:
         self._current_language = language
@@ -206,28 +220,47 @@ class OCREngine(IOCREngine):
         Run every sub-engine and collect per-engine results as lists of
         ``{"text", "bbox", "confidence", "engine"}`` dicts.
         """
+        return self._run_all_engines_batch([frame], options)[0]
+
+    def _run_all_engines_batch(
+        self, frames: list[Frame], options: OCRProcessingOptions
+    ) -> list[dict[str, list[dict]]]:
+        """
+        Batch variant of :meth:`_run_all_engines`: each sub-engine sees all
+        frames in one ``extract_text_batch`` call (single-frame batches go
+        through ``extract_text``). Returns one engine-result dict per frame.
+        """
 
-        def _run_single(name: str, engine: IOCREngine) -> tuple[str, list[dict]]:
+        def _run_single(name: str, engine: IOCREngine) -> tuple[str, list[list[dict]]]:
             try:
-                blocks = engine.extract_text(frame, options)
+                if len(frames) == 1:
+                    batch_blocks = [engine.extract_text(frames[0], options)]
+                else:
+                    batch_blocks = engine.extract_text_batch(frames, options)
                 threshold = self._engine_thresholds.get(name, 0.0)
                 results = []
-                for blk in blocks:
-                    if blk.confidence >= threshold:
-                        results.append(
-                            {
-                                "text": blk.text,
-                                "bbox": blk.position,
-                                "confidence": blk.confidence,
-                                "engine": name,
-                            }
-                        )
+                for blocks in batch_blocks:
+                    results.append([
+                        {
+                            "text": blk.text,
+                            "bbox": blk.position,
+                            "confidence": blk.confidence,
+                            "engine": name,
+                        }
+                        for blk in blocks
+                        if blk.confidence >= threshold
+                    ])
                 return name, results
             except Exception:
                 logger.warning("Sub-engine %s raised during extract_text", name, exc_info=True)
-                return name, []
+                return name, [[] for _ in frames]
 
-        engine_results: dict[str, list[dict]] = {}
+        engine_results: list[dict[str, list[dict]]] = [{} for _ in frames]
+
+        def _collect(name: str, per_frame: list[list[dict]]) -> None:
+            for frame_results, res in zip(engine_results, per_frame):
+                if res:
+                    frame_results[name] = res
 
         if self._parallel and len(self._sub_engines) > 1:
             with concurrent.futures.ThreadPoolExecutor(
@@ -238,14 +271,10 @@ class OCREngine(IOCREngine):
                     for n, e in self._sub_engines.items()
                 }
                 for fut in concurrent.futures.as_completed(futures):
-                    name, res = fut.result()
-                    if res:
-                        engine_results[name] = res
+                    _collect(*fut.result())
         else:
             for name, engine in self._sub_engines.items():
-                _, res = _run_single(name, engine)
-                if res:
-                    engine_results[name] = res
+                _collect(*_run_single(name, engine))
 
         return engine_results
 
@@ -2,25 +2,58 @@
 Cloud Translation Engine Base
 
 Shared base class for all cloud/API-based translation engine plugins.
-Handles the common boilerplate: timing, fallback results, batch-via-loop,
-and consistent error handling.
+Handles the common boilerplate: timing, fallback results, batching,
+retries and consistent error handling.
 
 Subclasses only need to implement:
   - _do_translate(text, src_lang, tgt_lang) -> str
   - initialize(config) -> bool
   - cleanup() -> None
   - get_supported_languages() -> list[str]
+
+Engines whose API accepts several texts per request also set
+``_native_batch_size`` and implement ``_do_translate_many``.  Engines that
+talk HTTP themselves use ``_get_session()``: one keep-alive
+``requests.Session`` per engine, so a batch does not pay a TCP/TLS
+handshake per text.
+
+translate_batch sends native batches when the engine has them and falls
+back to per-text requests otherwise (or when a native batch fails), run
+concurrently on at most ``max_concurrency`` connections.  Every request is
+retried on connection errors, timeouts, 429 and 5xx with exponential
+backoff (``Retry-After`` is honoured).
 """
 
 import logging
+import threading
 import time
 from abc import abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    requests = None
+    HTTPAdapter = None
+    REQUESTS_AVAILABLE = False
 
 from app.text_translation.translation_engine_interface import (
     AbstractTranslationEngine, TranslationOptions, TranslationResult,
     BatchTranslationResult,
 )
 
+_T = TypeVar("_T")
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Longest Retry-After we are willing to sleep for inside a translation
+_MAX_RETRY_AFTER_S = 5.0
+
 
 class CloudTranslationEngine(AbstractTranslationEngine):
     """
@@ -34,10 +67,21 @@ class CloudTranslationEngine(AbstractTranslationEngine):
     # Used for engine ranking when multiple engines are available.
     _default_confidence: float = 0.90
 
+    # Texts per API request when the engine implements _do_translate_many
+    # (0 = one request per text); _native_batch_chars caps the summed length
+    _native_batch_size: int = 0
+    _native_batch_chars: int = 0
+
     def __init__(self, engine_name: str):
         super().__init__(engine_name)
         self._logger = logging.getLogger(f"{__name__}.{engine_name}")
         self._is_initialized = False
+        self._max_concurrency = 4
+        self._max_retries = 2
+        self._retry_backoff = 0.25
+        self._session = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._transport_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Subclass contract
@@ -61,6 +105,15 @@ class CloudTranslationEngine(AbstractTranslationEngine):
         """
         ...
 
+    def _do_translate_many(self, texts: list[str], src_lang: str, tgt_lang: str) -> list[str]:
+        """
+        Translate several texts in one API request.
+
+        Only called when ``_native_batch_size`` is set; must return exactly
+        one translation per input text, in order.
+        """
+        raise NotImplementedError
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -78,6 +131,115 @@ class CloudTranslationEngine(AbstractTranslationEngine):
             from_cache=False,
         )
 
+    def _is_retryable(self, exc: Exception) -> bool:
+        """Whether a failed request is worth repeating."""
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+        if status is not None:
+            return status in _RETRY_STATUSES
+        if REQUESTS_AVAILABLE and isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+            return True
+        return isinstance(exc, (ConnectionError, TimeoutError))
+
+    def _with_retry(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Call *fn*, retrying transient failures with exponential backoff."""
+        attempt = 0
+        while True:
+            try:
+                return fn(*args)
+            except Exception as e:
+                if attempt >= self._max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._retry_backoff * (2 ** attempt)
+                retry_after = getattr(getattr(e, "response", None), "headers", {}).get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = max(delay, min(float(retry_after), _MAX_RETRY_AFTER_S))
+                    except ValueError:
+                        pass
+                attempt += 1
+                self._logger.debug(f"Request failed ({e}), retry {attempt} in {delay:.2f}s")
+                time.sleep(delay)
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _configure_transport(self, config: dict) -> None:
+        """Read the shared concurrency / retry settings from plugin config."""
+        self._max_concurrency = max(1, int(config.get('max_concurrency', self._max_concurrency)))
+        self._max_retries = max(0, int(config.get('max_retries', self._max_retries)))
+
+    def _get_session(self):
+        """Keep-alive HTTP session shared by all requests of this engine."""
+        if not REQUESTS_AVAILABLE:
+            raise RuntimeError("requests library not available")
+        with self._transport_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_concurrency)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._transport_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix=f"{self.engine_name}-request",
+                )
+            return self._executor
+
+    def _close_transport(self) -> None:
+        """Close pooled connections and request threads; call from cleanup()."""
+        with self._transport_lock:
+            session, self._session = self._session, None
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if session is not None:
+            session.close()
+
+    def _chunks(self, texts: list[str]) -> list[tuple[int, list[str]]]:
+        """Split *texts* into (offset, chunk) pieces that fit one native request."""
+        chunks: list[tuple[int, list[str]]] = []
+        start = 0
+        chars = 0
+        for i, text in enumerate(texts):
+            too_many = i - start >= self._native_batch_size
+            too_long = self._native_batch_chars and chars + len(text) > self._native_batch_chars
+            if i > start and (too_many or too_long):
+                chunks.append((start, texts[start:i]))
+                start, chars = i, 0
+            chars += len(text)
+        if start < len(texts):
+            chunks.append((start, texts[start:]))
+        return chunks
+
+    def _translate_chunk(self, texts: list[str], src_lang: str, tgt_lang: str) -> list[str | None]:
+        """Translate one chunk natively; fall back to per-text requests on failure."""
+        if len(texts) > 1:
+            try:
+                translated = self._with_retry(self._do_translate_many, texts, src_lang, tgt_lang)
+                if len(translated) == len(texts):
+                    return list(translated)
+                self._logger.warning(
+                    f"Batch request returned {len(translated)} translations "
+                    f"for {len(texts)} texts, retrying one by one"
+                )
+            except Exception as e:
+                self._logger.warning(f"Batch request failed ({e}), retrying one by one")
+        return [self._translate_one(text, src_lang, tgt_lang) for text in texts]
+
+    def _translate_one(self, text: str, src_lang: str, tgt_lang: str) -> str | None:
+        try:
+            return self._with_retry(self._do_translate, text, src_lang, tgt_lang)
+        except Exception as e:
+            self._logger.error(f"Translation failed: {e}")
+            return None
+
     # ------------------------------------------------------------------
     # AbstractTranslationEngine interface
     # ------------------------------------------------------------------
@@ -93,7 +255,7 @@ class CloudTranslationEngine(AbstractTranslationEngine):
 
         start_time = time.time()
         try:
-            translated_text = self._do_translate(text, src_lang, tgt_lang)
+            translated_text = self._with_retry(self._do_translate, text, src_lang, tgt_lang)
             processing_time = (time.time() - start_time) * 1000
             return TranslationResult(
                 original_text=text,
@@ -115,13 +277,46 @@ class CloudTranslationEngine(AbstractTranslationEngine):
         results: list[TranslationResult] = []
         failed: list = []
 
-        for i, text in enumerate(texts):
-            result = self.translate_text(text, src_lang, tgt_lang, options)
-            results.append(result)
-            if result.confidence == 0.0:
-                failed.append((i, "Translation failed"))
+        if not self.is_available():
+            self._logger.warning("Engine not available")
+            translations: list[str | None] = [None] * len(texts)
+        elif self._native_batch_size > 0:
+            pieces = self._chunks(texts)
+            if len(pieces) == 1:
+                translations = self._translate_chunk(texts, src_lang, tgt_lang)
+            else:
+                executor = self._get_executor()
+                futures = [
+                    executor.submit(self._translate_chunk, chunk, src_lang, tgt_lang)
+                    for _, chunk in pieces
+                ]
+                translations = [t for future in futures for t in future.result()]
+        elif len(texts) > 1 and self._max_concurrency > 1:
+            executor = self._get_executor()
+            translations = list(executor.map(
+                lambda text: self._translate_one(text, src_lang, tgt_lang), texts,
+            ))
+        else:
+            translations = [self._translate_one(text, src_lang, tgt_lang) for text in texts]
 
         total_time = (time.time() - start_time) * 1000
+        per_text_ms = total_time / len(texts) if texts else 0.0
+        for i, (text, translated_text) in enumerate(zip(texts, translations)):
+            if translated_text is None:
+                results.append(self._make_fallback(text, src_lang, tgt_lang))
+                failed.append((i, "Translation failed"))
+                continue
+            results.append(TranslationResult(
+                original_text=text,
+                translated_text=translated_text,
+                source_language=src_lang,
+                target_language=tgt_lang,
+                confidence=self._default_confidence,
+                engine_used=self.engine_name,
+                processing_time_ms=per_text_ms,
+                from_cache=False,
+            ))
+
         return BatchTranslationResult(
             results=results,
             total_processing_time_ms=total_time,
@@ -5,8 +5,6 @@ Premium translation using Microsoft Azure Cognitive Services Translator API v3.0
 Requires API key and region from Azure Portal.
 """
 
-import requests
-
 from plugins.stages.translation._base import CloudTranslationEngine
 
 
@@ -14,6 +12,9 @@ class TranslationEngine(CloudTranslationEngine):
     """Azure Translator engine plugin."""
 
     _default_confidence = 0.95
+    # Translator v3 takes up to 1000 elements / 50,000 characters per request
+    _native_batch_size = 100
+    _native_batch_chars = 50_000
 
     def __init__(self):
         super().__init__("azure")
@@ -26,6 +27,7 @@ class TranslationEngine(CloudTranslationEngine):
             self._api_key = config.get('api_key', self._api_key)
             self._region = config.get('region', self._region)
             self._endpoint = config.get('endpoint', self._endpoint)
+            self._configure_transport(config)
             if not self._api_key:
                 self._logger.error("No API key provided")
                 return False
@@ -37,7 +39,10 @@ class TranslationEngine(CloudTranslationEngine):
             return False
 
     def _do_translate(self, text: str, src_lang: str, tgt_lang: str) -> str:
-        response = requests.post(
+        return self._do_translate_many([text], src_lang, tgt_lang)[0]
+
+    def _do_translate_many(self, texts: list[str], src_lang: str, tgt_lang: str) -> list[str]:
+        response = self._get_session().post(
             f"{self._endpoint}/translate",
             params={'api-version': '3.0', 'from': src_lang, 'to': tgt_lang},
             headers={
@@ -45,11 +50,11 @@ class TranslationEngine(CloudTranslationEngine):
                 'Ocp-Apim-Subscription-Region': self._region,
                 'Content-type': 'application/json',
             },
-            json=[{'text': text}],
+            json=[{'text': text} for text in texts],
             timeout=10,
         )
         response.raise_for_status()
-        return response.json()[0]['translations'][0]['text']
+        return [item['translations'][0]['text'] for item in response.json()]
 
     def get_supported_languages(self) -> list[str]:
         return [
@@ -59,5 +64,6 @@ class TranslationEngine(CloudTranslationEngine):
         ]
 
     def cleanup(self) -> None:
+        self._close_transport()
         self._is_initialized = False
         self._logger.info("Azure Translator cleaned up")
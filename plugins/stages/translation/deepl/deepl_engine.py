@@ -20,6 +20,8 @@ class TranslationEngine(CloudTranslationEngine):
     """DeepL translation engine plugin."""
 
     _default_confidence = 0.98
+    # translate_text takes a list; the API accepts up to 50 texts per request
+    _native_batch_size = 50
 
     def __init__(self):
         super().__init__("deepl")
@@ -37,7 +39,11 @@ class TranslationEngine(CloudTranslationEngine):
             if not self._api_key:
                 self._logger.error("No API key provided")
                 return False
+            self._configure_transport(config)
+            # The SDK keeps its own keep-alive session; its retries are
+            # disabled so _with_retry is the only backoff loop
             self._translator = deepl.Translator(self._api_key)
+            deepl.http_client.max_network_retries = 0
             self._is_initialized = True
             self._logger.info("DeepL engine initialized")
             return True
@@ -46,12 +52,20 @@ class TranslationEngine(CloudTranslationEngine):
             return False
 
     def _do_translate(self, text: str, src_lang: str, tgt_lang: str) -> str:
-        result = self._translator.translate_text(
-            text,
+        return self._do_translate_many([text], src_lang, tgt_lang)[0]
+
+    def _do_translate_many(self, texts: list[str], src_lang: str, tgt_lang: str) -> list[str]:
+        results = self._translator.translate_text(
+            texts,
             source_lang=src_lang.upper(),
             target_lang=tgt_lang.upper(),
         )
-        return result.text
+        return [result.text for result in results]
+
+    def _is_retryable(self, exc: Exception) -> bool:
+        if isinstance(exc, (deepl.TooManyRequestsException, deepl.ConnectionException)):
+            return True
+        return super()._is_retryable(exc)
 
     def get_supported_languages(self) -> list[str]:
         return [
@@ -61,6 +75,9 @@ class TranslationEngine(CloudTranslationEngine):
         ]
 
     def cleanup(self) -> None:
+        if self._translator is not None:
+            self._translator.close()
         self._translator = None
+        self._close_transport()
         self._is_initialized = False
         self._logger.info("DeepL engine cleaned up")
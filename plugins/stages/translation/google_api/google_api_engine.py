@@ -20,6 +20,8 @@ class TranslationEngine(CloudTranslationEngine):
     """Google Cloud Translation engine plugin."""
 
     _default_confidence = 0.95
+    # Client.translate takes a list (v2 allows up to 128 texts per request)
+    _native_batch_size = 100
 
     def __init__(self):
         super().__init__("google_api")
@@ -37,6 +39,7 @@ class TranslationEngine(CloudTranslationEngine):
             if not self._api_key:
                 self._logger.error("No API key provided")
                 return False
+            self._configure_transport(config)
             self._client = translate.Client(api_key=self._api_key)
             self._is_initialized = True
             self._logger.info("Google Cloud Translation initialized")
@@ -53,6 +56,14 @@ class TranslationEngine(CloudTranslationEngine):
         )
         return result['translatedText']
 
+    def _do_translate_many(self, texts: list[str], src_lang: str, tgt_lang: str) -> list[str]:
+        results = self._client.translate(
+            texts,
+            source_language=src_lang,
+            target_language=tgt_lang,
+        )
+        return [result['translatedText'] for result in results]
+
     def get_supported_languages(self) -> list[str]:
         return [
             'en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh',
@@ -62,5 +73,6 @@ class TranslationEngine(CloudTranslationEngine):
 
     def cleanup(self) -> None:
         self._client = None
+        self._close_transport()
         self._is_initialized = False
         self._logger.info("Google Cloud Translation cleaned up")
@@ -35,6 +35,7 @@ class TranslationEngine(CloudTranslationEngine):
             self._logger.error("deep-translator library not available")
             return False
         try:
+            self._configure_transport(config)
             GoogleTranslator(source='en', target='de').translate("test")
             self._is_initialized = True
             self._logger.info("Google Translate Free initialized")
@@ -70,5 +71,6 @@ class TranslationEngine(CloudTranslationEngine):
         return src in supported and tgt in supported
 
     def cleanup(self) -> None:
+        self._close_transport()
         self._is_initialized = False
         self._logger.info("Google Translate Free cleaned up")
@@ -5,8 +5,6 @@ Free, open-source translation using the LibreTranslate API.
 Supports public instance or self-hosted.
 """
 
-import requests
-
 from plugins.stages.translation._base import CloudTranslationEngine
 
 
@@ -20,6 +18,8 @@ class TranslationEngine(CloudTranslationEngine):
     """LibreTranslate engine plugin."""
 
     _default_confidence = 0.80
+    # /translate accepts a list for ``q`` and answers with a list
+    _native_batch_size = 50
 
     def __init__(self):
         super().__init__("libretranslate")
@@ -36,6 +36,7 @@ class TranslationEngine(CloudTranslationEngine):
                 self._api_url = self._api_url[:-len('/translate')]
             self._api_key = config.get('api_key') or None
             self._timeout = int(config.get('timeout', 10))
+            self._configure_transport(config)
             # Fetch supported languages (also validates connectivity)
             self._fetch_languages()
             self._is_initialized = True
@@ -48,7 +49,7 @@ class TranslationEngine(CloudTranslationEngine):
     def _fetch_languages(self) -> None:
         """Fetch supported languages from the API."""
         try:
-            resp = requests.get(f"{self._api_url}/languages", timeout=self._timeout)
+            resp = self._get_session().get(f"{self._api_url}/languages", timeout=self._timeout)
             resp.raise_for_status()
             self._fetched_languages = [lang['code'] for lang in resp.json()]
             self._logger.info(f"LibreTranslate supports {len(self._fetched_languages)} languages")
@@ -58,19 +59,28 @@ class TranslationEngine(CloudTranslationEngine):
                 'en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh', 'ar',
             ]
 
-    def _do_translate(self, text: str, src_lang: str, tgt_lang: str) -> str:
+    def _post_translate(self, q: str | list[str], src_lang: str, tgt_lang: str):
         src = _LANG_MAP.get(src_lang, src_lang.lower())
         tgt = _LANG_MAP.get(tgt_lang, tgt_lang.lower())
-        payload = {'q': text, 'source': src, 'target': tgt, 'format': 'text'}
+        payload = {'q': q, 'source': src, 'target': tgt, 'format': 'text'}
         if self._api_key:
             payload['api_key'] = self._api_key
-        resp = requests.post(
+        resp = self._get_session().post(
             f"{self._api_url}/translate",
             json=payload,
             timeout=self._timeout,
         )
         resp.raise_for_status()
-        return resp.json().get('translatedText', text)
+        return resp.json().get('translatedText')
+
+    def _do_translate(self, text: str, src_lang: str, tgt_lang: str) -> str:
+        return self._post_translate(text, src_lang, tgt_lang) or text
+
+    def _do_translate_many(self, texts: list[str], src_lang: str, tgt_lang: str) -> list[str]:
+        translated = self._post_translate(texts, src_lang, tgt_lang)
+        if not isinstance(translated, list):
+            raise ValueError("server does not support batch requests")
+        return translated
 
     def get_supported_languages(self) -> list[str]:
         return list(self._fetched_languages)
@@ -82,5 +92,6 @@ class TranslationEngine(CloudTranslationEngine):
         return src in langs and tgt in langs
 
     def cleanup(self) -> None:
+        self._close_transport()
         self._is_initialized = False
         self._logger.info("LibreTranslate cleaned up")
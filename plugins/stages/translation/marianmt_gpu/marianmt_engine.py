@@ -6,9 +6,18 @@ This is the plugin wrapper that implements the AbstractTranslationEngine interfa
 
 This is the CANONICAL MarianMT implementation — all other MarianMT code
 (subprocess wrappers, app/ engine) should be removed in favor of this.
+
+Batches are planned rather than padded as a whole: long blocks are split
+into sentences, the pieces are sorted by token length and grouped into
+buckets that fit a token budget, each bucket is generated separately and
+the pieces are joined back per input text.  One long paragraph therefore
+no longer pads every short speech bubble to its length, and blocks longer
+than ``max_length`` are translated in parts instead of being truncated.
 """
 
 import logging
+import math
+import re
 import threading
 import time
 
@@ -30,6 +39,16 @@ from app.text_translation.translation_engine_interface import (
 # Each model is ~300MB. With a limit of 3, worst case is ~900MB.
 _MAX_CACHED_MODELS = 3
 
+# Sentence boundaries: whitespace after terminal punctuation, or directly
+# after CJK full stops, which are not followed by spaces
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?…])\s+|(?<=[。！？])')
+
+# Output tokens allowed per source token of a bucket's longest piece
+_OUTPUT_LENGTH_RATIO = 3
+
+# Target languages written without spaces between sentences
+_NO_SPACE_LANGUAGES = {'ja', 'zh'}
+
 
 class TranslationEngine(AbstractTranslationEngine):
     """
@@ -39,6 +58,8 @@ class TranslationEngine(AbstractTranslationEngine):
     Must be named 'TranslationEngine' for plugin discovery.
     """
 
+    runs_locally = True
+
     def __init__(self):
         """Initialize MarianMT engine."""
         super().__init__("marianmt")
@@ -50,6 +71,9 @@ class TranslationEngine(AbstractTranslationEngine):
         self._device = None  # Set during initialize()
         self._max_length = 512
         self._num_beams = 4
+        self._batch_size = 8
+        self._batch_token_budget = 2048
+        self._sentence_split_tokens = 48
 
         if not TRANSFORMERS_AVAILABLE:
             self._logger.warning("transformers library not available")
@@ -72,6 +96,11 @@ class TranslationEngine(AbstractTranslationEngine):
                    - runtime_mode: 'auto', 'gpu', or 'cpu'
                    - max_length: Maximum token length (default 512)
                    - num_beams: Beam search width (default 4)
+                   - batch_size: Maximum sequences per generate call (default 8)
+                   - batch_token_budget: Maximum padded source tokens per
+                     generate call (default 2048)
+                   - sentence_split_tokens: Blocks longer than this are
+                     translated sentence by sentence (default 48, 0 = never)
 
         Returns:
             True if initialization successful
@@ -86,6 +115,9 @@ class TranslationEngine(AbstractTranslationEngine):
             self._config = config
             self._max_length = int(config.get('max_length', 512))
             self._num_beams = int(config.get('num_beams', 4))
+            self._batch_size = max(1, int(config.get('batch_size', 8)))
+            self._batch_token_budget = max(1, int(config.get('batch_token_budget', 2048)))
+            self._sentence_split_tokens = int(config.get('sentence_split_tokens', 48))
 
             # Determine device
             use_gpu = config.get('gpu', True)
@@ -283,29 +315,16 @@ class TranslationEngine(AbstractTranslationEngine):
                 self._logger.warning(f"Model loading failed for {src_lang}->{tgt_lang}")
                 return self._make_fallback_result(text, src_lang, tgt_lang)
 
-            model, tokenizer = model_tuple
-
-            # Tokenize and move to device
-            import torch
-            device = self._device or torch.device('cpu')
-            inputs = tokenizer(text, return_tensors="pt", padding=True,
-                               truncation=True, max_length=self._max_length)
-            inputs = {k: v.to(device) for k, v in inputs.items()}
-
-            # Generate
-            translated = model.generate(
-                **inputs,
-                max_length=self._max_length,
-                num_beams=self._num_beams,
-                early_stopping=True,
-            )
+            translations, errors = self._translate_texts([text], tgt_lang, *model_tuple)
+            if errors:
+                self._logger.error(f"Translation failed: {errors[0]}")
+                return self._make_fallback_result(text, src_lang, tgt_lang)
 
-            translated_text = tokenizer.decode(translated[0], skip_special_tokens=True)
             processing_time = (time.time() - start_time) * 1000
 
             return TranslationResult(
                 original_text=text,
-                translated_text=translated_text,
+                translated_text=translations[0],
                 source_language=src_lang,
                 target_language=tgt_lang,
                 confidence=0.90,
@@ -321,7 +340,7 @@ class TranslationEngine(AbstractTranslationEngine):
     def translate_batch(self, texts: list[str], src_lang: str, tgt_lang: str,
                         options: TranslationOptions | None = None) -> BatchTranslationResult:
         """
-        Translate multiple texts in a single batch.
+        Translate multiple texts with length-bucketed batched generation.
 
         Args:
             texts: List of texts to translate
@@ -330,7 +349,7 @@ class TranslationEngine(AbstractTranslationEngine):
             options: Translation options (optional)
 
         Returns:
-            BatchTranslationResult with all translations
+            BatchTranslationResult with all translations, in input order
         """
         start_time = time.time()
         results: list[TranslationResult] = []
@@ -344,40 +363,27 @@ class TranslationEngine(AbstractTranslationEngine):
                     failed.append((i, "Model loading failed"))
                     results.append(self._make_fallback_result(text, src_lang, tgt_lang))
             else:
-                model, tokenizer = model_tuple
-
-                inputs = tokenizer(texts, return_tensors="pt", padding=True,
-                                   truncation=True, max_length=self._max_length)
-                import torch
-                device = self._device or torch.device('cpu')
-                inputs = {k: v.to(device) for k, v in inputs.items()}
-
-                translated = model.generate(
-                    **inputs,
-                    max_length=self._max_length,
-                    num_beams=self._num_beams,
-                    early_stopping=True,
-                )
-
-                for i, (original, translation) in enumerate(zip(texts, translated)):
-                    try:
-                        translated_text = tokenizer.decode(translation, skip_special_tokens=True)
-                        results.append(TranslationResult(
-                            original_text=original,
-                            translated_text=translated_text,
-                            source_language=src_lang,
-                            target_language=tgt_lang,
-                            confidence=0.90,
-                            engine_used=self.engine_name,
-                            processing_time_ms=0.0,
-                            from_cache=False,
-                        ))
-                    except Exception as e:
-                        failed.append((i, str(e)))
+                translations, errors = self._translate_texts(texts, tgt_lang, *model_tuple)
+                for i, (original, translated_text) in enumerate(zip(texts, translations)):
+                    if i in errors:
+                        failed.append((i, errors[i]))
                         results.append(self._make_fallback_result(original, src_lang, tgt_lang))
+                        continue
+                    results.append(TranslationResult(
+                        original_text=original,
+                        translated_text=translated_text,
+                        source_language=src_lang,
+                        target_language=tgt_lang,
+                        confidence=0.90,
+                        engine_used=self.engine_name,
+                        processing_time_ms=0.0,
+                        from_cache=False,
+                    ))
 
         except Exception as e:
             self._logger.error(f"Batch translation failed: {e}")
+            results = []
+            failed = []
             for i, text in enumerate(texts):
                 failed.append((i, str(e)))
                 results.append(self._make_fallback_result(text, src_lang, tgt_lang))
@@ -391,6 +397,118 @@ class TranslationEngine(AbstractTranslationEngine):
             failed_translations=failed,
         )
 
+    # ------------------------------------------------------------------
+    # Batch planning
+    # ------------------------------------------------------------------
+
+    def _translate_texts(self, texts: list[str], tgt_lang: str, model, tokenizer
+                         ) -> tuple[list[str], dict[int, str]]:
+        """
+        Translate *texts* bucket by bucket.
+
+        Returns:
+            (translations in input order, {text index: error} for texts
+            with a piece in a failed bucket)
+        """
+        segments = self._plan_segments(texts, tokenizer)
+        outputs: list[str | None] = [None] * len(segments)
+        errors: dict[int, str] = {}
+
+        for bucket in self._make_buckets([len(ids) for _, ids in segments]):
+            try:
+                decoded = self._generate(model, tokenizer, [segments[k][1] for k in bucket])
+            except Exception as e:
+                self._logger.error(f"Batch generation failed for {len(bucket)} segments: {e}")
+                for k in bucket:
+                    errors.setdefault(segments[k][0], str(e))
+                continue
+            for k, translated_text in zip(bucket, decoded):
+                outputs[k] = translated_text
+
+        joiner = '' if tgt_lang.lower() in _NO_SPACE_LANGUAGES else ' '
+        parts: list[list[str]] = [[] for _ in texts]
+        for (text_index, _), translated_text in zip(segments, outputs):
+            if translated_text is not None:
+                parts[text_index].append(translated_text)
+        return [joiner.join(p) for p in parts], errors
+
+    def _plan_segments(self, texts: list[str], tokenizer) -> list[tuple[int, list[int]]]:
+        """
+        Tokenize *texts* into the pieces the model translates separately.
+
+        Blocks over ``sentence_split_tokens`` are split into sentences and
+        pieces over ``max_length`` into roughly equal parts, so nothing is
+        truncated.  Blank texts produce no pieces.
+
+        Returns:
+            (text index, token ids) per piece, in text order
+        """
+        encoded = tokenizer(texts, truncation=False)["input_ids"]
+        segments: list[tuple[int, list[int]]] = []
+        for text_index, (text, ids) in enumerate(zip(texts, encoded)):
+            if not text.strip():
+                continue
+            pieces, piece_ids = [text], [ids]
+            if 0 < self._sentence_split_tokens < len(ids):
+                sentences = [p for p in _SENTENCE_BOUNDARY_RE.split(text.strip()) if p.strip()]
+                if len(sentences) > 1:
+                    pieces = sentences
+                    piece_ids = tokenizer(sentences, truncation=False)["input_ids"]
+
+            for piece, ids in zip(pieces, piece_ids):
+                if len(ids) <= self._max_length:
+                    segments.append((text_index, ids))
+                    continue
+                chunks = _split_evenly(piece, math.ceil(len(ids) / (self._max_length - 1)))
+                chunk_ids = tokenizer(chunks, truncation=True, max_length=self._max_length)["input_ids"]
+                segments.extend((text_index, c) for c in chunk_ids)
+        return segments
+
+    def _make_buckets(self, lengths: list[int]) -> list[list[int]]:
+        """
+        Group segment indices into generate calls, longest first.
+
+        A bucket holds at most ``batch_size`` segments and, padded to its
+        longest member, at most ``batch_token_budget`` tokens (a single
+        segment over the budget gets a bucket of its own).
+        """
+        order = sorted(range(len(lengths)), key=lengths.__getitem__, reverse=True)
+        buckets: list[list[int]] = []
+        current: list[int] = []
+        width = 0
+        for k in order:
+            if current and (len(current) >= self._batch_size
+                            or (len(current) + 1) * width > self._batch_token_budget):
+                buckets.append(current)
+                current = []
+            if not current:
+                width = lengths[k]
+            current.append(k)
+        if current:
+            buckets.append(current)
+        return buckets
+
+    def _generate(self, model, tokenizer, batch_ids: list[list[int]]) -> list[str]:
+        """Run one padded generate call and decode the outputs."""
+        import torch
+        device = self._device or torch.device('cpu')
+        inputs = tokenizer.pad({"input_ids": batch_ids}, return_tensors="pt")
+        inputs = {k: v.to(device) for k, v in inputs.items()}
+
+        # A bucket of short pieces cannot need max_length output tokens;
+        # the cap stops a degenerate repetition from stalling the batch
+        width = max(len(ids) for ids in batch_ids)
+        max_length = min(self._max_length, width * _OUTPUT_LENGTH_RATIO + 16)
+
+        with torch.inference_mode():
+            translated = model.generate(
+                **inputs,
+                max_length=max_length,
+                num_beams=self._num_beams,
+                early_stopping=True,
+            )
+        return tokenizer.batch_decode(translated, skip_special_tokens=True)
+
     # ------------------------------------------------------------------
     # Language support
     # ------------------------------------------------------------------
@@ -408,3 +526,13 @@ class TranslationEngine(AbstractTranslationEngine):
         """Check if engine supports specific language pair."""
         supported = self.get_supported_languages()
         return src_lang.lower() in supported and tgt_lang.lower() in supported
+
+
+def _split_evenly(text: str, parts: int) -> list[str]:
+    """Split *text* into *parts* pieces at word (or character) boundaries."""
+    words = text.split()
+    if len(words) >= parts:
+        size = math.ceil(len(words) / parts)
+        return [' '.join(words[i:i + size]) for i in range(0, len(words), size)]
+    size = math.ceil(len(text) / parts)
+    return [text[i:i + size] for i in range(0, len(text), size)]
@@ -41,6 +41,8 @@ def _to_nllb(lang: str) -> str:
 class TranslationEngine(AbstractTranslationEngine):
     """NLLB-200 translation engine plugin."""
 
+    runs_locally = True
+
     def __init__(self):
         super().__init__("nllb200")
         self._logger = logger
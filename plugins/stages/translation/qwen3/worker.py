@@ -10,6 +10,7 @@ text with ``AutoModelForCausalLM``.
 import logging
 import re
 import time
+from collections.abc import Iterator
 from typing import Any
 
 try:
@@ -20,6 +21,7 @@ try:
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
+from app.llm.batched_generation import PrefixCachedGenerator, shared_prefix
 from app.text_translation.translation_engine_interface import (
     AbstractTranslationEngine,
     BatchTranslationResult,
@@ -49,6 +51,11 @@ _LANG_NAMES: dict[str, str] = {
 _SUPPORTED_LANGUAGES = list(_LANG_NAMES.keys())
 
 
+# Token IDs for <think> / </think> in Qwen3
+_THINK_START = 151667
+_THINK_END = 151668
+
+
 def _lang_name(code: str) -> str:
     return _LANG_NAMES.get(code, code)
 
@@ -79,6 +86,9 @@ def _is_valid_prompt_template(template: str) -> bool:
 class TranslationEngine(AbstractTranslationEngine):
     """Qwen3 prompt-based translation engine."""
 
+    runs_locally = True
+    supports_streaming = True
+
     def __init__(self) -> None:
         super().__init__("qwen3")
         self._logger = logger
@@ -88,6 +98,8 @@ class TranslationEngine(AbstractTranslationEngine):
         self._device: "torch.device | None" = None
         self._max_length = 512
         self._temperature = 0.3
+        self._batch_size = 8
+        self._generator: PrefixCachedGenerator | None = None
         self._using_shared_model = False
         self._prompt_template: str = _DEFAULT_PROMPT_TEMPLATE
 
@@ -119,6 +131,7 @@ class TranslationEngine(AbstractTranslationEngine):
             self.model_name = config.get("model_name", self.model_name)
             self._max_length = int(config.get("max_length", self._max_length))
             self._temperature = float(config.get("temperature", self._temperature))
+            self._batch_size = max(1, int(config.get("batch_size", self._batch_size)))
             quantization = config.get("quantization", "none")
             use_gpu = config.get("gpu", True) or config.get("use_gpu", True)
 
@@ -246,6 +259,7 @@ class TranslationEngine(AbstractTranslationEngine):
                 "(model kept alive — still used by another component)"
             )
         self._using_shared_model = False
+        self._generator = None
 
     # ------------------------------------------------------------------
     # Prompt construction
@@ -311,6 +325,138 @@ class TranslationEngine(AbstractTranslationEngine):
             from_cache=False,
         )
 
+    def _render_prompt(
+        self,
+        text: str,
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None,
+        strict_mode: bool,
+    ) -> str:
+        messages = self._build_messages(
+            text, src_lang, tgt_lang, options, strict_mode=strict_mode
+        )
+        return self.tokenizer.apply_chat_template(
+            messages, tokenize=False, add_generation_prompt=True,
+            enable_thinking=False,
+        )
+
+    def _get_generator(self) -> PrefixCachedGenerator:
+        if self._generator is None or self._generator.model is not self.model:
+            self._generator = PrefixCachedGenerator(self.model, self.tokenizer)
+        return self._generator
+
+    def _generate_translations(
+        self,
+        texts: list[str],
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None,
+        strict_mode: bool,
+    ) -> list[str]:
+        """Translate *texts* in batched ``generate`` runs sharing the cached system prompt."""
+        def render(text: str) -> str:
+            return self._render_prompt(text, src_lang, tgt_lang, options, strict_mode)
+
+        generated = self._get_generator().generate(
+            [render(text) for text in texts],
+            prefix=shared_prefix(render),
+            max_batch_size=self._batch_size,
+            max_input_tokens=self._max_length,
+            **self._generation_kwargs(),
+        )
+        return [self._decode_output(output_ids) for output_ids in generated]
+
+    def _stream_translation(
+        self,
+        text: str,
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None,
+        strict_mode: bool,
+    ) -> Iterator[str]:
+        """Yield the growing translation of *text* while it is generated."""
+        def render(t: str) -> str:
+            return self._render_prompt(t, src_lang, tgt_lang, options, strict_mode)
+
+        generated = ""
+        last = None
+        for piece in self._get_generator().stream(
+            render(text),
+            prefix=shared_prefix(render),
+            max_input_tokens=self._max_length,
+            **self._generation_kwargs(),
+        ):
+            generated += piece
+            partial = self._clean_streamed(generated)
+            if partial and partial != last:
+                last = partial
+                yield partial
+        translated = self._clean_streamed(generated)
+        if translated != last:
+            yield translated
+
+    def _generation_kwargs(self) -> dict[str, Any]:
+        return {
+            "max_new_tokens": min(self._max_length, 64),
+            "do_sample": False,
+            "repetition_penalty": 1.1,
+            "pad_token_id": self.tokenizer.eos_token_id,
+            "suppress_tokens": [_THINK_START],
+        }
+
+    def _decode_output(self, output_ids: list[int]) -> str:
+        # If </think> is present despite suppression, skip past it
+        try:
+            think_end = len(output_ids) - output_ids[::-1].index(_THINK_END)
+            output_ids = output_ids[think_end:]
+        except ValueError:
+            pass
+
+        translated = self.tokenizer.decode(
+            output_ids, skip_special_tokens=True,
+        ).strip()
+        return self._strip_thinking(translated)
+
+    def _clean_streamed(self, text: str) -> str:
+        # Streamed text still contains a </think> the id-level skip would drop
+        if "</think>" in text:
+            text = text.rsplit("</think>", 1)[-1]
+        return self._strip_thinking(text.strip())
+
+    @staticmethod
+    def _strip_thinking(translated: str) -> str:
+        # Final safety net: aggressively strip any thinking content
+        if "<think>" in translated:
+            parts = translated.split("</think>")
+            translated = parts[-1] if len(parts) > 1 else ""
+            translated = re.sub(r"</?think>", "", translated).strip()
+        return translated
+
+    def _translate_texts(
+        self,
+        texts: list[str],
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None,
+    ) -> list[str]:
+        translated = self._generate_translations(
+            texts, src_lang, tgt_lang, options, strict_mode=False,
+        )
+        # Allow one strict retry for outputs that ignore the target language
+        retry = [
+            i for i, t in enumerate(translated)
+            if self._looks_wrong_for_target(t, tgt_lang)
+        ]
+        if retry:
+            strict = self._generate_translations(
+                [texts[i] for i in retry], src_lang, tgt_lang, options,
+                strict_mode=True,
+            )
+            for i, t in zip(retry, strict):
+                translated[i] = t
+        return translated
+
     def translate_text(
         self,
         text: str,
@@ -323,59 +469,7 @@ class TranslationEngine(AbstractTranslationEngine):
 
         start = time.time()
         try:
-            translated = ""
-            # Allow one strict retry if first pass ignores target language.
-            for strict_mode in (False, True):
-                messages = self._build_messages(
-                    text, src_lang, tgt_lang, options, strict_mode=strict_mode
-                )
-                prompt = self.tokenizer.apply_chat_template(
-                    messages, tokenize=False, add_generation_prompt=True,
-                    enable_thinking=False,
-                )
-                inputs = self.tokenizer(
-                    prompt, return_tensors="pt", truncation=True,
-                    max_length=self._max_length,
-                ).to(self._device)
-
-                input_len = inputs["input_ids"].shape[1]
-
-                # Token IDs for <think> / </think> in Qwen3
-                _THINK_START = 151667
-                _THINK_END = 151668
-
-                with torch.no_grad():
-                    outputs = self.model.generate(
-                        **inputs,
-                        max_new_tokens=min(self._max_length, 64),
-                        do_sample=False,
-                        repetition_penalty=1.1,
-                        pad_token_id=self.tokenizer.eos_token_id,
-                        suppress_tokens=[_THINK_START],
-                    )
-
-                output_ids = outputs[0][input_len:].tolist()
-
-                # If </think> is present despite suppression, skip past it
-                try:
-                    think_end = len(output_ids) - output_ids[::-1].index(_THINK_END)
-                    output_ids = output_ids[think_end:]
-                except ValueError:
-                    pass
-
-                translated = self.tokenizer.decode(
-                    output_ids, skip_special_tokens=True,
-                ).strip()
-
-                # Final safety net: aggressively strip any thinking content
-                if "<think>" in translated:
-                    parts = translated.split("</think>")
-                    translated = parts[-1] if len(parts) > 1 else ""
-                    translated = re.sub(r"</?think>", "", translated).strip()
-
-                if not self._looks_wrong_for_target(translated, tgt_lang):
-                    break
-
+            translated = self._translate_texts([text], src_lang, tgt_lang, options)[0]
             elapsed = (time.time() - start) * 1000
             return TranslationResult(
                 original_text=text,
@@ -391,6 +485,34 @@ class TranslationEngine(AbstractTranslationEngine):
             self._logger.error("Qwen3 translation failed: %s", e)
             return self._make_fallback(text, src_lang, tgt_lang)
 
+    def translate_text_stream(
+        self,
+        text: str,
+        src_lang: str,
+        tgt_lang: str,
+        options: TranslationOptions | None = None,
+    ) -> Iterator[str]:
+        if not self.is_available():
+            yield text
+            return
+
+        start = time.time()
+        try:
+            translated = ""
+            for translated in self._stream_translation(
+                text, src_lang, tgt_lang, options, strict_mode=False,
+            ):
+                yield translated
+            # Same strict retry as translate_text(); its output replaces the first attempt
+            if self._looks_wrong_for_target(translated, tgt_lang):
+                yield from self._stream_translation(
+                    text, src_lang, tgt_lang, options, strict_mode=True,
+                )
+            self.record_performance("translate_stream", (time.time() - start) * 1000)
+        except Exception as e:
+            self._logger.error("Qwen3 streaming translation failed: %s", e)
+            yield text
+
     def translate_batch(
         self,
         texts: list[str],
@@ -402,14 +524,30 @@ class TranslationEngine(AbstractTranslationEngine):
         results: list[TranslationResult] = []
         failed: list[tuple[int, str]] = []
 
-        for i, text in enumerate(texts):
+        if not self.is_available():
+            results = [self._make_fallback(t, src_lang, tgt_lang) for t in texts]
+            failed = [(i, "Engine not available") for i in range(len(texts))]
+        else:
             try:
-                result = self.translate_text(text, src_lang, tgt_lang, options)
-                results.append(result)
+                translated = self._translate_texts(texts, src_lang, tgt_lang, options)
+                per_text_ms = (time.time() - start) * 1000 / max(len(texts), 1)
+                results = [
+                    TranslationResult(
+                        original_text=text,
+                        translated_text=t,
+                        source_language=src_lang,
+                        target_language=tgt_lang,
+                        confidence=0.85,
+                        engine_used=self.engine_name,
+                        processing_time_ms=per_text_ms,
+                        from_cache=False,
+                    )
+                    for text, t in zip(texts, translated)
+                ]
             except Exception as e:
-                self._logger.error("Qwen3 batch item %d failed: %s", i, e)
-                failed.append((i, str(e)))
-                results.append(self._make_fallback(text, src_lang, tgt_lang))
+                self._logger.error("Qwen3 batch translation failed: %s", e)
+                results = [self._make_fallback(t, src_lang, tgt_lang) for t in texts]
+                failed = [(i, str(e)) for i in range(len(texts))]
 
         elapsed = (time.time() - start) * 1000
         return BatchTranslationResult(
@@ -0,0 +1,71 @@
+"""Tests for the memory-mapped dictionary store."""
+
+from app.text_translation import dictionary_store
+from app.text_translation.dictionary_store import MappedDictionary, write_store
+
+
+def _open(tmp_path, entries=None):
+    path = tmp_path / "ja_en.optidict"
+    items = {"base": 1, **(entries or {})}
+    write_store(path, ((k, dictionary_store._encode_value(v)) for k, v in items.items()), "ja", "en")
+    return MappedDictionary(path)
+
+
+def _delete_during_compaction(monkeypatch, store, key):
+    real_write_store = dictionary_store.write_store
+
+    def write_store_and_delete(*args, **kwargs):
+        # Consume the snapshot first, as the real rewrite would
+        items = list(args[1])
+        del store[key]
+        return real_write_store(args[0], items, *args[2:], **kwargs)
+
+    monkeypatch.setattr(dictionary_store, "write_store", write_store_and_delete)
+
+
+def test_key_added_after_open_and_deleted_during_compaction_stays_deleted(tmp_path, monkeypatch):
+    store = _open(tmp_path)
+    store["new"] = 5
+    _delete_during_compaction(monkeypatch, store, "new")
+
+    store.compact()
+
+    assert "new" not in store
+    assert "new" not in list(store)
+    assert len(store) == 1
+    store.close()
+
+    reopened = MappedDictionary(store.path)
+    assert "new" not in reopened
+    assert reopened["base"] == 1
+    reopened.close()
+
+
+def test_edited_base_key_deleted_during_compaction_stays_deleted(tmp_path, monkeypatch):
+    store = _open(tmp_path, {"edited": 2})
+    store["edited"] = 3
+    _delete_during_compaction(monkeypatch, store, "edited")
+
+    store.compact()
+
+    assert "edited" not in store
+    assert len(store) == 1
+    store.close()
+
+
+def test_key_reset_after_delete_during_compaction_keeps_new_value(tmp_path, monkeypatch):
+    store = _open(tmp_path)
+    store["new"] = 5
+    real_write_store = dictionary_store.write_store
+
+    def write_store_and_replace(*args, **kwargs):
+        items = list(args[1])
+        del store["new"]
+        store["new"] = 6
+        return real_write_store(args[0], items, *args[2:], **kwargs)
+
+    monkeypatch.setattr(dictionary_store, "write_store", write_store_and_replace)
+    store.compact()
+
+    assert store["new"] == 6
+    store.close()
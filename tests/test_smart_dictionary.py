@@ -0,0 +1,39 @@
+"""Tests for SmartDictionary with the binary store enabled."""
+
+import gzip
+import json
+
+from app.text_translation.dictionary_store import MappedDictionary
+from app.text_translation.smart_dictionary import SmartDictionary
+
+
+def _write_wordbook(path, translations):
+    data = {"source_language": "ja", "target_language": "en", "translations": translations}
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _read_wordbook(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_save_keeps_json_in_sync_and_reimport_keeps_pending_entries(tmp_path):
+    path = tmp_path / "ja_en.json.gz"
+    _write_wordbook(path, {"base": {"translation": "Base"}})
+    dictionary = SmartDictionary(str(path))
+    assert isinstance(dictionary._dictionaries[("ja", "en")], MappedDictionary)
+
+    dictionary.add_entry("learned", "Learned", "ja", "en")
+    dictionary.save_dictionary(str(path), "ja", "en", auto_cleanup=False)
+    data = _read_wordbook(path)
+    assert set(data["translations"]) == {"base", "learned"}
+
+    # Learned after the save, then the JSON is edited directly (as the UI does)
+    dictionary.add_entry("pending", "Pending", "ja", "en")
+    data["translations"]["edited"] = {"translation": "Edited"}
+    _write_wordbook(path, data["translations"])
+    dictionary.load_dictionary(str(path), "ja", "en")
+
+    assert set(dictionary._dictionaries[("ja", "en")]) == {"base", "learned", "pending", "edited"}
+    dictionary.clear_all_entries()
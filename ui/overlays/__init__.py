@@ -14,6 +14,7 @@ from .overlay_manager import (
     AnimationType,
 )
 from .overlay_adapter import PyQt6OverlayAdapter, create_overlay_system
+from .overlay_compositor import CompositorOverlayManager, OverlayCompositorWindow
 from .thread_safe_overlay import (
     ThreadSafeOverlaySystem,
     create_thread_safe_overlay_system,
@@ -30,6 +31,8 @@ __all__ = [
     'OverlayPosition',
     'AnimationType',
     'PyQt6OverlayAdapter',
+    'CompositorOverlayManager',
+    'OverlayCompositorWindow',
     'create_overlay_system',
     'ThreadSafeOverlaySystem',
     'create_thread_safe_overlay_system',
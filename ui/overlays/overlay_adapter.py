@@ -20,20 +20,41 @@ class PyQt6OverlayAdapter:
 
     Provides the same interface as the old Tkinter overlay system for
     seamless migration.
+
+    Two renderers are available: ``"widgets"`` (one ``TranslationOverlay``
+    window per translation, with animations) and ``"compositor"`` (one
+    window painting every translation, see ``overlay_compositor``).
     """
 
-    def __init__(self, config_manager=None):
+    RENDERERS = ('widgets', 'compositor')
+
+    def __init__(self, config_manager=None, renderer: str | None = None):
         """
         Initialize overlay adapter.
 
         Args:
             config_manager: Configuration manager for loading settings
+            renderer: ``"widgets"`` or ``"compositor"``; defaults to the
+                ``overlay.renderer`` setting
         """
         self.config_manager = config_manager
 
+        if renderer is None:
+            renderer = (self.config_manager.get_setting('overlay.renderer', 'widgets')
+                        if self.config_manager else 'widgets')
+        if renderer not in self.RENDERERS:
+            logger.warning("Unknown overlay renderer '%s', falling back to widgets", renderer)
+            renderer = 'widgets'
+        self.renderer = renderer
+
         # Create overlay manager with default config
         default_config = self._load_config_from_manager()
-        self.manager = OverlayManager(config=default_config)
+        if renderer == 'compositor':
+            from .overlay_compositor import CompositorOverlayManager
+            self.manager = CompositorOverlayManager(config=default_config)
+        else:
+            self.manager = OverlayManager(config=default_config)
+        logger.debug("Overlay renderer: %s", renderer)
 
         # Track overlay IDs
         self.next_overlay_id = 0
@@ -252,19 +273,46 @@ class PyQt6OverlayAdapter:
             translation_id = f"translation_{self.next_overlay_id}"
             self.next_overlay_id += 1
 
-        # Adjust position for monitor if specified
+        position = self._to_screen(translation_id, position, monitor_id)
+        self.manager.show_overlay(translation_id, text, position)
+        return translation_id
+
+    def reconcile_translations(self, translations: list[tuple[str, str, tuple[int, int]]],
+                               monitor_id: int | None = None) -> dict[str, int]:
+        """
+        Show exactly these translations, keeping overlays whose ID is unchanged.
+
+        Args:
+            translations: ``(translation_id, text, (x, y))`` per overlay;
+                IDs should be stable across frames for the same bubble
+            monitor_id: Optional monitor ID the positions are relative to
+
+        Returns:
+            Per-frame counts from ``OverlayManager.reconcile``
+        """
+        overlays = [
+            (translation_id, text, self._to_screen(translation_id, position, monitor_id))
+            for translation_id, text, position in translations
+        ]
+        counts = self.manager.reconcile(overlays)
+        wanted = {translation_id for translation_id, _, _ in overlays}
+        for translation_id in list(self.overlay_monitor_map):
+            if translation_id not in wanted:
+                del self.overlay_monitor_map[translation_id]
+        return counts
+
+    def _to_screen(self, translation_id: str, position: tuple[int, int],
+                   monitor_id: int | None) -> tuple[int, int]:
+        """Apply the monitor offset and remember the overlay's monitor."""
         if monitor_id is not None and monitor_id < len(self.monitor_info):
             monitor = self.monitor_info[monitor_id]
             abs_x = monitor['x'] + position[0]
             abs_y = monitor['y'] + position[1]
-            position = (abs_x, abs_y)
             self.overlay_monitor_map[translation_id] = monitor_id
-        else:
-            detected_monitor = self._get_monitor_for_position(position[0], position[1])
-            self.overlay_monitor_map[translation_id] = detected_monitor
-
-        self.manager.show_overlay(translation_id, text, position)
-        return translation_id
+            return (abs_x, abs_y)
+        detected_monitor = self._get_monitor_for_position(position[0], position[1])
+        self.overlay_monitor_map[translation_id] = detected_monitor
+        return position
 
     def hide_translation(self, translation_id: str):
         """Hide a specific translation overlay."""
@@ -292,6 +340,10 @@ class PyQt6OverlayAdapter:
         """Get number of active overlays."""
         return self.manager.get_active_count()
 
+    def get_performance_stats(self) -> dict:
+        """Overlay manager statistics, including window churn per frame."""
+        return self.manager.get_performance_stats()
+
     def set_all_capture_visible(self, visible: bool) -> None:
         """Toggle DXGI capture visibility on every active overlay."""
         self.manager.set_all_capture_visible(visible)
@@ -317,14 +369,15 @@ class PyQt6OverlayAdapter:
         self.manager.cleanup()
 
 
-def create_overlay_system(config_manager=None) -> PyQt6OverlayAdapter:
+def create_overlay_system(config_manager=None, renderer: str | None = None) -> PyQt6OverlayAdapter:
     """
     Factory function to create overlay system.
 
     Args:
         config_manager: Optional configuration manager
+        renderer: ``"widgets"`` or ``"compositor"`` (default: ``overlay.renderer``)
 
     Returns:
         PyQt6OverlayAdapter instance
     """
-    return PyQt6OverlayAdapter(config_manager)
+    return PyQt6OverlayAdapter(config_manager, renderer=renderer)
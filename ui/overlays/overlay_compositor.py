@@ -0,0 +1,368 @@
+"""
+Single-Window Overlay Compositor
+
+Alternative to one ``TranslationOverlay`` window per bubble: a single
+transparent, click-through, capture-excluded window spanning the desktop
+paints every translation box in one ``paintEvent``.
+
+- Boxes live in a retained display list; text layout is computed once
+  per text change (``QStaticText``), not on every paint.
+- Changes invalidate only the old and new box rectangles, and a paint
+  only draws the boxes that intersect the dirty region.
+- Adding or removing a box never creates or destroys a window.
+
+``CompositorOverlayManager`` has the interface of ``OverlayManager``, so
+``PyQt6OverlayAdapter`` (and with it ``OverlayStage`` / the thread-safe
+wrapper) can use either renderer.  Show/hide animations and blurred
+shadows are not drawn in this mode.
+"""
+
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from PyQt6.QtCore import QObject, QPoint, QRect, QRectF, QSizeF, Qt
+from PyQt6.QtGui import (
+    QColor, QFont, QFontMetrics, QPainter, QPen, QRegion, QStaticText,
+    QTextOption,
+)
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from .overlay_manager import OverlayConfig, OverlayStyle
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _DisplayItem:
+    """One retained translation box, in global screen coordinates."""
+    text: str
+    position: tuple[int, int]
+    style: OverlayStyle
+    static_text: QStaticText
+    size: tuple[int, int]          # box size including padding and border
+
+    def rect(self) -> QRect:
+        return QRect(self.position[0], self.position[1], self.size[0], self.size[1])
+
+    def damage(self) -> QRect:
+        """Box plus its shadow."""
+        rect = self.rect()
+        if self.style.shadow_enabled:
+            dx, dy = self.style.shadow_offset
+            rect = rect.united(rect.translated(dx, dy))
+        return rect.adjusted(-1, -1, 1, 1)
+
+
+def _font(style: OverlayStyle) -> QFont:
+    font = QFont(style.font_family)
+    font.setPixelSize(style.font_size)
+    font.setBold(style.font_weight == "bold")
+    font.setItalic(style.font_italic)
+    return font
+
+
+def _layout(text: str, style: OverlayStyle) -> tuple[QStaticText, tuple[int, int]]:
+    """Lay out *text* like the ``QLabel`` of a ``TranslationOverlay``."""
+    font = _font(style)
+    inset = style.padding + (style.border_width if style.border_enabled else 0)
+    natural = QFontMetrics(font).horizontalAdvance(text)
+    width = natural
+    if style.word_wrap:
+        width = min(natural, max(style.max_width - 2 * inset, 1))
+
+    static_text = QStaticText(text)
+    static_text.setTextFormat(Qt.TextFormat.PlainText)
+    option = QTextOption(Qt.AlignmentFlag.AlignHCenter)
+    option.setWrapMode(
+        QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere
+        if style.word_wrap else QTextOption.WrapMode.NoWrap
+    )
+    static_text.setTextOption(option)
+    static_text.setTextWidth(width)
+    static_text.prepare(font=font)
+    text_size = static_text.size()
+    height = min(int(text_size.height()) + 1 + 2 * inset, style.max_height)
+    return static_text, (int(text_size.width()) + 1 + 2 * inset, height)
+
+
+class OverlayCompositorWindow(QWidget):
+    """Desktop-sized transparent window that paints the display list."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items: dict[str, _DisplayItem] = {}
+        self.paint_count = 0
+        self.paint_times: list[float] = []
+        self.last_paint_items = 0
+
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint
+            | Qt.WindowType.WindowStaysOnTopHint
+            | Qt.WindowType.Tool
+            | Qt.WindowType.BypassWindowManagerHint
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.fit_to_desktop()
+        self._set_capture_affinity(exclude=True)
+
+    def fit_to_desktop(self):
+        """Cover the virtual desktop (all monitors)."""
+        screen = QApplication.primaryScreen()
+        if screen is not None:
+            self.setGeometry(screen.virtualGeometry())
+
+    def invalidate(self, rect: QRect):
+        """Schedule a repaint of *rect* (global coordinates)."""
+        self.update(rect.translated(-self.geometry().topLeft()))
+
+    def paintEvent(self, event):
+        start_time = time.time()
+        origin = self.geometry().topLeft()
+        dirty: QRegion = event.region().translated(origin)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.translate(-origin.x(), -origin.y())
+        painted = 0
+        for item in self.items.values():
+            if dirty.intersects(item.damage()):
+                self._paint_item(painter, item)
+                painted += 1
+        painter.end()
+
+        self.paint_count += 1
+        self.last_paint_items = painted
+        self.paint_times.append(time.time() - start_time)
+        if len(self.paint_times) > 100:
+            self.paint_times.pop(0)
+
+    @staticmethod
+    def _paint_item(painter: QPainter, item: _DisplayItem):
+        style = item.style
+        rect = QRectF(item.rect())
+        radius = style.border_radius if style.border_enabled else 0
+        painter.setOpacity(style.opacity)
+
+        if style.shadow_enabled:
+            dx, dy = style.shadow_offset
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(*style.shadow_color))
+            painter.drawRoundedRect(rect.translated(dx, dy), radius, radius)
+
+        if style.border_enabled:
+            half = style.border_width / 2
+            painter.setPen(QPen(QColor(*style.border_color), style.border_width))
+            box = rect.adjusted(half, half, -half, -half)
+        else:
+            painter.setPen(Qt.PenStyle.NoPen)
+            box = rect
+        if style.background_enabled:
+            painter.setBrush(QColor(*style.background_color))
+        else:
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(box, radius, radius)
+
+        inset = style.padding + (style.border_width if style.border_enabled else 0)
+        text_size: QSizeF = item.static_text.size()
+        left = rect.x() + (rect.width() - text_size.width()) / 2
+        painter.setFont(_font(style))
+        painter.setPen(QColor(*style.text_color))
+        painter.save()
+        painter.setClipRect(rect.adjusted(inset, inset, -inset, -inset))
+        painter.drawStaticText(QPoint(int(left), int(rect.y()) + inset), item.static_text)
+        painter.restore()
+        painter.setOpacity(1.0)
+
+    def _set_capture_affinity(self, exclude: bool):
+        """Keep the window out of DXGI Desktop Duplication (see TranslationOverlay)."""
+        if sys.platform != 'win32':
+            return
+        try:
+            import ctypes
+            hwnd = int(self.winId())
+            WDA_EXCLUDEFROMCAPTURE = 0x00000011
+            affinity = WDA_EXCLUDEFROMCAPTURE if exclude else 0x00000000
+            if not ctypes.windll.user32.SetWindowDisplayAffinity(hwnd, affinity) and exclude:
+                logger.warning(
+                    "SetWindowDisplayAffinity failed for the overlay compositor; "
+                    "overlays may be captured and re-translated",
+                )
+        except Exception:
+            logger.warning("SetWindowDisplayAffinity unavailable", exc_info=True)
+
+
+class CompositorOverlayManager(QObject):
+    """
+    ``OverlayManager`` replacement that draws all overlays in one window.
+
+    Keeps the overlay IDs, ``reconcile`` semantics and statistics of
+    ``OverlayManager``; ``created``/``destroyed`` window counts stay 0
+    after the compositor window exists, and paint statistics are added.
+    """
+
+    def __init__(self, config: OverlayConfig | None = None, parent=None):
+        super().__init__(parent)
+        self.default_config = config or OverlayConfig()
+        self.window = OverlayCompositorWindow()
+        self.total_created = 1  # the compositor window
+        self.total_destroyed = 0
+        self.render_times: list[float] = []
+        self.frame_counts: list[dict[str, int]] = []
+
+    @property
+    def items(self) -> dict[str, _DisplayItem]:
+        return self.window.items
+
+    def show_overlay(self, overlay_id: str, text: str, position: tuple[int, int],
+                     config: OverlayConfig | None = None) -> None:
+        """Add or update one box."""
+        start_time = time.time()
+        counts = {'unchanged': 0, 'moved': 0, 'updated': 0, 'shown': 0}
+        self._put(overlay_id, text, tuple(position), config, counts)
+        self._show_window()
+        self._record_render(start_time)
+
+    def hide_overlay(self, overlay_id: str):
+        """Remove one box (no fade-out in compositor mode)."""
+        item = self.items.pop(overlay_id, None)
+        if item is not None:
+            self.window.invalidate(item.damage())
+
+    def hide_overlay_immediate(self, overlay_id: str):
+        self.hide_overlay(overlay_id)
+
+    def hide_all(self, immediate: bool = False):
+        for overlay_id in list(self.items):
+            self.hide_overlay(overlay_id)
+
+    def update_overlay(self, overlay_id: str, text: str | None = None,
+                       position: tuple[int, int] | None = None):
+        item = self.items.get(overlay_id)
+        if item is None:
+            return
+        counts = {'unchanged': 0, 'moved': 0, 'updated': 0, 'shown': 0}
+        self._put(
+            overlay_id,
+            item.text if text is None else text,
+            item.position if position is None else tuple(position),
+            None, counts,
+        )
+
+    def reconcile(self, overlays: list[tuple[str, str, tuple[int, int]]],
+                  config: OverlayConfig | None = None) -> dict[str, int]:
+        """Make the display list match one frame; see ``OverlayManager.reconcile``."""
+        start_time = time.time()
+        counts = {'unchanged': 0, 'moved': 0, 'updated': 0,
+                  'retargeted': 0, 'shown': 0, 'hidden': 0}
+        wanted = {overlay_id for overlay_id, _, _ in overlays}
+        # Boxes whose ID is gone, by text: a bubble that moved to another
+        # key keeps its laid-out text
+        spare: dict[str, list[str]] = {}
+        for overlay_id, item in self.items.items():
+            if overlay_id not in wanted:
+                spare.setdefault(item.text, []).append(overlay_id)
+        for overlay_id, text, position in overlays:
+            if overlay_id not in self.items and spare.get(text):
+                self.items[overlay_id] = self.items.pop(spare[text].pop())
+                counts['retargeted'] += 1
+            self._put(overlay_id, text, tuple(position), config, counts)
+        for overlay_id in [oid for ids in spare.values() for oid in ids]:
+            self.hide_overlay(overlay_id)
+            counts['hidden'] += 1
+        if self.items:
+            self._show_window()
+
+        counts['created'] = 0
+        counts['destroyed'] = 0
+        self.frame_counts.append(counts)
+        if len(self.frame_counts) > 100:
+            self.frame_counts.pop(0)
+        self._record_render(start_time)
+        return counts
+
+    def _put(self, overlay_id: str, text: str, position: tuple[int, int],
+             config: OverlayConfig | None, counts: dict[str, int]):
+        style = (config or self.default_config).style
+        item = self.items.get(overlay_id)
+        if item is None:
+            static_text, size = _layout(text, style)
+            item = _DisplayItem(text, position, style, static_text, size)
+            self.items[overlay_id] = item
+            self.window.invalidate(item.damage())
+            counts['shown'] += 1
+            return
+        if item.text == text and item.position == position and item.style is style:
+            counts['unchanged'] += 1
+            return
+        old = item.damage()
+        if item.text != text or item.style is not style:
+            item.static_text, item.size = _layout(text, style)
+            item.text = text
+            item.style = style
+            counts['updated'] += 1
+        if item.position != position:
+            item.position = position
+            counts['moved'] += 1
+        self.window.invalidate(old.united(item.damage()))
+
+    def _show_window(self):
+        if not self.window.isVisible():
+            self.window.show()
+            self.window._set_capture_affinity(exclude=True)
+
+    def _record_render(self, start_time: float):
+        self.render_times.append(time.time() - start_time)
+        if len(self.render_times) > 100:
+            self.render_times.pop(0)
+
+    def get_overlay(self, overlay_id: str) -> _DisplayItem | None:
+        return self.items.get(overlay_id)
+
+    def is_active(self, overlay_id: str) -> bool:
+        return overlay_id in self.items
+
+    def get_active_count(self) -> int:
+        return len(self.items)
+
+    def get_performance_stats(self) -> dict[str, Any]:
+        """Get performance statistics (same keys as ``OverlayManager`` plus paints)."""
+        avg_render_time = sum(self.render_times) / len(self.render_times) if self.render_times else 0
+        paint_times = self.window.paint_times
+        frames = len(self.frame_counts)
+        return {
+            'renderer': 'compositor',
+            'active_overlays': len(self.items),
+            'pooled_overlays': 0,
+            'total_created': self.total_created,
+            'total_reused': 0,
+            'total_destroyed': self.total_destroyed,
+            'reuse_rate': 0.0,
+            'avg_render_time_ms': avg_render_time * 1000,
+            'recent_render_times': self.render_times[-10:],
+            'last_frame': dict(self.frame_counts[-1]) if frames else {},
+            'avg_created_per_frame': 0.0,
+            'avg_destroyed_per_frame': 0.0,
+            'paint_count': self.window.paint_count,
+            'avg_paint_time_ms': (
+                sum(paint_times) / len(paint_times) * 1000 if paint_times else 0.0),
+            'last_paint_items': self.window.last_paint_items,
+        }
+
+    def set_all_capture_visible(self, visible: bool) -> None:
+        """Toggle DXGI capture visibility of the compositor window."""
+        self.window._set_capture_affinity(exclude=not visible)
+
+    def cleanup(self):
+        """Drop all boxes and close the compositor window."""
+        logger.debug("Cleaning up overlay compositor (active: %d)", len(self.items))
+        self.items.clear()
+        self.window.hide()
+        self.window.close()
+        self.window.deleteLater()
+        self.total_destroyed += 1
@@ -535,6 +535,7 @@ class OverlayManager(QObject):
     
     Features:
     - Overlay pooling for performance
+    - Keyed per-frame reconciliation (see ``reconcile``)
     - Automatic cleanup
     - Batch operations
     - Performance monitoring
@@ -558,7 +559,13 @@ class OverlayManager(QObject):
         # Performance metrics
         self.total_created = 0
         self.total_reused = 0
+        self.total_destroyed = 0
         self.render_times: list[float] = []
+        # Widget churn per reconciled frame; counts since the last
+        # reconcile() belong to the next one
+        self._frame_created = 0
+        self._frame_destroyed = 0
+        self.frame_counts: list[dict[str, int]] = []
     
     def show_overlay(self, overlay_id: str, text: str, position: tuple[int, int],
                     config: OverlayConfig | None = None) -> TranslationOverlay:
@@ -579,8 +586,10 @@ class OverlayManager(QObject):
         # Check if overlay already exists and is active
         if overlay_id in self.active_overlays:
             existing_overlay = self.active_overlays[overlay_id]
-            existing_overlay.update_text(text)
-            existing_overlay.update_position(position)
+            if existing_overlay.text != text:
+                existing_overlay.update_text(text)
+            if tuple(existing_overlay.position) != tuple(position):
+                existing_overlay.update_position(position)
             if config:
                 existing_overlay.config = config
                 existing_overlay.label.setStyleSheet(config.style.to_stylesheet())
@@ -615,6 +624,7 @@ class OverlayManager(QObject):
                 config=config or self.default_config
             )
             self.total_created += 1
+            self._frame_created += 1
             logger.debug("Overlay %s created (total: %d)", overlay_id, self.total_created)
         
         # Connect closed signal with current overlay_id
@@ -697,6 +707,135 @@ class OverlayManager(QObject):
                 overlay.deleteLater()
             except Exception:
                 pass
+            self.total_destroyed += 1
+            self._frame_destroyed += 1
+
+    def reconcile(self, overlays: list[tuple[str, str, tuple[int, int]]],
+                  config: OverlayConfig | None = None) -> dict[str, int]:
+        """
+        Make the active overlays match one frame's translations.
+
+        Overlays are matched by key: unchanged ones are left alone, moved
+        ones get ``update_position`` and changed text ``update_text``.
+        Widgets of overlays that are gone are moved to new keys before
+        any window is created, and the rest go back to the pool, so only
+        a change in the number of overlays creates or hides windows.
+
+        Args:
+            overlays: ``(overlay_id, text, (x, y))`` for every overlay of
+                the frame; active overlays with other IDs are removed
+            config: Optional configuration for newly shown overlays
+
+        Returns:
+            Counts of this frame (see ``get_performance_stats``)
+        """
+        start_time = time.time()
+        counts = {'unchanged': 0, 'moved': 0, 'updated': 0,
+                  'retargeted': 0, 'shown': 0, 'hidden': 0}
+        wanted = {overlay_id: (text, tuple(position)) for overlay_id, text, position in overlays}
+
+        # Widgets of removed overlays, by text so a bubble that moved out
+        # of its key keeps its own widget
+        spare: dict[str, list[str]] = {}
+        for overlay_id, overlay in self.active_overlays.items():
+            if overlay_id not in wanted:
+                spare.setdefault(overlay.text, []).append(overlay_id)
+
+        added: list[str] = []
+        for overlay_id, (text, position) in wanted.items():
+            overlay = self.active_overlays.get(overlay_id)
+            if overlay is None:
+                added.append(overlay_id)
+                continue
+            changed = self._apply(overlay, text, position, counts)
+            if not overlay.is_visible:
+                # Was fading out after hide_overlay(); bring it back
+                self._stop_animations(overlay)
+                overlay.show_animated()
+                counts['shown'] += 1
+            elif not changed:
+                counts['unchanged'] += 1
+
+        still_added: list[str] = []
+        for overlay_id in added:
+            text = wanted[overlay_id][0]
+            same_text = spare.get(text)
+            if not same_text:
+                still_added.append(overlay_id)
+                continue
+            self._retarget(same_text.pop(), overlay_id, text, wanted[overlay_id][1], counts)
+        leftover = [oid for ids in spare.values() for oid in ids]
+        for overlay_id in still_added:
+            text, position = wanted[overlay_id]
+            if leftover:
+                self._retarget(leftover.pop(), overlay_id, text, position, counts)
+            else:
+                self.show_overlay(overlay_id, text, position, config)
+                counts['shown'] += 1
+
+        for overlay_id in leftover:
+            self._release(overlay_id)
+            counts['hidden'] += 1
+
+        counts['created'] = self._frame_created
+        counts['destroyed'] = self._frame_destroyed
+        self._frame_created = 0
+        self._frame_destroyed = 0
+        self.frame_counts.append(counts)
+        if len(self.frame_counts) > 100:
+            self.frame_counts.pop(0)
+        self.render_times.append(time.time() - start_time)
+        if len(self.render_times) > 100:
+            self.render_times.pop(0)
+        return counts
+
+    @staticmethod
+    def _apply(overlay: TranslationOverlay, text: str, position: tuple[int, int],
+               counts: dict[str, int]) -> bool:
+        """Update text/position of *overlay* where they differ."""
+        changed = False
+        if overlay.text != text:
+            overlay.update_text(text)
+            counts['updated'] += 1
+            changed = True
+        if tuple(overlay.position) != position:
+            overlay.update_position(position)
+            counts['moved'] += 1
+            changed = True
+        return changed
+
+    def _retarget(self, old_id: str, new_id: str, text: str,
+                  position: tuple[int, int], counts: dict[str, int]):
+        """Move the widget of removed overlay *old_id* to *new_id*."""
+        overlay = self.active_overlays.pop(old_id)
+        try:
+            overlay.closed.disconnect()
+        except TypeError:
+            pass
+        overlay.closed.connect(lambda oid=new_id: self._on_overlay_closed(oid))
+        self.active_overlays[new_id] = overlay
+        self._apply(overlay, text, position, counts)
+        if not overlay.is_visible:
+            self._stop_animations(overlay)
+            overlay.show_animated()
+        counts['retargeted'] += 1
+
+    def _release(self, overlay_id: str):
+        """Hide an overlay at once and keep its widget in the pool."""
+        overlay = self.active_overlays.pop(overlay_id)
+        self._stop_animations(overlay)
+        overlay.is_visible = False
+        overlay.hide()
+        self._return_to_pool(overlay)
+
+    @staticmethod
+    def _stop_animations(overlay: TranslationOverlay):
+        if getattr(overlay, 'animation', None):
+            overlay.animation.stop()
+            overlay.animation = None
+        if getattr(overlay, 'auto_hide_timer', None):
+            overlay.auto_hide_timer.stop()
+            overlay.auto_hide_timer = None
     
     def update_overlay(self, overlay_id: str, text: str | None = None,
                       position: tuple[int, int] | None = None):
@@ -723,15 +862,23 @@ class OverlayManager(QObject):
     def get_performance_stats(self) -> dict[str, Any]:
         """Get performance statistics."""
         avg_render_time = sum(self.render_times) / len(self.render_times) if self.render_times else 0
+        frames = len(self.frame_counts)
         
         return {
             'active_overlays': len(self.active_overlays),
             'pooled_overlays': len(self.overlay_pool),
             'total_created': self.total_created,
             'total_reused': self.total_reused,
+            'total_destroyed': self.total_destroyed,
             'reuse_rate': self.total_reused / max(self.total_created, 1),
             'avg_render_time_ms': avg_render_time * 1000,
-            'recent_render_times': self.render_times[-10:]
+            'recent_render_times': self.render_times[-10:],
+            # Window churn per reconciled frame (last 100 frames)
+            'last_frame': dict(self.frame_counts[-1]) if frames else {},
+            'avg_created_per_frame': (
+                sum(c['created'] for c in self.frame_counts) / frames if frames else 0.0),
+            'avg_destroyed_per_frame': (
+                sum(c['destroyed'] for c in self.frame_counts) / frames if frames else 0.0),
         }
     
     def _get_from_pool(self) -> TranslationOverlay | None:
@@ -746,6 +893,8 @@ class OverlayManager(QObject):
             self.overlay_pool.append(overlay)
         else:
             overlay.deleteLater()
+            self.total_destroyed += 1
+            self._frame_destroyed += 1
     
     def _on_overlay_closed(self, overlay_id: str):
         """Handle overlay closed signal — remove from active and return to pool."""
@@ -28,6 +28,7 @@ class ThreadSafeOverlaySystem(QObject):
     _show_signal = pyqtSignal(str, str, int, int)       # overlay_id, text, x, y
     _hide_signal = pyqtSignal(str)                       # overlay_id
     _hide_all_signal = pyqtSignal(bool)                  # immediate
+    _reconcile_signal = pyqtSignal(object, object)       # [(overlay_id, text, (x, y))], monitor_id
     
     def __init__(self, overlay_system):
         """
@@ -38,11 +39,17 @@ class ThreadSafeOverlaySystem(QObject):
         """
         super().__init__()
         self.overlay_system = overlay_system
+
+        # Last frame handed to _do_reconcile; None once anything else has
+        # touched the overlays, so the next frame is always applied
+        self._last_reconciled: tuple | None = None
+        self._last_reconciled_lock = threading.Lock()
         
         # Connect signals to slots (runs in main thread via QueuedConnection)
         self._show_signal.connect(self._do_show, Qt.ConnectionType.QueuedConnection)
         self._hide_signal.connect(self._do_hide, Qt.ConnectionType.QueuedConnection)
         self._hide_all_signal.connect(self._do_hide_all, Qt.ConnectionType.QueuedConnection)
+        self._reconcile_signal.connect(self._do_reconcile, Qt.ConnectionType.QueuedConnection)
         
         logger.info("Thread-safe overlay system initialized")
 
@@ -66,11 +73,13 @@ class ThreadSafeOverlaySystem(QObject):
                 translation_id = f"translation_{_next_id}"
         
         x, y = position
+        self._forget_reconciled()
         self._show_signal.emit(translation_id, text, x, y)
         return translation_id
     
     def hide_translation(self, translation_id: str):
         """Hide a specific translation overlay (thread-safe)."""
+        self._forget_reconciled()
         self._hide_signal.emit(translation_id)
     
     def hide_all_translations(self, immediate: bool = False):
@@ -80,6 +89,7 @@ class ThreadSafeOverlaySystem(QObject):
         Args:
             immediate: If True, hide immediately without animation
         """
+        self._forget_reconciled()
         # Direct call if already on main thread (e.g. during shutdown)
         from PyQt6.QtWidgets import QApplication
         from PyQt6.QtCore import QThread
@@ -90,16 +100,46 @@ class ThreadSafeOverlaySystem(QObject):
             logger.debug("hide_all_translations: on worker thread, using signal")
             self._hide_all_signal.emit(immediate)
     
+    def reconcile_translations(self, translations: list[tuple[str, str, tuple[int, int]]],
+                               monitor_id: int | None = None):
+        """
+        Replace the shown translations with *translations* (thread-safe).
+
+        Args:
+            translations: ``(translation_id, text, (x, y))`` per overlay;
+                overlays with unchanged IDs are kept and updated in place
+            monitor_id: Optional monitor ID the positions are relative to
+
+        A frame identical to the previous one is not sent to the main
+        thread at all.
+        """
+        frame = list(translations)
+        with self._last_reconciled_lock:
+            if (frame, monitor_id) == self._last_reconciled:
+                return
+            self._last_reconciled = (frame, monitor_id)
+        self._reconcile_signal.emit(frame, monitor_id)
+
+    def _forget_reconciled(self) -> None:
+        with self._last_reconciled_lock:
+            self._last_reconciled = None
+
+    def get_performance_stats(self) -> dict:
+        """Overlay manager statistics (create/destroy counts per frame)."""
+        return self.overlay_system.get_performance_stats()
+
     def set_all_capture_visible(self, visible: bool) -> None:
         """Toggle DXGI capture visibility on every active overlay (thread-safe)."""
         self.overlay_system.set_all_capture_visible(visible)
 
     def reload_config(self):
         """Reload overlay configuration from config manager."""
+        self._forget_reconciled()
         self.overlay_system.reload_config()
     
     def cleanup(self):
         """Cleanup overlay system."""
+        self._forget_reconciled()
         self.overlay_system.cleanup()
 
     # ------------------------------------------------------------------
@@ -121,6 +161,15 @@ class ThreadSafeOverlaySystem(QObject):
         except Exception:
             logger.exception("Error hiding overlay '%s'", overlay_id)
     
+    def _do_reconcile(self, translations: list, monitor_id: int | None = None):
+        """Actually reconcile overlays (runs in main thread)."""
+        try:
+            counts = self.overlay_system.reconcile_translations(translations, monitor_id=monitor_id)
+            logger.debug("Overlays reconciled: %s", counts)
+        except Exception:
+            self._forget_reconciled()
+            logger.exception("Error reconciling overlays")
+
     def _do_hide_all(self, immediate: bool = False):
         """Actually hide all overlays (runs in main thread)."""
         try:
@@ -130,17 +179,18 @@ class ThreadSafeOverlaySystem(QObject):
             logger.exception("Error hiding all overlays")
 
 
-def create_thread_safe_overlay_system(config_manager=None):
+def create_thread_safe_overlay_system(config_manager=None, renderer: str | None = None):
     """
     Factory function to create thread-safe overlay system.
     
     Args:
         config_manager: Optional configuration manager
+        renderer: ``"widgets"`` or ``"compositor"`` (default: ``overlay.renderer``)
         
     Returns:
         ThreadSafeOverlaySystem instance
     """
     from ui.overlays.overlay_adapter import create_overlay_system
     
-    overlay_system = create_overlay_system(config_manager)
+    overlay_system = create_overlay_system(config_manager, renderer=renderer)
     return ThreadSafeOverlaySystem(overlay_system)
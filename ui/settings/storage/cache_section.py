@@ -332,17 +332,24 @@ class CacheSection(TranslatableMixin, QWidget):
 
     @staticmethod
     def _delete_persistent_translation_cache() -> bool:
-        """Remove the on-disk translation cache file."""
+        """Clear the shared translation cache and remove its on-disk files."""
+        deleted = False
+        try:
+            from app.text_translation.tiered_cache import get_translation_cache
+            get_translation_cache().clear(persistent=True)
+            deleted = True
+        except Exception as e:
+            logger.warning("Could not clear shared translation cache: %s", e)
         try:
             from app.utils.path_utils import get_cache_dir
             cache_file = get_cache_dir() / "translation_cache.json.gz"
             if cache_file.exists():
                 cache_file.unlink()
                 logger.info("Deleted persistent translation cache: %s", cache_file)
-                return True
+                deleted = True
         except Exception as e:
             logger.warning("Could not delete persistent translation cache: %s", e)
-        return False
+        return deleted
 
     def _clear_cache(self):
         """Handle clear cache button click — clears translation cache plugin."""